@@ -8,7 +8,8 @@ from app.api.v1.endpoints import (
     ai_recommendation,
     approval,
     notification,
-    dashboard
+    dashboard,
+    risk
 )
 
 api_router = APIRouter()
@@ -47,3 +48,10 @@ api_router.include_router(
     prefix="/dashboard",
     tags=["대시보드"]
 )
+
+# 위험도 분석 엔드포인트
+api_router.include_router(
+    risk.router,
+    prefix="/risk",
+    tags=["위험도 분석"]
+)
@@ -17,6 +17,7 @@ from app.models.ai_recommendation import (
 from app.services.ai_service import AIService
 from app.services.data_collection_service import DataCollectionService
 from app.services.risk_analysis_service import RiskAnalysisService
+from app.services.recommendation_pipeline import RecommendationPipeline
 from app.services.notification_service import NotificationService, NotificationChannel, NotificationPriority
 
 router = APIRouter()
@@ -26,48 +27,32 @@ ai_service = AIService()
 data_collection_service = DataCollectionService()
 risk_analysis_service = RiskAnalysisService()
 notification_service = NotificationService()
+recommendation_pipeline = RecommendationPipeline(
+    data_collection_service,
+    risk_analysis_service,
+    ai_service
+)
 
 @router.post("/generate", response_model=List[AIRecommendationResponse])
 async def generate_recommendations(
     location: dict,
-    radius_km: float = 5.0,
-    db: Session = Depends(get_db)
+    radius_km: float = 5.0
 ):
     """
     AI 권고안 생성
     
+    데이터 수집 → 위험도 분석 → 권고안 생성 → 저장 파이프라인을 거쳐 처리되며,
+    파이프라인이 밀려 있으면 수집 단계에 자리가 날 때까지 대기합니다.
+    
     Args:
         location: {"lat": float, "lng": float} 위치 정보
         radius_km: 데이터 수집 반경 (km)
-        db: 데이터베이스 세션
         
     Returns:
         생성된 권고안 리스트
     """
     try:
-        # 1. 데이터 수집
-        sensor_data = await data_collection_service.collect_all_data(location, radius_km)
-        
-        # 2. 위험도 분석
-        risk_analysis = await risk_analysis_service.analyze_fire_risk(sensor_data, location)
-        
-        # 3. AI 권고안 생성
-        recommendations = await ai_service.generate_recommendations(
-            sensor_data, 
-            risk_analysis["overall_risk"], 
-            location
-        )
-        
-        # 4. 데이터베이스에 저장
-        saved_recommendations = []
-        for rec_data in recommendations:
-            db_rec = AIRecommendation(**rec_data.dict())
-            db.add(db_rec)
-            db.commit()
-            db.refresh(db_rec)
-            saved_recommendations.append(db_rec)
-        
-        return saved_recommendations
+        return await recommendation_pipeline.submit(location, radius_km)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"권고안 생성 실패: {str(e)}")
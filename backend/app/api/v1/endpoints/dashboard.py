@@ -2,13 +2,15 @@
 대시보드 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.core.database import get_db
 from app.models.sensor_data import SensorData
 from app.models.ai_recommendation import AIRecommendation
+from app.services.spatial_index import sensor_index
 
 router = APIRouter()
 
@@ -86,3 +88,50 @@ async def get_recent_alerts(db: Session = Depends(get_db)):
         return alerts
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"최근 알림 조회 실패: {str(e)}")
+
+@router.get("/sensors")
+async def get_sensors_in_area(
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="반경 조회 중심 위도"),
+    lng: Optional[float] = Query(None, ge=-180, le=180, description="반경 조회 중심 경도"),
+    radius_km: float = Query(5.0, gt=0, le=100, description="반경 (km)"),
+    lat_min: Optional[float] = Query(None, description="영역 조회 최소 위도"),
+    lat_max: Optional[float] = Query(None, description="영역 조회 최대 위도"),
+    lng_min: Optional[float] = Query(None, description="영역 조회 최소 경도"),
+    lng_max: Optional[float] = Query(None, description="영역 조회 최대 경도")
+):
+    """
+    지도 영역 내 센서 최신 측정값 조회
+    
+    중심 좌표(lat, lng)가 있으면 반경 조회, 없으면 영역(lat_min ~ lng_max) 조회를 수행합니다.
+    DB 대신 수집 시 갱신되는 공간 색인을 사용합니다.
+    """
+    if lat is not None and lng is not None:
+        readings = sensor_index.within(lat, lng, radius_km)
+    elif lat is None and lng is None:
+        readings = sensor_index.in_bbox(
+            lat_min if lat_min is not None else -90.0,
+            lat_max if lat_max is not None else 90.0,
+            lng_min if lng_min is not None else -180.0,
+            lng_max if lng_max is not None else 180.0
+        )
+    else:
+        raise HTTPException(status_code=400, detail="반경 조회에는 lat, lng 가 모두 필요합니다")
+    
+    return [
+        {
+            "sensor_id": reading.sensor_id,
+            "sensor_type": getattr(reading.sensor_type, "value", reading.sensor_type),
+            "lat": reading.location_lat,
+            "lng": reading.location_lng,
+            "location_name": reading.location_name,
+            "temperature": reading.temperature,
+            "humidity": reading.humidity,
+            "smoke_density": reading.smoke_density,
+            "wind_speed": reading.wind_speed,
+            "fire_detected": reading.fire_detected,
+            "fire_confidence": reading.fire_confidence,
+            "data_quality": reading.data_quality
+        }
+        for reading in readings
+    ]
+
@@ -0,0 +1,218 @@
+"""
+위험도 분석 API 엔드포인트
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+
+from app.core.config import settings
+from app.core.metrics import RISK_TILE_REQUESTS_TOTAL
+from app.models.risk import (
+    RiskBatchRequest,
+    RiskBatchResponse,
+    SpreadEnsembleRequest,
+    SpreadEnsembleResponse,
+    SpreadRequest,
+    SpreadResponse
+)
+from app.services.data_collection_service import DataCollectionService
+from app.services.region_risk import region_risk_tracker
+from app.services.risk_analysis_service import RiskAnalysisService
+from app.services.risk_batch import collect_snapshot
+from app.services.risk_tiles import EMPTY_TILE, risk_tile_cache
+from app.services.sensor_columns import SensorColumns
+from app.services.spread_ensemble import IncidentForecast
+
+router = APIRouter()
+
+# 서비스 인스턴스
+data_collection_service = DataCollectionService()
+risk_analysis_service = RiskAnalysisService()
+
+@router.post("/batch", response_model=RiskBatchResponse)
+async def analyze_risk_batch(request: RiskBatchRequest):
+    """
+    다지점 화재 위험도 일괄 분석
+    
+    모든 지점이 하나의 센서 스냅샷과 격자별 날씨 조회를 공유합니다.
+    """
+    if len(request.locations) > settings.RISK_BATCH_MAX_LOCATIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 분석할 수 있는 지점은 최대 {settings.RISK_BATCH_MAX_LOCATIONS}개입니다"
+        )
+    
+    locations = [location.model_dump() for location in request.locations]
+    try:
+        snapshot = await collect_snapshot(data_collection_service, locations, request.radius_km)
+        columns = SensorColumns.from_readings(snapshot)
+        results = await risk_analysis_service.analyze_fire_risk_batch(
+            columns, locations, request.radius_km
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"위험도 일괄 분석 실패: {str(e)}")
+    
+    return RiskBatchResponse(
+        results=results,
+        sensor_count=len(columns),
+        analysis_timestamp=datetime.now()
+    )
+
+@router.post("/spread", response_model=SpreadResponse)
+async def simulate_spread(request: SpreadRequest):
+    """
+    격자 기반 화재 확산 시뮬레이션
+    
+    발화 지점 중심의 영역을 풍향/풍속, 경사, 연료 조건으로 시간 단계별 진행하여
+    도달 시간 등치선과 피해 예상 영역을 반환합니다.
+    """
+    if request.duration_hours > settings.SPREAD_MAX_HOURS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"시뮬레이션 시간은 최대 {settings.SPREAD_MAX_HOURS}시간입니다"
+        )
+    
+    ignitions = [ignition.model_dump() for ignition in request.ignitions]
+    try:
+        sensor_data = []
+        if request.wind_speed is None:
+            center = {
+                "lat": sum(point["lat"] for point in ignitions) / len(ignitions),
+                "lng": sum(point["lng"] for point in ignitions) / len(ignitions)
+            }
+            sensor_data = await data_collection_service.collect_all_data(center, settings.SPREAD_AREA_KM / 2)
+        result, wind = await risk_analysis_service.simulate_fire_spread(
+            sensor_data,
+            ignitions,
+            request.duration_hours * 60,
+            request.wind_speed,
+            request.wind_direction
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"확산 시뮬레이션 실패: {str(e)}")
+    
+    return SpreadResponse(
+        wind_speed=wind["wind_speed"],
+        wind_direction=wind["wind_direction"],
+        wind_source=wind["source"],
+        **result.summary(request.contour_minutes)
+    )
+
+def _ensemble_response(
+    incident: IncidentForecast,
+    wind_source: str,
+    probability_levels: List[float],
+    contour_minutes: Optional[List[float]] = None
+) -> SpreadEnsembleResponse:
+    conditions = incident.conditions
+    return SpreadEnsembleResponse(
+        incident_id=incident.incident_id,
+        version=incident.version,
+        refreshed_members=incident.last_refreshed,
+        wind_speed=conditions.wind_speed,
+        wind_direction=conditions.wind_direction,
+        wind_source=wind_source,
+        wind_speed_sigma=conditions.wind_speed_sigma,
+        wind_direction_sigma=conditions.wind_direction_sigma,
+        updated_at=datetime.fromtimestamp(incident.updated_at),
+        **incident.result.summary(probability_levels, contour_minutes)
+    )
+
+@router.post("/spread/ensemble", response_model=SpreadEnsembleResponse)
+async def forecast_spread_ensemble(request: SpreadEnsembleRequest):
+    """
+    화재 확산 앙상블 예측
+    
+    풍속/풍향(기상청 예보 변동 반영)과 발화 지점을 섭동한 시뮬레이션을 병렬 실행하여
+    연소 확률 등치선과 백분위 도달 시간 등치선을 반환합니다.
+    같은 산불 건을 같은 조건으로 다시 요청하면 캐시된 결과에 새 측정값만 증분 반영하고,
+    풍속/풍향을 지정하면 캐시 조건과 다를 때 그 바람으로 다시 실행합니다.
+    """
+    if request.duration_hours > settings.SPREAD_MAX_HOURS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"시뮬레이션 시간은 최대 {settings.SPREAD_MAX_HOURS}시간입니다"
+        )
+    if request.members is not None and request.members > settings.SPREAD_ENSEMBLE_MAX_MEMBERS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"앙상블 구성원은 최대 {settings.SPREAD_ENSEMBLE_MAX_MEMBERS}개입니다"
+        )
+    
+    ignitions = [ignition.model_dump() for ignition in request.ignitions]
+    try:
+        sensor_data = []
+        # 캐시를 다시 쓰면 지정한 바람이나 캐시 조건을 사용하므로 센서 수집 생략
+        cached = risk_analysis_service.cached_ensemble(request.incident_id, ignitions, request.duration_hours * 60)
+        if request.wind_speed is None and cached is None:
+            center = {
+                "lat": sum(point["lat"] for point in ignitions) / len(ignitions),
+                "lng": sum(point["lng"] for point in ignitions) / len(ignitions)
+            }
+            sensor_data = await data_collection_service.collect_all_data(center, settings.SPREAD_AREA_KM / 2)
+        incident, wind = await risk_analysis_service.forecast_fire_spread_ensemble(
+            request.incident_id,
+            sensor_data,
+            ignitions,
+            request.duration_hours * 60,
+            request.members,
+            request.wind_speed,
+            request.wind_direction
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"확산 앙상블 예측 실패: {str(e)}")
+    
+    return _ensemble_response(incident, wind["source"], request.probability_levels, request.contour_minutes)
+
+@router.get("/spread/ensemble/{incident_id}", response_model=SpreadEnsembleResponse)
+async def get_spread_ensemble(incident_id: str):
+    """
+    캐시된 확산 앙상블 예측 조회
+    
+    마지막 예측 이후 들어온 측정값(바람 변화, 예측 영역 밖 화재 탐지)을 증분 반영한 결과를 반환합니다.
+    """
+    incident = await risk_analysis_service.spread_ensemble.refresh(incident_id)
+    if incident is None:
+        raise HTTPException(status_code=404, detail="앙상블 예측이 없는 산불 건입니다")
+    return _ensemble_response(incident, "cache", [0.1, 0.5, 0.9])
+
+@router.get("/tiles/{z}/{x}/{y}.png")
+async def get_risk_tile(
+    z: int,
+    x: int,
+    y: int,
+    layer: str = Query("color", pattern="^(color|values)$"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    위험도 지도 타일 (XYZ, 256px PNG)
+    
+    수집 주기마다 미리 그려 둔 타일을 그대로 반환하며, 타일 입력이 바뀌지 않았으면 ETag 재검증에 304 를 반환합니다.
+    layer=values 는 위험도 × 254 회색조 (255 는 값 없음) 입니다.
+    """
+    if not risk_tile_cache.min_zoom <= z <= risk_tile_cache.max_zoom or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise HTTPException(status_code=404, detail="제공하지 않는 타일입니다")
+    
+    tile = risk_tile_cache.get(z, x, y)
+    body, etag = tile.body(layer)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={settings.RISK_TILE_MAX_AGE_SECONDS}"}
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))):
+        RISK_TILE_REQUESTS_TOTAL.labels("not_modified").inc()
+        return Response(status_code=304, headers=headers)
+    
+    RISK_TILE_REQUESTS_TOTAL.labels("empty" if tile is EMPTY_TILE else "hit").inc()
+    return Response(content=body, media_type="image/png", headers=headers)
+
+@router.get("/regions")
+async def get_region_risks():
+    """
+    감시 지역별 현재 위험도
+    
+    수집/푸시 수신 시 갱신되는 이동 구간 상태에서 바로 산출합니다 (센서 목록 재조회 없음).
+    """
+    return {
+        str(region): risk
+        for region, risk in region_risk_tracker.risk_all().items()
+    }
+
@@ -2,12 +2,24 @@
 센서 데이터 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Query, Body
+from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.models.sensor_data import SensorData, SensorDataCreate, SensorDataResponse, SensorDataFilter
+from app.models.sensor_data import (
+    SensorData,
+    SensorDataBatchResponse,
+    SensorDataCreate,
+    SensorDataFilter,
+    SensorDataItemError,
+    SensorDataResponse
+)
+from app.services.blob_store import payload_policy
+from app.services.sensor_validation import validate_batch
 
 router = APIRouter()
 
@@ -26,12 +38,54 @@ async def create_sensor_data(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"센서 데이터 생성 실패: {str(e)}")
 
+@router.post("/batch", response_model=SensorDataBatchResponse)
+async def create_sensor_data_batch(
+    items: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db)
+):
+    """
+    센서 데이터 일괄 등록
+    
+    목록 전체를 한 번에 검증하고 잘못된 항목은 건너뛴 뒤 나머지를 한 번의 INSERT로 저장합니다.
+    """
+    if len(items) > settings.SENSOR_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 등록할 수 있는 항목은 최대 {settings.SENSOR_BATCH_MAX_ITEMS}개입니다"
+        )
+    
+    result = validate_batch(items)
+    rows = result.rows()
+    try:
+        for row in rows:
+            if row["raw_data"]:
+                row["raw_data"] = await payload_policy.apply(row["raw_data"])
+        if rows:
+            db.execute(insert(SensorData.__table__), rows)
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"센서 데이터 일괄 등록 실패: {str(e)}")
+    
+    return SensorDataBatchResponse(
+        accepted=len(rows),
+        rejected=len(result.errors),
+        errors=[
+            SensorDataItemError(index=index, errors=errors)
+            for index, errors in sorted(result.errors.items())
+        ]
+    )
+
 @router.get("/", response_model=List[SensorDataResponse])
 async def get_sensor_data(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     sensor_type: Optional[str] = None,
     fire_detected: Optional[bool] = None,
+    location_lat_min: Optional[float] = None,
+    location_lat_max: Optional[float] = None,
+    location_lng_min: Optional[float] = None,
+    location_lng_max: Optional[float] = None,
     db: Session = Depends(get_db)
 ):
     """센서 데이터 목록 조회"""
@@ -42,6 +96,15 @@ async def get_sensor_data(
             query = query.filter(SensorData.sensor_type == sensor_type)
         if fire_detected is not None:
             query = query.filter(SensorData.fire_detected == fire_detected)
+        # 위경도 영역 (SensorDataFilter 와 같은 경계)
+        if location_lat_min is not None:
+            query = query.filter(SensorData.location_lat >= location_lat_min)
+        if location_lat_max is not None:
+            query = query.filter(SensorData.location_lat <= location_lat_max)
+        if location_lng_min is not None:
+            query = query.filter(SensorData.location_lng >= location_lng_min)
+        if location_lng_max is not None:
+            query = query.filter(SensorData.location_lng <= location_lng_max)
         
         sensor_data = query.offset(skip).limit(limit).all()
         return sensor_data
@@ -63,3 +126,21 @@ async def get_sensor_data_by_id(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"센서 데이터 조회 실패: {str(e)}")
+
+@router.get("/{sensor_data_id}/raw", response_model=Optional[Dict[str, Any]])
+async def get_sensor_raw_data(
+    sensor_data_id: int,
+    db: Session = Depends(get_db)
+):
+    """센서 데이터 원본 조회 (blob 저장소로 옮긴 필드 복원)"""
+    try:
+        sensor_data = db.query(SensorData).filter(SensorData.id == sensor_data_id).first()
+        if not sensor_data:
+            raise HTTPException(status_code=404, detail="센서 데이터를 찾을 수 없습니다")
+        return await asyncio.to_thread(payload_policy.hydrate, sensor_data.raw_data)
+    except HTTPException:
+        raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="원본 데이터 파일을 찾을 수 없습니다")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"센서 원본 데이터 조회 실패: {str(e)}")
@@ -39,6 +39,13 @@ class Settings(BaseSettings):
     AI_MAX_TOKENS: int = 2048
     AI_TEMPERATURE: float = 0.7
     
+    # 권고안 생성 파이프라인 설정 (단계별 작업자 수, 단계 간 대기열 크기)
+    PIPELINE_QUEUE_SIZE: int = 100
+    PIPELINE_COLLECT_WORKERS: int = 4
+    PIPELINE_RISK_WORKERS: int = 4
+    PIPELINE_RECOMMEND_WORKERS: int = 2
+    PIPELINE_PERSIST_WORKERS: int = 2
+    
     # Vision AI 설정
     VISION_AI_ENDPOINT: str = "https://api.kt.com/gigai"
     VISION_AI_API_KEY: str = ""
@@ -48,15 +55,126 @@ class Settings(BaseSettings):
     IOT_SENSOR_ENDPOINT: str = "https://sensors.forest-fire.com"
     IOT_SENSOR_API_KEY: str = ""
     SENSOR_UPDATE_INTERVAL: int = 30  # 초
+    SENSOR_BATCH_MAX_ITEMS: int = 5000  # 일괄 등록 요청 1건의 최대 항목 수
+    
+    # IoT 센서 MQTT 수신 설정
+    MQTT_ENABLED: bool = False
+    MQTT_BROKER_URL: str = "mqtt://localhost:1883"
+    MQTT_TOPIC: str = "forest_fire/sensors/#"
+    MQTT_USERNAME: Optional[str] = None
+    MQTT_PASSWORD: Optional[str] = None
+    MQTT_QOS: int = 1
+    MQTT_BATCH_SIZE: int = 200
+    MQTT_BATCH_INTERVAL_SECONDS: float = 0.2
+    MQTT_MAX_QUEUE: int = 10000
+    
+    # 센서 데이터 지연 쓰기 설정
+    WRITE_BEHIND_MAX_QUEUE: int = 10000  # 가득 차면 수집이 저장 속도에 맞춰 대기
+    WRITE_BEHIND_BATCH_SIZE: int = 500
+    WRITE_BEHIND_FLUSH_INTERVAL_SECONDS: float = 1.0
+    WRITE_BEHIND_STOP_TIMEOUT_SECONDS: float = 10.0  # 종료 시 남은 데이터 저장 제한 시간
+    WRITE_BEHIND_SKIP_UNCHANGED: bool = True  # 직전 값과 같은 센서 데이터는 저장 생략
+    UNCHANGED_HEARTBEAT_SECONDS: float = 600.0  # 값이 같아도 이 간격마다 한 번은 저장
+    
+    # 다지역 수집 스케줄러 설정
+    COLLECTION_SCHEDULER_ENABLED: bool = False
+    COLLECTION_MAX_QUERY_RADIUS_KM: float = 15.0  # 겹치는 지역을 합친 조회의 최대 반경
+    COLLECTION_JITTER_RATIO: float = 0.1  # 수집 간격 무작위 분산 비율 (±)
+    COLLECTION_COALESCE_SECONDS: float = 2.0  # 이 시간 안에 도래하는 지역은 함께 조회
+    
+    # 위험도 기반 수집 주기 설정 (위험도가 높을수록 최소값에 가까워짐)
+    ADAPTIVE_POLLING_ENABLED: bool = True
+    POLL_INTERVAL_MIN_SECONDS: float = 10.0
+    POLL_INTERVAL_MAX_SECONDS: float = 300.0
+    CAMERA_POLL_INTERVAL_MIN_SECONDS: float = 5.0
+    CAMERA_POLL_INTERVAL_MAX_SECONDS: float = 300.0
+    
+    # 지역별 실시간 위험도 설정
+    REGION_RISK_WINDOW_SECONDS: float = 900.0  # 이동 구간 길이 (이보다 오래된 측정값은 제외)
+    REGION_RISK_EWMA_HALFLIFE_SECONDS: float = 120.0  # 추세(EWMA) 반감기
+    
+    # 위험도 지도 타일 설정
+    RISK_TILE_MIN_ZOOM: int = 7  # 미리 그리는 XYZ 타일 최소 줌
+    RISK_TILE_MAX_ZOOM: int = 13  # 미리 그리는 XYZ 타일 최대 줌
+    RISK_TILE_REFRESH_DELAY_SECONDS: float = 1.0  # 수집 주기 한 번의 지역 갱신을 모아 다시 그리는 지연
+    RISK_TILE_MAX_AGE_SECONDS: int = 60  # 브라우저 캐시 유지 시간 (이후 ETag 재검증)
+    
+    # 다지점 위험도 일괄 분석 설정
+    RISK_BATCH_MAX_LOCATIONS: int = 2000  # 일괄 분석 요청 1건의 최대 지점 수
+    SPATIAL_INDEX_CELL_KM: float = 2.0  # 센서 위치 공간 색인의 격자 버킷 크기
+    
+    # 위험도 분석 결과 메모이제이션 설정
+    RISK_MEMO_MAX_ENTRIES: int = 512  # 캐시할 분석 결과 수 (0 이면 사용 안 함)
+    RISK_MEMO_VALUE_DECIMALS: int = 2  # 센서 측정값 비교 소수 자릿수
+    RISK_MEMO_LOCATION_DEG: float = 0.001  # 분석 위치 비교 셀 크기 (도)
+    
+    # 화재 확산 시뮬레이션 설정
+    SPREAD_AREA_KM: float = 20.0  # 시뮬레이션 영역 한 변 길이
+    SPREAD_CELL_METERS: float = 30.0  # 격자 해상도
+    SPREAD_BASE_ROS_M_PER_MIN: float = 5.0  # 평지/무풍/기준 연료의 확산 속도
+    SPREAD_RESIDENCE_MINUTES: float = 60.0  # 셀 연소 지속 시간 (연소 중 확률 감쇠 시간 상수)
+    SPREAD_MAX_HOURS: float = 12.0  # 요청 1건의 최대 시뮬레이션 시간
+    SPREAD_ENSEMBLE_MEMBERS: int = 32  # 앙상블 기본 구성원 수
+    SPREAD_ENSEMBLE_MAX_MEMBERS: int = 256  # 요청 1건의 최대 구성원 수
+    SPREAD_ENSEMBLE_WORKERS: int = 0  # 구성원 실행 프로세스 수 (0: CPU 수)
+    SPREAD_ENSEMBLE_WIND_SPEED_SIGMA: float = 1.5  # 풍속 섭동 최소 폭 (m/s, 예보 변동이 크면 확대)
+    SPREAD_ENSEMBLE_WIND_DIRECTION_SIGMA: float = 20.0  # 풍향 섭동 최소 폭 (도)
+    SPREAD_ENSEMBLE_IGNITION_JITTER_M: float = 150.0  # 발화 지점 섭동 폭
+    SPREAD_ENSEMBLE_REFRESH_FRACTION: float = 0.25  # 작은 바람 변화 시 다시 실행할 구성원 비율
+    SPREAD_ENSEMBLE_MAX_INCIDENTS: int = 16  # 캐시할 산불 건 수
+    
+    # 지형/연료 래스터 저장소 설정
+    TERRAIN_DATA_DIR: str = "./data/terrain"  # 레이어별(elevation, fuel, landcover) 타일 디렉터리
+    TERRAIN_MAX_OPEN_TILES: int = 256  # 레이어별로 메모리 매핑을 유지할 타일 수
+    
+    # 과거 화재 발생 지수 설정
+    HISTORICAL_INDEX_PATH: str = "./data/historical_fire_index.npz"  # 셀 × 월 × 시 화재 건수 파일
+    HISTORICAL_INDEX_CELL_DEG: float = 0.1  # 집계 셀 크기 (도)
+    HISTORICAL_INCIDENT_GAP_HOURS: float = 24.0  # 같은 셀에서 이 시간 안에 이어진 탐지는 한 건으로 셈
+    HISTORICAL_PRIOR_STRENGTH: float = 20.0  # 기록이 적은 셀의 월/시 비율을 기본 분포로 당기는 사전 건수
+    HISTORICAL_PRIOR_YEARS: float = 1.0  # 셀 연간 건수에 섞는 계절/시간대 기본 위험도의 연수 분량
+    HISTORICAL_REFERENCE_RATE: float = 0.05  # 위험도 0.63 에 해당하는 (월, 시) 구간 연간 화재 건수
+    HISTORICAL_INDEX_SAVE_INTERVAL_SECONDS: int = 600  # 새 화재 반영 후 저장 최소 간격
     
     # 기상청 API 설정
     WEATHER_API_ENDPOINT: str = "https://apis.data.go.kr/1360000/VilageFcstInfoService_2.0"
     WEATHER_API_KEY: str = ""
     
+    # 업스트림 호출 한도 설정 (초당 요청 수 / 버스트)
+    RATE_LIMIT_BACKEND: str = "local"  # local | redis (워커 간 공유)
+    VISION_AI_RATE_LIMIT: float = 5.0
+    VISION_AI_RATE_BURST: int = 10
+    IOT_SENSOR_RATE_LIMIT: float = 10.0
+    IOT_SENSOR_RATE_BURST: int = 20
+    WEATHER_API_RATE_LIMIT: float = 2.0
+    WEATHER_API_RATE_BURST: int = 5
+    
+    # 업스트림 장애 격리 설정 (회로 차단기 / 보조 요청)
+    UPSTREAM_TIMEOUT_SECONDS: float = 10.0  # 보조 요청 포함 호출 1건의 최대 대기 시간
+    CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 횟수가 이 값에 도달하면 차단
+    CIRCUIT_RESET_TIMEOUT_SECONDS: float = 30.0  # 차단 후 시험 호출까지 대기 시간
+    UPSTREAM_HEDGING_ENABLED: bool = False  # 응답이 p95 보다 늦으면 같은 요청을 한 번 더 전송
+    
+    # 업스트림 장애 대비 최근 정상값 캐시 설정
+    LKG_MAX_STALENESS_SECONDS: int = 1800  # 이보다 오래된 데이터는 사용하지 않음
+    LKG_REFRESH_TIMEOUT_SECONDS: float = 3.0  # 캐시가 있을 때 업스트림 응답 대기 한도
+    WEATHER_CACHE_FRESH_SECONDS: int = 600  # 기상 데이터 재호출 없이 사용하는 시간
+    
+    # 원본 데이터(raw_data) 저장 정책
+    BLOB_STORE_DIR: str = "./data/blobs"  # 큰 필드를 내용 해시로 저장하는 디렉터리
+    BLOB_COMPRESSION_LEVEL: int = 6  # zlib 압축 수준
+    RAW_DATA_INLINE_MAX_BYTES: int = 2048  # 이보다 큰 필드는 blob 저장소로 이동
+    
     # 알림 설정
     NOTIFICATION_CHANNELS: List[str] = ["sms", "email", "push", "radio"]
     CAP_PROTOCOL_ENABLED: bool = True
     CAP_SERVER_URL: str = "https://cap.forest-fire.com"
+    SMS_API_ENDPOINT: str = "https://api.sms-service.com"
+    SMS_API_KEY: str = ""
+    PUSH_API_ENDPOINT: str = "https://fcm.googleapis.com/fcm/send"
+    FCM_SERVER_KEY: str = ""
+    RADIO_API_ENDPOINT: str = "https://api.radio-system.com"
+    RADIO_API_KEY: str = ""
     
     # 보안 설정
     SECRET_KEY: str = "your-secret-key-here"
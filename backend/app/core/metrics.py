@@ -0,0 +1,177 @@
+"""
+Prometheus 메트릭 정의
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# 업스트림 호출 한도 (토큰 버킷)
+UPSTREAM_THROTTLED_TOTAL = Counter(
+    "upstream_rate_limit_throttled_total",
+    "토큰 부족으로 대기한 업스트림 호출 수",
+    ["upstream", "priority"]
+)
+UPSTREAM_QUEUE_WAIT_SECONDS = Histogram(
+    "upstream_rate_limit_wait_seconds",
+    "업스트림 호출 토큰 대기 시간 (초)",
+    ["upstream", "priority"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+UPSTREAM_QUOTA_EXCEEDED_TOTAL = Counter(
+    "upstream_quota_exceeded_total",
+    "업스트림이 429 응답을 반환한 횟수",
+    ["upstream"]
+)
+
+# 최근 정상값 캐시
+UPSTREAM_STALE_SERVED_TOTAL = Counter(
+    "upstream_stale_served_total",
+    "업스트림 장애로 최근 정상값을 대신 사용한 횟수",
+    ["source"]
+)
+
+# 센서 데이터 지연 쓰기
+WRITE_BEHIND_QUEUE_DEPTH = Gauge(
+    "sensor_write_behind_queue_depth",
+    "저장 대기 중인 센서 데이터 수"
+)
+WRITE_BEHIND_FLUSH_SECONDS = Histogram(
+    "sensor_write_behind_flush_seconds",
+    "센서 데이터 일괄 저장 소요 시간 (초)",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+WRITE_BEHIND_ROWS_TOTAL = Counter(
+    "sensor_write_behind_rows_total",
+    "일괄 저장된 센서 데이터 행 수"
+)
+WRITE_BEHIND_FLUSH_ERRORS_TOTAL = Counter(
+    "sensor_write_behind_flush_errors_total",
+    "센서 데이터 일괄 저장 실패 횟수"
+)
+WRITE_BEHIND_DROPPED_ROWS_TOTAL = Counter(
+    "sensor_write_behind_dropped_rows_total",
+    "저장하지 못하고 버린 센서 데이터 행 수 (rejected: 영구 오류, shutdown: 중지 시간 초과)",
+    ["reason"]
+)
+
+# 수집 주기
+COLLECTION_POLL_INTERVAL_SECONDS = Gauge(
+    "collection_poll_interval_seconds",
+    "위험도 기반으로 산출된 지역별 수집 간격 (초)",
+    ["region"]
+)
+
+# 증분 수집
+COLLECTION_NOT_MODIFIED_TOTAL = Counter(
+    "collection_not_modified_total",
+    "업스트림이 304 (변경 없음)로 응답한 수집 호출 수",
+    ["source"]
+)
+WRITE_BEHIND_UNCHANGED_SKIPPED_TOTAL = Counter(
+    "sensor_write_behind_unchanged_skipped_total",
+    "직전 값과 같아 저장하지 않은 센서 데이터 수"
+)
+
+# 권고안 생성 파이프라인
+PIPELINE_QUEUE_DEPTH = Gauge(
+    "recommendation_pipeline_queue_depth",
+    "파이프라인 단계별 입력 대기열 길이",
+    ["stage"]
+)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "recommendation_pipeline_stage_seconds",
+    "파이프라인 단계별 처리 시간 (초)",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+PIPELINE_JOBS_TOTAL = Counter(
+    "recommendation_pipeline_jobs_total",
+    "파이프라인 단계별 처리 작업 수",
+    ["stage", "outcome"]
+)
+
+# MQTT 수신
+MQTT_MESSAGES_TOTAL = Counter(
+    "mqtt_ingest_readings_total",
+    "MQTT로 수신한 센서 데이터 수 (검증 결과별)",
+    ["result"]
+)
+MQTT_BATCH_SECONDS = Histogram(
+    "mqtt_ingest_batch_seconds",
+    "MQTT 수신 묶음 검증/전달 소요 시간 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+)
+
+# 업스트림 회로 차단기 / 보조 요청
+UPSTREAM_CIRCUIT_STATE = Gauge(
+    "upstream_circuit_state",
+    "업스트림 회로 상태 (0: closed, 1: half-open, 2: open)",
+    ["upstream"]
+)
+UPSTREAM_CIRCUIT_TRANSITIONS_TOTAL = Counter(
+    "upstream_circuit_transitions_total",
+    "업스트림 회로 상태 전환 횟수",
+    ["upstream", "state"]
+)
+UPSTREAM_HEDGED_REQUESTS_TOTAL = Counter(
+    "upstream_hedged_requests_total",
+    "응답 지연으로 보조 요청을 보낸 횟수",
+    ["upstream"]
+)
+
+# 원본 데이터 blob 저장소
+BLOB_STORE_BYTES_TOTAL = Counter(
+    "blob_store_bytes_total",
+    "blob 저장소에 새로 기록한 바이트 수 (압축 후)"
+)
+RAW_DATA_FIELDS_OFFLOADED_TOTAL = Counter(
+    "raw_data_fields_offloaded_total",
+    "raw_data 에서 blob 저장소로 옮긴 필드 수",
+    ["field"]
+)
+
+# 지역별 실시간 위험도
+REGION_RISK_SCORE = Gauge(
+    "region_risk_score",
+    "지역별 이동 구간 기준 현재 종합 위험도",
+    ["region"]
+)
+
+# 위험도 분석 결과 메모이제이션
+RISK_MEMO_REQUESTS_TOTAL = Counter(
+    "risk_memo_requests_total",
+    "위험도 분석 결과 캐시 조회 수 (hit/miss)",
+    ["result"]
+)
+RISK_MEMO_ENTRIES = Gauge(
+    "risk_memo_entries",
+    "캐시된 위험도 분석 결과 수"
+)
+
+# 위험도 지도 타일
+RISK_TILES_RENDERED_TOTAL = Counter(
+    "risk_tiles_rendered_total",
+    "입력이 바뀌어 다시 그린 위험도 타일 수"
+)
+RISK_TILE_REFRESH_SECONDS = Histogram(
+    "risk_tile_refresh_seconds",
+    "위험도 타일 피라미드 갱신 소요 시간 (초)",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+RISK_TILE_REQUESTS_TOTAL = Counter(
+    "risk_tile_requests_total",
+    "위험도 타일 요청 수",
+    ["result"]
+)
+
+# 화재 확산 앙상블 예측
+SPREAD_ENSEMBLE_SECONDS = Histogram(
+    "spread_ensemble_seconds",
+    "확산 앙상블 구성원 실행과 집계 소요 시간 (초)",
+    ["mode"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+SPREAD_ENSEMBLE_MEMBERS_TOTAL = Counter(
+    "spread_ensemble_members_total",
+    "실행한 확산 앙상블 구성원 수",
+    ["mode"]
+)
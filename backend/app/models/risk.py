@@ -0,0 +1,106 @@
+"""
+위험도 분석 모델
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List, Tuple
+from datetime import datetime
+
+class RiskLocation(BaseModel):
+    """분석 지점"""
+    lat: float = Field(..., ge=-90, le=90, description="위도")
+    lng: float = Field(..., ge=-180, le=180, description="경도")
+
+class RiskBatchRequest(BaseModel):
+    """다지점 위험도 일괄 분석 요청 스키마"""
+    locations: List[RiskLocation] = Field(..., min_length=1, description="분석 지점 목록")
+    radius_km: float = Field(5.0, gt=0, le=50, description="지점별 센서 반경 (km)")
+
+class LocationRiskResult(BaseModel):
+    """지점별 위험도 요약"""
+    location: RiskLocation
+    overall_risk: float = Field(..., description="종합 위험도 (0~0.99)")
+    risk_level: str = Field(..., description="위험도 등급 (low/medium/high/critical)")
+    fire_detection_risk: float
+    environmental_risk: float
+    weather_risk: float
+    historical_risk: float
+    sensor_count: int = Field(..., description="반경 내 센서 데이터 수")
+    detection_count: int = Field(..., description="화재 탐지 센서 수")
+    confidence: float = Field(..., description="분석 신뢰도")
+    spread_direction: Optional[float] = Field(None, description="예상 확산 방향 (도)")
+    spread_speed: float = Field(..., description="예상 확산 속도 (km/h)")
+    affected_radius: float = Field(..., description="영향 반경 (km)")
+    evacuation_radius: float = Field(..., description="대피 권고 반경 (km)")
+
+class RiskBatchResponse(BaseModel):
+    """다지점 위험도 일괄 분석 응답 스키마"""
+    results: List[LocationRiskResult]
+    sensor_count: int = Field(..., description="공유한 센서 스냅샷 크기")
+    analysis_timestamp: datetime
+
+class SpreadRequest(BaseModel):
+    """격자 확산 시뮬레이션 요청 스키마"""
+    ignitions: List[RiskLocation] = Field(..., min_length=1, description="발화 지점 목록")
+    duration_hours: float = Field(6.0, gt=0, description="시뮬레이션 시간 (시간)")
+    wind_speed: Optional[float] = Field(None, ge=0, description="풍속 (m/s, 미지정 시 센서/날씨 기준)")
+    wind_direction: Optional[float] = Field(None, ge=0, lt=360, description="풍향 (불어오는 방향, 도)")
+    contour_minutes: Optional[List[float]] = Field(None, description="도달 시간 등치선 시각 (분, 미지정 시 1시간 간격)")
+
+class SpreadContour(BaseModel):
+    """도달 시간 등치선"""
+    minutes: float = Field(..., description="발화 후 경과 시간 (분)")
+    polygons: List[List[Tuple[float, float]]] = Field(..., description="해당 시각까지 도달한 영역의 외곽선 [(lat, lng), ...]")
+
+class SpreadResponse(BaseModel):
+    """격자 확산 시뮬레이션 응답 스키마"""
+    wind_speed: float = Field(..., description="적용 풍속 (m/s)")
+    wind_direction: Optional[float] = Field(None, description="적용 풍향 (불어오는 방향, 도)")
+    wind_source: str = Field(..., description="바람 출처 (request/sensors/weather/calm)")
+    duration_minutes: float
+    cell_m: float = Field(..., description="격자 해상도 (m)")
+    steps: int = Field(..., description="시간 단계 수")
+    affected_area_km2: float = Field(..., description="도달 영역 면적 (km²)")
+    expected_area_km2: float = Field(..., description="연소 확률 기준 기대 면적 (km²)")
+    affected_polygon: List[Tuple[float, float]] = Field(..., description="피해 예상 영역 외곽선 [(lat, lng), ...]")
+    contours: List[SpreadContour]
+    elapsed_seconds: float
+
+class SpreadEnsembleRequest(BaseModel):
+    """확산 앙상블 예측 요청 스키마"""
+    incident_id: str = Field(..., min_length=1, max_length=100, description="산불 건 식별자 (결과 캐시 키)")
+    ignitions: List[RiskLocation] = Field(..., min_length=1, description="발화 지점 목록")
+    duration_hours: float = Field(6.0, gt=0, description="시뮬레이션 시간 (시간)")
+    members: Optional[int] = Field(None, ge=2, description="구성원 수 (미지정 시 설정값)")
+    wind_speed: Optional[float] = Field(None, ge=0, description="중심 풍속 (m/s, 미지정 시 센서/날씨 기준)")
+    wind_direction: Optional[float] = Field(None, ge=0, lt=360, description="중심 풍향 (불어오는 방향, 도)")
+    probability_levels: List[float] = Field([0.1, 0.5, 0.9], description="연소 확률 등치선 수준")
+    contour_minutes: Optional[List[float]] = Field(None, description="도달 시간 등치선 시각 (분, 미지정 시 1시간 간격)")
+
+class ProbabilityContour(BaseModel):
+    """연소 확률 등치선"""
+    probability: float = Field(..., description="연소 확률 수준")
+    polygons: List[List[Tuple[float, float]]] = Field(..., description="해당 확률 이상 영역의 외곽선 [(lat, lng), ...]")
+
+class PercentileArrival(BaseModel):
+    """백분위 도달 시간 등치선"""
+    percentile: float = Field(..., description="구성원 백분위 (해당 비율의 구성원이 도달한 시각)")
+    contours: List[SpreadContour]
+
+class SpreadEnsembleResponse(BaseModel):
+    """확산 앙상블 예측 응답 스키마"""
+    incident_id: str
+    version: int = Field(..., description="결과 갱신 횟수")
+    refreshed_members: int = Field(..., description="이번 요청에서 다시 실행한 구성원 수")
+    wind_speed: float = Field(..., description="중심 풍속 (m/s)")
+    wind_direction: Optional[float] = Field(None, description="중심 풍향 (불어오는 방향, 도)")
+    wind_source: str = Field(..., description="바람 출처 (request/sensors/weather/calm/cache)")
+    wind_speed_sigma: float = Field(..., description="풍속 섭동 폭 (m/s)")
+    wind_direction_sigma: float = Field(..., description="풍향 섭동 폭 (도)")
+    members: int
+    duration_minutes: float
+    cell_m: float = Field(..., description="격자 해상도 (m)")
+    expected_area_km2: float = Field(..., description="연소 확률 기준 기대 면적 (km²)")
+    probability_contours: List[ProbabilityContour]
+    arrival_contours: List[PercentileArrival]
+    updated_at: datetime
@@ -6,7 +6,7 @@ from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text,
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
@@ -116,6 +116,17 @@ class SensorDataResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class SensorDataItemError(BaseModel):
+    """일괄 등록 항목 오류"""
+    index: int = Field(..., description="요청 목록 내 위치")
+    errors: List[Dict[str, Any]] = Field(..., description="검증 오류 (loc, msg, type)")
+
+class SensorDataBatchResponse(BaseModel):
+    """센서 데이터 일괄 등록 응답 스키마"""
+    accepted: int = Field(..., description="저장된 항목 수")
+    rejected: int = Field(..., description="검증 실패 항목 수")
+    errors: List[SensorDataItemError] = Field(default_factory=list, description="항목별 오류")
+
 class SensorDataFilter(BaseModel):
     """센서 데이터 필터 스키마"""
     sensor_type: Optional[SensorType] = None
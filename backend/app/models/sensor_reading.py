@@ -0,0 +1,101 @@
+"""
+경량 센서 측정값 모델
+수집 → 위험도 분석 → 저장 경로에서 사용하는 __slots__ 기반 측정값 (검증 없음)
+"""
+
+from typing import Any, Dict, Optional
+
+from app.models.sensor_data import SensorData, SensorDataCreate, SensorType
+
+# SensorDataCreate 와 같은 필드 순서
+READING_FIELDS = tuple(SensorDataCreate.model_fields)
+
+class SensorReading:
+    """
+    경량 센서 측정값
+
+    SensorDataCreate / SensorData 와 같은 속성 이름을 가지므로 위험도 분석, 권고안 생성,
+    지연 쓰기 버퍼에 그대로 전달할 수 있습니다. 생성 시 값을 검증하지 않으므로
+    이미 검증된 데이터나 신뢰할 수 있는 내부 소스(합성 센서망, DB 조회 결과 등)에만 사용합니다.
+    """
+
+    __slots__ = READING_FIELDS
+
+    def __init__(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType,
+        location_lat: float,
+        location_lng: float,
+        location_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        humidity: Optional[float] = None,
+        smoke_density: Optional[float] = None,
+        wind_speed: Optional[float] = None,
+        wind_direction: Optional[float] = None,
+        air_pressure: Optional[float] = None,
+        visibility: Optional[float] = None,
+        image_url: Optional[str] = None,
+        image_analysis: Optional[Dict[str, Any]] = None,
+        fire_detected: bool = False,
+        fire_confidence: Optional[float] = None,
+        raw_data: Optional[Dict[str, Any]] = None,
+        data_quality: Optional[float] = None
+    ):
+        self.sensor_id = sensor_id
+        self.sensor_type = sensor_type
+        self.location_lat = location_lat
+        self.location_lng = location_lng
+        self.location_name = location_name
+        self.temperature = temperature
+        self.humidity = humidity
+        self.smoke_density = smoke_density
+        self.wind_speed = wind_speed
+        self.wind_direction = wind_direction
+        self.air_pressure = air_pressure
+        self.visibility = visibility
+        self.image_url = image_url
+        self.image_analysis = image_analysis
+        self.fire_detected = fire_detected
+        self.fire_confidence = fire_confidence
+        self.raw_data = raw_data
+        self.data_quality = data_quality
+
+    @classmethod
+    def from_create(cls, data: SensorDataCreate) -> "SensorReading":
+        """검증된 스키마 객체에서 변환"""
+        return cls(**data.__dict__)
+
+    @classmethod
+    def from_orm(cls, row: SensorData) -> "SensorReading":
+        """DB 조회 결과에서 변환 (sensor_type 문자열은 SensorType 으로)"""
+        reading = cls(**{name: getattr(row, name) for name in READING_FIELDS})
+        reading.sensor_type = SensorType(reading.sensor_type)
+        if reading.fire_detected is None:
+            reading.fire_detected = False
+        return reading
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in READING_FIELDS}
+
+    def to_create(self) -> SensorDataCreate:
+        """스키마 객체로 변환 (재검증 없음)"""
+        return SensorDataCreate.model_construct(**self.to_dict())
+
+    def to_row(self) -> Dict[str, Any]:
+        """sensor_data INSERT 행"""
+        row = self.to_dict()
+        row["sensor_type"] = self.sensor_type.value
+        return row
+
+    def to_orm(self) -> SensorData:
+        """저장 전 ORM 객체로 변환"""
+        return SensorData(**self.to_row())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SensorReading):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in READING_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"SensorReading({self.sensor_id!r}, {self.sensor_type.value})"
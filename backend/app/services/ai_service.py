@@ -4,13 +4,15 @@ AI 서비스 모듈 - 믿:음 LLM 기반 권고안 생성
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 import asyncio
 import httpx
+import numpy as np
 
 from app.core.config import settings
 from app.models.sensor_data import SensorData
+from app.services.sensor_columns import SensorColumns
 from app.models.ai_recommendation import (
     AIRecommendation, 
     AIRecommendationCreate, 
@@ -31,7 +33,7 @@ class AIService:
         
     async def generate_recommendations(
         self, 
-        sensor_data: List[SensorData],
+        sensor_data: Union[List[SensorData], SensorColumns],
         fire_risk_level: float,
         location_info: Dict[str, Any]
     ) -> List[AIRecommendationCreate]:
@@ -39,7 +41,7 @@ class AIService:
         센서 데이터를 기반으로 기관별 권고안 생성
         
         Args:
-            sensor_data: 센서 데이터 리스트
+            sensor_data: 센서 데이터 리스트 (또는 위험도 분석에 사용한 SensorColumns)
             fire_risk_level: 화재 위험도 (0-1)
             location_info: 위치 정보
             
@@ -83,7 +85,7 @@ class AIService:
             logger.error(f"❌ AI 권고안 생성 실패: {str(e)}")
             raise
     
-    async def _analyze_sensor_data(self, sensor_data: List[SensorData]) -> Dict[str, Any]:
+    async def _analyze_sensor_data(self, sensor_data: Union[List[SensorData], SensorColumns]) -> Dict[str, Any]:
         """센서 데이터 분석"""
         analysis = {
             "fire_detected": False,
@@ -93,42 +95,46 @@ class AIService:
             "recommended_actions": []
         }
         
+        # 위험도 분석과 같은 집계값 사용 (SensorColumns 를 받으면 다시 계산하지 않음)
+        columns = SensorColumns.of(sensor_data)
+        stats = columns.stats
+        
         # 화재 탐지 여부 확인
-        fire_detections = [data for data in sensor_data if data.fire_detected]
-        if fire_detections:
+        if stats.fire.count:
             analysis["fire_detected"] = True
-            analysis["fire_confidence"] = max([d.fire_confidence or 0 for d in fire_detections])
+            analysis["fire_confidence"] = stats.fire.max
         
         # 환경 조건 분석
-        temp_data = [d for d in sensor_data if d.temperature is not None]
-        humidity_data = [d for d in sensor_data if d.humidity is not None]
-        smoke_data = [d for d in sensor_data if d.smoke_density is not None]
-        wind_data = [d for d in sensor_data if d.wind_speed is not None]
+        temperature = stats["temperature"]
+        humidity = stats["humidity"]
+        smoke = stats["smoke_density"]
+        wind = stats["wind_speed"]
         
-        if temp_data:
+        if temperature.count:
             analysis["environmental_conditions"]["temperature"] = {
-                "avg": sum(d.temperature for d in temp_data) / len(temp_data),
-                "max": max(d.temperature for d in temp_data),
-                "min": min(d.temperature for d in temp_data)
+                "avg": temperature.mean,
+                "max": temperature.max,
+                "min": temperature.min
             }
         
-        if humidity_data:
+        if humidity.count:
             analysis["environmental_conditions"]["humidity"] = {
-                "avg": sum(d.humidity for d in humidity_data) / len(humidity_data),
-                "min": min(d.humidity for d in humidity_data)
+                "avg": humidity.mean,
+                "min": humidity.min
             }
         
-        if smoke_data:
+        if smoke.count:
             analysis["environmental_conditions"]["smoke_density"] = {
-                "avg": sum(d.smoke_density for d in smoke_data) / len(smoke_data),
-                "max": max(d.smoke_density for d in smoke_data)
+                "avg": smoke.mean,
+                "max": smoke.max
             }
         
-        if wind_data:
+        if wind.count:
+            directions = columns["wind_direction"][~np.isnan(columns["wind_speed"])]
             analysis["environmental_conditions"]["wind"] = {
-                "avg_speed": sum(d.wind_speed for d in wind_data) / len(wind_data),
-                "max_speed": max(d.wind_speed for d in wind_data),
-                "directions": [d.wind_direction for d in wind_data if d.wind_direction]
+                "avg_speed": wind.mean,
+                "max_speed": wind.max,
+                "directions": directions[~np.isnan(directions) & (directions != 0)].tolist()
             }
         
         # 위험 요인 분석
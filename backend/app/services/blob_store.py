@@ -0,0 +1,189 @@
+"""
+원본 데이터 blob 저장소 모듈
+raw_data 의 큰 필드(base64 이미지 등)를 내용 해시로 주소 지정한 파일에 압축 저장하고,
+행에는 참조와 작은 메타데이터만 남기는 저장 정책
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import BLOB_STORE_BYTES_TOTAL, RAW_DATA_FIELDS_OFFLOADED_TOTAL
+
+logger = logging.getLogger(__name__)
+
+# 참조 표시 키 (raw_data 안의 {"$blob": <해시>, ...})
+BLOB_REF_KEY = "$blob"
+
+class BlobStore:
+    """
+    내용 주소 기반 blob 저장소 (로컬 파일시스템)
+
+    같은 내용은 같은 해시 경로에 한 번만 저장됩니다. 압축해도 줄지 않는 내용(JPEG 등)은
+    그대로 저장하고 파일 확장자로 구분합니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, compression_level: Optional[int] = None):
+        self.root = Path(root or settings.BLOB_STORE_DIR)
+        self.compression_level = (
+            compression_level if compression_level is not None
+            else settings.BLOB_COMPRESSION_LEVEL
+        )
+
+    def _path(self, digest: str, compressed: bool) -> Path:
+        suffix = ".z" if compressed else ".bin"
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{suffix}"
+
+    def exists(self, digest: str) -> bool:
+        return self._path(digest, True).exists() or self._path(digest, False).exists()
+
+    def put(self, data: bytes) -> str:
+        """내용 저장 후 해시 반환 (이미 있으면 쓰지 않음)"""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.exists(digest):
+            return digest
+
+        compressed = zlib.compress(data, self.compression_level)
+        use_compressed = len(compressed) < len(data)
+        payload = compressed if use_compressed else data
+        path = self._path(digest, use_compressed)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 절반만 쓰인 파일을 보지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        BLOB_STORE_BYTES_TOTAL.inc(len(payload))
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """내용 조회 (없으면 FileNotFoundError)"""
+        path = self._path(digest, True)
+        if path.exists():
+            return zlib.decompress(path.read_bytes())
+        return self._path(digest, False).read_bytes()
+
+class PayloadPolicy:
+    """
+    raw_data 저장 정책
+
+    - blob_fields 에 해당하는 필드와 직렬화 크기가 max_inline_bytes 를 넘는 필드는 blob 저장소로 옮기고
+      {"$blob": 해시, "bytes": 크기, "encoding": ...} 참조로 대체
+    - shared=True 로 호출하면 dict 전체를 blob 으로 저장하고 raw_data 자체를 참조로 대체
+      (여러 행이 같은 원본을 공유하는 경우, 같은 내용은 한 번만 저장됨)
+    """
+
+    def __init__(
+        self,
+        store: Optional[BlobStore] = None,
+        max_inline_bytes: Optional[int] = None,
+        blob_fields: Iterable[str] = ("image_data",)
+    ):
+        self.store = store or BlobStore()
+        self.max_inline_bytes = max_inline_bytes or settings.RAW_DATA_INLINE_MAX_BYTES
+        self.blob_fields = frozenset(blob_fields)
+
+    def _encode(self, key: str, value: Any) -> Optional[Tuple[bytes, str]]:
+        """옮길 필드면 (저장할 바이트, 인코딩) 반환"""
+        if isinstance(value, str):
+            if key in self.blob_fields:
+                # base64 문자열은 디코딩해 원본 바이트로 저장 (약 25% 절감)
+                try:
+                    return base64.b64decode(value, validate=True), "base64"
+                except (binascii.Error, ValueError):
+                    return value.encode(), "utf-8"
+            if len(value) > self.max_inline_bytes:
+                return value.encode(), "utf-8"
+            return None
+
+        if key in self.blob_fields or isinstance(value, (dict, list)):
+            encoded = json.dumps(value, ensure_ascii=False, default=str).encode()
+            if key in self.blob_fields or len(encoded) > self.max_inline_bytes:
+                return encoded, "json"
+        return None
+
+    def _split(self, raw: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Tuple[bytes, str]]]:
+        inline, offloaded = {}, {}
+        for key, value in raw.items():
+            encoded = self._encode(key, value) if value is not None else None
+            if encoded is None:
+                inline[key] = value
+            else:
+                offloaded[key] = encoded
+        return inline, offloaded
+
+    def _reference(self, key: str, data: bytes, encoding: str) -> Dict[str, Any]:
+        RAW_DATA_FIELDS_OFFLOADED_TOTAL.labels(key).inc()
+        return {BLOB_REF_KEY: self.store.put(data), "bytes": len(data), "encoding": encoding}
+
+    def _store(self, inline: Dict[str, Any], offloaded: Dict[str, Tuple[bytes, str]]) -> Dict[str, Any]:
+        result = dict(inline)
+        for key, (data, encoding) in offloaded.items():
+            result[key] = self._reference(key, data, encoding)
+        return result
+
+    def apply_sync(self, raw: Optional[Dict[str, Any]], shared: bool = False) -> Optional[Dict[str, Any]]:
+        """저장 정책 적용 (동기 버전)"""
+        if raw is None:
+            return None
+        if shared:
+            data = json.dumps(raw, ensure_ascii=False, default=str, sort_keys=True).encode()
+            return self._reference("shared", data, "json")
+
+        inline, offloaded = self._split(raw)
+        return self._store(inline, offloaded) if offloaded else inline
+
+    async def apply(self, raw: Optional[Dict[str, Any]], shared: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        저장 정책 적용
+
+        옮길 필드가 없으면 파일 입출력 없이 그대로 반환하고,
+        있으면 작업자 스레드에서 blob 을 기록합니다.
+        """
+        if raw is None:
+            return None
+        if not shared:
+            inline, offloaded = self._split(raw)
+            if not offloaded:
+                return inline
+            return await asyncio.to_thread(self._store, inline, offloaded)
+        return await asyncio.to_thread(self.apply_sync, raw, True)
+
+    def _load(self, ref: Dict[str, Any]) -> Any:
+        data = self.store.get(ref[BLOB_REF_KEY])
+        encoding = ref.get("encoding")
+        if encoding == "base64":
+            return base64.b64encode(data).decode()
+        if encoding == "json":
+            return json.loads(data)
+        return data.decode()
+
+    def hydrate(self, raw: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """참조를 원래 값으로 복원 (base64 필드는 다시 base64 문자열로)"""
+        if raw is None:
+            return None
+        if BLOB_REF_KEY in raw:
+            return self._load(raw)
+        return {
+            key: self._load(value) if isinstance(value, dict) and BLOB_REF_KEY in value else value
+            for key, value in raw.items()
+        }
+
+# 전역 저장 정책 인스턴스
+payload_policy = PayloadPolicy()
@@ -0,0 +1,216 @@
+"""
+업스트림 회로 차단기 모듈
+업스트림별 연속 실패 시 호출을 즉시 실패시키고(open), 일정 시간 후 시험 호출(half-open)로 복구를 확인하며,
+응답 지연 p95 를 기준으로 보조 요청(hedged request)을 보내 꼬리 지연을 줄임
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import (
+    UPSTREAM_CIRCUIT_STATE,
+    UPSTREAM_CIRCUIT_TRANSITIONS_TOTAL,
+    UPSTREAM_HEDGED_REQUESTS_TOTAL
+)
+from app.services.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+class CircuitState(IntEnum):
+    """회로 상태 (메트릭 값)"""
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않음"""
+
+    def __init__(self, upstream: str, retry_in: float):
+        super().__init__(f"{upstream} 회로 차단 중 ({retry_in:.0f}초 후 재시도)")
+        self.upstream = upstream
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """업스트림 회로 차단기"""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        UPSTREAM_CIRCUIT_STATE.labels(name).set(self.state)
+
+    def _transition(self, state: CircuitState):
+        if state == self.state:
+            return
+        logger.warning(f"🔌 {self.name} 회로 상태 변경: {self.state.name} → {state.name}")
+        self.state = state
+        UPSTREAM_CIRCUIT_STATE.labels(self.name).set(state)
+        UPSTREAM_CIRCUIT_TRANSITIONS_TOTAL.labels(self.name, state.name.lower()).inc()
+
+    def before_call(self):
+        """호출 가능 여부 확인 (불가하면 CircuitOpenError)"""
+        if self.state == CircuitState.OPEN:
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_timeout_seconds:
+                raise CircuitOpenError(self.name, self.reset_timeout_seconds - elapsed)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            # 시험 호출은 한 번에 하나만
+            if self._probing:
+                raise CircuitOpenError(self.name, 0.0)
+            self._probing = True
+
+    def release(self):
+        """결과 없이 끝난 호출 (취소 등) 정리"""
+        self._probing = False
+
+    def record_success(self):
+        self._probing = False
+        self.failures = 0
+        self._transition(CircuitState.CLOSED)
+
+    def record_failure(self):
+        self._probing = False
+        self.failures += 1
+        if self.state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+class LatencyTracker:
+    """최근 응답 시간 기록 (p95 산출용)"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+RequestFactory = Callable[[], Awaitable[httpx.Response]]
+
+class UpstreamGuard:
+    """업스트림별 회로 차단 + 시간 제한 + 보조 요청"""
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout_seconds: Optional[float] = None,
+        timeout_seconds: Optional[float] = None,
+        hedging_enabled: Optional[bool] = None,
+        hedge_min_samples: int = 20
+    ):
+        self.failure_threshold = failure_threshold or settings.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout_seconds = reset_timeout_seconds or settings.CIRCUIT_RESET_TIMEOUT_SECONDS
+        self.timeout_seconds = timeout_seconds or settings.UPSTREAM_TIMEOUT_SECONDS
+        self.hedging_enabled = (
+            hedging_enabled if hedging_enabled is not None
+            else settings.UPSTREAM_HEDGING_ENABLED
+        )
+        self.hedge_min_samples = hedge_min_samples
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+
+    def breaker(self, upstream: str) -> CircuitBreaker:
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            breaker = CircuitBreaker(upstream, self.failure_threshold, self.reset_timeout_seconds)
+            self._breakers[upstream] = breaker
+        return breaker
+
+    def latency(self, upstream: str) -> LatencyTracker:
+        return self._latencies.setdefault(upstream, LatencyTracker())
+
+    def hedge_delay(self, upstream: str) -> Optional[float]:
+        """보조 요청 지연 (최근 응답 p95, 표본이 부족하면 None)"""
+        tracker = self.latency(upstream)
+        if len(tracker) < self.hedge_min_samples:
+            return None
+        return tracker.percentile(0.95)
+
+    async def _hedged(self, upstream: str, request: RequestFactory) -> httpx.Response:
+        delay = self.hedge_delay(upstream)
+        primary = asyncio.create_task(request())
+        if delay is None:
+            return await primary
+
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            # 호출 한도에 여유가 있을 때만 보조 요청
+            if not done and await rate_limiter.try_acquire(upstream):
+                UPSTREAM_HEDGED_REQUESTS_TOTAL.labels(upstream).inc()
+                tasks.add(asyncio.create_task(request()))
+
+            # 먼저 정상 응답한 요청을 사용, 모두 실패하면 마지막 오류 전달
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    if task.exception() is None and task.result().status_code < 500:
+                        return task.result()
+                    if not tasks:
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def call(self, upstream: str, request: RequestFactory, hedge: Optional[bool] = None) -> httpx.Response:
+        """
+        업스트림 호출
+
+        회로가 열려 있으면 즉시 CircuitOpenError, timeout_seconds 를 넘기면 asyncio.TimeoutError 가 발생합니다.
+        예외와 5xx 응답은 실패로 집계합니다 (429 는 호출 한도 문제이므로 제외).
+
+        Args:
+            upstream: 업스트림 이름
+            request: 요청 생성 함수 (보조 요청 시 한 번 더 호출됨, 멱등 요청만 사용).
+                첫 요청의 호출 한도 토큰은 호출자가 미리 획득합니다.
+            hedge: 보조 요청 사용 여부 (미지정 시 UPSTREAM_HEDGING_ENABLED)
+        """
+        breaker = self.breaker(upstream)
+        breaker.before_call()
+
+        hedge = self.hedging_enabled if hedge is None else hedge
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self._hedged(upstream, request) if hedge else request(),
+                timeout=self.timeout_seconds
+            )
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            self.latency(upstream).record(time.monotonic() - started)
+        return response
+
+# 전역 업스트림 보호 인스턴스
+upstream_guard = UpstreamGuard()
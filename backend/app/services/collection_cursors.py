@@ -0,0 +1,137 @@
+"""
+증분 수집 커서 모듈
+소스/조회 단위로 업스트림 커서(ETag, 시퀀스)와 직전 응답을 보관해 변경분만 요청하고,
+커서를 지원하지 않는 업스트림은 항목 내용 해시로 변경 여부를 판별
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.models.sensor_data import SensorDataCreate
+from app.models.sensor_reading import SensorReading
+
+def item_digest(item: Dict[str, Any]) -> str:
+    """업스트림 항목 내용 해시"""
+    encoded = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+class SourceCursor:
+    """
+    소스/조회 단위 증분 수집 상태
+
+    - ETag: 다음 요청에 If-None-Match 로 전달, 304 응답이면 직전 항목을 그대로 사용
+    - next_cursor: 업스트림이 응답에 시퀀스/마지막 시각을 주면 다음 요청에 cursor 로 전달하고
+      응답 항목을 변경분으로 보아 직전 항목에 병합
+    - 그 외에는 응답 전체를 새 목록으로 사용
+    """
+
+    def __init__(self):
+        self.etag: Optional[str] = None
+        self.cursor: Optional[str] = None
+        self._items: Dict[str, Dict[str, Any]] = {}
+        # 항목 ID → (내용 해시, 변환된 센서 데이터)
+        self._parsed: Dict[str, Tuple[str, SensorDataCreate]] = {}
+
+    def request_headers(self) -> Dict[str, str]:
+        return {"If-None-Match": self.etag} if self.etag else {}
+
+    def request_params(self) -> Dict[str, str]:
+        return {"cursor": self.cursor} if self.cursor else {}
+
+    def items(self) -> List[Dict[str, Any]]:
+        """현재 전체 항목"""
+        return list(self._items.values())
+
+    def apply(self, etag: Optional[str], payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """200 응답 반영 후 전체 항목 반환"""
+        data = payload.get("data", [])
+        is_delta = self.cursor is not None and "next_cursor" in payload
+
+        if not is_delta:
+            self._items = {}
+        for deleted_id in payload.get("deleted", []) if is_delta else []:
+            self._items.pop(str(deleted_id), None)
+        for item in data:
+            self._items[str(item.get("id"))] = item
+
+        self.etag = etag
+        self.cursor = payload.get("next_cursor")
+
+        live_ids = set(self._items)
+        self._parsed = {k: v for k, v in self._parsed.items() if k in live_ids}
+        return self.items()
+
+    def cached_reading(self, item: Dict[str, Any]) -> Tuple[str, Optional[SensorDataCreate]]:
+        """
+        내용이 바뀌지 않은 항목의 직전 변환 결과 조회 (이미지 재분석 생략)
+
+        Returns:
+            (내용 해시, 직전 변환 결과 또는 None)
+        """
+        digest = item_digest(item)
+        cached = self._parsed.get(str(item.get("id")))
+        if cached is not None and cached[0] == digest:
+            return digest, cached[1]
+        return digest, None
+
+    def remember(self, item: Dict[str, Any], digest: str, reading: SensorDataCreate):
+        self._parsed[str(item.get("id"))] = (digest, reading)
+
+class CursorStore:
+    """(소스, 조회 키) 별 커서 저장소"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._cursors: "OrderedDict[Tuple[str, Hashable], SourceCursor]" = OrderedDict()
+
+    def get(self, source: str, key: Hashable) -> SourceCursor:
+        cache_key = (source, key)
+        cursor = self._cursors.get(cache_key)
+        if cursor is None:
+            cursor = SourceCursor()
+            self._cursors[cache_key] = cursor
+            while len(self._cursors) > self.max_entries:
+                self._cursors.popitem(last=False)
+        self._cursors.move_to_end(cache_key)
+        return cursor
+
+class ChangeFilter:
+    """
+    직전에 저장한 값과 같은 센서 데이터 제외
+
+    같은 센서의 값이 그대로여도 heartbeat_seconds 마다 한 번은 통과시켜 수신 상태를 남깁니다.
+    """
+
+    def __init__(self, heartbeat_seconds: Optional[float] = None, max_entries: int = 100000):
+        self.heartbeat_seconds = (
+            heartbeat_seconds if heartbeat_seconds is not None
+            else settings.UNCHANGED_HEARTBEAT_SECONDS
+        )
+        self.max_entries = max_entries
+        self._seen: "OrderedDict[Tuple[str, float, float], Tuple[int, float]]" = OrderedDict()
+
+    def is_changed(self, reading: Union[SensorDataCreate, SensorReading]) -> bool:
+        key = (reading.sensor_id, reading.location_lat, reading.location_lng)
+        if not isinstance(reading, BaseModel):
+            reading = reading.to_create()
+        fingerprint = hash(reading.model_dump_json(exclude={"data_quality"}))
+        now = time.monotonic()
+
+        seen = self._seen.get(key)
+        if seen is not None and seen[0] == fingerprint and now - seen[1] < self.heartbeat_seconds:
+            return False
+
+        self._seen[key] = (fingerprint, now)
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return True
+
+# 전역 커서 저장소 인스턴스
+cursor_store = CursorStore()
@@ -0,0 +1,415 @@
+"""
+다지역 수집 스케줄러 모듈
+감시 지역 레지스트리를 기준으로 겹치는 반경 조회를 최소한의 업스트림 호출로 합치고,
+지역별 타이머를 분산시켜 수집한 뒤 결과를 각 지역에 나눠 전달
+"""
+
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.models.sensor_data import SensorDataCreate
+from app.services.polling_cadence import PollingCadence
+from app.services.rate_limiter import CallPriority
+from app.services.spatial_index import KM_PER_DEG_LAT, SpatialIndex
+
+logger = logging.getLogger(__name__)
+
+# 푸시 수신 데이터에서 즉시 수집을 앞당기는 연기 농도
+PUSH_SMOKE_ALERT_DENSITY = 50.0
+
+class MonitoredRegion:
+    """감시 지역"""
+
+    def __init__(
+        self,
+        name: str,
+        lat: float,
+        lng: float,
+        radius_km: float = 5.0,
+        interval_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.lat = lat
+        self.lng = lng
+        self.radius_km = radius_km
+        self.interval_seconds = interval_seconds or settings.SENSOR_UPDATE_INTERVAL
+
+    @property
+    def location(self) -> Dict[str, float]:
+        return {"lat": self.lat, "lng": self.lng}
+
+    def distance_km(self, lat: float, lng: float) -> float:
+        """지역 중심까지의 거리 (km, 평면 근사)"""
+        dy = (lat - self.lat) * KM_PER_DEG_LAT
+        dx = (lng - self.lng) * KM_PER_DEG_LAT * math.cos(math.radians(self.lat))
+        return math.hypot(dx, dy)
+
+    def contains(self, lat: float, lng: float) -> bool:
+        return self.distance_km(lat, lng) <= self.radius_km
+
+    def __repr__(self) -> str:
+        return f"MonitoredRegion({self.name!r}, {self.lat}, {self.lng}, {self.radius_km}km)"
+
+class RegionRegistry:
+    """감시 지역 레지스트리"""
+
+    def __init__(self, regions: Optional[List[MonitoredRegion]] = None):
+        self._regions: Dict[str, MonitoredRegion] = {}
+        for region in regions or []:
+            self.register(region)
+
+    def register(self, region: MonitoredRegion) -> MonitoredRegion:
+        self._regions[region.name] = region
+        return region
+
+    def unregister(self, name: str):
+        self._regions.pop(name, None)
+
+    def get(self, name: str) -> Optional[MonitoredRegion]:
+        return self._regions.get(name)
+
+    def __iter__(self) -> Iterator[MonitoredRegion]:
+        return iter(list(self._regions.values()))
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+def default_regions() -> List[MonitoredRegion]:
+    """기본 감시 지역 (주요 산악 지역)"""
+    return [
+        MonitoredRegion("용문산", 37.5447, 127.4857),
+        MonitoredRegion("청계산", 37.4236, 127.0489),
+        MonitoredRegion("관악산", 37.4447, 126.9637),
+        MonitoredRegion("청평", 37.7451, 127.4251)
+    ]
+
+class CollectionQuery:
+    """업스트림 반경 조회 1건과 그 결과를 받을 지역 목록"""
+
+    def __init__(self, lat: float, lng: float, radius_km: float, regions: List[MonitoredRegion]):
+        self.lat = lat
+        self.lng = lng
+        self.radius_km = radius_km
+        self.regions = regions
+
+    @property
+    def location(self) -> Dict[str, float]:
+        return {"lat": self.lat, "lng": self.lng}
+
+    def __repr__(self) -> str:
+        names = ", ".join(region.name for region in self.regions)
+        return f"CollectionQuery({self.lat:.4f}, {self.lng:.4f}, {self.radius_km:.1f}km, [{names}])"
+
+def _enclosing_circle(
+    a: Tuple[float, float, float],
+    b: Tuple[float, float, float]
+) -> Tuple[float, float, float]:
+    """두 원 (x, y, r) 을 모두 포함하는 최소 원"""
+    (ax, ay, ar), (bx, by, br) = a, b
+    d = math.hypot(bx - ax, by - ay)
+    if d + br <= ar:
+        return a
+    if d + ar <= br:
+        return b
+    r = (d + ar + br) / 2
+    t = (r - ar) / d
+    return ax + (bx - ax) * t, ay + (by - ay) * t, r
+
+def plan_queries(
+    regions: List[MonitoredRegion],
+    max_radius_km: Optional[float] = None
+) -> List[CollectionQuery]:
+    """
+    겹치는 지역 반경을 합쳐 업스트림 조회 목록 생성
+
+    서로 겹치는 원은 둘을 모두 포함하는 원의 반경이 max_radius_km 이하일 때 하나의 조회로 합칩니다.
+    """
+    if not regions:
+        return []
+
+    max_radius_km = max_radius_km or settings.COLLECTION_MAX_QUERY_RADIUS_KM
+    # 평면 근사 좌표 (km)
+    ref_lat = sum(region.lat for region in regions) / len(regions)
+    km_per_deg_lng = KM_PER_DEG_LAT * math.cos(math.radians(ref_lat))
+
+    groups: List[Tuple[Tuple[float, float, float], List[MonitoredRegion]]] = []
+    for region in sorted(regions, key=lambda r: -r.radius_km):
+        circle = (region.lng * km_per_deg_lng, region.lat * KM_PER_DEG_LAT, region.radius_km)
+        best = None
+        for i, (group_circle, _) in enumerate(groups):
+            gap = math.hypot(circle[0] - group_circle[0], circle[1] - group_circle[1])
+            if gap >= circle[2] + group_circle[2]:
+                continue
+            merged = _enclosing_circle(group_circle, circle)
+            if merged[2] <= max_radius_km and (best is None or merged[2] < best[1][2]):
+                best = (i, merged)
+
+        if best is None:
+            groups.append((circle, [region]))
+        else:
+            i, merged = best
+            groups[i] = (merged, groups[i][1] + [region])
+
+    queries = []
+    for (x, y, _), members in groups:
+        lat, lng = y / KM_PER_DEG_LAT, x / km_per_deg_lng
+        # 투영 오차를 고려해 각 지역 기준 거리로 반경 재계산
+        radius_km = max(region.distance_km(lat, lng) + region.radius_km for region in members)
+        queries.append(CollectionQuery(lat, lng, radius_km, members))
+    return queries
+
+def _readings_index(readings: List[SensorDataCreate]) -> SpatialIndex:
+    """조회 결과의 공간 색인 (슬롯 번호는 목록 위치)"""
+    return SpatialIndex.from_points(
+        np.array([data.location_lat for data in readings], dtype=float),
+        np.array([data.location_lng for data in readings], dtype=float)
+    )
+
+RegionCallback = Callable[[MonitoredRegion, List[SensorDataCreate]], Awaitable[None]]
+
+class CollectionScheduler:
+    """다지역 수집 스케줄러"""
+
+    def __init__(
+        self,
+        registry: Optional[RegionRegistry] = None,
+        service=None,
+        buffer=None,
+        max_query_radius_km: Optional[float] = None,
+        jitter_ratio: Optional[float] = None,
+        coalesce_seconds: Optional[float] = None,
+        seed: Optional[int] = None,
+        cadence: Optional[PollingCadence] = None,
+        risk_tracker=None
+    ):
+        if service is None:
+            from app.services.data_collection_service import DataCollectionService
+            service = DataCollectionService()
+        if buffer is None:
+            from app.services.write_behind import write_behind_buffer
+            buffer = write_behind_buffer
+        if risk_tracker is None:
+            from app.services.region_risk import region_risk_tracker
+            risk_tracker = region_risk_tracker
+
+        self.registry = registry if registry is not None else RegionRegistry(default_regions())
+        self.service = service
+        self.buffer = buffer
+        self.max_query_radius_km = max_query_radius_km or settings.COLLECTION_MAX_QUERY_RADIUS_KM
+        self.jitter_ratio = jitter_ratio if jitter_ratio is not None else settings.COLLECTION_JITTER_RATIO
+        self.coalesce_seconds = (
+            coalesce_seconds if coalesce_seconds is not None
+            else settings.COLLECTION_COALESCE_SECONDS
+        )
+        self._rng = random.Random(seed)
+        # 위험도 기반 주기 조정 (비활성화 시 지역별 고정 간격)
+        self.cadence = cadence
+        if self.cadence is None and settings.ADAPTIVE_POLLING_ENABLED:
+            self.cadence = PollingCadence()
+        # 지역별 실시간 위험도 (수집/푸시 수신 시 갱신)
+        self.risk_tracker = risk_tracker
+        self._subscribers: List[RegionCallback] = []
+        self._next_due: Dict[str, float] = {}
+        self._in_flight: Set[str] = set()
+        self._cycles: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        # 지역별 최근 수집 결과
+        self.latest: Dict[str, List[SensorDataCreate]] = {}
+
+    def subscribe(self, callback: RegionCallback):
+        """지역별 수집 결과 수신 등록"""
+        self._subscribers.append(callback)
+
+    def _next_delay(self, region: MonitoredRegion) -> float:
+        interval = region.interval_seconds
+        if self.cadence is not None:
+            interval = self.cadence.region_interval(region.name, region.interval_seconds)
+        jitter = self._rng.uniform(-self.jitter_ratio, self.jitter_ratio)
+        return interval * (1 + jitter)
+
+    async def _update_cadence(self, region: MonitoredRegion, region_data: List[SensorDataCreate]):
+        self.cadence.observe_readings(region.name, region_data)
+        if not region_data:
+            return
+
+        # 전체 목록 재분석 없이 이동 구간 상태에서 위험도 산출 (날씨는 수집 주기마다 갱신)
+        await self.risk_tracker.refresh_weather(region.name, region.location)
+        risk = self.risk_tracker.risk(region.name)
+        self.cadence.observe_risk(region.name, risk["overall_risk"])
+
+    def _priority(self, query: CollectionQuery) -> CallPriority:
+        flagged = self.service.fire_flagged_locations
+        if any(self.service._location_key(region.location) in flagged for region in query.regions):
+            return CallPriority.FIRE
+        return CallPriority.NORMAL
+
+    async def _collect_query(self, query: CollectionQuery) -> Dict[str, List[SensorDataCreate]]:
+        priority = self._priority(query)
+        readings = [
+            data async for data in self.service.stream_all_data(
+                query.location, query.radius_km, priority, include_weather=False
+            )
+        ]
+
+        # 저장은 조회 단위로 한 번만 (겹치는 지역에 중복 저장하지 않음)
+        for data in readings:
+            await self.buffer.put(data)
+
+        results = {}
+        index = _readings_index(readings)
+        for region in query.regions:
+            slots = np.sort(index.radius_slots(region.lat, region.lng, region.radius_km))
+            region_data = [readings[slot] for slot in slots]
+            # 기상 데이터는 격자 단위 캐시를 거치므로 지역별로 조회해도 중복 호출되지 않음
+            weather_data = await self.service._collect_weather_data(region.location, priority)
+            for data in weather_data:
+                await self.buffer.put(data)
+            results[region.name] = region_data + weather_data
+        return results
+
+    async def run_once(self, regions: Optional[List[MonitoredRegion]] = None) -> Dict[str, List[SensorDataCreate]]:
+        """
+        지정 지역 (미지정 시 전체) 1회 수집
+
+        Returns:
+            지역 이름 → 해당 지역 반경 내 센서 데이터
+        """
+        regions = list(regions if regions is not None else self.registry)
+        queries = plan_queries(regions, self.max_query_radius_km)
+        logger.info(f"🗺️ {len(regions)}개 지역 수집 - 업스트림 조회 {len(queries)}건")
+
+        outcomes = await asyncio.gather(
+            *(self._collect_query(query) for query in queries),
+            return_exceptions=True
+        )
+
+        results: Dict[str, List[SensorDataCreate]] = {}
+        for query, outcome in zip(queries, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"지역 수집 실패 {query}: {str(outcome)}")
+                continue
+            results.update(outcome)
+
+        for region in regions:
+            if region.name not in results:
+                continue
+            region_data = results[region.name]
+            self.latest[region.name] = region_data
+            self.risk_tracker.observe(region.name, region_data)
+
+            if self.cadence is not None:
+                try:
+                    await self._update_cadence(region, region_data)
+                except Exception as e:
+                    logger.error(f"{region.name} 수집 주기 갱신 실패: {str(e)}")
+
+            location_key = self.service._location_key(region.location)
+            if any(data.fire_detected for data in region_data):
+                self.service.fire_flagged_locations.add(location_key)
+            else:
+                self.service.fire_flagged_locations.discard(location_key)
+
+            for callback in self._subscribers:
+                try:
+                    await callback(region, region_data)
+                except Exception as e:
+                    logger.error(f"{region.name} 수집 결과 처리 실패: {str(e)}")
+
+        return results
+
+    async def ingest(self, readings: List[SensorDataCreate]):
+        """
+        푸시 수신 센서 데이터 반영 (MQTT 등)
+
+        지역별 최근 데이터에 병합하고, 화재 징후가 있는 지역은 다음 수집을 즉시 앞당깁니다.
+        """
+        now = time.monotonic()
+        index = _readings_index(readings)
+        for region in self.registry:
+            slots = np.sort(index.radius_slots(region.lat, region.lng, region.radius_km))
+            region_data = [readings[slot] for slot in slots]
+            if not region_data:
+                continue
+
+            merged = {data.sensor_id: data for data in self.latest.get(region.name, [])}
+            merged.update((data.sensor_id, data) for data in region_data)
+            self.latest[region.name] = list(merged.values())
+
+            # 푸시 수신 측정값마다 지역 위험도 재산출
+            self.risk_tracker.observe(region.name, region_data)
+            if self.cadence is not None:
+                self.cadence.observe_risk(region.name, self.risk_tracker.risk(region.name)["overall_risk"])
+
+            if any(data.fire_detected or (data.smoke_density or 0) > PUSH_SMOKE_ALERT_DENSITY for data in region_data):
+                self.service.fire_flagged_locations.add(self.service._location_key(region.location))
+                self._next_due[region.name] = now
+
+    async def _run_cycle(self, regions: List[MonitoredRegion]):
+        started = time.monotonic()
+        try:
+            await self.run_once(regions)
+            # 이번 수집 결과로 조정된 간격을 반영해 다음 수집 시각 재설정
+            for region in regions:
+                self._next_due[region.name] = started + self._next_delay(region)
+        except Exception as e:
+            logger.error(f"지역 수집 주기 오류: {str(e)}")
+        finally:
+            self._in_flight.difference_update(region.name for region in regions)
+
+    async def _run(self):
+        while True:
+            now = time.monotonic()
+            regions = list(self.registry)
+            for region in regions:
+                # 첫 수집 시각을 주기 안에서 무작위로 분산
+                self._next_due.setdefault(
+                    region.name, now + self._rng.uniform(0, region.interval_seconds)
+                )
+
+            # 곧 도래하는 지역까지 묶어서 함께 조회 (겹침 병합 기회 확보)
+            due = [
+                region for region in regions
+                if region.name not in self._in_flight
+                and self._next_due[region.name] <= now + self.coalesce_seconds
+            ]
+            if due:
+                for region in due:
+                    self._next_due[region.name] = now + self._next_delay(region)
+                    self._in_flight.add(region.name)
+                task = asyncio.create_task(self._run_cycle(due))
+                self._cycles.add(task)
+                task.add_done_callback(self._cycles.discard)
+
+            pending = [
+                self._next_due[region.name] for region in regions
+                if region.name not in self._in_flight
+            ]
+            wait = min(pending) - time.monotonic() if pending else 1.0
+            await asyncio.sleep(min(max(wait, 0.05), 1.0))
+
+    def start(self):
+        """스케줄러 시작"""
+        if self._task is None or self._task.done():
+            self.buffer.start()
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🔄 다지역 수집 스케줄러 시작 - {len(self.registry)}개 지역")
+
+    async def stop(self):
+        """스케줄러 중지"""
+        for task in [self._task, *self._cycles]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *(task for task in [self._task, *self._cycles] if task is not None),
+            return_exceptions=True
+        )
+        self._task = None
+        self._cycles.clear()
+        self._in_flight.clear()
@@ -0,0 +1,131 @@
+"""
+수집 소스 레지스트리 모듈
+업스트림 /nearby 소스를 한 번씩 선언하고 (엔드포인트, 변환기, 센서 타입, 기본 품질) 공통 수집 경로로 처리
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.models.sensor_data import SensorDataCreate, SensorType
+from app.services.blob_store import payload_policy
+
+logger = logging.getLogger(__name__)
+
+# 변환기: (수집 서비스, 소스, 업스트림 항목) → SensorDataCreate
+SourceParser = Callable[[Any, "CollectionSource", Dict[str, Any]], Awaitable[SensorDataCreate]]
+
+class CollectionSource:
+    """수집 소스 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        upstream: str,
+        path: str,
+        parser: SourceParser,
+        api_key_setting: str,
+        default_quality: float,
+        sensor_type: Optional[SensorType] = None,
+        id_prefix: Optional[str] = None
+    ):
+        self.name = name
+        self.label = label
+        self.upstream = upstream
+        self.path = path
+        self.parser = parser
+        self.api_key_setting = api_key_setting
+        self.default_quality = default_quality
+        self.sensor_type = sensor_type
+        self.id_prefix = id_prefix or name
+
+    @property
+    def api_key(self) -> str:
+        return getattr(settings, self.api_key_setting)
+
+    def __repr__(self) -> str:
+        return f"CollectionSource({self.name!r}, {self.upstream}{self.path})"
+
+async def parse_vision_item(service, source: CollectionSource, item: Dict[str, Any]) -> SensorDataCreate:
+    """영상 소스 항목 변환 (이미지 분석 포함)"""
+    image_analysis = await service.vision_ai_service.analyze_image(
+        item.get("image_url"),
+        item.get("image_data")
+    )
+
+    return SensorDataCreate(
+        sensor_id=f"{source.id_prefix}_{item['id']}",
+        sensor_type=source.sensor_type,
+        location_lat=item["lat"],
+        location_lng=item["lng"],
+        location_name=item.get("name"),
+        image_url=item.get("image_url"),
+        image_analysis=image_analysis,
+        fire_detected=image_analysis.get("fire_detected", False),
+        fire_confidence=image_analysis.get("fire_confidence", 0.0),
+        raw_data=await payload_policy.apply(item),
+        data_quality=image_analysis.get("data_quality", source.default_quality)
+    )
+
+def iot_item_fields(source: CollectionSource, item: Dict[str, Any]) -> Dict[str, Any]:
+    """IoT 센서 항목 → SensorDataCreate 필드 (검증 전, raw_data 제외)"""
+    return {
+        "sensor_id": f"{source.id_prefix}_{item['id']}",
+        "sensor_type": source.sensor_type or item["type"],
+        "location_lat": item["lat"],
+        "location_lng": item["lng"],
+        "location_name": item.get("name"),
+        "temperature": item.get("temperature"),
+        "humidity": item.get("humidity"),
+        "smoke_density": item.get("smoke_density"),
+        "wind_speed": item.get("wind_speed"),
+        "wind_direction": item.get("wind_direction"),
+        "air_pressure": item.get("air_pressure"),
+        "visibility": item.get("visibility"),
+        "data_quality": item.get("data_quality", source.default_quality)
+    }
+
+async def parse_iot_item(service, source: CollectionSource, item: Dict[str, Any]) -> SensorDataCreate:
+    """IoT 센서 항목 변환"""
+    return SensorDataCreate(
+        **iot_item_fields(source, item),
+        raw_data=await payload_policy.apply(item)
+    )
+
+# 등록된 수집 소스 (등록 순서대로 수집 시작)
+COLLECTION_SOURCES: Dict[str, CollectionSource] = {}
+
+def register_source(source: CollectionSource) -> CollectionSource:
+    """수집 소스 등록"""
+    if source.name in COLLECTION_SOURCES:
+        raise ValueError(f"이미 등록된 수집 소스입니다: {source.name}")
+    COLLECTION_SOURCES[source.name] = source
+    return source
+
+def get_sources(names: Optional[List[str]] = None) -> List[CollectionSource]:
+    """수집 소스 조회 (미지정 시 전체)"""
+    if names is None:
+        return list(COLLECTION_SOURCES.values())
+    return [COLLECTION_SOURCES[name] for name in names]
+
+# KT 기가아이즈 CCTV
+register_source(CollectionSource(
+    "cctv", "CCTV", "kt_gigai", "/cctv/nearby", parse_vision_item,
+    "VISION_AI_API_KEY", default_quality=0.8, sensor_type=SensorType.CCTV
+))
+# 드론
+register_source(CollectionSource(
+    "drone", "드론", "kt_gigai", "/drone/nearby", parse_vision_item,
+    "VISION_AI_API_KEY", default_quality=0.9, sensor_type=SensorType.DRONE
+))
+# 위성
+register_source(CollectionSource(
+    "satellite", "위성", "kt_gigai", "/satellite/nearby", parse_vision_item,
+    "VISION_AI_API_KEY", default_quality=0.85, sensor_type=SensorType.SATELLITE
+))
+# IoT 센서 (항목별 type 필드로 센서 타입 결정)
+register_source(CollectionSource(
+    "iot_sensors", "IoT 센서", "iot_sensors", "/sensors/nearby", parse_iot_item,
+    "IOT_SENSOR_API_KEY", default_quality=0.9, id_prefix="iot"
+))
@@ -5,9 +5,10 @@ Vision AI, IoT 센서, 기상 데이터 수집
 
 import asyncio
 import logging
+import time
 import httpx
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 import cv2
 import numpy as np
@@ -16,9 +17,18 @@ import io
 import base64
 
 from app.core.config import settings
+from app.core.metrics import COLLECTION_NOT_MODIFIED_TOTAL
 from app.models.sensor_data import SensorData, SensorDataCreate, SensorType
 from app.services.vision_ai_service import VisionAIService
 from app.services.weather_service import WeatherService
+from app.services.rate_limiter import CallPriority, rate_limiter
+from app.services.circuit_breaker import CircuitOpenError, upstream_guard
+from app.services.last_known_good import last_known_good_store
+from app.services.collection_sources import CollectionSource, get_sources
+from app.services.collection_cursors import SourceCursor, cursor_store
+from app.services.write_behind import WriteBehindBuffer, write_behind_buffer
+from app.services.blob_store import payload_policy
+from app.services.spatial_index import sensor_index
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +43,18 @@ class DataCollectionService:
             "iot_sensors": settings.IOT_SENSOR_ENDPOINT,
             "weather": settings.WEATHER_API_ENDPOINT
         }
+        # 직전 수집에서 화재가 탐지된 위치 (다음 수집 시 호출 우선순위 상향)
+        self.fire_flagged_locations = set()
+    
+    def _location_key(self, location: Dict[str, float]) -> Tuple[float, float]:
+        """위치 식별 키 (소수점 4자리, 약 10m)"""
+        return (round(location["lat"], 4), round(location["lng"], 4))
     
     async def collect_all_data(
         self, 
         location: Dict[str, float],
-        radius_km: float = 5.0
+        radius_km: float = 5.0,
+        priority: Optional[CallPriority] = None
     ) -> List[SensorDataCreate]:
         """
         모든 데이터 소스에서 데이터 수집
@@ -45,6 +62,7 @@ class DataCollectionService:
         Args:
             location: {"lat": float, "lng": float} 위치 정보
             radius_km: 수집 반경 (km)
+            priority: 업스트림 호출 우선순위 (미지정 시 화재 탐지 이력으로 결정)
             
         Returns:
             수집된 센서 데이터 리스트
@@ -52,19 +70,23 @@ class DataCollectionService:
         try:
             logger.info(f"📡 데이터 수집 시작 - 위치: {location}, 반경: {radius_km}km")
             
-            all_sensor_data = []
-            
-            # 1. Vision AI 데이터 수집 (CCTV, 드론, 위성)
-            vision_data = await self._collect_vision_data(location, radius_km)
-            all_sensor_data.extend(vision_data)
+            location_key = self._location_key(location)
+            if priority is None:
+                priority = (
+                    CallPriority.FIRE if location_key in self.fire_flagged_locations
+                    else CallPriority.NORMAL
+                )
             
-            # 2. IoT 센서 데이터 수집
-            iot_data = await self._collect_iot_sensor_data(location, radius_km)
-            all_sensor_data.extend(iot_data)
+            # Vision AI (CCTV, 드론, 위성), IoT 센서, 기상 데이터 동시 수집
+            all_sensor_data = [
+                data async for data in self.stream_all_data(location, radius_km, priority)
+            ]
             
-            # 3. 기상 데이터 수집
-            weather_data = await self._collect_weather_data(location)
-            all_sensor_data.extend(weather_data)
+            # 화재 탐지 지역 표시 갱신
+            if any(data.fire_detected for data in all_sensor_data):
+                self.fire_flagged_locations.add(location_key)
+            else:
+                self.fire_flagged_locations.discard(location_key)
             
             logger.info(f"✅ 데이터 수집 완료 - 총 {len(all_sensor_data)}개 데이터 수집")
             return all_sensor_data
@@ -73,240 +95,170 @@ class DataCollectionService:
             logger.error(f"❌ 데이터 수집 실패: {str(e)}")
             raise
     
-    async def _collect_vision_data(
-        self, 
-        location: Dict[str, float], 
-        radius_km: float
-    ) -> List[SensorDataCreate]:
-        """Vision AI 데이터 수집 (CCTV, 드론, 위성)"""
-        vision_data = []
+    async def stream_all_data(
+        self,
+        location: Dict[str, float],
+        radius_km: float = 5.0,
+        priority: CallPriority = CallPriority.NORMAL,
+        sources: Optional[List[CollectionSource]] = None,
+        include_weather: bool = True
+    ) -> AsyncIterator[SensorDataCreate]:
+        """
+        모든 소스를 동시에 수집하며 도착하는 순서대로 센서 데이터 반환
         
-        try:
-            # KT 기가아이즈 CCTV 데이터 수집
-            cctv_data = await self._collect_cctv_data(location, radius_km)
-            vision_data.extend(cctv_data)
-            
-            # 드론 데이터 수집
-            drone_data = await self._collect_drone_data(location, radius_km)
-            vision_data.extend(drone_data)
-            
-            # 위성 데이터 수집
-            satellite_data = await self._collect_satellite_data(location, radius_km)
-            vision_data.extend(satellite_data)
-            
-        except Exception as e:
-            logger.error(f"Vision AI 데이터 수집 실패: {str(e)}")
+        느린 소스를 기다리지 않고 먼저 도착한 데이터부터 후속 처리를 시작할 수 있습니다.
         
-        return vision_data
-    
-    async def _collect_cctv_data(
-        self, 
-        location: Dict[str, float], 
-        radius_km: float
-    ) -> List[SensorDataCreate]:
-        """CCTV 데이터 수집"""
-        cctv_data = []
+        Args:
+            location: {"lat": float, "lng": float} 위치 정보
+            radius_km: 수집 반경 (km)
+            priority: 업스트림 호출 우선순위
+            sources: 수집할 소스 (미지정 시 등록된 전체 소스)
+            include_weather: 기상 데이터 포함 여부
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        finished = object()
         
-        try:
-            async with httpx.AsyncClient() as client:
-                # KT 기가아이즈 API 호출
-                response = await client.get(
-                    f"{self.sensor_endpoints['kt_gigai']}/cctv/nearby",
-                    params={
-                        "lat": location["lat"],
-                        "lng": location["lng"],
-                        "radius": radius_km,
-                        "api_key": settings.VISION_AI_API_KEY
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    cctv_list = response.json().get("data", [])
-                    
-                    for cctv in cctv_list:
-                        # 이미지 분석
-                        image_analysis = await self.vision_ai_service.analyze_image(
-                            cctv.get("image_url"),
-                            cctv.get("image_data")
-                        )
-                        
-                        sensor_data = SensorDataCreate(
-                            sensor_id=f"cctv_{cctv['id']}",
-                            sensor_type=SensorType.CCTV,
-                            location_lat=cctv["lat"],
-                            location_lng=cctv["lng"],
-                            location_name=cctv.get("name"),
-                            image_url=cctv.get("image_url"),
-                            image_analysis=image_analysis,
-                            fire_detected=image_analysis.get("fire_detected", False),
-                            fire_confidence=image_analysis.get("fire_confidence", 0.0),
-                            raw_data=cctv,
-                            data_quality=image_analysis.get("data_quality", 0.8)
-                        )
-                        cctv_data.append(sensor_data)
-                        
-        except Exception as e:
-            logger.error(f"CCTV 데이터 수집 실패: {str(e)}")
+        streams = [
+            self.stream_source(source, location, radius_km, priority)
+            for source in (sources if sources is not None else get_sources())
+        ]
+        if include_weather:
+            streams.append(self._stream_weather_data(location, priority))
         
-        return cctv_data
-    
-    async def _collect_drone_data(
-        self, 
-        location: Dict[str, float], 
-        radius_km: float
-    ) -> List[SensorDataCreate]:
-        """드론 데이터 수집"""
-        drone_data = []
+        async def pump(stream: AsyncIterator[SensorDataCreate]):
+            try:
+                async for data in stream:
+                    await queue.put(data)
+            except Exception as e:
+                logger.error(f"수집 스트림 오류: {str(e)}")
+            finally:
+                await queue.put(finished)
         
-        try:
-            async with httpx.AsyncClient() as client:
-                # 드론 API 호출
-                response = await client.get(
-                    f"{self.sensor_endpoints['kt_gigai']}/drone/nearby",
-                    params={
-                        "lat": location["lat"],
-                        "lng": location["lng"],
-                        "radius": radius_km,
-                        "api_key": settings.VISION_AI_API_KEY
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    drone_list = response.json().get("data", [])
-                    
-                    for drone in drone_list:
-                        # 드론 이미지 분석
-                        image_analysis = await self.vision_ai_service.analyze_image(
-                            drone.get("image_url"),
-                            drone.get("image_data")
-                        )
-                        
-                        sensor_data = SensorDataCreate(
-                            sensor_id=f"drone_{drone['id']}",
-                            sensor_type=SensorType.DRONE,
-                            location_lat=drone["lat"],
-                            location_lng=drone["lng"],
-                            location_name=drone.get("name"),
-                            image_url=drone.get("image_url"),
-                            image_analysis=image_analysis,
-                            fire_detected=image_analysis.get("fire_detected", False),
-                            fire_confidence=image_analysis.get("fire_confidence", 0.0),
-                            raw_data=drone,
-                            data_quality=image_analysis.get("data_quality", 0.9)
-                        )
-                        drone_data.append(sensor_data)
-                        
-        except Exception as e:
-            logger.error(f"드론 데이터 수집 실패: {str(e)}")
+        tasks = [asyncio.create_task(pump(stream)) for stream in streams]
+        remaining = len(tasks)
         
-        return drone_data
+        try:
+            while remaining:
+                data = await queue.get()
+                if data is finished:
+                    remaining -= 1
+                    continue
+                sensor_index.upsert(data.sensor_id, data.location_lat, data.location_lng, data)
+                yield data
+        finally:
+            for task in tasks:
+                task.cancel()
     
-    async def _collect_satellite_data(
-        self, 
-        location: Dict[str, float], 
-        radius_km: float
-    ) -> List[SensorDataCreate]:
-        """위성 데이터 수집"""
-        satellite_data = []
+    async def stream_source(
+        self,
+        source: CollectionSource,
+        location: Dict[str, float],
+        radius_km: float,
+        priority: CallPriority = CallPriority.NORMAL
+    ) -> AsyncIterator[SensorDataCreate]:
+        """
+        단일 소스 수집 (최근 정상값 캐시 경유)
         
-        try:
-            async with httpx.AsyncClient() as client:
-                # 위성 API 호출
-                response = await client.get(
-                    f"{self.sensor_endpoints['kt_gigai']}/satellite/nearby",
-                    params={
-                        "lat": location["lat"],
-                        "lng": location["lng"],
-                        "radius": radius_km,
-                        "api_key": settings.VISION_AI_API_KEY
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    satellite_list = response.json().get("data", [])
-                    
-                    for satellite in satellite_list:
-                        # 위성 이미지 분석
-                        image_analysis = await self.vision_ai_service.analyze_image(
-                            satellite.get("image_url"),
-                            satellite.get("image_data")
-                        )
-                        
-                        sensor_data = SensorDataCreate(
-                            sensor_id=f"satellite_{satellite['id']}",
-                            sensor_type=SensorType.SATELLITE,
-                            location_lat=satellite["lat"],
-                            location_lng=satellite["lng"],
-                            location_name=satellite.get("name"),
-                            image_url=satellite.get("image_url"),
-                            image_analysis=image_analysis,
-                            fire_detected=image_analysis.get("fire_detected", False),
-                            fire_confidence=image_analysis.get("fire_confidence", 0.0),
-                            raw_data=satellite,
-                            data_quality=image_analysis.get("data_quality", 0.85)
-                        )
-                        satellite_data.append(sensor_data)
-                        
-        except Exception as e:
-            logger.error(f"위성 데이터 수집 실패: {str(e)}")
+        업스트림이 느리거나 실패하면 마지막 정상 데이터를 사용하고,
+        경과 시간에 비례해 데이터 품질 점수를 낮춥니다 (최대 50%).
+        업스트림 커서로 변경분만 받아 직전 항목에 병합하며, 내용이 그대로인 항목은
+        이미지 분석 등 변환을 다시 하지 않고 직전 결과를 사용합니다.
+        """
+        key = (*self._location_key(location), radius_km)
+        cursor = cursor_store.get(source.name, key)
+        items, staleness = await last_known_good_store.get(
+            source.name, key,
+            lambda: self._fetch_source_items(source, location, radius_km, priority, cursor)
+        )
         
-        return satellite_data
-    
-    async def _collect_iot_sensor_data(
-        self, 
-        location: Dict[str, float], 
-        radius_km: float
-    ) -> List[SensorDataCreate]:
-        """IoT 센서 데이터 수집"""
-        iot_data = []
+        if not items:
+            return
+        
+        decay = 1.0
+        if staleness:
+            decay = 1 - 0.5 * min(1.0, staleness / last_known_good_store.max_staleness_seconds)
         
+        for item in items:
+            digest, data = cursor.cached_reading(item)
+            if data is None:
+                try:
+                    data = await source.parser(self, source, item)
+                except Exception as e:
+                    logger.error(f"{source.label} 데이터 변환 실패: {str(e)}")
+                    continue
+                cursor.remember(item, digest, data)
+            
+            if decay < 1.0:
+                data = data.model_copy(update={"data_quality": (data.data_quality or 0.5) * decay})
+            yield data
+    
+    async def _fetch_source_items(
+        self,
+        source: CollectionSource,
+        location: Dict[str, float],
+        radius_km: float,
+        priority: CallPriority = CallPriority.NORMAL,
+        cursor: Optional[SourceCursor] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """소스 업스트림 /nearby 호출 (실패 시 None, 커서가 있으면 변경분만 요청)"""
+        cursor = cursor or SourceCursor()
         try:
             async with httpx.AsyncClient() as client:
-                # IoT 센서 API 호출
-                response = await client.get(
-                    f"{self.sensor_endpoints['iot_sensors']}/sensors/nearby",
-                    params={
-                        "lat": location["lat"],
-                        "lng": location["lng"],
-                        "radius": radius_km,
-                        "api_key": settings.IOT_SENSOR_API_KEY
-                    },
-                    timeout=30.0
+                await rate_limiter.acquire(source.upstream, priority)
+                response = await upstream_guard.call(
+                    source.upstream,
+                    lambda: client.get(
+                        f"{self.sensor_endpoints[source.upstream]}{source.path}",
+                        params={
+                            "lat": location["lat"],
+                            "lng": location["lng"],
+                            "radius": radius_km,
+                            "api_key": source.api_key,
+                            **cursor.request_params()
+                        },
+                        headers=cursor.request_headers(),
+                        timeout=settings.UPSTREAM_TIMEOUT_SECONDS
+                    )
                 )
                 
+                if response.status_code == 304:
+                    COLLECTION_NOT_MODIFIED_TOTAL.labels(source.name).inc()
+                    return cursor.items()
+                
+                if response.status_code == 429:
+                    await rate_limiter.report_quota_exceeded(
+                        source.upstream, response.headers.get("Retry-After")
+                    )
+                
                 if response.status_code == 200:
-                    sensor_list = response.json().get("data", [])
-                    
-                    for sensor in sensor_list:
-                        sensor_data = SensorDataCreate(
-                            sensor_id=f"iot_{sensor['id']}",
-                            sensor_type=SensorType(sensor["type"]),
-                            location_lat=sensor["lat"],
-                            location_lng=sensor["lng"],
-                            location_name=sensor.get("name"),
-                            temperature=sensor.get("temperature"),
-                            humidity=sensor.get("humidity"),
-                            smoke_density=sensor.get("smoke_density"),
-                            wind_speed=sensor.get("wind_speed"),
-                            wind_direction=sensor.get("wind_direction"),
-                            air_pressure=sensor.get("air_pressure"),
-                            visibility=sensor.get("visibility"),
-                            raw_data=sensor,
-                            data_quality=sensor.get("data_quality", 0.9)
-                        )
-                        iot_data.append(sensor_data)
-                        
+                    return cursor.apply(response.headers.get("ETag"), response.json())
+                
+                logger.error(f"{source.label} API 호출 실패: {response.status_code}")
+                return None
+                
+        except CircuitOpenError as e:
+            logger.warning(f"{source.label} 호출 생략: {str(e)}")
+            return None
+        except asyncio.TimeoutError:
+            logger.error(f"{source.label} API 응답 시간 초과 ({settings.UPSTREAM_TIMEOUT_SECONDS}초)")
+            return None
         except Exception as e:
-            logger.error(f"IoT 센서 데이터 수집 실패: {str(e)}")
-        
-        return iot_data
+            logger.error(f"{source.label} 데이터 수집 실패: {str(e)}")
+            return None
+    
+    async def _stream_weather_data(
+        self,
+        location: Dict[str, float],
+        priority: CallPriority = CallPriority.NORMAL
+    ) -> AsyncIterator[SensorDataCreate]:
+        """기상 데이터 스트림"""
+        for data in await self._collect_weather_data(location, priority):
+            yield data
     
     async def _collect_weather_data(
         self, 
-        location: Dict[str, float]
+        location: Dict[str, float],
+        priority: CallPriority = CallPriority.NORMAL
     ) -> List[SensorDataCreate]:
         """기상 데이터 수집"""
         weather_data = []
@@ -314,10 +266,13 @@ class DataCollectionService:
         try:
             # 기상청 API에서 현재 날씨 데이터 수집
             weather_info = await self.weather_service.get_current_weather(
-                location["lat"], location["lng"]
+                location["lat"], location["lng"], priority
             )
             
             if weather_info:
+                # 네 행이 같은 원본을 참조하도록 한 번만 저장
+                weather_raw = await payload_policy.apply(weather_info, shared=True)
+                
                 # 온도 센서 데이터
                 temp_sensor = SensorDataCreate(
                     sensor_id="weather_temp",
@@ -326,7 +281,7 @@ class DataCollectionService:
                     location_lng=location["lng"],
                     location_name="기상청",
                     temperature=weather_info.get("temperature"),
-                    raw_data=weather_info,
+                    raw_data=weather_raw,
                     data_quality=0.95
                 )
                 weather_data.append(temp_sensor)
@@ -339,7 +294,7 @@ class DataCollectionService:
                     location_lng=location["lng"],
                     location_name="기상청",
                     humidity=weather_info.get("humidity"),
-                    raw_data=weather_info,
+                    raw_data=weather_raw,
                     data_quality=0.95
                 )
                 weather_data.append(humidity_sensor)
@@ -353,7 +308,7 @@ class DataCollectionService:
                     location_name="기상청",
                     wind_speed=weather_info.get("wind_speed"),
                     wind_direction=weather_info.get("wind_direction"),
-                    raw_data=weather_info,
+                    raw_data=weather_raw,
                     data_quality=0.95
                 )
                 weather_data.append(wind_sensor)
@@ -366,7 +321,7 @@ class DataCollectionService:
                     location_lng=location["lng"],
                     location_name="기상청",
                     air_pressure=weather_info.get("air_pressure"),
-                    raw_data=weather_info,
+                    raw_data=weather_raw,
                     data_quality=0.95
                 )
                 weather_data.append(pressure_sensor)
@@ -379,22 +334,52 @@ class DataCollectionService:
     async def start_continuous_collection(
         self, 
         location: Dict[str, float],
-        interval_seconds: int = 30
+        interval_seconds: Optional[int] = None,
+        radius_km: float = 5.0,
+        buffer: Optional[WriteBehindBuffer] = None
     ):
-        """지속적인 데이터 수집 시작"""
+        """
+        지속적인 데이터 수집 시작
+        
+        수집된 데이터는 도착 즉시 지연 쓰기 버퍼로 전달되어 sensor_data 테이블에 일괄 저장됩니다.
+        저장이 밀려 버퍼가 가득 차면 수집도 함께 대기합니다.
+        
+        Args:
+            location: {"lat": float, "lng": float} 위치 정보
+            interval_seconds: 수집 간격 (미지정 시 SENSOR_UPDATE_INTERVAL)
+            radius_km: 수집 반경 (km)
+            buffer: 지연 쓰기 버퍼 (미지정 시 전역 버퍼)
+        """
+        interval_seconds = interval_seconds or settings.SENSOR_UPDATE_INTERVAL
+        buffer = buffer or write_behind_buffer
+        buffer.start()
+        location_key = self._location_key(location)
         logger.info(f"🔄 지속적 데이터 수집 시작 - 간격: {interval_seconds}초")
         
         while True:
+            started = time.monotonic()
             try:
-                # 데이터 수집
-                sensor_data = await self.collect_all_data(location)
+                priority = (
+                    CallPriority.FIRE if location_key in self.fire_flagged_locations
+                    else CallPriority.NORMAL
+                )
+                collected = 0
+                fire_detected = False
                 
-                # 데이터베이스에 저장 (여기서는 로그만 출력)
-                logger.info(f"📊 수집된 데이터: {len(sensor_data)}개")
+                async for data in self.stream_all_data(location, radius_km, priority):
+                    await buffer.put(data)
+                    collected += 1
+                    fire_detected = fire_detected or data.fire_detected
                 
-                # 다음 수집까지 대기
-                await asyncio.sleep(interval_seconds)
+                if fire_detected:
+                    self.fire_flagged_locations.add(location_key)
+                else:
+                    self.fire_flagged_locations.discard(location_key)
+                
+                logger.info(f"📊 수집된 데이터: {collected}개 (저장 대기: {buffer.depth}개)")
                 
             except Exception as e:
                 logger.error(f"지속적 데이터 수집 오류: {str(e)}")
-                await asyncio.sleep(interval_seconds)
+            
+            # 수집에 걸린 시간을 제외하고 다음 수집까지 대기
+            await asyncio.sleep(max(0.0, interval_seconds - (time.monotonic() - started)))
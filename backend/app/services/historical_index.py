@@ -0,0 +1,349 @@
+"""
+과거 화재 발생 지수 모듈
+과거 화재 기록을 격자 셀 × 월 × 시 빈도로 집계해 두고, 지점별 과거 데이터 위험도를 배열 조회로 산출
+"""
+
+import asyncio
+import logging
+import math
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 한국 표준시 (월/시 구간 기준)
+KST = timezone(timedelta(hours=9))
+
+# 기본 집계 범위 (남, 서, 북, 동)
+KOREA_BOUNDS = (33.0, 124.0, 39.0, 132.0)
+
+SECONDS_PER_YEAR = 365.25 * 86400
+
+# 기록이 없을 때의 계절/시간대 기본 위험도 (월 1~12, 시 0~23)
+# 봄 0.3, 여름 0.1, 가을 0.4, 겨울 0.2 / 낮(10~16시) 0.3, 저녁(17~20시) 0.2, 밤/새벽 0.1
+SEASONAL_PRIOR = np.array([0.2, 0.2, 0.3, 0.3, 0.3, 0.1, 0.1, 0.1, 0.4, 0.4, 0.4, 0.2])
+TIME_PRIOR = np.array([0.1] * 10 + [0.3] * 7 + [0.2] * 4 + [0.1] * 3)
+
+Timestamp = Union[datetime, float, None]
+
+def _epoch(when: Timestamp) -> float:
+    """datetime(시간대 없으면 한국 표준시로 간주)/epoch 초를 epoch 초로"""
+    if when is None:
+        return time.time()
+    if isinstance(when, datetime):
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=KST)
+        return when.timestamp()
+    return float(when)
+
+def _month_hour(epochs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """epoch 초 배열의 한국 표준시 월(0~11)/시(0~23)"""
+    local = (np.asarray(epochs, dtype=np.float64) + 9 * 3600).astype("datetime64[s]")
+    months = local.astype("datetime64[M]").astype(np.int64) % 12
+    hours = (local - local.astype("datetime64[D]")).astype(np.int64) // 3600
+    return months, hours
+
+class HistoricalFireIndex:
+    """
+    격자 셀 × 월 × 시 화재 발생 빈도 지수
+
+    같은 셀에서 gap 시간 안에 이어진 탐지는 하나의 화재로 셉니다. 셀/월/시 주변 합계를 함께 유지하여
+    기록 추가와 조회가 모두 지점당 O(1) 입니다.
+
+    위험도는 셀의 (월, 시) 구간 연간 화재 건수 λ 를 기준 건수 reference_rate 로 나눈 값의 1 - exp(-x) 입니다.
+    사전 분포는 계절/시간대 기본 위험도(SEASONAL_PRIOR, TIME_PRIOR)를 같은 식으로 건수로 바꾼 값입니다.
+    기록이 적은 셀은 월/시 비율을 사전 분포 쪽으로 당기고(prior_strength 건 분량), 연간 건수도 prior_years 년 분량의
+    사전 건수와 섞어 추정하므로, 기록이 없으면 기본 위험도와 같습니다.
+    """
+
+    def __init__(
+        self,
+        bounds: Tuple[float, float, float, float] = KOREA_BOUNDS,
+        cell_deg: Optional[float] = None,
+        gap_hours: Optional[float] = None,
+        prior_strength: Optional[float] = None,
+        prior_years: Optional[float] = None,
+        reference_rate: Optional[float] = None,
+        path: Optional[str] = None
+    ):
+        self.south, self.west, self.north, self.east = bounds
+        self.cell_deg = cell_deg or settings.HISTORICAL_INDEX_CELL_DEG
+        self.gap_seconds = (gap_hours if gap_hours is not None else settings.HISTORICAL_INCIDENT_GAP_HOURS) * 3600
+        self.prior_strength = prior_strength if prior_strength is not None else settings.HISTORICAL_PRIOR_STRENGTH
+        self.prior_years = prior_years if prior_years is not None else settings.HISTORICAL_PRIOR_YEARS
+        self.reference_rate = reference_rate or settings.HISTORICAL_REFERENCE_RATE
+        self.path = Path(path) if path else None
+        self.rows = math.ceil(round((self.north - self.south) / self.cell_deg, 6))
+        self.cols = math.ceil(round((self.east - self.west) / self.cell_deg, 6))
+
+        # 셀 × 월 × 시 화재 건수
+        self.counts = np.zeros((self.rows, self.cols, 12, 24), dtype=np.uint16)
+        # 셀별 마지막 화재 시각 (epoch 초, 없으면 NaN)
+        self.last_incident = np.full((self.rows, self.cols), np.nan)
+        # 기록 기간 시작 (epoch 초)
+        self.since: Optional[float] = None
+        self.dirty = False
+        self._saved_at = time.monotonic()
+        self._reset_totals()
+
+    def _reset_totals(self):
+        counts = self.counts.astype(np.int64)
+        self.cell_total = counts.sum(axis=(2, 3))
+        self.cell_month = counts.sum(axis=3)
+        self.cell_hour = counts.sum(axis=2)
+        self.slot_total = counts.sum(axis=(0, 1))
+        self.total = int(self.slot_total.sum())
+        self.active_cells = int(np.count_nonzero(self.cell_total))
+
+    def prior_rates(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        기본 위험도를 (월, 시) 구간 연간 건수로 바꾼 사전 분포 (위험도 = 1 - exp(-λ / reference_rate) 의 역)
+
+        Returns:
+            (구간별 12×24, 월별 12, 시별 24) 구간당 연간 건수
+        """
+        def to_rate(risk: np.ndarray) -> np.ndarray:
+            return -np.log1p(-risk) * self.reference_rate
+
+        slot = to_rate((SEASONAL_PRIOR[:, None] + TIME_PRIOR[None, :]) / 2)
+        return slot, to_rate(SEASONAL_PRIOR), to_rate(TIME_PRIOR)
+
+    def cell_of(self, lats: np.ndarray, lngs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """위경도 배열의 셀 (행, 열, 범위 안 여부), 0행이 북쪽"""
+        with np.errstate(invalid="ignore"):
+            rows = np.floor((self.north - np.asarray(lats, dtype=float)) / self.cell_deg)
+            cols = np.floor((np.asarray(lngs, dtype=float) - self.west) / self.cell_deg)
+            valid = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        return np.where(valid, rows, 0).astype(np.intp), np.where(valid, cols, 0).astype(np.intp), valid
+
+    def record(self, lat: float, lng: float, when: Timestamp = None) -> bool:
+        """화재 탐지 1건 반영 (같은 셀의 gap 시간 안 탐지는 이어진 화재로 보고 무시, 새 화재면 True)"""
+        at = _epoch(when)
+        rows, cols, valid = self.cell_of(np.array([lat]), np.array([lng]))
+        if not valid[0]:
+            return False
+        row, col = rows[0], cols[0]
+        last = self.last_incident[row, col]
+        if not math.isnan(last) and abs(at - last) < self.gap_seconds:
+            self.last_incident[row, col] = max(last, at)
+            return False
+
+        months, hours = _month_hour(np.array([at]))
+        month, hour = months[0], hours[0]
+        if self.counts[row, col, month, hour] < np.iinfo(np.uint16).max:
+            self.counts[row, col, month, hour] += 1
+        if not self.cell_total[row, col]:
+            self.active_cells += 1
+        self.cell_total[row, col] += 1
+        self.cell_month[row, col, month] += 1
+        self.cell_hour[row, col, hour] += 1
+        self.slot_total[month, hour] += 1
+        self.total += 1
+        self.last_incident[row, col] = at
+        self.since = at if self.since is None else min(self.since, at)
+        self.dirty = True
+        return True
+
+    def observe(self, readings: Iterable[Any], when: Timestamp = None) -> int:
+        """센서 데이터 묶음의 화재 탐지 반영 (측정 시각이 없으면 when 또는 현재 시각), 새 화재 수 반환"""
+        added = 0
+        for reading in readings:
+            if reading.fire_detected:
+                added += self.record(
+                    reading.location_lat, reading.location_lng,
+                    getattr(reading, "timestamp", None) or when
+                )
+        return added
+
+    @classmethod
+    def build(
+        cls,
+        lats: Sequence[float],
+        lngs: Sequence[float],
+        timestamps: Sequence[Timestamp],
+        since: Timestamp = None,
+        **kwargs
+    ) -> "HistoricalFireIndex":
+        """
+        과거 화재 탐지 기록으로 지수 생성
+
+        Args:
+            lats, lngs, timestamps: 탐지 기록 (순서 무관)
+            since: 기록 기간 시작 (없으면 가장 이른 기록)
+        """
+        index = cls(**kwargs)
+        epochs = np.array([_epoch(ts) for ts in timestamps], dtype=np.float64)
+        rows, cols, valid = index.cell_of(np.asarray(lats, dtype=float), np.asarray(lngs, dtype=float))
+        rows, cols, epochs = rows[valid], cols[valid], epochs[valid]
+        if not len(epochs):
+            index.since = None if since is None else _epoch(since)
+            return index
+
+        # 셀별 시간순으로 정렬하여 같은 셀의 직전 탐지와 gap 이상 떨어진 탐지만 새 화재로 셈 (record 와 같은 기준)
+        cells = rows * index.cols + cols
+        order = np.lexsort((epochs, cells))
+        cells, epochs = cells[order], epochs[order]
+        first = np.r_[True, cells[1:] != cells[:-1]]
+        incident = first | (np.diff(epochs, prepend=-np.inf) >= index.gap_seconds)
+        starts = np.flatnonzero(first)
+
+        months, hours = _month_hour(epochs[incident])
+        flat = np.zeros(index.counts.size, dtype=np.int64)
+        np.add.at(flat, np.ravel_multi_index(
+            (cells[incident] // index.cols, cells[incident] % index.cols, months, hours), index.counts.shape
+        ), 1)
+        index.counts = np.minimum(flat, np.iinfo(np.uint16).max).astype(np.uint16).reshape(index.counts.shape)
+        last_by_cell = np.r_[starts[1:], len(epochs)] - 1
+        index.last_incident.reshape(-1)[cells[last_by_cell]] = epochs[last_by_cell]
+        index.since = _epoch(since) if since is not None else float(epochs.min())
+        index.dirty = True
+        index._reset_totals()
+        return index
+
+    def risk(self, lats: np.ndarray, lngs: np.ndarray, when: Timestamp = None) -> Dict[str, np.ndarray]:
+        """
+        지점별 과거 데이터 위험도
+
+        범위 밖이나 위치가 없는 지점은 화재 기록이 있는 셀의 전국 평균을 사용하고,
+        기록이 하나도 없으면 계절/시간대 기본 위험도를 그대로 반환합니다.
+
+        Returns:
+            {"risk_score": 해당 월/시 구간, "seasonal_risk": 해당 월 평균, "time_risk": 해당 시 연평균,
+             "incident_count": 셀 누적 화재 건수}
+        """
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        lngs = np.atleast_1d(np.asarray(lngs, dtype=float))
+        at = _epoch(when)
+        months, hours = _month_hour(np.array([at]))
+        month, hour = int(months[0]), int(hours[0])
+        rows, cols, valid = self.cell_of(lats, lngs)
+        if not self.total:
+            seasonal, time_of_day = SEASONAL_PRIOR[month], TIME_PRIOR[hour]
+            return {
+                "risk_score": np.full(lats.shape, (seasonal + time_of_day) / 2),
+                "seasonal_risk": np.full(lats.shape, seasonal),
+                "time_risk": np.full(lats.shape, time_of_day),
+                "incident_count": np.zeros(lats.shape, dtype=int)
+            }
+
+        # 사전 분포 (구간당 연간 건수와 그 월/시 비율)
+        prior_slot, prior_month, prior_hour = self.prior_rates()
+        prior_total = prior_slot.sum()
+        national_slot = prior_slot[month, hour] / prior_total
+        national_month = prior_slot[month].sum() / prior_total
+        national_hour = prior_slot[:, hour].sum() / prior_total
+
+        cell_total = self.cell_total[rows, cols].astype(float)
+        slot = self.counts[rows, cols, month, hour].astype(float)
+        month_count = self.cell_month[rows, cols, month].astype(float)
+        hour_count = self.cell_hour[rows, cols, hour].astype(float)
+        # 범위 밖 지점: 화재 기록이 있는 셀의 평균 건수와 전국 분포
+        average = self.total / max(1, self.active_cells)
+        cell_total = np.where(valid, cell_total, average)
+        slot = np.where(valid, slot, average * national_slot)
+        month_count = np.where(valid, month_count, average * national_month)
+        hour_count = np.where(valid, hour_count, average * national_hour)
+
+        years = max(1.0, (at - (self.since if self.since is not None else at)) / SECONDS_PER_YEAR)
+
+        def to_risk(count: np.ndarray, share: float, slots: int, prior_rate: float) -> np.ndarray:
+            # 셀 건수 × (사전 분포로 당긴 구간 비율) = 구간 건수, 사전 건수와 섞어 연수로 나누면 구간당 연간 건수
+            incidents = cell_total * (count + self.prior_strength * share) / (cell_total + self.prior_strength) / slots
+            rate = (incidents + self.prior_years * prior_rate) / (years + self.prior_years)
+            return 1.0 - np.exp(-rate / self.reference_rate)
+
+        return {
+            "risk_score": to_risk(slot, national_slot, 1, prior_slot[month, hour]),
+            "seasonal_risk": to_risk(month_count, national_month, 24, prior_month[month]),
+            "time_risk": to_risk(hour_count, national_hour, 12, prior_hour[hour]),
+            "incident_count": cell_total.round().astype(int)
+        }
+
+    def lookup(self, lat: Optional[float], lng: Optional[float], when: Timestamp = None) -> Dict[str, Any]:
+        """한 지점의 과거 데이터 위험도"""
+        at = _epoch(when)
+        risk = self.risk(
+            np.array([math.nan if lat is None else lat]),
+            np.array([math.nan if lng is None else lng]),
+            at
+        )
+        local = datetime.fromtimestamp(at, KST)
+        return {
+            "risk_score": float(risk["risk_score"][0]),
+            "seasonal_risk": float(risk["seasonal_risk"][0]),
+            "time_risk": float(risk["time_risk"][0]),
+            "incident_count": int(risk["incident_count"][0]),
+            "current_month": local.month,
+            "current_hour": local.hour
+        }
+
+    def save(self, path: Optional[str] = None):
+        """압축 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path) if path else self.path
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    counts=self.counts,
+                    last_incident=self.last_incident,
+                    bounds=np.array([self.south, self.west, self.north, self.east]),
+                    cell_deg=np.array(self.cell_deg),
+                    since=np.array(np.nan if self.since is None else self.since)
+                )
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self.dirty = False
+        self._saved_at = time.monotonic()
+        logger.info(f"💾 과거 화재 지수 저장 - 화재 {self.total}건, 셀 {self.active_cells}개 ({path})")
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "HistoricalFireIndex":
+        """저장된 지수 불러오기 (파일이 없으면 빈 지수)"""
+        if not Path(path).exists():
+            return cls(path=path, **kwargs)
+        with np.load(path) as data:
+            index = cls(
+                bounds=tuple(float(v) for v in data["bounds"]),
+                cell_deg=float(data["cell_deg"]),
+                path=path,
+                **kwargs
+            )
+            index.counts = data["counts"].astype(np.uint16)
+            index.last_incident = data["last_incident"].astype(np.float64)
+            since = float(data["since"])
+        index.since = None if math.isnan(since) else since
+        index._reset_totals()
+        logger.info(f"📚 과거 화재 지수 로드 - 화재 {index.total}건, 셀 {index.active_cells}개")
+        return index
+
+    async def _maybe_save(self):
+        if self.dirty and time.monotonic() - self._saved_at >= settings.HISTORICAL_INDEX_SAVE_INTERVAL_SECONDS:
+            await asyncio.to_thread(self.save)
+
+    async def ingest(self, readings: Sequence[Any]):
+        """MQTT 수신 묶음 콜백"""
+        if self.observe(readings):
+            await self._maybe_save()
+
+    async def observe_region(self, region: Any, readings: Sequence[Any]):
+        """수집 스케줄러 지역별 결과 콜백"""
+        if self.observe(readings):
+            await self._maybe_save()
+
+# 전역 과거 화재 지수 (시작 시 저장 파일에서 로드)
+historical_index = HistoricalFireIndex.load(settings.HISTORICAL_INDEX_PATH)
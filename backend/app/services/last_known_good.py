@@ -0,0 +1,138 @@
+"""
+최근 정상값 캐시 모듈
+업스트림 지연/장애 시 마지막 정상 데이터를 경과 시간과 함께 제공하고 백그라운드에서 갱신
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import UPSTREAM_STALE_SERVED_TOTAL
+
+logger = logging.getLogger(__name__)
+
+class CachedEntry:
+    """캐시 항목"""
+
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value: Any, fetched_at: float):
+        self.value = value
+        self.fetched_at = fetched_at
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+class LastKnownGoodStore:
+    """소스/위치별 최근 정상값 저장소 (stale-while-revalidate)"""
+
+    def __init__(
+        self,
+        max_staleness_seconds: Optional[float] = None,
+        refresh_timeout_seconds: Optional[float] = None,
+        max_entries: int = 10000
+    ):
+        self.max_staleness_seconds = (
+            max_staleness_seconds if max_staleness_seconds is not None
+            else settings.LKG_MAX_STALENESS_SECONDS
+        )
+        self.refresh_timeout_seconds = (
+            refresh_timeout_seconds if refresh_timeout_seconds is not None
+            else settings.LKG_REFRESH_TIMEOUT_SECONDS
+        )
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedEntry]" = OrderedDict()
+        self._refreshing: Dict[Tuple[str, Hashable], asyncio.Task] = {}
+
+    def peek(self, source: str, key: Hashable) -> Optional[CachedEntry]:
+        """최대 허용 경과 시간 이내의 캐시 항목 조회"""
+        entry = self._entries.get((source, key))
+        if entry is None or entry.age > self.max_staleness_seconds:
+            return None
+        return entry
+
+    def put(self, source: str, key: Hashable, value: Any):
+        """정상값 저장"""
+        cache_key = (source, key)
+        self._entries[cache_key] = CachedEntry(value, time.monotonic())
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _refresh(
+        self,
+        source: str,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        try:
+            value = await fetcher()
+        except Exception as e:
+            logger.error(f"{source} 데이터 갱신 실패: {str(e)}")
+            value = None
+
+        if value is not None:
+            self.put(source, key, value)
+        return value
+
+    async def get(
+        self,
+        source: str,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Optional[Any]]],
+        fresh_seconds: float = 0.0
+    ) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        데이터 조회
+
+        fresh_seconds 이내의 캐시는 그대로 반환합니다. 그보다 오래되면 업스트림을 호출하되,
+        사용 가능한 캐시가 있으면 refresh_timeout_seconds 까지만 기다리고 이후에는 캐시를
+        반환하며 호출은 백그라운드에서 계속 진행됩니다.
+
+        Args:
+            source: 데이터 소스 이름
+            key: 위치 등 캐시 키
+            fetcher: 업스트림 호출 함수 (실패 시 None 반환)
+            fresh_seconds: 업스트림 재호출 없이 사용할 수 있는 경과 시간 (초)
+
+        Returns:
+            (데이터, 경과 시간 초) - 데이터가 없으면 (None, None)
+        """
+        entry = self.peek(source, key)
+        if entry is not None and entry.age <= fresh_seconds:
+            return entry.value, entry.age
+
+        cache_key = (source, key)
+        task = self._refreshing.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(source, key, fetcher))
+            self._refreshing[cache_key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
+
+        try:
+            if entry is None:
+                value = await asyncio.shield(task)
+            else:
+                value = await asyncio.wait_for(
+                    asyncio.shield(task), timeout=self.refresh_timeout_seconds
+                )
+        except asyncio.TimeoutError:
+            value = None
+
+        if value is not None:
+            return value, 0.0
+
+        entry = self.peek(source, key)
+        if entry is None:
+            return None, None
+
+        UPSTREAM_STALE_SERVED_TOTAL.labels(source).inc()
+        logger.warning(f"⚠️ {source} 업스트림 응답 없음 - {entry.age:.0f}초 전 데이터 사용")
+        return entry.value, entry.age
+
+# 전역 최근 정상값 저장소 인스턴스
+last_known_good_store = LastKnownGoodStore()
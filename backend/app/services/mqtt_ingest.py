@@ -0,0 +1,212 @@
+"""
+MQTT 센서 데이터 수신 모듈
+IoT 센서가 발행하는 측정값을 구독하여 묶음 단위로 검증한 뒤 저장/위험도 경로로 전달
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+from urllib.parse import urlparse
+
+from app.core.config import settings
+from app.core.metrics import MQTT_MESSAGES_TOTAL, MQTT_BATCH_SECONDS
+from app.models.sensor_reading import SensorReading
+from app.services.collection_sources import COLLECTION_SOURCES, iot_item_fields
+from app.services.blob_store import payload_policy
+from app.services.sensor_validation import validate_batch
+from app.services.spatial_index import sensor_index
+
+logger = logging.getLogger(__name__)
+
+BatchCallback = Callable[[List[SensorReading]], Awaitable[None]]
+
+# 수신 처리 작업 종료 신호
+_STOP = object()
+
+def _create_paho_client(client_id: str):
+    import paho.mqtt.client as mqtt
+    return mqtt.Client(client_id=client_id, clean_session=False)
+
+class MqttIngestService:
+    """
+    MQTT 센서 데이터 수신 서비스
+
+    페이로드는 /sensors/nearby 응답 항목과 같은 형태의 JSON 객체 또는 그 배열입니다.
+    수신 대기열이 가득 차면 MQTT 네트워크 스레드가 대기하므로 브로커 쪽으로 역압이 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        broker_url: Optional[str] = None,
+        topic: Optional[str] = None,
+        buffer=None,
+        batch_size: Optional[int] = None,
+        batch_interval_seconds: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        client_factory: Optional[Callable[[str], Any]] = None
+    ):
+        if buffer is None:
+            from app.services.write_behind import write_behind_buffer
+            buffer = write_behind_buffer
+
+        self.broker_url = broker_url or settings.MQTT_BROKER_URL
+        self.topic = topic or settings.MQTT_TOPIC
+        self.buffer = buffer
+        self.batch_size = batch_size or settings.MQTT_BATCH_SIZE
+        self.batch_interval_seconds = batch_interval_seconds or settings.MQTT_BATCH_INTERVAL_SECONDS
+        self.max_queue_size = max_queue_size or settings.MQTT_MAX_QUEUE
+        self.client_factory = client_factory or _create_paho_client
+        self.source = COLLECTION_SOURCES["iot_sensors"]
+        self._subscribers: List[BatchCallback] = []
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, callback: BatchCallback):
+        """검증된 센서 데이터 묶음 수신 등록 (위험도 분석 등)"""
+        self._subscribers.append(callback)
+
+    def _on_connect(self, client, userdata, flags, rc):
+        if rc == 0:
+            # 재연결 시에도 구독 복구
+            client.subscribe(self.topic, qos=settings.MQTT_QOS)
+            logger.info(f"📶 MQTT 구독 시작 - {self.topic}")
+        else:
+            logger.error(f"MQTT 연결 실패: rc={rc}")
+
+    def _on_message(self, client, userdata, message):
+        # MQTT 네트워크 스레드에서 호출됨
+        future = asyncio.run_coroutine_threadsafe(
+            self._queue.put((message.topic, message.payload)), self._loop
+        )
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"MQTT 메시지 적재 실패: {str(e)}")
+
+    async def start(self):
+        """브로커 연결 및 수신 시작"""
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.buffer.start()
+        self._task = asyncio.create_task(self._run())
+
+        url = urlparse(self.broker_url)
+        client = self.client_factory(f"{settings.RABBITMQ_QUEUE_PREFIX}-ingest")
+        if settings.MQTT_USERNAME:
+            client.username_pw_set(settings.MQTT_USERNAME, settings.MQTT_PASSWORD)
+        if url.scheme == "mqtts":
+            client.tls_set()
+        client.on_connect = self._on_connect
+        client.on_message = self._on_message
+        client.connect_async(url.hostname or "localhost", url.port or 1883)
+        client.loop_start()
+        self._client = client
+
+    async def stop(self):
+        """수신 중지 (대기 중인 메시지는 처리 후 종료)"""
+        if self._client is not None:
+            await asyncio.to_thread(self._client.loop_stop)
+            self._client.disconnect()
+            self._client = None
+
+        # 처리 중인 묶음은 끝까지 처리하도록 취소 대신 종료 신호를 넣고 대기
+        if self._task is not None:
+            if not self._task.done():
+                try:
+                    self._queue.put_nowait(_STOP)
+                except asyncio.QueueFull:
+                    await self._queue.put(_STOP)
+                await self._task
+            self._task = None
+
+        if self._queue is not None:
+            messages = []
+            while not self._queue.empty():
+                message = self._queue.get_nowait()
+                if message is not _STOP:
+                    messages.append(message)
+            if messages:
+                await self._handle_batch(messages)
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            message = await self._queue.get()
+            if message is _STOP:
+                break
+            messages = [message]
+            deadline = time.monotonic() + self.batch_interval_seconds
+            while len(messages) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if message is _STOP:
+                    stopping = True
+                    break
+                messages.append(message)
+
+            try:
+                await self._handle_batch(messages)
+            except Exception as e:
+                logger.error(f"MQTT 묶음 처리 실패 ({len(messages)}개): {str(e)}")
+
+    async def validate(self, messages: List[tuple]) -> List[SensorReading]:
+        """수신 메시지 묶음을 센서 데이터로 변환 (잘못된 항목은 건너뜀, 묶음 단위로 한 번에 검증)"""
+        fields, topics = [], []
+        for topic, payload in messages:
+            try:
+                decoded = json.loads(payload)
+            except (ValueError, UnicodeDecodeError):
+                MQTT_MESSAGES_TOTAL.labels("invalid").inc()
+                logger.warning(f"MQTT 페이로드 해석 실패 ({topic})")
+                continue
+
+            items = decoded if isinstance(decoded, list) else [decoded]
+            for item in items:
+                if not isinstance(item, dict):
+                    MQTT_MESSAGES_TOTAL.labels("invalid").inc()
+                    continue
+                # 토픽 마지막 단계를 센서 ID로 사용 (페이로드에 id가 없을 때)
+                item.setdefault("id", topic.rsplit("/", 1)[-1])
+                try:
+                    row = iot_item_fields(self.source, item)
+                except KeyError as e:
+                    MQTT_MESSAGES_TOTAL.labels("invalid").inc()
+                    logger.warning(f"MQTT 센서 데이터 필드 누락 ({topic}): {str(e)}")
+                    continue
+                row["raw_data"] = await payload_policy.apply(item)
+                fields.append(row)
+                topics.append(topic)
+
+        result = validate_batch(fields)
+        for index, errors in result.errors.items():
+            MQTT_MESSAGES_TOTAL.labels("invalid").inc()
+            logger.warning(f"MQTT 센서 데이터 검증 실패 ({topics[index]}): {errors[0]['msg']}")
+        readings = result.readings()
+        MQTT_MESSAGES_TOTAL.labels("accepted").inc(len(readings))
+        return readings
+
+    async def _handle_batch(self, messages: List[tuple]):
+        started = time.monotonic()
+        readings = await self.validate(messages)
+        if readings:
+            sensor_index.update(readings)
+            for reading in readings:
+                await self.buffer.put(reading)
+            for callback in self._subscribers:
+                try:
+                    await callback(readings)
+                except Exception as e:
+                    logger.error(f"MQTT 센서 데이터 처리 실패: {str(e)}")
+        MQTT_BATCH_SECONDS.observe(time.monotonic() - started)
@@ -240,7 +240,7 @@ class NotificationService:
             # 실제 SMS 서비스 API 호출 (예시)
             async with httpx.AsyncClient() as client:
                 response = await client.post(
-                    "https://api.sms-service.com/send",
+                    f"{settings.SMS_API_ENDPOINT}/send",
                     json={
                         "to": cap_message["info"]["contact"].get("sms", []),
                         "message": sms_content,
@@ -310,7 +310,7 @@ class NotificationService:
             # FCM 또는 다른 푸시 서비스 API 호출
             async with httpx.AsyncClient() as client:
                 response = await client.post(
-                    "https://fcm.googleapis.com/fcm/send",
+                    settings.PUSH_API_ENDPOINT,
                     headers={
                         "Authorization": f"key={settings.FCM_SERVER_KEY}",
                         "Content-Type": "application/json"
@@ -342,7 +342,7 @@ class NotificationService:
             # 무전 시스템 API 호출
             async with httpx.AsyncClient() as client:
                 response = await client.post(
-                    "https://api.radio-system.com/broadcast",
+                    f"{settings.RADIO_API_ENDPOINT}/broadcast",
                     json={
                         "channels": cap_message["info"]["contact"].get("radio", []),
                         "message": radio_message,
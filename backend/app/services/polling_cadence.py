@@ -0,0 +1,155 @@
+"""
+위험도 기반 수집 주기 조정 모듈
+지역/카메라별 최근 위험도, 화재 탐지 신뢰도, 데이터 변화 여부로 다음 수집 간격을 결정
+"""
+
+import logging
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import COLLECTION_POLL_INTERVAL_SECONDS
+from app.models.sensor_data import SensorDataCreate, SensorType
+
+logger = logging.getLogger(__name__)
+
+CAMERA_TYPES = {SensorType.CCTV, SensorType.DRONE, SensorType.SATELLITE}
+
+# 위험도가 이 값 미만일 때만 변화 없는 수집이 이어지면 간격을 늘림
+QUIET_RISK = 0.3
+# 연속 무변화 1회당 간격 증가 배율
+QUIET_BACKOFF = 1.5
+# 위험도 상승분 가중치 (상승 중인 지역을 한 단계 먼저 촘촘하게)
+RISING_GAIN = 2.0
+
+class CadenceState:
+    """지역/카메라별 주기 산출 상태"""
+
+    __slots__ = ("risk", "previous_risk", "fire_confidence", "fingerprint", "unchanged", "updated_at")
+
+    def __init__(self):
+        self.risk: Optional[float] = None
+        self.previous_risk: Optional[float] = None
+        self.fire_confidence = 0.0
+        self.fingerprint: Optional[int] = None
+        self.unchanged = 0
+        self.updated_at = time.monotonic()
+
+    @property
+    def signal(self) -> float:
+        """0(한산) ~ 1(긴급) 사이 수집 긴급도"""
+        if self.risk is None:
+            return self.fire_confidence
+        rising = max(0.0, self.risk - self.previous_risk) * RISING_GAIN
+        return min(1.0, max(self.risk + rising, self.fire_confidence))
+
+    def observe(self, risk: float):
+        # 첫 관측은 상승으로 보지 않음
+        self.previous_risk = self.risk if self.risk is not None else risk
+        self.risk = risk
+        self.updated_at = time.monotonic()
+
+def _fingerprint(readings: Iterable[SensorDataCreate]) -> int:
+    return hash(frozenset(
+        (
+            data.sensor_id,
+            data.temperature,
+            data.humidity,
+            data.smoke_density,
+            data.wind_speed,
+            data.fire_detected,
+            data.fire_confidence
+        )
+        for data in readings
+    ))
+
+class PollingCadence:
+    """
+    위험도 기반 수집 주기
+
+    긴급도 s(0~1)에 따라 최대 간격에서 최소 간격까지 로그 스케일로 보간합니다:
+    interval = max * (min / max) ** s. 한산한 지역에서 데이터가 계속 그대로면 간격을 늘립니다.
+    """
+
+    def __init__(
+        self,
+        min_seconds: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+        camera_min_seconds: Optional[float] = None,
+        camera_max_seconds: Optional[float] = None
+    ):
+        self.min_seconds = min_seconds or settings.POLL_INTERVAL_MIN_SECONDS
+        self.max_seconds = max_seconds or settings.POLL_INTERVAL_MAX_SECONDS
+        self.camera_min_seconds = camera_min_seconds or settings.CAMERA_POLL_INTERVAL_MIN_SECONDS
+        self.camera_max_seconds = camera_max_seconds or settings.CAMERA_POLL_INTERVAL_MAX_SECONDS
+        self._regions: Dict[Hashable, CadenceState] = {}
+        self._cameras: Dict[str, CadenceState] = {}
+        # 지역 → 해당 지역에서 관측된 카메라 ID
+        self._region_cameras: Dict[Hashable, List[str]] = {}
+
+    def _scaled(self, state: Optional[CadenceState], bounds: Tuple[float, float], default: float) -> float:
+        low, high = bounds
+        if state is None:
+            return min(high, max(low, default))
+
+        signal = state.signal
+        interval = high * (low / high) ** signal
+        if signal < QUIET_RISK and state.unchanged:
+            interval *= QUIET_BACKOFF ** state.unchanged
+        return min(high, max(low, interval))
+
+    def observe_risk(self, region: Hashable, overall_risk: float):
+        """지역 종합 위험도 반영 (RiskAnalysisService overall_risk)"""
+        self._regions.setdefault(region, CadenceState()).observe(overall_risk)
+
+    def observe_readings(self, region: Hashable, readings: List[SensorDataCreate]):
+        """지역 수집 결과 반영 (화재 탐지 신뢰도, 데이터 변화 여부)"""
+        state = self._regions.setdefault(region, CadenceState())
+        fingerprint = _fingerprint(readings)
+        state.unchanged = state.unchanged + 1 if fingerprint == state.fingerprint else 0
+        state.fingerprint = fingerprint
+        state.fire_confidence = max(
+            (data.fire_confidence or 0.0 for data in readings if data.fire_detected),
+            default=0.0
+        )
+        state.updated_at = time.monotonic()
+
+        cameras = []
+        for data in readings:
+            if data.sensor_type not in CAMERA_TYPES:
+                continue
+            cameras.append(data.sensor_id)
+            camera = self._cameras.setdefault(data.sensor_id, CadenceState())
+            confidence = (data.fire_confidence or 0.0) if data.fire_detected else 0.0
+            camera.observe(confidence)
+            camera.fire_confidence = confidence
+        self._region_cameras[region] = cameras
+
+    def camera_interval(self, camera_id: str) -> float:
+        """카메라 수집 간격 (초)"""
+        return self._scaled(
+            self._cameras.get(camera_id),
+            (self.camera_min_seconds, self.camera_max_seconds),
+            self.camera_max_seconds
+        )
+
+    def region_interval(self, region: Hashable, default: Optional[float] = None) -> float:
+        """
+        지역 수집 간격 (초)
+
+        지역 자체 간격과 지역 내 카메라 간격 중 가장 짧은 값을 사용합니다.
+        관측 이력이 없으면 default (미지정 시 SENSOR_UPDATE_INTERVAL) 를 범위 안으로 맞춰 사용합니다.
+        """
+        interval = self._scaled(
+            self._regions.get(region),
+            (self.min_seconds, self.max_seconds),
+            default or settings.SENSOR_UPDATE_INTERVAL
+        )
+        # 화재 징후가 있는 카메라만 지역 간격을 앞당김
+        for camera_id in self._region_cameras.get(region, []):
+            camera = self._cameras.get(camera_id)
+            if camera is not None and camera.signal > 0:
+                interval = min(interval, self.camera_interval(camera_id))
+
+        COLLECTION_POLL_INTERVAL_SECONDS.labels(str(region)).set(interval)
+        return interval
@@ -0,0 +1,229 @@
+"""
+업스트림 호출 한도 관리 모듈
+기상청, KT 기가아이즈, IoT 플랫폼 API 키별 토큰 버킷 호출 제어
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import (
+    UPSTREAM_QUEUE_WAIT_SECONDS,
+    UPSTREAM_QUOTA_EXCEEDED_TOTAL,
+    UPSTREAM_THROTTLED_TOTAL
+)
+
+logger = logging.getLogger(__name__)
+
+class CallPriority(IntEnum):
+    """업스트림 호출 우선순위 (값이 작을수록 먼저 처리)"""
+    FIRE = 0      # 화재 탐지 지역
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+# Redis 서버 시간을 기준으로 토큰을 보충/차감하는 스크립트 (원자적 실행)
+_REDIS_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local penalty = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if penalty > 0 then
+    tokens = math.min(tokens, 0) - penalty * rate
+elseif tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate + penalty) + 1)
+return tostring(wait)
+"""
+
+class TokenBucket:
+    """프로세스 내부 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def try_acquire(self, tokens: int = 1) -> float:
+        """
+        토큰 획득 시도
+
+        Returns:
+            0이면 획득 성공, 그 외에는 다시 시도하기까지 기다려야 할 시간 (초)
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    async def penalize(self, seconds: float):
+        """업스트림 한도 초과 응답 시 지정 시간 동안 토큰 지급 중단"""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+class RedisTokenBucket:
+    """Redis 공유 토큰 버킷 (여러 워커가 같은 API 키 한도를 나눠 씀)"""
+
+    def __init__(self, redis_client, key: str, rate: float, capacity: int):
+        self.redis = redis_client
+        self.key = key
+        self.rate = rate
+        self.capacity = capacity
+        self._script = redis_client.register_script(_REDIS_TOKEN_BUCKET_SCRIPT)
+        # Redis 장애 시 사용할 로컬 버킷
+        self._fallback = TokenBucket(rate, capacity)
+
+    async def try_acquire(self, tokens: int = 1) -> float:
+        try:
+            wait = await self._script(keys=[self.key], args=[self.rate, self.capacity, tokens, 0])
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"Redis 토큰 버킷 사용 불가, 로컬 버킷으로 대체: {str(e)}")
+            return await self._fallback.try_acquire(tokens)
+
+    async def penalize(self, seconds: float):
+        try:
+            await self._script(keys=[self.key], args=[self.rate, self.capacity, 0, seconds])
+        except Exception as e:
+            logger.warning(f"Redis 토큰 버킷 사용 불가, 로컬 버킷으로 대체: {str(e)}")
+            await self._fallback.penalize(seconds)
+
+class _Lane:
+    """업스트림별 대기열"""
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.waiters: List[List[int]] = []
+        self.condition = asyncio.Condition()
+
+class UpstreamRateLimiter:
+    """업스트림별 우선순위 토큰 버킷 호출 제어기"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None, backend: Optional[str] = None):
+        self.limits = limits or {
+            "kt_gigai": {"rate": settings.VISION_AI_RATE_LIMIT, "burst": settings.VISION_AI_RATE_BURST},
+            "iot_sensors": {"rate": settings.IOT_SENSOR_RATE_LIMIT, "burst": settings.IOT_SENSOR_RATE_BURST},
+            "weather": {"rate": settings.WEATHER_API_RATE_LIMIT, "burst": settings.WEATHER_API_RATE_BURST}
+        }
+        self.backend = backend or settings.RATE_LIMIT_BACKEND
+        self._lanes: Dict[str, _Lane] = {}
+        self._redis = None
+        self._sequence = itertools.count()
+
+    def _create_bucket(self, upstream: str):
+        limit = self.limits[upstream]
+        if self.backend == "redis":
+            if self._redis is None:
+                import redis.asyncio as aioredis
+                self._redis = aioredis.from_url(settings.REDIS_URL, password=settings.REDIS_PASSWORD)
+            return RedisTokenBucket(
+                self._redis,
+                f"{settings.RABBITMQ_QUEUE_PREFIX}:ratelimit:{upstream}",
+                limit["rate"],
+                int(limit["burst"])
+            )
+        return TokenBucket(limit["rate"], int(limit["burst"]))
+
+    def _get_lane(self, upstream: str) -> _Lane:
+        lane = self._lanes.get(upstream)
+        if lane is None:
+            lane = _Lane(self._create_bucket(upstream))
+            self._lanes[upstream] = lane
+        return lane
+
+    async def acquire(self, upstream: str, priority: CallPriority = CallPriority.NORMAL) -> float:
+        """
+        업스트림 호출 전 토큰 획득 (우선순위가 높은 호출이 먼저 토큰을 받음)
+
+        Args:
+            upstream: 업스트림 이름 (kt_gigai, iot_sensors, weather)
+            priority: 호출 우선순위
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if upstream not in self.limits:
+            return 0.0
+
+        lane = self._get_lane(upstream)
+        priority_label = priority.name.lower()
+        started = time.monotonic()
+        entry = [int(priority), next(self._sequence)]
+        throttled = False
+
+        async with lane.condition:
+            heapq.heappush(lane.waiters, entry)
+
+        try:
+            while True:
+                # 대기열 맨 앞 호출만 토큰을 시도
+                async with lane.condition:
+                    await lane.condition.wait_for(lambda: lane.waiters[0] is entry)
+
+                wait = await lane.bucket.try_acquire()
+                if wait <= 0:
+                    break
+
+                if not throttled:
+                    throttled = True
+                    UPSTREAM_THROTTLED_TOTAL.labels(upstream, priority_label).inc()
+                await asyncio.sleep(wait)
+        finally:
+            async with lane.condition:
+                lane.waiters.remove(entry)
+                heapq.heapify(lane.waiters)
+                lane.condition.notify_all()
+
+        waited = time.monotonic() - started
+        UPSTREAM_QUEUE_WAIT_SECONDS.labels(upstream, priority_label).observe(waited)
+        return waited
+
+    async def try_acquire(self, upstream: str) -> bool:
+        """대기 없이 토큰 획득 시도 (대기 중인 호출이 있으면 양보)"""
+        if upstream not in self.limits:
+            return True
+
+        lane = self._get_lane(upstream)
+        if lane.waiters:
+            return False
+        return await lane.bucket.try_acquire() <= 0
+
+    async def report_quota_exceeded(self, upstream: str, retry_after: Optional[str] = None):
+        """업스트림 429 응답 반영 (Retry-After 동안 해당 업스트림 호출 중단)"""
+        if upstream not in self.limits:
+            return
+
+        try:
+            seconds = float(retry_after) if retry_after else 1.0
+        except ValueError:
+            seconds = 1.0
+
+        UPSTREAM_QUOTA_EXCEEDED_TOTAL.labels(upstream).inc()
+        logger.warning(f"⏳ {upstream} 호출 한도 초과 - {seconds}초 동안 호출 보류")
+        await self._get_lane(upstream).bucket.penalize(seconds)
+
+# 전역 호출 제어기 인스턴스
+rate_limiter = UpstreamRateLimiter()
@@ -0,0 +1,207 @@
+"""
+권고안 생성 파이프라인 모듈
+데이터 수집 → 위험도 분석 → 권고안 생성 → 저장 단계를 제한된 크기의 대기열로 연결하고
+단계별 작업자 수를 조정하여, 느린 단계가 앞 단계의 투입 속도를 제한하도록 구성
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import (
+    PIPELINE_JOBS_TOTAL,
+    PIPELINE_QUEUE_DEPTH,
+    PIPELINE_STAGE_SECONDS
+)
+from app.services.sensor_columns import SensorColumns
+
+logger = logging.getLogger(__name__)
+
+class PipelineJob:
+    """파이프라인 작업 (단계를 거치며 결과가 채워짐)"""
+
+    def __init__(self, location: Dict[str, float], radius_km: float):
+        self.location = location
+        self.radius_km = radius_km
+        self.sensor_data: List[Any] = []
+        self.risk_analysis: Dict[str, Any] = {}
+        self.recommendations: List[Any] = []
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+class PipelineStage:
+    """파이프라인 단계 (입력 대기열 + 작업자)"""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[PipelineJob], Awaitable[None]],
+        workers: int,
+        queue_size: int
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.next: Optional["PipelineStage"] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def put(self, job: PipelineJob):
+        # 대기열이 가득 차면 앞 단계 작업자가 여기서 대기 (역압)
+        await self.queue.put(job)
+        PIPELINE_QUEUE_DEPTH.labels(self.name).set(self.queue.qsize())
+
+    def start(self):
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self):
+        while True:
+            job = await self.queue.get()
+            PIPELINE_QUEUE_DEPTH.labels(self.name).set(self.queue.qsize())
+            if job.future.done():
+                # 요청이 취소된 작업은 건너뜀
+                continue
+
+            started = time.monotonic()
+            try:
+                await self.handler(job)
+            except Exception as e:
+                PIPELINE_JOBS_TOTAL.labels(self.name, "error").inc()
+                logger.error(f"파이프라인 {self.name} 단계 실패: {str(e)}")
+                if not job.future.done():
+                    job.future.set_exception(e)
+                continue
+            finally:
+                PIPELINE_STAGE_SECONDS.labels(self.name).observe(time.monotonic() - started)
+
+            PIPELINE_JOBS_TOTAL.labels(self.name, "ok").inc()
+            if self.next is not None:
+                await self.next.put(job)
+            elif not job.future.done():
+                job.future.set_result(job.recommendations)
+
+class RecommendationPipeline:
+    """권고안 생성 파이프라인"""
+
+    def __init__(
+        self,
+        data_collection_service=None,
+        risk_analysis_service=None,
+        ai_service=None,
+        persist: Optional[Callable[[List[Any]], List[Any]]] = None,
+        workers: Optional[Dict[str, int]] = None,
+        queue_size: Optional[int] = None
+    ):
+        if data_collection_service is None:
+            from app.services.data_collection_service import DataCollectionService
+            data_collection_service = DataCollectionService()
+        if risk_analysis_service is None:
+            from app.services.risk_analysis_service import RiskAnalysisService
+            risk_analysis_service = RiskAnalysisService()
+        if ai_service is None:
+            from app.services.ai_service import AIService
+            ai_service = AIService()
+
+        self.data_collection_service = data_collection_service
+        self.risk_analysis_service = risk_analysis_service
+        self.ai_service = ai_service
+        self.persist = persist or _persist_recommendations
+        self.workers = workers or {
+            "collect": settings.PIPELINE_COLLECT_WORKERS,
+            "risk": settings.PIPELINE_RISK_WORKERS,
+            "recommend": settings.PIPELINE_RECOMMEND_WORKERS,
+            "persist": settings.PIPELINE_PERSIST_WORKERS
+        }
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
+        self._stages: List[PipelineStage] = []
+
+    async def _collect(self, job: PipelineJob):
+        job.sensor_data = await self.data_collection_service.collect_all_data(job.location, job.radius_km)
+
+    async def _analyze(self, job: PipelineJob):
+        # 열 단위 변환과 집계는 한 번만 하고 권고안 단계와 공유 (업스트림이 반경 밖 센서를 보내도 반경 내만 사용)
+        job.sensor_data = SensorColumns.of(job.sensor_data).within(job.location, job.radius_km)
+        job.risk_analysis = await self.risk_analysis_service.analyze_fire_risk(job.sensor_data, job.location)
+
+    async def _recommend(self, job: PipelineJob):
+        job.recommendations = await self.ai_service.generate_recommendations(
+            job.sensor_data,
+            job.risk_analysis["overall_risk"],
+            job.location
+        )
+
+    async def _persist(self, job: PipelineJob):
+        job.recommendations = await asyncio.to_thread(self.persist, job.recommendations)
+
+    def start(self):
+        """단계별 작업자 시작"""
+        if self._stages:
+            return
+
+        handlers = [
+            ("collect", self._collect),
+            ("risk", self._analyze),
+            ("recommend", self._recommend),
+            ("persist", self._persist)
+        ]
+        self._stages = [
+            PipelineStage(name, handler, self.workers[name], self.queue_size)
+            for name, handler in handlers
+        ]
+        for stage, next_stage in zip(self._stages, self._stages[1:]):
+            stage.next = next_stage
+        for stage in self._stages:
+            stage.start()
+        logger.info(f"🔀 권고안 파이프라인 시작 - 작업자: {self.workers}")
+
+    async def stop(self):
+        """작업자 중지"""
+        for stage in self._stages:
+            await stage.stop()
+        self._stages = []
+
+    async def submit(self, location: Dict[str, float], radius_km: float = 5.0) -> List[Any]:
+        """
+        권고안 생성 요청
+
+        수집 단계 대기열이 가득 차면 자리가 날 때까지 대기합니다.
+
+        Returns:
+            저장된 권고안 리스트
+        """
+        self.start()
+        job = PipelineJob(location, radius_km)
+        await self._stages[0].put(job)
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            # 요청이 끊기면 남은 단계는 건너뛰도록 표시
+            job.future.cancel()
+            raise
+
+def _persist_recommendations(recommendations: List[Any]) -> List[Any]:
+    """권고안 일괄 저장 (작업자 스레드에서 실행, 한 번의 커밋)"""
+    from app.core.database import SessionLocal
+    from app.models.ai_recommendation import AIRecommendation
+
+    db = SessionLocal()
+    try:
+        saved = [AIRecommendation(**rec_data.dict()) for rec_data in recommendations]
+        db.add_all(saved)
+        db.commit()
+        for db_rec in saved:
+            db.refresh(db_rec)
+            db.expunge(db_rec)
+        return saved
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,337 @@
+"""
+지역별 실시간 위험도 상태 모듈
+측정값이 들어올 때마다 지역별 이동 구간 집계(개수/합계/최솟값/최댓값/EWMA)를 O(1)로 갱신하고,
+전체 센서 목록을 다시 훑지 않고 현재 위험도를 바로 산출
+"""
+
+import logging
+import math
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import REGION_RISK_SCORE
+
+logger = logging.getLogger(__name__)
+
+# 이동 구간 집계 대상 수치 열
+ROLLING_COLUMNS = ("temperature", "humidity", "smoke_density", "visibility")
+
+class RollingStat:
+    """
+    시간 구간 이동 집계
+
+    구간 합계는 누적값에 더하고 빼며, 최솟값/최댓값은 단조 덱으로 유지하여
+    추가와 만료가 모두 분할 상환 O(1) 입니다. EWMA 는 반감기 기준으로 감쇠한 가중 평균이며
+    (같은 시각의 값은 단순 평균) 구간과 관계없이 모든 값을 반영합니다.
+    """
+
+    __slots__ = (
+        "window", "tau", "count", "total",
+        "_decayed_sum", "_decayed_weight", "_decayed_at",
+        "_seq", "_values", "_mins", "_maxs"
+    )
+
+    def __init__(self, window_seconds: float, halflife_seconds: float):
+        self.window = window_seconds
+        self.tau = halflife_seconds / math.log(2)
+        self.count = 0
+        self.total = 0.0
+        self._decayed_sum = 0.0
+        self._decayed_weight = 0.0
+        self._decayed_at = 0.0
+        self._seq = 0
+        # (시각, 순번, 값)
+        self._values: Deque[Tuple[float, int, float]] = deque()
+        # (순번, 값) - 앞쪽이 구간 최솟값/최댓값
+        self._mins: Deque[Tuple[int, float]] = deque()
+        self._maxs: Deque[Tuple[int, float]] = deque()
+
+    def push(self, at: float, value: float):
+        seq = self._seq
+        self._seq += 1
+        self._values.append((at, seq, value))
+        self.count += 1
+        self.total += value
+
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((seq, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((seq, value))
+
+        decay = math.exp(-max(0.0, at - self._decayed_at) / self.tau)
+        self._decayed_sum = self._decayed_sum * decay + value
+        self._decayed_weight = self._decayed_weight * decay + 1.0
+        self._decayed_at = at
+
+    def expire(self, now: float) -> bool:
+        """구간을 벗어난 값 제거 (제거한 값이 있으면 True)"""
+        cutoff = now - self.window
+        expired = False
+        while self._values and self._values[0][0] < cutoff:
+            _, seq, value = self._values.popleft()
+            self.count -= 1
+            self.total -= value
+            if self._mins[0][0] == seq:
+                self._mins.popleft()
+            if self._maxs[0][0] == seq:
+                self._maxs.popleft()
+            expired = True
+        if not self.count:
+            # 누적 오차 제거
+            self.total = 0.0
+        return expired
+
+    @property
+    def ewma(self) -> Optional[float]:
+        return self._decayed_sum / self._decayed_weight if self._decayed_weight else None
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    @property
+    def min(self) -> float:
+        return self._mins[0][1] if self._mins else math.nan
+
+    @property
+    def max(self) -> float:
+        return self._maxs[0][1] if self._maxs else math.nan
+
+class _LatestBySensor:
+    """센서별 최근 항목 (구간 내 마지막 관측만 유지, 만료는 관측 순서 덱으로 처리)"""
+
+    __slots__ = ("window", "items", "_log")
+
+    def __init__(self, window_seconds: float):
+        self.window = window_seconds
+        # 센서 ID → (시각, 값)
+        self.items: Dict[str, Tuple[float, Any]] = {}
+        self._log: Deque[Tuple[float, str]] = deque()
+
+    def put(self, at: float, sensor_id: str, value: Any) -> Optional[Tuple[float, Any]]:
+        """갱신 후 이전 항목 반환"""
+        previous = self.items.get(sensor_id)
+        self.items[sensor_id] = (at, value)
+        self._log.append((at, sensor_id))
+        return previous
+
+    def discard(self, sensor_id: str) -> Optional[Tuple[float, Any]]:
+        return self.items.pop(sensor_id, None)
+
+    def expire(self, now: float) -> List[Any]:
+        """구간을 벗어난 센서의 값 목록 (이후 다시 관측된 센서는 유지)"""
+        cutoff = now - self.window
+        expired = []
+        while self._log and self._log[0][0] < cutoff:
+            at, sensor_id = self._log.popleft()
+            item = self.items.get(sensor_id)
+            if item is not None and item[0] == at:
+                del self.items[sensor_id]
+                expired.append(item[1])
+        return expired
+
+class RegionRiskState:
+    """
+    지역 하나의 실시간 위험도 상태
+
+    수치 열은 측정값 단위 이동 구간으로, 센서 수/타입 다양성과 화재 탐지는 센서별 최근 관측으로 집계합니다.
+    화재 탐지는 센서의 최근 측정값이 탐지 해제이면 즉시 빠집니다.
+    """
+
+    def __init__(self, window_seconds: float, halflife_seconds: float):
+        self.window = window_seconds
+        self.columns = {name: RollingStat(window_seconds, halflife_seconds) for name in ROLLING_COLUMNS}
+        self.wind_speed = RollingStat(window_seconds, halflife_seconds)
+        # 풍향 단위 벡터 성분 (원형 평균)
+        self.wind_sin = RollingStat(window_seconds, halflife_seconds)
+        self.wind_cos = RollingStat(window_seconds, halflife_seconds)
+        self.quality = RollingStat(window_seconds, halflife_seconds)
+        self.sensors = _LatestBySensor(window_seconds)
+        self.sensor_types: Counter = Counter()
+        self.detections = _LatestBySensor(window_seconds)
+        self.weather_risk = 0.0
+        # 지역 대표 위치 (과거 화재 지수 조회, refresh_weather 로 설정)
+        self.location: Optional[Dict[str, float]] = None
+        # 상태가 바뀔 때마다 증가 (위험도 캐시 무효화)
+        self.version = 0
+
+    def observe(self, reading: Any, at: float):
+        for name, stat in self.columns.items():
+            value = getattr(reading, name)
+            if value is not None:
+                stat.push(at, value)
+
+        if reading.wind_speed is not None and reading.wind_direction is not None:
+            radians = math.radians(reading.wind_direction)
+            self.wind_speed.push(at, reading.wind_speed)
+            self.wind_sin.push(at, math.sin(radians))
+            self.wind_cos.push(at, math.cos(radians))
+
+        quality = reading.data_quality
+        self.quality.push(at, 0.5 if not quality or math.isnan(quality) else quality)
+
+        sensor_type = getattr(reading.sensor_type, "value", reading.sensor_type)
+        previous = self.sensors.put(at, reading.sensor_id, sensor_type)
+        if previous is not None:
+            self._drop_type(previous[1])
+        self.sensor_types[sensor_type] += 1
+
+        if reading.fire_detected:
+            self.detections.put(at, reading.sensor_id, reading.fire_confidence or 0.0)
+        else:
+            self.detections.discard(reading.sensor_id)
+        self.version += 1
+
+    def _drop_type(self, sensor_type: str):
+        self.sensor_types[sensor_type] -= 1
+        if not self.sensor_types[sensor_type]:
+            del self.sensor_types[sensor_type]
+
+    def expire(self, now: float):
+        expired = False
+        for stat in (*self.columns.values(), self.wind_speed, self.wind_sin, self.wind_cos, self.quality):
+            expired = stat.expire(now) or expired
+        for sensor_type in self.sensors.expire(now):
+            self._drop_type(sensor_type)
+            expired = True
+        if self.detections.expire(now):
+            expired = True
+        if expired:
+            self.version += 1
+
+    def aggregates(self) -> Dict[str, float]:
+        """위험도 산출용 집계값 (risk_batch.group_stats 와 같은 키)"""
+        confidences = [confidence for _, confidence in self.detections.items.values()]
+        values = {
+            "count": len(self.sensors.items),
+            "fire_count": len(confidences),
+            "fire_max": max(confidences, default=math.nan),
+            "wind_pairs": self.wind_speed.count,
+            "wind_speed_mean": self.wind_speed.mean,
+            "wind_direction_mean": (
+                math.degrees(math.atan2(self.wind_sin.total, self.wind_cos.total)) % 360.0
+                if self.wind_speed.count else math.nan
+            ),
+            "quality_mean": self.quality.mean,
+            "sensor_type_count": len(self.sensor_types)
+        }
+        for name, stat in self.columns.items():
+            values[f"{name}_count"] = stat.count
+            values[f"{name}_mean"] = stat.mean
+            values[f"{name}_min"] = stat.min
+            values[f"{name}_max"] = stat.max
+        return values
+
+    def trends(self) -> Dict[str, Optional[float]]:
+        """수치 열 EWMA (반감기 기준 최근값 가중 평균)"""
+        return {
+            **{name: stat.ewma for name, stat in self.columns.items()},
+            "wind_speed": self.wind_speed.ewma
+        }
+
+class RegionRiskTracker:
+    """
+    지역별 실시간 위험도
+
+    observe 로 측정값을 반영하고 risk 로 현재 위험도를 읽습니다. 위험도는 상태가 바뀐 뒤 처음 읽을 때
+    RiskAnalysisService.score_aggregates 로 한 번 산출하여 다음 변경까지 재사용합니다.
+    날씨 위험도는 refresh_weather 로 갱신한 마지막 값을 사용하고, 과거 데이터 위험도는 그때 받은 지역 위치로
+    과거 화재 지수를 조회합니다 (위치가 없으면 전국 평균).
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        halflife_seconds: Optional[float] = None,
+        risk_service=None
+    ):
+        self.window_seconds = window_seconds or settings.REGION_RISK_WINDOW_SECONDS
+        self.halflife_seconds = halflife_seconds or settings.REGION_RISK_EWMA_HALFLIFE_SECONDS
+        self.risk_service = risk_service
+        self._states: Dict[Hashable, RegionRiskState] = {}
+        # 지역 → (상태 버전, 과거 데이터 위험도, 위험도)
+        self._scores: Dict[Hashable, Tuple[int, float, Dict[str, Any]]] = {}
+
+    def _service(self):
+        if self.risk_service is None:
+            from app.services.risk_analysis_service import RiskAnalysisService
+            self.risk_service = RiskAnalysisService()
+        return self.risk_service
+
+    def _state(self, region: Hashable) -> RegionRiskState:
+        state = self._states.get(region)
+        if state is None:
+            state = self._states[region] = RegionRiskState(self.window_seconds, self.halflife_seconds)
+        return state
+
+    def __contains__(self, region: Hashable) -> bool:
+        return region in self._states
+
+    def observe(self, region: Hashable, readings: Iterable[Any], now: Optional[float] = None):
+        """지역 측정값 반영"""
+        now = time.monotonic() if now is None else now
+        state = self._state(region)
+        for reading in readings:
+            state.observe(reading, now)
+
+    async def refresh_weather(self, region: Hashable, location: Dict[str, float]):
+        """지역 날씨 위험도 갱신 (기상청 격자 캐시 경유)"""
+        weather = await self._service()._analyze_weather_conditions(location)
+        state = self._state(region)
+        state.location = location
+        if state.weather_risk != weather["risk_score"]:
+            state.weather_risk = weather["risk_score"]
+            state.version += 1
+
+    def risk(self, region: Hashable, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """지역 현재 위험도 (관측 이력이 없으면 None)"""
+        if region not in self._states:
+            return None
+        return self.risk_all([region], now)[region]
+
+    def risk_all(
+        self,
+        regions: Optional[Iterable[Hashable]] = None,
+        now: Optional[float] = None
+    ) -> Dict[Hashable, Dict[str, Any]]:
+        """여러 지역의 현재 위험도 (변경된 지역만 한 번의 배열 연산으로 재산출)"""
+        now = time.monotonic() if now is None else now
+        regions = list(self._states if regions is None else (r for r in regions if r in self._states))
+        service = self._service()
+        locations = [self._states[region].location or {} for region in regions]
+        historical = service.historical_index.risk(
+            np.array([location.get("lat", math.nan) for location in locations], dtype=float),
+            np.array([location.get("lng", math.nan) for location in locations], dtype=float)
+        )["risk_score"]
+        historical_by_region = dict(zip(regions, historical.tolist()))
+
+        stale = []
+        for region in regions:
+            state = self._states[region]
+            state.expire(now)
+            cached = self._scores.get(region)
+            if cached is None or cached[0] != state.version or cached[1] != historical_by_region[region]:
+                stale.append(region)
+
+        if stale:
+            states = [self._states[region] for region in stale]
+            rows = [state.aggregates() for state in states]
+            stats = {key: np.array([row[key] for row in rows], dtype=float) for key in rows[0]}
+            weather_risk = np.array([state.weather_risk for state in states])
+            historical_risk = np.array([historical_by_region[region] for region in stale])
+            scores = service.score_aggregates(stats, weather_risk, historical_risk)
+            for region, state, score in zip(stale, states, scores):
+                score["trends"] = state.trends()
+                self._scores[region] = (state.version, historical_by_region[region], score)
+                REGION_RISK_SCORE.labels(str(region)).set(score["overall_risk"])
+
+        return {region: self._scores[region][2] for region in regions}
+
+# 전역 지역별 실시간 위험도
+region_risk_tracker = RegionRiskTracker()
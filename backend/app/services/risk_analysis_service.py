@@ -6,20 +6,35 @@
 import asyncio
 import logging
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import math
 
 from app.models.sensor_data import SensorData, SensorType
+from app.services.historical_index import historical_index
+from app.services.risk_batch import assign_sensors, group_stats
+from app.services.risk_memo import RiskMemo, snapshot_fingerprint
+from app.services.sensor_columns import SensorColumns
+from app.services.spread_ensemble import EnsembleConditions, IncidentForecast, spread_ensemble
+from app.services.spread_simulator import SLOPE_COEFFICIENT, SpreadGrid, SpreadResult, SpreadSimulator
+from app.services.terrain_store import terrain_store
 from app.services.weather_service import WeatherService
 
 logger = logging.getLogger(__name__)
 
+# 센서 데이터 묶음 (객체 목록 또는 열 단위 변환 결과)
+SensorBatch = Union[List[SensorData], SensorColumns]
+
 class RiskAnalysisService:
     """위험도 분석 서비스 클래스"""
     
     def __init__(self):
         self.weather_service = WeatherService()
+        self.spread_simulator = SpreadSimulator()
+        self.spread_ensemble = spread_ensemble
+        self.terrain_store = terrain_store
+        self.historical_index = historical_index
+        self.risk_memo = RiskMemo()
         
         # 위험도 계산 가중치
         self.weights = {
@@ -39,20 +54,47 @@ class RiskAnalysisService:
     
     async def analyze_fire_risk(
         self, 
-        sensor_data: List[SensorData],
+        sensor_data: SensorBatch,
         location: Dict[str, float]
     ) -> Dict[str, Any]:
         """
         화재 위험도 종합 분석
         
+        센서 스냅샷, 양자화한 날씨, 위치 셀, 가중치/임계값이 같은 최근 분석이 있으면 그 결과를 반환합니다.
+        
         Args:
-            sensor_data: 센서 데이터 리스트
+            sensor_data: 센서 데이터 리스트 (또는 SensorColumns, 집계값을 권고안 생성과 공유)
             location: 위치 정보 {"lat": float, "lng": float}
             
         Returns:
             위험도 분석 결과
         """
         try:
+            # 열 단위로 한 번만 변환하여 아래 단계가 같은 집계값을 사용
+            sensor_data = SensorColumns.of(sensor_data)
+            
+            # 날씨(격자 캐시 경유)와 과거 데이터는 지문에 포함하므로 먼저 조회
+            weather_risk = await self._analyze_weather_conditions(location)
+            historical_risk = self._analyze_historical_data(sensor_data, location)
+            memo_key = snapshot_fingerprint(
+                sensor_data, weather_risk["weather_data"], location,
+                (
+                    tuple(sorted(self.weights.items())),
+                    tuple(sorted(self.thresholds.items())),
+                    round(historical_risk["risk_score"], 4),
+                    str(self.terrain_store.root)
+                )
+            )
+            cached = self.risk_memo.get(memo_key)
+            if cached is not None:
+                # 분석 시각과 방금 조회한 날씨/과거 데이터(수신 시각, 현재 월/시)는 새 값으로
+                cached.update({
+                    "weather_risk": weather_risk,
+                    "historical_risk": historical_risk,
+                    "analysis_timestamp": datetime.now().isoformat()
+                })
+                logger.info(f"♻️ 화재 위험도 분석 캐시 사용 - 위험도: {cached['overall_risk']:.2f}")
+                return cached
             logger.info(f"🔍 화재 위험도 분석 시작 - 센서 데이터: {len(sensor_data)}개")
             
             # 1. 화재 탐지 분석
@@ -61,11 +103,7 @@ class RiskAnalysisService:
             # 2. 환경 조건 분석
             environmental_risk = self._analyze_environmental_conditions(sensor_data)
             
-            # 3. 날씨 조건 분석
-            weather_risk = await self._analyze_weather_conditions(location)
-            
-            # 4. 과거 데이터 분석
-            historical_risk = self._analyze_historical_data(sensor_data, location)
+            # 3. 날씨 조건 분석 / 4. 과거 데이터 분석 (위에서 조회)
             
             # 5. 종합 위험도 계산
             overall_risk = self._calculate_overall_risk(
@@ -95,6 +133,7 @@ class RiskAnalysisService:
                 "confidence": self._calculate_analysis_confidence(sensor_data)
             }
             
+            self.risk_memo.put(memo_key, analysis_result)
             logger.info(f"✅ 화재 위험도 분석 완료 - 위험도: {overall_risk:.2f}, 등급: {risk_level}")
             return analysis_result
             
@@ -102,13 +141,202 @@ class RiskAnalysisService:
             logger.error(f"❌ 화재 위험도 분석 실패: {str(e)}")
             raise
     
-    def _analyze_fire_detection(self, sensor_data: List[SensorData]) -> Dict[str, Any]:
+    async def analyze_fire_risk_batch(
+        self,
+        sensor_data: SensorBatch,
+        locations: List[Dict[str, float]],
+        radius_km: float = 5.0
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 지점의 화재 위험도 일괄 분석
+        
+        하나의 센서 스냅샷을 지점별 반경으로 나눠 analyze_fire_risk 와 같은 산식을 배열 연산으로 적용합니다.
+        날씨는 기상청 격자마다 한 번만 조회하여 같은 격자의 지점이 공유합니다.
+        
+        Args:
+            sensor_data: 모든 지점을 포함하는 센서 데이터 (또는 SensorColumns)
+            locations: 위치 목록 [{"lat": float, "lng": float}, ...]
+            radius_km: 지점별 센서 반경 (km)
+            
+        Returns:
+            지점별 위험도 요약 (locations 순서)
+        """
+        if not locations:
+            return []
+        
+        columns = SensorColumns.of(sensor_data)
+        size = len(locations)
+        lats = np.array([loc["lat"] for loc in locations], dtype=float)
+        lngs = np.array([loc["lng"] for loc in locations], dtype=float)
+        logger.info(f"🔍 화재 위험도 일괄 분석 시작 - 지점: {size}개, 센서 데이터: {len(columns)}개")
+        
+        # 1. 지점별 센서 배정과 집계
+        group, sensors = assign_sensors(columns, lats, lngs, radius_km)
+        stats = group_stats(columns, group, sensors, size)
+        
+        # 2. 날씨 조건 (격자별 1회 조회)
+        cells = [self.weather_service.grid_cell(lat, lng) for lat, lng in zip(lats, lngs)]
+        representatives: Dict[Tuple[int, int], int] = {}
+        for i, cell in enumerate(cells):
+            representatives.setdefault(cell, i)
+        weather = await asyncio.gather(*(
+            self._analyze_weather_conditions(locations[i]) for i in representatives.values()
+        ))
+        weather_by_cell = dict(zip(representatives, weather))
+        weather_risk = np.array([weather_by_cell[cell]["risk_score"] for cell in cells])
+        
+        # 3. 과거 데이터 (과거 화재 지수에서 지점별 배열 조회)
+        historical_risk = self.historical_index.risk(lats, lngs)["risk_score"]
+        
+        # 4. 지형 특성 (타일 메모리 매핑으로 모든 지점을 한 번에 조회)
+        terrain = self.terrain_store.features(lats, lngs)
+        
+        scores = self.score_aggregates(stats, weather_risk, historical_risk, terrain)
+        results = [
+            {"location": {"lat": location["lat"], "lng": location["lng"]}, **score}
+            for location, score in zip(locations, scores)
+        ]
+        
+        logger.info(
+            f"✅ 화재 위험도 일괄 분석 완료 - 지점: {size}개, 날씨 조회: {len(representatives)}건, "
+            f"최고 위험도: {max(result['overall_risk'] for result in results):.2f}"
+        )
+        return results
+    
+    def score_aggregates(
+        self,
+        stats: Dict[str, np.ndarray],
+        weather_risk: np.ndarray,
+        historical_risk: Union[float, np.ndarray],
+        terrain: Optional[Dict[str, np.ndarray]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        묶음별 집계값에서 위험도 산출 (analyze_fire_risk 와 같은 산식을 배열 연산으로 적용)
+        
+        Args:
+            stats: 묶음별 집계 배열 (risk_batch.group_stats 와 같은 키, 값이 없는 묶음은 개수 0)
+            weather_risk: 묶음별 날씨 위험도
+            historical_risk: 묶음별 과거 데이터 위험도 (스칼라면 모든 묶음 공통)
+            terrain: 묶음별 지형 특성 (TerrainStore.features, 없으면 확산 속도 보정 생략)
+            
+        Returns:
+            묶음별 위험도 요약
+        """
+        weather_risk = np.asarray(weather_risk, dtype=float)
+        historical_risk = np.broadcast_to(np.asarray(historical_risk, dtype=float), stats["count"].shape)
+        with np.errstate(invalid="ignore"):
+            # 화재 탐지
+            fire_risk = np.where(
+                stats["fire_count"] > 0,
+                np.minimum(0.99, stats["fire_max"] * (stats["fire_count"] / 3)),
+                0.0
+            )
+            
+            # 환경 조건 (값이 없는 항목은 0)
+            temp_risk = np.clip((stats["temperature_max"] - 25) / 20, 0, 0.8)
+            humidity_risk = np.clip((30 - stats["humidity_min"]) / 30, 0, 0.8)
+            smoke_risk = np.minimum(0.9, stats["smoke_density_max"] / 100)
+            visibility_risk = np.clip((5 - stats["visibility_min"]) / 5, 0, 0.7)
+            environmental_risk = sum(
+                np.where(stats[f"{name}_count"] > 0, risk, 0.0)
+                for name, risk in (
+                    ("temperature", temp_risk),
+                    ("humidity", humidity_risk),
+                    ("smoke_density", smoke_risk),
+                    ("visibility", visibility_risk)
+                )
+            ) / 4
+            
+            # 종합 위험도와 등급
+            overall_risk = np.clip(
+                fire_risk * self.weights["fire_detection"] +
+                environmental_risk * self.weights["environmental"] +
+                weather_risk * self.weights["weather"] +
+                historical_risk * self.weights["historical"],
+                0.0, 0.99
+            )
+            risk_level = np.select(
+                [
+                    overall_risk >= self.thresholds["critical"],
+                    overall_risk >= self.thresholds["high"],
+                    overall_risk >= self.thresholds["medium"]
+                ],
+                ["critical", "high", "medium"],
+                "low"
+            )
+            
+            # 확산 예측 (풍속/풍향이 있는 묶음만)
+            has_wind = stats["wind_pairs"] > 0
+            spread_speed = np.where(has_wind, stats["wind_speed_mean"] * 0.1 * (1 + overall_risk * 2), 0.0)
+            if terrain is not None:
+                spread_speed = spread_speed * self._terrain_spread_factor(stats["wind_direction_mean"], terrain)
+            affected_radius = np.minimum(10.0, spread_speed * 2)
+            
+            # 분석 신뢰도
+            count = stats["count"]
+            confidence = np.where(
+                count > 0,
+                np.clip(
+                    (
+                        stats["quality_mean"] +
+                        np.minimum(1.0, count / 10) +
+                        np.minimum(1.0, stats["sensor_type_count"] / 5)
+                    ) / 3,
+                    0.0, 0.99
+                ),
+                0.0
+            )
+        
+        spread_direction = np.where(has_wind, stats["wind_direction_mean"], np.nan).tolist()
+        return [
+            {
+                "overall_risk": float(overall_risk[i]),
+                "risk_level": str(risk_level[i]),
+                "fire_detection_risk": float(fire_risk[i]),
+                "environmental_risk": float(environmental_risk[i]),
+                "weather_risk": float(weather_risk[i]),
+                "historical_risk": float(historical_risk[i]),
+                "sensor_count": int(count[i]),
+                "detection_count": int(stats["fire_count"][i]),
+                "confidence": float(confidence[i]),
+                "spread_direction": None if math.isnan(spread_direction[i]) else spread_direction[i],
+                "spread_speed": float(spread_speed[i]),
+                "affected_radius": float(affected_radius[i]),
+                "evacuation_radius": float(affected_radius[i] * 1.5),
+                **({} if terrain is None else {"terrain": self._terrain_summary(terrain, i)})
+            }
+            for i in range(len(count))
+        ]
+    
+    @staticmethod
+    def _terrain_spread_factor(wind_direction: np.ndarray, terrain: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        지형에 따른 확산 속도 배율 (연료 계수 × 경사 계수)
+        
+        풍향은 바람이 불어오는 방향이므로 불은 풍향 + 180° 로 번집니다. 경사 계수는 확산 시뮬레이션과 같은
+        exp(a × 경사) 를 그 방향과 오르막 방향(경사 방향 + 180°)이 이루는 각의 코사인만큼 적용해,
+        오르막으로 부는 바람은 확산을 빠르게, 내리막으로 부는 바람은 느리게 합니다. 값이 없는 항목은 배율 1 입니다.
+        """
+        fuel = np.nan_to_num(np.asarray(terrain["fuel"], dtype=float), nan=1.0)
+        heading = np.asarray(wind_direction, dtype=float) + 180.0
+        uphill = np.asarray(terrain["aspect"], dtype=float) + 180.0
+        alignment = np.cos(np.radians(heading - uphill))
+        slope = np.nan_to_num(np.asarray(terrain["slope"], dtype=float) * alignment, nan=0.0)
+        return fuel * np.exp(SLOPE_COEFFICIENT * slope)
+    
+    @staticmethod
+    def _terrain_summary(terrain: Dict[str, np.ndarray], i: int) -> Dict[str, Optional[float]]:
+        """i 번째 지점의 지형 특성 (값이 없으면 None)"""
+        values = {name: float(np.asarray(column).ravel()[i]) for name, column in terrain.items()}
+        return {name: None if math.isnan(value) else value for name, value in values.items()}
+    
+    def _analyze_fire_detection(self, sensor_data: SensorBatch) -> Dict[str, Any]:
         """화재 탐지 분석"""
         try:
-            # 화재 탐지된 센서들
-            fire_detected_sensors = [s for s in sensor_data if s.fire_detected]
+            columns = SensorColumns.of(sensor_data)
+            fire = columns.stats.fire
             
-            if not fire_detected_sensors:
+            if not fire.count:
                 return {
                     "risk_score": 0.0,
                     "confidence": 0.0,
@@ -117,30 +345,15 @@ class RiskAnalysisService:
                     "detection_sources": []
                 }
             
-            # 탐지 신뢰도 분석
-            confidences = [s.fire_confidence or 0 for s in fire_detected_sensors]
-            max_confidence = max(confidences)
-            avg_confidence = sum(confidences) / len(confidences)
-            
-            # 탐지 소스 분석
-            detection_sources = []
-            for sensor in fire_detected_sensors:
-                detection_sources.append({
-                    "sensor_type": sensor.sensor_type,
-                    "sensor_id": sensor.sensor_id,
-                    "confidence": sensor.fire_confidence or 0,
-                    "location": (sensor.location_lat, sensor.location_lng)
-                })
-            
             # 위험도 점수 계산
-            risk_score = min(0.99, max_confidence * (len(fire_detected_sensors) / 3))
+            risk_score = min(0.99, fire.max * (fire.count / 3))
             
             return {
                 "risk_score": risk_score,
-                "confidence": avg_confidence,
-                "detection_count": len(fire_detected_sensors),
-                "max_confidence": max_confidence,
-                "detection_sources": detection_sources
+                "confidence": fire.mean,
+                "detection_count": fire.count,
+                "max_confidence": fire.max,
+                "detection_sources": columns.fire_detections()
             }
             
         except Exception as e:
@@ -153,43 +366,23 @@ class RiskAnalysisService:
                 "detection_sources": []
             }
     
-    def _analyze_environmental_conditions(self, sensor_data: List[SensorData]) -> Dict[str, Any]:
+    def _analyze_environmental_conditions(self, sensor_data: SensorBatch) -> Dict[str, Any]:
         """환경 조건 분석"""
         try:
-            # 온도 데이터 분석
-            temp_data = [s for s in sensor_data if s.temperature is not None]
-            temp_risk = 0.0
-            if temp_data:
-                avg_temp = sum(s.temperature for s in temp_data) / len(temp_data)
-                max_temp = max(s.temperature for s in temp_data)
-                # 30도 이상이면 위험도 증가
-                temp_risk = min(0.8, max(0, (max_temp - 25) / 20))
-            
-            # 습도 데이터 분석
-            humidity_data = [s for s in sensor_data if s.humidity is not None]
-            humidity_risk = 0.0
-            if humidity_data:
-                avg_humidity = sum(s.humidity for s in humidity_data) / len(humidity_data)
-                min_humidity = min(s.humidity for s in humidity_data)
-                # 30% 이하면 위험도 증가
-                humidity_risk = min(0.8, max(0, (30 - min_humidity) / 30))
-            
-            # 연기 농도 분석
-            smoke_data = [s for s in sensor_data if s.smoke_density is not None]
-            smoke_risk = 0.0
-            if smoke_data:
-                avg_smoke = sum(s.smoke_density for s in smoke_data) / len(smoke_data)
-                max_smoke = max(s.smoke_density for s in smoke_data)
-                # 연기 농도가 높을수록 위험도 증가
-                smoke_risk = min(0.9, max_smoke / 100)
-            
-            # 가시거리 분석
-            visibility_data = [s for s in sensor_data if s.visibility is not None]
-            visibility_risk = 0.0
-            if visibility_data:
-                min_visibility = min(s.visibility for s in visibility_data)
-                # 가시거리가 짧을수록 위험도 증가
-                visibility_risk = min(0.7, max(0, (5 - min_visibility) / 5))
+            stats = SensorColumns.of(sensor_data).stats
+            temperature = stats["temperature"]
+            humidity = stats["humidity"]
+            smoke = stats["smoke_density"]
+            visibility = stats["visibility"]
+            
+            # 30도 이상이면 위험도 증가
+            temp_risk = min(0.8, max(0, (temperature.max - 25) / 20)) if temperature.count else 0.0
+            # 30% 이하면 위험도 증가
+            humidity_risk = min(0.8, max(0, (30 - humidity.min) / 30)) if humidity.count else 0.0
+            # 연기 농도가 높을수록 위험도 증가
+            smoke_risk = min(0.9, smoke.max / 100) if smoke.count else 0.0
+            # 가시거리가 짧을수록 위험도 증가
+            visibility_risk = min(0.7, max(0, (5 - visibility.min) / 5)) if visibility.count else 0.0
             
             # 종합 환경 위험도
             environmental_risk = (temp_risk + humidity_risk + smoke_risk + visibility_risk) / 4
@@ -200,10 +393,10 @@ class RiskAnalysisService:
                 "humidity_risk": humidity_risk,
                 "smoke_risk": smoke_risk,
                 "visibility_risk": visibility_risk,
-                "avg_temperature": sum(s.temperature for s in temp_data) / len(temp_data) if temp_data else None,
-                "min_humidity": min(s.humidity for s in humidity_data) if humidity_data else None,
-                "max_smoke_density": max(s.smoke_density for s in smoke_data) if smoke_data else None,
-                "min_visibility": min(s.visibility for s in visibility_data) if visibility_data else None
+                "avg_temperature": temperature.mean,
+                "min_humidity": humidity.min,
+                "max_smoke_density": smoke.max,
+                "min_visibility": visibility.min
             }
             
         except Exception as e:
@@ -227,7 +420,21 @@ class RiskAnalysisService:
             weather_info = await self.weather_service.get_current_weather(
                 location["lat"], location["lng"]
             )
+            return self._weather_risk(weather_info)
             
+        except Exception as e:
+            logger.error(f"날씨 조건 분석 실패: {str(e)}")
+            return {
+                "risk_score": 0.0,
+                "wind_risk": 0.0,
+                "temperature_risk": 0.0,
+                "humidity_risk": 0.0,
+                "weather_data": None
+            }
+    
+    def _weather_risk(self, weather_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """날씨 정보에서 날씨 위험도 산출"""
+        try:
             if not weather_info:
                 return {
                     "risk_score": 0.0,
@@ -260,11 +467,12 @@ class RiskAnalysisService:
                 "wind_speed": wind_speed,
                 "temperature": temperature,
                 "humidity": humidity,
+                "staleness_seconds": weather_info.get("staleness_seconds"),
                 "weather_data": weather_info
             }
             
         except Exception as e:
-            logger.error(f"날씨 조건 분석 실패: {str(e)}")
+            logger.error(f"날씨 위험도 계산 실패: {str(e)}")
             return {
                 "risk_score": 0.0,
                 "wind_risk": 0.0,
@@ -275,48 +483,17 @@ class RiskAnalysisService:
     
     def _analyze_historical_data(
         self, 
-        sensor_data: List[SensorData], 
+        sensor_data: SensorBatch, 
         location: Dict[str, float]
     ) -> Dict[str, Any]:
-        """과거 데이터 분석"""
+        """
+        과거 데이터 분석
+        
+        과거 화재 지수(셀 × 월 × 시 화재 빈도)에서 지점의 현재 월/시 구간 위험도를 조회합니다.
+        위치가 없으면 화재 기록이 있는 셀의 전국 평균을 사용합니다.
+        """
         try:
-            # 현재는 간단한 구현 (실제로는 과거 데이터베이스 조회)
-            # 과거 화재 발생 이력, 계절적 패턴 등을 고려
-            
-            # 계절적 위험도 (예시)
-            current_month = datetime.now().month
-            seasonal_risk = 0.0
-            
-            if current_month in [3, 4, 5]:  # 봄
-                seasonal_risk = 0.3
-            elif current_month in [6, 7, 8]:  # 여름
-                seasonal_risk = 0.1
-            elif current_month in [9, 10, 11]:  # 가을
-                seasonal_risk = 0.4
-            elif current_month in [12, 1, 2]:  # 겨울
-                seasonal_risk = 0.2
-            
-            # 시간대별 위험도 (예시)
-            current_hour = datetime.now().hour
-            time_risk = 0.0
-            
-            if 10 <= current_hour <= 16:  # 낮 시간대
-                time_risk = 0.3
-            elif 16 <= current_hour <= 20:  # 저녁 시간대
-                time_risk = 0.2
-            else:  # 밤/새벽 시간대
-                time_risk = 0.1
-            
-            # 종합 과거 데이터 위험도
-            historical_risk = (seasonal_risk + time_risk) / 2
-            
-            return {
-                "risk_score": historical_risk,
-                "seasonal_risk": seasonal_risk,
-                "time_risk": time_risk,
-                "current_month": current_month,
-                "current_hour": current_hour
-            }
+            return self.historical_index.lookup(location.get("lat"), location.get("lng"))
             
         except Exception as e:
             logger.error(f"과거 데이터 분석 실패: {str(e)}")
@@ -324,6 +501,7 @@ class RiskAnalysisService:
                 "risk_score": 0.0,
                 "seasonal_risk": 0.0,
                 "time_risk": 0.0,
+                "incident_count": 0,
                 "current_month": datetime.now().month,
                 "current_hour": datetime.now().hour
             }
@@ -364,16 +542,16 @@ class RiskAnalysisService:
     
     def _predict_fire_spread(
         self, 
-        sensor_data: List[SensorData], 
+        sensor_data: SensorBatch, 
         location: Dict[str, float], 
         overall_risk: float
     ) -> Dict[str, Any]:
         """화재 확산 예측"""
         try:
-            # 풍속 데이터 수집
-            wind_data = [s for s in sensor_data if s.wind_speed is not None and s.wind_direction is not None]
+            # 풍속/풍향이 모두 있는 센서
+            stats = SensorColumns.of(sensor_data).stats
             
-            if not wind_data:
+            if not stats.wind_pairs:
                 return {
                     "spread_direction": None,
                     "spread_speed": 0.0,
@@ -382,17 +560,19 @@ class RiskAnalysisService:
                     "confidence": 0.0
                 }
             
-            # 평균 풍속과 풍향 계산
-            avg_wind_speed = sum(s.wind_speed for s in wind_data) / len(wind_data)
-            avg_wind_direction = sum(s.wind_direction for s in wind_data) / len(wind_data)
+            # 평균 풍속과 풍향 계산 (풍향은 원형 평균, 350°와 10°의 평균은 0°)
+            avg_wind_speed = stats.wind_pair_speed
+            avg_wind_direction = stats.wind_direction_mean
             
             # 확산 방향 (풍향 기준)
             spread_direction = avg_wind_direction
             
-            # 확산 속도 계산 (풍속과 위험도 기반)
+            # 확산 속도 계산 (풍속과 위험도 기반, 지형 자료가 있으면 경사/연료 보정)
             base_spread_speed = avg_wind_speed * 0.1  # km/h
             risk_multiplier = 1 + overall_risk * 2
             spread_speed = base_spread_speed * risk_multiplier
+            terrain = self.terrain_store.features(np.array([location["lat"]]), np.array([location["lng"]]))
+            spread_speed = float(spread_speed * self._terrain_spread_factor(np.array([spread_direction]), terrain)[0])
             
             # 영향 반경 계산
             affected_radius = min(10.0, spread_speed * 2)  # 최대 10km
@@ -401,7 +581,7 @@ class RiskAnalysisService:
             evacuation_radius = affected_radius * 1.5  # 영향 반경의 1.5배
             
             # 신뢰도 계산
-            confidence = min(0.9, len(wind_data) / 5)  # 센서 수에 따른 신뢰도
+            confidence = min(0.9, stats.wind_pairs / 5)  # 센서 수에 따른 신뢰도
             
             return {
                 "spread_direction": spread_direction,
@@ -410,7 +590,8 @@ class RiskAnalysisService:
                 "evacuation_radius": evacuation_radius,
                 "confidence": confidence,
                 "wind_speed": avg_wind_speed,
-                "wind_direction": avg_wind_direction
+                "wind_direction": avg_wind_direction,
+                "terrain": self._terrain_summary(terrain, 0)
             }
             
         except Exception as e:
@@ -423,22 +604,168 @@ class RiskAnalysisService:
                 "confidence": 0.0
             }
     
-    def _calculate_analysis_confidence(self, sensor_data: List[SensorData]) -> float:
+    async def simulate_fire_spread(
+        self,
+        sensor_data: SensorBatch,
+        ignitions: List[Dict[str, float]],
+        duration_minutes: float,
+        wind_speed: Optional[float] = None,
+        wind_direction: Optional[float] = None
+    ) -> Tuple[SpreadResult, Dict[str, Any]]:
+        """
+        격자 확산 시뮬레이션
+        
+        발화 지점들의 중심을 기준으로 한 격자에서 도달 시간 래스터를 계산합니다.
+        바람은 지정값 → 센서 평균(풍속/풍향 쌍) → 중심 지점의 현재 날씨 순으로 정하며 없으면 무풍으로 봅니다.
+        
+        Args:
+            sensor_data: 시뮬레이션 영역의 센서 데이터 (또는 SensorColumns)
+            ignitions: 발화 지점 [{"lat": float, "lng": float}, ...]
+            duration_minutes: 시뮬레이션 시간 (분)
+            wind_speed: 풍속 (m/s)
+            wind_direction: 풍향 (불어오는 방향, 도)
+            
+        Returns:
+            (시뮬레이션 결과, 사용한 바람 {"wind_speed", "wind_direction", "source"})
+        """
+        center_lat = float(np.mean([point["lat"] for point in ignitions]))
+        center_lng = float(np.mean([point["lng"] for point in ignitions]))
+        wind = await self._spread_wind(sensor_data, center_lat, center_lng, wind_speed, wind_direction)
+        
+        grid = await asyncio.to_thread(SpreadGrid.from_terrain, center_lat, center_lng, self.terrain_store)
+        result = await asyncio.to_thread(
+            self.spread_simulator.simulate,
+            grid,
+            [(point["lat"], point["lng"]) for point in ignitions],
+            wind["wind_speed"],
+            wind["wind_direction"],
+            duration_minutes
+        )
+        return result, wind
+    
+    async def forecast_fire_spread_ensemble(
+        self,
+        incident_id: str,
+        sensor_data: SensorBatch,
+        ignitions: List[Dict[str, float]],
+        duration_minutes: float,
+        members: Optional[int] = None,
+        wind_speed: Optional[float] = None,
+        wind_direction: Optional[float] = None
+    ) -> Tuple[IncidentForecast, Dict[str, Any]]:
+        """
+        산불 건별 확산 앙상블 예측
+        
+        simulate_fire_spread 와 같은 방식으로 중심 바람을 정하고, 기상청 예보의 시간별 바람 변동으로 섭동 폭을 정해
+        구성원을 병렬 실행합니다. 같은 산불 건을 같은 발화 지점/시간/구성원 수로 다시 요청하면
+        캐시된 결과에 그동안 들어온 측정값만 증분 반영하고, 풍속/풍향을 지정하면 캐시 조건과 다를 때
+        그 바람으로 다시 실행합니다.
+        
+        Args:
+            incident_id: 산불 건 식별자 (캐시 키)
+            sensor_data: 시뮬레이션 영역의 센서 데이터 (또는 SensorColumns)
+            ignitions: 발화 지점 [{"lat": float, "lng": float}, ...]
+            duration_minutes: 시뮬레이션 시간 (분)
+            members: 구성원 수 (미지정 시 설정값)
+            wind_speed: 풍속 (m/s)
+            wind_direction: 풍향 (불어오는 방향, 도)
+            
+        Returns:
+            (산불 건 앙상블 상태, 사용한 중심 바람 {"wind_speed", "wind_direction", "source"})
+        """
+        points = [(point["lat"], point["lng"]) for point in ignitions]
+        cached = self.cached_ensemble(incident_id, ignitions, duration_minutes)
+        if cached is not None:
+            # 지정한 바람은 섭동 폭을 유지한 채 중심 바람만 교체 (지정하지 않은 값은 캐시 조건 유지)
+            requested = None
+            if wind_speed is not None or wind_direction is not None:
+                requested = cached.conditions.with_wind(
+                    cached.conditions.wind_speed if wind_speed is None else wind_speed,
+                    cached.conditions.wind_direction if wind_direction is None else wind_direction
+                )
+            incident = await self.spread_ensemble.forecast(
+                incident_id, cached.grid, points, cached.conditions, duration_minutes, members,
+                requested_wind=requested
+            )
+            conditions = incident.conditions
+            return incident, {
+                "wind_speed": conditions.wind_speed,
+                "wind_direction": conditions.wind_direction,
+                "source": "cache" if requested is None else "request"
+            }
+        
+        center_lat = float(np.mean([lat for lat, _ in points]))
+        center_lng = float(np.mean([lng for _, lng in points]))
+        wind = await self._spread_wind(sensor_data, center_lat, center_lng, wind_speed, wind_direction)
+        forecast = await self.weather_service.get_weather_forecast(
+            center_lat, center_lng, hours=max(1, math.ceil(duration_minutes / 60))
+        )
+        conditions = EnsembleConditions.from_forecast(
+            wind["wind_speed"], wind["wind_direction"], forecast, duration_minutes / 60
+        )
+        grid = await asyncio.to_thread(SpreadGrid.from_terrain, center_lat, center_lng, self.terrain_store)
+        incident = await self.spread_ensemble.forecast(
+            incident_id, grid, points, conditions, duration_minutes, members
+        )
+        return incident, wind
+    
+    def cached_ensemble(
+        self,
+        incident_id: str,
+        ignitions: List[Dict[str, float]],
+        duration_minutes: float
+    ) -> Optional[IncidentForecast]:
+        """같은 발화 지점/시간으로 다시 사용할 수 있는 캐시된 앙상블 (없으면 None, 센서 수집 생략 판단용)"""
+        cached = self.spread_ensemble.incidents.get(incident_id)
+        points = [(point["lat"], point["lng"]) for point in ignitions]
+        if cached is not None and cached.origin == points and cached.duration_minutes == duration_minutes:
+            return cached
+        return None
+    
+    async def _spread_wind(
+        self,
+        sensor_data: SensorBatch,
+        lat: float,
+        lng: float,
+        wind_speed: Optional[float],
+        wind_direction: Optional[float]
+    ) -> Dict[str, Any]:
+        """확산 시뮬레이션 바람 (지정값 → 센서 평균 → 현재 날씨 → 무풍)"""
+        source = "request"
+        if wind_speed is None:
+            stats = SensorColumns.of(sensor_data).stats
+            if stats.wind_pairs:
+                source = "sensors"
+                wind_speed = stats.wind_pair_speed
+                wind_direction = stats.wind_direction_mean if wind_direction is None else wind_direction
+            else:
+                weather_info = await self.weather_service.get_current_weather(lat, lng)
+                if weather_info and weather_info.get("wind_speed") is not None:
+                    source = "weather"
+                    wind_speed = weather_info["wind_speed"]
+                    if wind_direction is None:
+                        wind_direction = weather_info.get("wind_direction")
+                else:
+                    source = "calm"
+                    wind_speed = 0.0
+        return {"wind_speed": wind_speed, "wind_direction": wind_direction, "source": source}
+    
+    def _calculate_analysis_confidence(self, sensor_data: SensorBatch) -> float:
         """분석 신뢰도 계산"""
         try:
-            if not sensor_data:
+            if not len(sensor_data):
                 return 0.0
             
+            stats = SensorColumns.of(sensor_data).stats
+            
             # 센서 데이터 품질 평균
-            quality_scores = [s.data_quality or 0.5 for s in sensor_data]
-            avg_quality = sum(quality_scores) / len(quality_scores)
+            avg_quality = stats.quality_mean
             
             # 센서 수에 따른 신뢰도
-            sensor_count_factor = min(1.0, len(sensor_data) / 10)
+            sensor_count_factor = min(1.0, stats.count / 10)
             
             # 센서 타입 다양성
-            sensor_types = set(s.sensor_type for s in sensor_data)
-            diversity_factor = min(1.0, len(sensor_types) / 5)
+            diversity_factor = min(1.0, stats.sensor_type_count / 5)
             
             # 종합 신뢰도
             confidence = (avg_quality + sensor_count_factor + diversity_factor) / 3
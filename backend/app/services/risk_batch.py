@@ -0,0 +1,140 @@
+"""
+다지점 위험도 일괄 산출 모듈
+하나의 센서 스냅샷을 여러 지점에 공간 조회로 나누고, 지점별 집계값을 그룹 단위 배열 연산으로 산출
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.models.sensor_data import SensorDataCreate
+from app.services.collection_scheduler import MonitoredRegion, plan_queries
+from app.services.sensor_columns import SensorColumns
+
+logger = logging.getLogger(__name__)
+
+async def collect_snapshot(
+    collector: Any,
+    locations: List[Dict[str, float]],
+    radius_km: float
+) -> List[SensorDataCreate]:
+    """
+    여러 지점의 센서 스냅샷 수집
+
+    지점 반경을 다지역 스케줄러와 같은 방식으로 합쳐 조회 수를 줄이고,
+    겹치는 조회에서 중복된 센서는 하나만 남깁니다. 기상 측정값은 조회마다 같은 ID(weather_temp 등)로
+    조회 위치에 만들어지므로 센서 ID 와 위치가 모두 같을 때만 중복으로 봅니다.
+
+    Args:
+        collector: DataCollectionService (collect_all_data 제공)
+        locations: [{"lat": float, "lng": float}, ...]
+        radius_km: 지점별 반경 (km)
+    """
+    regions = [
+        MonitoredRegion(f"batch_{i}", loc["lat"], loc["lng"], radius_km)
+        for i, loc in enumerate(locations)
+    ]
+    queries = plan_queries(regions)
+    results = await asyncio.gather(*(
+        collector.collect_all_data(query.location, query.radius_km) for query in queries
+    ))
+    snapshot = {
+        (data.sensor_id, data.location_lat, data.location_lng): data
+        for result in results for data in result
+    }
+    logger.info(f"📡 일괄 분석 스냅샷 수집 - 지점: {len(locations)}개, 조회: {len(queries)}건, 센서: {len(snapshot)}개")
+    return list(snapshot.values())
+
+def assign_sensors(
+    columns: SensorColumns,
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    radius_km: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    지점별 반경 내 센서 배정 (스냅샷의 공간 색인으로 지점마다 주변 버킷만 확인)
+
+    Returns:
+        (지점 인덱스, 센서 인덱스) 쌍 배열 (지점 순으로 정렬됨)
+    """
+    index = columns.spatial_index
+    location_parts, sensor_parts = [], []
+    for i, (lat, lng) in enumerate(zip(lats.tolist(), lngs.tolist())):
+        hits = index.radius_slots(lat, lng, radius_km)
+        location_parts.append(np.full(hits.size, i))
+        sensor_parts.append(hits)
+
+    if not sensor_parts:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    return np.concatenate(location_parts), np.concatenate(sensor_parts)
+
+def _grouped(group: np.ndarray, values: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """그룹별 (개수, 평균, 최솟값, 최댓값), 값이 없는 그룹은 NaN"""
+    present = ~np.isnan(values)
+    group, values = group[present], values[present]
+    counts = np.bincount(group, minlength=size)
+    sums = np.bincount(group, weights=values, minlength=size)
+    mins = np.full(size, np.inf)
+    maxs = np.full(size, -np.inf)
+    np.minimum.at(mins, group, values)
+    np.maximum.at(maxs, group, values)
+    empty = counts == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(empty, np.nan, sums / counts)
+    return counts, means, np.where(empty, np.nan, mins), np.where(empty, np.nan, maxs)
+
+def group_stats(columns: SensorColumns, group: np.ndarray, sensors: np.ndarray, size: int) -> Dict[str, np.ndarray]:
+    """
+    지점별 집계 (SensorColumns.stats 와 같은 정의, 값이 없는 지점은 개수 0 / 나머지 NaN)
+
+    Args:
+        columns: 센서 스냅샷
+        group: 지점 인덱스 (assign_sensors 결과)
+        sensors: 센서 인덱스 (assign_sensors 결과)
+        size: 지점 수
+    """
+    stats: Dict[str, np.ndarray] = {}
+    stats["count"] = np.bincount(group, minlength=size)
+
+    for name in ("temperature", "humidity", "smoke_density", "visibility"):
+        counts, means, mins, maxs = _grouped(group, columns[name][sensors], size)
+        stats[f"{name}_count"] = counts
+        stats[f"{name}_mean"] = means
+        stats[f"{name}_min"] = mins
+        stats[f"{name}_max"] = maxs
+
+    # 화재 탐지 (미기록 신뢰도는 0)
+    detected = columns.fire_detected[sensors]
+    confidence = np.nan_to_num(columns["fire_confidence"][sensors][detected], nan=0.0)
+    counts, means, _, maxs = _grouped(group[detected], confidence, size)
+    stats["fire_count"] = counts
+    stats["fire_mean"] = means
+    stats["fire_max"] = maxs
+
+    # 풍속/풍향 쌍과 원형 평균 풍향
+    speed = columns["wind_speed"][sensors]
+    direction = columns["wind_direction"][sensors]
+    pair = ~np.isnan(speed) & ~np.isnan(direction)
+    pair_group = group[pair]
+    counts, means, _, _ = _grouped(pair_group, speed[pair], size)
+    radians = np.radians(direction[pair])
+    sin_sum = np.bincount(pair_group, weights=np.sin(radians), minlength=size)
+    cos_sum = np.bincount(pair_group, weights=np.cos(radians), minlength=size)
+    stats["wind_pairs"] = counts
+    stats["wind_speed_mean"] = means
+    stats["wind_direction_mean"] = np.where(counts > 0, np.degrees(np.arctan2(sin_sum, cos_sum)) % 360.0, np.nan)
+
+    # 데이터 품질 (미기록/0 은 0.5)
+    quality = columns["data_quality"][sensors]
+    quality = np.where(np.isnan(quality) | (quality == 0), 0.5, quality)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats["quality_mean"] = np.bincount(group, weights=quality, minlength=size) / stats["count"]
+
+    # 센서 타입 다양성 (지점별 서로 다른 타입 수)
+    _, type_codes = np.unique(np.asarray(columns.sensor_types, dtype=object).astype(str), return_inverse=True)
+    type_count = int(type_codes.max()) + 1 if type_codes.size else 1
+    pairs = np.unique(group * type_count + type_codes[sensors])
+    stats["sensor_type_count"] = np.bincount(pairs // type_count, minlength=size)
+    return stats
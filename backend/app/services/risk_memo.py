@@ -0,0 +1,122 @@
+"""
+위험도 분석 결과 메모이제이션 모듈
+분석 입력(센서 스냅샷, 양자화한 날씨, 위치 셀, 가중치/임계값)을 지문으로 만들어
+같은 입력의 반복 분석을 크기 제한 LRU 캐시에서 바로 반환
+"""
+
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import RISK_MEMO_ENTRIES, RISK_MEMO_REQUESTS_TOTAL
+from app.services.sensor_columns import NUMERIC_COLUMNS
+
+# 날씨 입력 양자화 단위 (날씨 위험도 산식에 쓰는 값만)
+WEATHER_STEPS = {
+    "temperature": 0.5,
+    "humidity": 1.0,
+    "wind_speed": 0.5
+}
+
+# 양자화 결과에서 결측값 표시
+_MISSING = np.iinfo(np.int64).min
+
+def _quantize(values: np.ndarray, step: float) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.where(np.isnan(values), _MISSING, np.round(values / step)).astype(np.int64)
+
+def snapshot_fingerprint(
+    columns: Any,
+    weather: Optional[Dict[str, Any]],
+    location: Dict[str, float],
+    extra: Hashable = (),
+    value_decimals: Optional[int] = None,
+    location_deg: Optional[float] = None
+) -> str:
+    """
+    위험도 분석 입력 지문
+
+    센서는 ID 순으로 정렬해 목록 순서와 무관하며, 수치 열은 value_decimals 자리, 날씨는 WEATHER_STEPS 단위,
+    분석 위치는 location_deg 격자 셀로 양자화합니다. 업스트림 측정값에는 시각이 없으므로
+    센서 ID 와 양자화한 측정값이 같으면 같은 스냅샷으로 봅니다.
+
+    Args:
+        columns: SensorColumns
+        weather: 날씨 정보 (None 이면 날씨 없음)
+        location: 분석 위치
+        extra: 그 밖의 입력 (가중치/임계값, 과거 데이터 위험도 등, repr 로 비교)
+    """
+    value_decimals = value_decimals if value_decimals is not None else settings.RISK_MEMO_VALUE_DECIMALS
+    location_deg = location_deg or settings.RISK_MEMO_LOCATION_DEG
+    digest = hashlib.blake2b(digest_size=16)
+
+    order = np.argsort(np.array(columns.sensor_ids, dtype=object), kind="stable") if len(columns) else np.array([], dtype=int)
+    digest.update("\x1f".join(columns.sensor_ids[i] for i in order).encode())
+    digest.update(b"\x1e")
+    digest.update("\x1f".join(str(columns.sensor_types[i]) for i in order).encode())
+    digest.update(columns.fire_detected[order].tobytes())
+    step = 10.0 ** -value_decimals
+    for name in NUMERIC_COLUMNS:
+        digest.update(_quantize(columns.values[name][order], step).tobytes())
+    digest.update(_quantize(columns.location_lat[order], 1e-4).tobytes())
+    digest.update(_quantize(columns.location_lng[order], 1e-4).tobytes())
+
+    weather_key = None if not weather else tuple(
+        None if weather.get(name) is None else round(weather[name] / unit)
+        for name, unit in WEATHER_STEPS.items()
+    )
+    lat, lng = location.get("lat"), location.get("lng")
+    location_key = None if lat is None or lng is None else (round(lat / location_deg), round(lng / location_deg))
+    digest.update(repr((weather_key, location_key, extra)).encode())
+    return digest.hexdigest()
+
+class RiskMemo:
+    """
+    위험도 분석 결과 LRU 캐시 (지문 → 분석 결과)
+
+    결과는 중첩 dict 이므로 저장과 조회 모두 깊은 복사본을 사용해 호출 쪽 수정이 캐시에 번지지 않게 합니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else settings.RISK_MEMO_MAX_ENTRIES
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (있으면 최근 사용으로 갱신하고 깊은 복사본 반환)"""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            RISK_MEMO_REQUESTS_TOTAL.labels("miss").inc()
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        RISK_MEMO_REQUESTS_TOTAL.labels("hit").inc()
+        return copy.deepcopy(result)
+
+    def put(self, key: str, result: Dict[str, Any]):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = copy.deepcopy(result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        RISK_MEMO_ENTRIES.set(len(self._entries))
+
+    def clear(self):
+        self._entries.clear()
+        RISK_MEMO_ENTRIES.set(0)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,288 @@
+"""
+위험도 지도 타일 모듈
+감시 지역의 현재 위험도를 XYZ(웹 메르카토르) 타일 피라미드로 미리 그려 두고,
+타일별 입력(겹치는 지역의 위험도, 과거 화재 지수)이 바뀐 타일만 다시 그리는 캐시
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import RISK_TILE_REFRESH_SECONDS, RISK_TILES_RENDERED_TOTAL
+from app.services.historical_index import KST
+from app.services.spatial_index import KM_PER_DEG_LAT
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+
+# 값 타일에서 값 없음 표시 (위험도는 0~254 로 양자화)
+NODATA = 255
+
+# 위험도 색상 단계 (위험도, RGBA) - 등급 임계값(0.3/0.6/0.8/0.9)에 맞춤
+COLOR_STOPS = (
+    (0.0, (46, 204, 113, 140)),
+    (0.3, (241, 196, 15, 160)),
+    (0.6, (230, 126, 34, 180)),
+    (0.8, (231, 76, 60, 200)),
+    (0.99, (142, 18, 24, 220))
+)
+
+TileKey = Tuple[int, int, int]
+# 지역 입력 (이름, 위도, 경도, 반경 km, 종합 위험도, 지역 중심 과거 데이터 위험도)
+RegionInput = Tuple[str, float, float, float, float, float]
+
+def _color_table() -> np.ndarray:
+    """양자화한 위험도(0~255) → BGRA 색상표 (값 없음은 투명)"""
+    levels = np.arange(256) / 254.0
+    stops = np.array([stop for stop, _ in COLOR_STOPS])
+    colors = np.array([color for _, color in COLOR_STOPS], dtype=float)
+    rgba = np.stack([np.interp(levels, stops, colors[:, channel]) for channel in range(4)], axis=1)
+    rgba[NODATA] = 0
+    return rgba[:, [2, 1, 0, 3]].round().astype(np.uint8)
+
+COLOR_TABLE = _color_table()
+
+def encode_png(values: np.ndarray, layer: str = "color") -> bytes:
+    """값 타일을 PNG 로 (color: 색상 RGBA, values: 양자화 위험도 회색조)"""
+    image = COLOR_TABLE[values] if layer == "color" else values
+    ok, encoded = cv2.imencode(".png", image)
+    if not ok:
+        raise ValueError("타일 PNG 인코딩 실패")
+    return encoded.tobytes()
+
+def tile_range(lat: float, lng: float, radius_km: float, zoom: int) -> Tuple[int, int, int, int]:
+    """원을 덮는 타일 범위 (x 최소, x 최대, y 최소, y 최대)"""
+    dlat = radius_km / KM_PER_DEG_LAT
+    dlng = radius_km / (KM_PER_DEG_LAT * math.cos(math.radians(lat)))
+    n = 2 ** zoom
+
+    def tile_x(value: float) -> int:
+        return min(n - 1, max(0, int((value + 180.0) / 360.0 * n)))
+
+    def tile_y(value: float) -> int:
+        value = max(-85.0511, min(85.0511, value))
+        return min(n - 1, max(0, int((1.0 - math.asinh(math.tan(math.radians(value))) / math.pi) / 2.0 * n)))
+
+    return tile_x(lng - dlng), tile_x(lng + dlng), tile_y(lat + dlat), tile_y(lat - dlat)
+
+def pixel_centers(zoom: int, x: int, y: int) -> Tuple[np.ndarray, np.ndarray]:
+    """타일 픽셀 중심 위도(행, 북쪽부터)/경도(열)"""
+    n = 2 ** zoom
+    offsets = (np.arange(TILE_SIZE) + 0.5) / TILE_SIZE
+    lngs = (x + offsets) / n * 360.0 - 180.0
+    lats = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * (y + offsets) / n))))
+    return lats, lngs
+
+def render_tile(
+    zoom: int,
+    x: int,
+    y: int,
+    regions: Sequence[RegionInput],
+    historical_index,
+    historical_weight: float
+) -> np.ndarray:
+    """
+    타일 한 장의 양자화 위험도 (값 없음 NODATA)
+
+    지역 반경 안 픽셀은 지역 위험도에서 지역 중심의 과거 데이터 위험도를 픽셀 위치의 값으로 바꿔 넣고,
+    여러 지역이 겹치면 큰 값을 사용합니다.
+    """
+    lats, lngs = pixel_centers(zoom, x, y)
+    lat_grid, lng_grid = np.meshgrid(lats, lngs, indexing="ij")
+    masks = []
+    for _, lat, lng, radius_km, _, _ in regions:
+        dy = (lat_grid - lat) * KM_PER_DEG_LAT
+        dx = (lng_grid - lng) * KM_PER_DEG_LAT * math.cos(math.radians(lat))
+        masks.append(dx * dx + dy * dy <= radius_km * radius_km)
+
+    covered = np.logical_or.reduce(masks) if masks else np.zeros(lat_grid.shape, dtype=bool)
+    values = np.full(lat_grid.shape, NODATA, dtype=np.uint8)
+    if not covered.any():
+        return values
+
+    risk = np.full(lat_grid.shape, -1.0)
+    historical = np.zeros(lat_grid.shape)
+    historical[covered] = historical_index.risk(lat_grid[covered], lng_grid[covered])["risk_score"]
+    for (_, _, _, _, overall, region_historical), mask in zip(regions, masks):
+        base = overall - region_historical * historical_weight
+        risk = np.where(mask, np.maximum(risk, np.clip(base + historical * historical_weight, 0.0, 0.99)), risk)
+    values[covered] = np.round(risk[covered] * 254).astype(np.uint8)
+    return values
+
+class RiskTile:
+    """그려 둔 타일 (입력 지문, ETag, 레이어별 PNG)"""
+
+    __slots__ = ("fingerprint", "etag", "color", "values")
+
+    def __init__(self, fingerprint: Tuple, values: np.ndarray):
+        self.fingerprint = fingerprint
+        self.etag = '"' + hashlib.sha1(repr(fingerprint).encode()).hexdigest()[:20] + '"'
+        self.color = encode_png(values, "color")
+        self.values = encode_png(values, "values")
+
+    def body(self, layer: str) -> Tuple[bytes, str]:
+        """레이어 PNG 와 ETag"""
+        if layer == "values":
+            return self.values, self.etag[:-1] + '-v"'
+        return self.color, self.etag
+
+# 지역과 겹치지 않는 타일 (투명)
+EMPTY_TILE = RiskTile(("empty",), np.full((TILE_SIZE, TILE_SIZE), NODATA, dtype=np.uint8))
+
+class RiskTileCache:
+    """
+    위험도 타일 피라미드 캐시
+
+    refresh 는 지역별 현재 위험도(RegionRiskTracker)로 타일마다 입력 지문을 만들고, 지문이 바뀐 타일만
+    스레드에서 다시 그립니다. 조회는 미리 인코딩한 PNG 와 ETag 를 그대로 반환합니다.
+    """
+
+    def __init__(
+        self,
+        tracker=None,
+        min_zoom: Optional[int] = None,
+        max_zoom: Optional[int] = None,
+        refresh_delay_seconds: Optional[float] = None
+    ):
+        self.tracker = tracker
+        self.min_zoom = min_zoom if min_zoom is not None else settings.RISK_TILE_MIN_ZOOM
+        self.max_zoom = max_zoom if max_zoom is not None else settings.RISK_TILE_MAX_ZOOM
+        self.refresh_delay_seconds = (
+            refresh_delay_seconds if refresh_delay_seconds is not None
+            else settings.RISK_TILE_REFRESH_DELAY_SECONDS
+        )
+        # 지역 이름 → 감시 지역 (수집 결과 콜백으로 등록)
+        self.regions: Dict[Hashable, Any] = {}
+        self.tiles: Dict[TileKey, RiskTile] = {}
+        self.version = 0
+        self.last_rendered = 0
+        self._task: Optional[asyncio.Task] = None
+        self._pending = False
+
+    def _tracker(self):
+        if self.tracker is None:
+            from app.services.region_risk import region_risk_tracker
+            self.tracker = region_risk_tracker
+        return self.tracker
+
+    def add_regions(self, regions: Iterable[Any]):
+        """감시 지역 등록 (name, lat, lng, radius_km 속성)"""
+        for region in regions:
+            self.regions[region.name] = region
+
+    def get(self, zoom: int, x: int, y: int) -> RiskTile:
+        """타일 조회 (지역과 겹치지 않으면 투명 타일)"""
+        return self.tiles.get((zoom, x, y), EMPTY_TILE)
+
+    def _inputs(self) -> Tuple[Dict[TileKey, List[RegionInput]], Tuple[int, int, int]]:
+        """타일별 겹치는 지역 입력과 과거 화재 지수 입력"""
+        tracker = self._tracker()
+        service = tracker._service()
+        names = [name for name in self.regions if name in tracker]
+        scores = tracker.risk_all(names)
+
+        by_tile: Dict[TileKey, List[RegionInput]] = {}
+        for name in names:
+            region, score = self.regions[name], scores[name]
+            item = (
+                str(name), region.lat, region.lng, region.radius_km,
+                round(score["overall_risk"], 3), round(score["historical_risk"], 3)
+            )
+            for zoom in range(self.min_zoom, self.max_zoom + 1):
+                x_min, x_max, y_min, y_max = tile_range(region.lat, region.lng, region.radius_km, zoom)
+                for x in range(x_min, x_max + 1):
+                    for y in range(y_min, y_max + 1):
+                        by_tile.setdefault((zoom, x, y), []).append(item)
+
+        # 과거 화재 지수 입력 (월/시 구간이 바뀌거나 새 화재가 기록되면 변경, 기록이 없어도 기본 위험도가 월/시에 따라 바뀜)
+        index = service.historical_index
+        now = datetime.now(KST)
+        historical_key = (index.total, now.month, now.hour)
+        return by_tile, historical_key
+
+    async def refresh(self) -> int:
+        """입력이 바뀐 타일만 다시 그림 (다시 그린 타일 수 반환)"""
+        started = time.monotonic()
+        by_tile, historical_key = self._inputs()
+        wanted = {
+            key: (historical_key, tuple(sorted(items)))
+            for key, items in by_tile.items()
+        }
+        changed = [
+            key for key, fingerprint in wanted.items()
+            if key not in self.tiles or self.tiles[key].fingerprint != fingerprint
+        ]
+
+        service = self._tracker()._service()
+        rendered = await asyncio.to_thread(
+            self._render, changed, wanted, service.historical_index, service.weights["historical"]
+        )
+        for key in [key for key in self.tiles if key not in wanted]:
+            del self.tiles[key]
+        self.tiles.update(rendered)
+
+        self.version += 1
+        self.last_rendered = len(rendered)
+        RISK_TILES_RENDERED_TOTAL.inc(len(rendered))
+        RISK_TILE_REFRESH_SECONDS.observe(time.monotonic() - started)
+        if rendered:
+            logger.info(f"🗺️ 위험도 타일 갱신 - {len(rendered)}/{len(wanted)}장 다시 그림 ({time.monotonic() - started:.2f}s)")
+        return len(rendered)
+
+    @staticmethod
+    def _render(
+        keys: List[TileKey],
+        wanted: Dict[TileKey, Tuple],
+        historical_index,
+        historical_weight: float
+    ) -> Dict[TileKey, RiskTile]:
+        tiles = {}
+        for key in keys:
+            fingerprint = wanted[key]
+            values = render_tile(*key, fingerprint[1], historical_index, historical_weight)
+            tiles[key] = RiskTile(fingerprint, values)
+        return tiles
+
+    def schedule(self):
+        """지연 후 갱신 예약 (진행 중이면 끝난 뒤 한 번 더)"""
+        if self._task is not None and not self._task.done():
+            self._pending = True
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_delay_seconds)
+            self._pending = False
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"위험도 타일 갱신 실패: {str(e)}")
+            if not self._pending:
+                return
+
+    async def observe_region(self, region: Any, readings: Sequence[Any]):
+        """수집 스케줄러 지역별 결과 콜백 (지역 위험도가 갱신된 뒤 호출됨)"""
+        self.regions[region.name] = region
+        self.schedule()
+
+    async def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+# 전역 위험도 타일 캐시
+risk_tile_cache = RiskTileCache()
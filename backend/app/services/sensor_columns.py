@@ -0,0 +1,224 @@
+"""
+열 단위 센서 데이터 모듈
+센서 데이터 묶음을 한 번만 NumPy 열(결측값은 NaN)로 변환하고,
+위험도 분석/권고안 생성에 필요한 집계값을 한 번의 벡터 연산으로 산출하여 공유
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from app.services.spatial_index import SpatialIndex
+
+# 집계 대상 수치 열 (NaN 은 결측)
+NUMERIC_COLUMNS = (
+    "temperature",
+    "humidity",
+    "smoke_density",
+    "wind_speed",
+    "wind_direction",
+    "visibility",
+    "fire_confidence",
+    "data_quality"
+)
+
+class ColumnStats:
+    """수치 열 하나의 집계값 (값이 없으면 mean/min/max 는 None)"""
+
+    __slots__ = ("count", "mean", "min", "max")
+
+    def __init__(self, count: int, mean: Optional[float], min: Optional[float], max: Optional[float]):
+        self.count = count
+        self.mean = mean
+        self.min = min
+        self.max = max
+
+class SensorStats:
+    """센서 데이터 묶음 집계 결과"""
+
+    def __init__(
+        self,
+        count: int,
+        columns: Dict[str, ColumnStats],
+        fire: ColumnStats,
+        wind_pairs: int,
+        wind_pair_speed: Optional[float],
+        wind_direction_mean: Optional[float],
+        quality_mean: float,
+        sensor_type_count: int
+    ):
+        self.count = count
+        self.columns = columns
+        # 화재 탐지 센서의 탐지 신뢰도 (미기록은 0)
+        self.fire = fire
+        # 풍속/풍향이 모두 있는 센서 수와 평균 풍속, 평균 풍향 (원형 평균, 0~360)
+        self.wind_pairs = wind_pairs
+        self.wind_pair_speed = wind_pair_speed
+        self.wind_direction_mean = wind_direction_mean
+        # 데이터 품질 평균 (미기록/0 은 0.5)
+        self.quality_mean = quality_mean
+        self.sensor_type_count = sensor_type_count
+
+    def __getitem__(self, name: str) -> ColumnStats:
+        return self.columns[name]
+
+def _value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+class SensorColumns:
+    """
+    열 단위 센서 데이터
+
+    SensorData(ORM), SensorDataCreate, SensorReading 목록에서 만들거나 NumPy 배열로 바로 만들 수 있습니다.
+    집계값(stats)은 처음 조회할 때 한 번 계산되어 같은 묶음을 쓰는 서비스끼리 공유됩니다.
+    """
+
+    def __init__(
+        self,
+        sensor_ids: Sequence[str],
+        sensor_types: Sequence[str],
+        location_lat: np.ndarray,
+        location_lng: np.ndarray,
+        fire_detected: np.ndarray,
+        **numeric: np.ndarray
+    ):
+        self.sensor_ids = list(sensor_ids)
+        self.sensor_types = list(sensor_types)
+        self.location_lat = np.asarray(location_lat, dtype=float)
+        self.location_lng = np.asarray(location_lng, dtype=float)
+        self.fire_detected = np.asarray(fire_detected, dtype=bool)
+        size = len(self.sensor_ids)
+        self.values = {
+            name: np.asarray(numeric[name], dtype=float) if name in numeric else np.full(size, np.nan)
+            for name in NUMERIC_COLUMNS
+        }
+        self._stats: Optional[SensorStats] = None
+        self._spatial_index: Optional[SpatialIndex] = None
+
+    @classmethod
+    def from_readings(cls, readings: Sequence[Any]) -> "SensorColumns":
+        """센서 데이터 객체 목록에서 변환 (None 은 NaN)"""
+        return cls(
+            [r.sensor_id for r in readings],
+            [_value(r.sensor_type) for r in readings],
+            np.array([r.location_lat for r in readings], dtype=float),
+            np.array([r.location_lng for r in readings], dtype=float),
+            np.array([bool(r.fire_detected) for r in readings], dtype=bool),
+            **{
+                name: np.array([getattr(r, name) for r in readings], dtype=float)
+                for name in NUMERIC_COLUMNS
+            }
+        )
+
+    @classmethod
+    def of(cls, sensor_data: Union["SensorColumns", Sequence[Any]]) -> "SensorColumns":
+        """이미 열 단위면 그대로, 아니면 변환"""
+        if isinstance(sensor_data, SensorColumns):
+            return sensor_data
+        return cls.from_readings(sensor_data)
+
+    def __len__(self) -> int:
+        return len(self.sensor_ids)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.values[name]
+
+    def subset(self, index: np.ndarray) -> "SensorColumns":
+        """선택한 행만의 열 단위 데이터 (index: 정수 배열 또는 불리언 마스크)"""
+        index = np.flatnonzero(index) if np.asarray(index).dtype == bool else np.asarray(index)
+        return SensorColumns(
+            [self.sensor_ids[i] for i in index],
+            [self.sensor_types[i] for i in index],
+            self.location_lat[index],
+            self.location_lng[index],
+            self.fire_detected[index],
+            **{name: column[index] for name, column in self.values.items()}
+        )
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """센서 위치 공간 색인 (슬롯 번호는 행 번호, 처음 조회할 때 한 번 생성)"""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex.from_points(self.location_lat, self.location_lng)
+        return self._spatial_index
+
+    def within(self, location: Dict[str, float], radius_km: float) -> "SensorColumns":
+        """지점에서 radius_km 이내 센서만의 열 단위 데이터"""
+        return self.subset(np.sort(self.spatial_index.radius_slots(location["lat"], location["lng"], radius_km)))
+
+    @property
+    def stats(self) -> SensorStats:
+        if self._stats is None:
+            self._stats = self._compute_stats()
+        return self._stats
+
+    def _compute_stats(self) -> SensorStats:
+        count = len(self)
+        names = list(NUMERIC_COLUMNS)
+
+        # 모든 수치 열을 (행, 열) 행렬로 묶어 한 번에 집계
+        matrix = np.column_stack([self.values[name] for name in names]) if count else np.empty((0, len(names)))
+        present = ~np.isnan(matrix)
+        counts = present.sum(axis=0)
+        sums = np.where(present, matrix, 0.0).sum(axis=0)
+        mins = np.where(present, matrix, np.inf).min(axis=0, initial=np.inf)
+        maxs = np.where(present, matrix, -np.inf).max(axis=0, initial=-np.inf)
+
+        columns = {}
+        for i, name in enumerate(names):
+            n = int(counts[i])
+            columns[name] = ColumnStats(
+                n,
+                float(sums[i] / n) if n else None,
+                float(mins[i]) if n else None,
+                float(maxs[i]) if n else None
+            )
+
+        # 화재 탐지 신뢰도 (미기록은 0)
+        confidence = np.nan_to_num(self.values["fire_confidence"][self.fire_detected], nan=0.0)
+        fire_count = int(confidence.size)
+        fire = ColumnStats(
+            fire_count,
+            float(confidence.mean()) if fire_count else None,
+            float(confidence.min()) if fire_count else None,
+            float(confidence.max()) if fire_count else None
+        )
+
+        # 풍속/풍향 쌍과 원형 평균 풍향
+        speed, direction = self.values["wind_speed"], self.values["wind_direction"]
+        pair = ~np.isnan(speed) & ~np.isnan(direction)
+        wind_pairs = int(pair.sum())
+        wind_pair_speed = wind_direction_mean = None
+        if wind_pairs:
+            wind_pair_speed = float(speed[pair].mean())
+            radians = np.radians(direction[pair])
+            wind_direction_mean = float(
+                np.degrees(np.arctan2(np.sin(radians).mean(), np.cos(radians).mean())) % 360.0
+            )
+
+        quality = self.values["data_quality"]
+        quality = np.where(np.isnan(quality) | (quality == 0), 0.5, quality)
+
+        return SensorStats(
+            count=count,
+            columns=columns,
+            fire=fire,
+            wind_pairs=wind_pairs,
+            wind_pair_speed=wind_pair_speed,
+            wind_direction_mean=wind_direction_mean,
+            quality_mean=float(quality.mean()) if count else 0.0,
+            sensor_type_count=len(set(self.sensor_types))
+        )
+
+    def fire_detections(self) -> List[Dict[str, Any]]:
+        """화재 탐지 센서 목록 (탐지된 행만 변환)"""
+        confidence = np.nan_to_num(self.values["fire_confidence"], nan=0.0)
+        return [
+            {
+                "sensor_type": self.sensor_types[i],
+                "sensor_id": self.sensor_ids[i],
+                "confidence": float(confidence[i]),
+                "location": (float(self.location_lat[i]), float(self.location_lng[i]))
+            }
+            for i in np.flatnonzero(self.fire_detected)
+        ]
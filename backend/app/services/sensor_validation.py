@@ -0,0 +1,91 @@
+"""
+센서 데이터 일괄 검증 모듈
+측정값 목록을 TypeAdapter 로 한 번에 검증하고 항목별 오류를 모아 반환하며,
+모델 객체를 거치지 않고 검증된 dict 에서 바로 INSERT 행과 경량 측정값을 생성
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+from app.models.sensor_data import SensorDataCreate
+from app.models.sensor_reading import SensorReading
+
+def _row_schema() -> type:
+    """SensorDataCreate 와 같은 필드/제약을 가진 TypedDict (검증 결과가 dict 로 나옴)"""
+    fields = {}
+    for name, field in SensorDataCreate.model_fields.items():
+        annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+        fields[name] = annotation if field.is_required() else NotRequired[annotation]
+    return TypedDict("SensorDataRow", fields)
+
+SensorDataRow = _row_schema()
+
+# 목록 단위 검증기 (항목마다 모델 객체를 만들지 않음)
+_ROWS_ADAPTER = TypeAdapter(List[SensorDataRow])
+
+# 생략 가능한 필드의 기본값 (INSERT 행의 키를 맞추기 위함)
+_ROW_DEFAULTS = {
+    name: field.default
+    for name, field in SensorDataCreate.model_fields.items()
+    if not field.is_required()
+}
+
+class BatchValidationResult:
+    """일괄 검증 결과"""
+
+    def __init__(
+        self,
+        validated: List[Dict[str, Any]],
+        indices: List[int],
+        errors: Dict[int, List[Dict[str, Any]]]
+    ):
+        # 검증된 항목 (모든 필드 포함, sensor_type 은 SensorType)
+        self.validated = validated
+        # validated[i] 의 입력 목록 내 위치
+        self.indices = indices
+        # 입력 위치 → 오류 목록 ({"loc", "msg", "type"})
+        self.errors = errors
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """sensor_data INSERT 행"""
+        return [{**row, "sensor_type": row["sensor_type"].value} for row in self.validated]
+
+    def readings(self) -> List[SensorReading]:
+        """경량 측정값 (이미 검증되었으므로 재검증 없이 생성)"""
+        return [SensorReading(**row) for row in self.validated]
+
+def _group_errors(error: ValidationError) -> Dict[int, List[Dict[str, Any]]]:
+    grouped: Dict[int, List[Dict[str, Any]]] = {}
+    for detail in error.errors(include_url=False):
+        index, *loc = detail["loc"]
+        grouped.setdefault(index, []).append({
+            "loc": loc,
+            "msg": detail["msg"],
+            "type": detail["type"]
+        })
+    return grouped
+
+def validate_batch(items: Sequence[Dict[str, Any]]) -> BatchValidationResult:
+    """
+    센서 데이터 일괄 검증
+
+    SensorDataCreate 와 같은 규칙으로 검증합니다. 잘못된 항목이 있어도 나머지는 결과에 포함하며,
+    이 경우 전체 검증에서 항목별 오류를 모은 뒤 정상 항목만 한 번 더 검증합니다.
+    """
+    items = list(items)
+    try:
+        validated = _ROWS_ADAPTER.validate_python(items)
+        indices = list(range(len(items)))
+        errors = {}
+    except ValidationError as e:
+        errors = _group_errors(e)
+        indices = [i for i in range(len(items)) if i not in errors]
+        validated = _ROWS_ADAPTER.validate_python([items[i] for i in indices]) if indices else []
+
+    return BatchValidationResult(
+        [{**_ROW_DEFAULTS, **row} for row in validated],
+        indices,
+        errors
+    )
@@ -0,0 +1,180 @@
+"""
+센서 위치 공간 색인 모듈
+위경도 격자 버킷에 센서 위치를 담아 반경/영역 조회 시 겹치는 버킷의 후보만 거리 계산하고,
+센서가 새로 나타나거나 이동하면 해당 항목의 버킷만 갱신
+"""
+
+import itertools
+import math
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+# 위도 1도당 거리 (km) - 서비스 전반의 평면 거리 근사가 이 값을 공유
+KM_PER_DEG_LAT = 111.32
+
+Cell = Tuple[int, int]
+
+class SpatialIndex:
+    """
+    위경도 격자 버킷 공간 색인
+
+    항목은 키(센서 ID 등)로 추가/이동/삭제하며 위치는 슬롯 번호로 관리합니다.
+    조회는 슬롯 번호 배열(*_slots) 또는 항목과 함께 저장한 값 목록(within, in_bbox)을 반환합니다.
+    거리는 다른 모듈과 같은 평면 근사(조회 지점 위도 기준)를 사용합니다.
+    """
+
+    def __init__(self, cell_km: Optional[float] = None, capacity: int = 1024):
+        self.cell_deg = (cell_km or settings.SPATIAL_INDEX_CELL_KM) / KM_PER_DEG_LAT
+        self.lat = np.zeros(max(capacity, 1))
+        self.lng = np.zeros(max(capacity, 1))
+        self.keys: List[Optional[Hashable]] = []
+        self.values: List[Any] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._slot_cells: List[Optional[Cell]] = []
+        self._cells: Dict[Cell, List[int]] = {}
+        self._free: List[int] = []
+
+    @classmethod
+    def from_points(cls, lats: np.ndarray, lngs: np.ndarray, cell_km: Optional[float] = None) -> "SpatialIndex":
+        """
+        위치 배열로 한 번에 생성 (키와 슬롯 번호는 배열 위치)
+
+        버킷 배정을 벡터 연산으로 처리하므로 스냅샷 단위 조회에 사용합니다.
+        """
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        size = len(lats)
+        index = cls(cell_km, capacity=size)
+        index.lat[:size] = lats
+        index.lng[:size] = lngs
+        index.keys = list(range(size))
+        index.values = [None] * size
+        index._slots = dict(zip(index.keys, index.keys))
+
+        rows = np.floor(lats / index.cell_deg).astype(np.int64)
+        cols = np.floor(lngs / index.cell_deg).astype(np.int64)
+        index._slot_cells = list(zip(rows.tolist(), cols.tolist()))
+        if size:
+            order = np.lexsort((cols, rows))
+            changed = (np.diff(rows[order]) != 0) | (np.diff(cols[order]) != 0)
+            bounds = np.concatenate(([0], np.flatnonzero(changed) + 1, [size]))
+            for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                index._cells[index._slot_cells[order[start]]] = order[start:end].tolist()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def _cell(self, lat: float, lng: float) -> Cell:
+        return math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg)
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        slot = len(self.keys)
+        if slot >= len(self.lat):
+            self.lat = np.concatenate((self.lat, np.zeros(len(self.lat))))
+            self.lng = np.concatenate((self.lng, np.zeros(len(self.lng))))
+        self.keys.append(None)
+        self.values.append(None)
+        self._slot_cells.append(None)
+        return slot
+
+    def _unlink(self, slot: int):
+        cell = self._slot_cells[slot]
+        members = self._cells[cell]
+        members.remove(slot)
+        if not members:
+            del self._cells[cell]
+
+    def upsert(self, key: Hashable, lat: float, lng: float, value: Any = None):
+        """항목 추가 또는 위치/값 갱신 (버킷이 바뀐 경우에만 버킷 이동)"""
+        cell = self._cell(lat, lng)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._allocate()
+            self._slots[key] = slot
+            self.keys[slot] = key
+            self._cells.setdefault(cell, []).append(slot)
+        elif self._slot_cells[slot] != cell:
+            self._unlink(slot)
+            self._cells.setdefault(cell, []).append(slot)
+
+        self.lat[slot] = lat
+        self.lng[slot] = lng
+        self.values[slot] = value
+        self._slot_cells[slot] = cell
+
+    def update(self, readings: Iterable[Any]):
+        """센서 데이터 객체 반영 (sensor_id 별 최신 측정값 유지)"""
+        for reading in readings:
+            self.upsert(reading.sensor_id, reading.location_lat, reading.location_lng, reading)
+
+    def remove(self, key: Hashable) -> bool:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        self._unlink(slot)
+        self.keys[slot] = None
+        self.values[slot] = None
+        self._slot_cells[slot] = None
+        self._free.append(slot)
+        return True
+
+    def _candidates(self, lat_min: float, lat_max: float, lng_min: float, lng_max: float) -> np.ndarray:
+        """영역과 겹치는 버킷의 슬롯"""
+        row_min, col_min = self._cell(lat_min, lng_min)
+        row_max, col_max = self._cell(lat_max, lng_max)
+        if (row_max - row_min + 1) * (col_max - col_min + 1) > len(self._cells):
+            # 조회 영역의 버킷 수가 사용 중인 버킷보다 많으면 사용 중인 버킷만 확인
+            buckets = [
+                members for (row, col), members in self._cells.items()
+                if row_min <= row <= row_max and col_min <= col <= col_max
+            ]
+        else:
+            get = self._cells.get
+            buckets = [
+                get((row, col), ())
+                for row in range(row_min, row_max + 1)
+                for col in range(col_min, col_max + 1)
+            ]
+        return np.fromiter(itertools.chain.from_iterable(buckets), dtype=np.intp)
+
+    def radius_slots(self, lat: float, lng: float, radius_km: float) -> np.ndarray:
+        """지점에서 radius_km 이내 항목의 슬롯"""
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        dlat = radius_km / KM_PER_DEG_LAT
+        dlng = dlat / cos_lat
+        slots = self._candidates(lat - dlat, lat + dlat, lng - dlng, lng + dlng)
+        if not slots.size:
+            return slots
+        dy = (self.lat[slots] - lat) * KM_PER_DEG_LAT
+        dx = (self.lng[slots] - lng) * KM_PER_DEG_LAT * cos_lat
+        return slots[dx * dx + dy * dy <= radius_km * radius_km]
+
+    def bbox_slots(self, lat_min: float, lat_max: float, lng_min: float, lng_max: float) -> np.ndarray:
+        """위경도 영역(경계 포함) 내 항목의 슬롯 (범위를 벗어난 경계는 위경도 한계로 제한)"""
+        lat_min, lat_max = max(lat_min, -90.0), min(lat_max, 90.0)
+        lng_min, lng_max = max(lng_min, -180.0), min(lng_max, 180.0)
+        slots = self._candidates(lat_min, lat_max, lng_min, lng_max)
+        if not slots.size:
+            return slots
+        lat, lng = self.lat[slots], self.lng[slots]
+        return slots[(lat >= lat_min) & (lat <= lat_max) & (lng >= lng_min) & (lng <= lng_max)]
+
+    def within(self, lat: float, lng: float, radius_km: float) -> List[Any]:
+        """지점에서 radius_km 이내 항목의 값"""
+        return [self.values[slot] for slot in self.radius_slots(lat, lng, radius_km)]
+
+    def in_bbox(self, lat_min: float, lat_max: float, lng_min: float, lng_max: float) -> List[Any]:
+        """위경도 영역 내 항목의 값"""
+        return [self.values[slot] for slot in self.bbox_slots(lat_min, lat_max, lng_min, lng_max)]
+
+# 센서별 최신 측정값 색인 (수집/MQTT 수신 시 갱신)
+sensor_index = SpatialIndex()
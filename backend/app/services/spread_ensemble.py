@@ -0,0 +1,473 @@
+"""
+화재 확산 앙상블 예측 모듈
+풍속/풍향과 발화 지점을 섭동한 확산 시뮬레이션 여러 개를 프로세스 풀에서 병렬로 실행하여
+연소 확률 래스터와 백분위 도달 시간으로 집계하고, 산불 건별로 캐시하여 새 측정값이 들어오면 일부 구성원만 다시 실행
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import SPREAD_ENSEMBLE_MEMBERS_TOTAL, SPREAD_ENSEMBLE_SECONDS
+from app.services.spatial_index import KM_PER_DEG_LAT
+from app.services.spread_simulator import SpreadGrid, SpreadSimulator, mask_polygons
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float]
+
+def _angle_difference(a: np.ndarray, b: float) -> np.ndarray:
+    """각도 차이 (-180 ~ 180)"""
+    return (np.asarray(a, dtype=float) - b + 180.0) % 360.0 - 180.0
+
+class EnsembleConditions:
+    """
+    앙상블 섭동 조건
+
+    구성원마다 풍속은 정규분포(0 이상), 풍향은 정규분포(원형), 발화 지점은 지점별로 평면 정규분포만큼 흔듭니다.
+    """
+
+    def __init__(
+        self,
+        wind_speed: float,
+        wind_direction: Optional[float],
+        wind_speed_sigma: Optional[float] = None,
+        wind_direction_sigma: Optional[float] = None,
+        ignition_jitter_m: Optional[float] = None
+    ):
+        self.wind_speed = wind_speed
+        self.wind_direction = wind_direction
+        self.wind_speed_sigma = wind_speed_sigma if wind_speed_sigma is not None else settings.SPREAD_ENSEMBLE_WIND_SPEED_SIGMA
+        self.wind_direction_sigma = (
+            wind_direction_sigma if wind_direction_sigma is not None
+            else settings.SPREAD_ENSEMBLE_WIND_DIRECTION_SIGMA
+        )
+        self.ignition_jitter_m = ignition_jitter_m if ignition_jitter_m is not None else settings.SPREAD_ENSEMBLE_IGNITION_JITTER_M
+
+    @classmethod
+    def from_forecast(
+        cls,
+        wind_speed: Optional[float],
+        wind_direction: Optional[float],
+        forecast: Optional[Dict[str, Any]],
+        hours: float
+    ) -> "EnsembleConditions":
+        """
+        기상청 예보로 섭동 폭 산정
+
+        시뮬레이션 시간 동안의 시간별 예보 풍속/풍향이 현재 값에서 벗어나는 정도(RMS)를 섭동 폭으로 쓰며
+        기본 섭동 폭보다 작아지지 않습니다. 현재 값이 없으면 예보 평균을 씁니다.
+        """
+        hourly = (forecast or {}).get("hourly", [])[:max(1, math.ceil(hours))]
+        speeds = np.array([h["wind_speed"] for h in hourly if h.get("wind_speed") is not None], dtype=float)
+        directions = np.array([h["wind_direction"] for h in hourly if h.get("wind_direction") is not None], dtype=float)
+
+        if wind_speed is None:
+            wind_speed = float(speeds.mean()) if speeds.size else 0.0
+        if wind_direction is None and directions.size:
+            radians = np.radians(directions)
+            wind_direction = float(np.degrees(np.arctan2(np.sin(radians).mean(), np.cos(radians).mean())) % 360.0)
+
+        conditions = cls(wind_speed, wind_direction)
+        if speeds.size:
+            spread = float(np.sqrt(np.mean((speeds - wind_speed) ** 2)))
+            conditions.wind_speed_sigma = max(conditions.wind_speed_sigma, spread)
+        if directions.size and wind_direction is not None:
+            spread = float(np.sqrt(np.mean(_angle_difference(directions, wind_direction) ** 2)))
+            conditions.wind_direction_sigma = max(conditions.wind_direction_sigma, spread)
+        return conditions
+
+    def with_wind(self, wind_speed: float, wind_direction: Optional[float]) -> "EnsembleConditions":
+        """섭동 폭은 유지하고 중심 바람만 바꾼 조건"""
+        return EnsembleConditions(
+            wind_speed, wind_direction,
+            self.wind_speed_sigma, self.wind_direction_sigma, self.ignition_jitter_m
+        )
+
+    def shift(self, other: "EnsembleConditions") -> float:
+        """중심 바람의 변화량 (섭동 폭 단위, 풍속과 풍향 중 큰 쪽)"""
+        speed = abs(other.wind_speed - self.wind_speed) / max(self.wind_speed_sigma, 1e-6)
+        if self.wind_direction is None or other.wind_direction is None:
+            direction = 0.0 if self.wind_direction == other.wind_direction else math.inf
+        else:
+            direction = abs(float(_angle_difference(other.wind_direction, self.wind_direction))) / max(self.wind_direction_sigma, 1e-6)
+        return max(speed, direction)
+
+    def draw(self, rng: np.random.Generator, ignitions: Sequence[Point]) -> Tuple[float, Optional[float], List[Point]]:
+        """구성원 하나의 (풍속, 풍향, 발화 지점)"""
+        speed = max(0.0, float(rng.normal(self.wind_speed, self.wind_speed_sigma)))
+        direction = None
+        if self.wind_direction is not None:
+            direction = float(rng.normal(self.wind_direction, self.wind_direction_sigma)) % 360.0
+        jittered = []
+        for lat, lng in ignitions:
+            dy, dx = rng.normal(0.0, self.ignition_jitter_m, 2) / 1000
+            jittered.append((
+                lat + dy / KM_PER_DEG_LAT,
+                lng + dx / (KM_PER_DEG_LAT * math.cos(math.radians(lat)))
+            ))
+        return speed, direction, jittered
+
+def _simulate_member(
+    simulator: SpreadSimulator,
+    grid: SpreadGrid,
+    ignitions: List[Point],
+    wind_speed: float,
+    wind_direction: Optional[float],
+    duration_minutes: float
+) -> Tuple[int, int, np.ndarray]:
+    """구성원 하나 실행 (작업 프로세스), 도달한 셀을 감싸는 영역의 도달 시간만 (시작 행, 시작 열, 배열) 로 반환"""
+    arrival = simulator.simulate(grid, ignitions, wind_speed, wind_direction, duration_minutes).arrival_minutes
+    reached = np.isfinite(arrival)
+    rows = np.flatnonzero(reached.any(axis=1))
+    if not rows.size:
+        return 0, 0, np.empty((0, 0), dtype=np.float32)
+    cols = np.flatnonzero(reached.any(axis=0))
+    r0, r1, c0, c1 = int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1
+    return r0, c0, arrival[r0:r1, c0:c1].copy()
+
+class EnsembleMember:
+    """앙상블 구성원 (섭동 조건과 도달 시간 결과)"""
+
+    __slots__ = ("wind_speed", "wind_direction", "ignitions", "row", "col", "arrival")
+
+    def __init__(
+        self,
+        wind_speed: float,
+        wind_direction: Optional[float],
+        ignitions: List[Point],
+        outcome: Tuple[int, int, np.ndarray]
+    ):
+        self.wind_speed = wind_speed
+        self.wind_direction = wind_direction
+        self.ignitions = ignitions
+        self.row, self.col, self.arrival = outcome
+
+class EnsembleResult:
+    """앙상블 집계 결과 (연소 확률 래스터와 백분위 도달 시간 래스터)"""
+
+    def __init__(
+        self,
+        grid: SpreadGrid,
+        members: Sequence[EnsembleMember],
+        duration_minutes: float,
+        percentiles: Sequence[float] = (10, 50, 90)
+    ):
+        self.grid = grid
+        self.member_count = len(members)
+        self.duration_minutes = duration_minutes
+        size = grid.size
+
+        # 구성원 결과를 모두 감싸는 영역에서만 집계
+        reached = [member for member in members if member.arrival.size]
+        self.burn_probability = np.zeros((size, size), dtype=np.float32)
+        self.arrival_percentiles = {float(q): np.full((size, size), np.inf, dtype=np.float32) for q in percentiles}
+        if not reached:
+            return
+        r0 = min(member.row for member in reached)
+        c0 = min(member.col for member in reached)
+        r1 = max(member.row + member.arrival.shape[0] for member in reached)
+        c1 = max(member.col + member.arrival.shape[1] for member in reached)
+        stack = np.full((len(members), r1 - r0, c1 - c0), np.inf, dtype=np.float32)
+        for i, member in enumerate(reached):
+            rows, cols = member.arrival.shape
+            stack[i, member.row - r0:member.row - r0 + rows, member.col - c0:member.col - c0 + cols] = member.arrival
+
+        window = (slice(r0, r1), slice(c0, c1))
+        self.burn_probability[window] = (stack <= duration_minutes).mean(axis=0)
+        # 순위 기준 백분위 (q% 의 구성원이 도달한 시각, 도달한 구성원이 부족하면 inf)
+        stack.sort(axis=0)
+        for q, raster in self.arrival_percentiles.items():
+            rank = min(len(members), max(1, math.ceil(q / 100 * len(members))))
+            raster[window] = stack[rank - 1]
+
+    @property
+    def expected_area_km2(self) -> float:
+        return float(self.burn_probability.sum(dtype=np.float64) * self.grid.cell_area_km2)
+
+    def probability_contours(
+        self,
+        levels: Sequence[float] = (0.1, 0.5, 0.9),
+        simplify_cells: float = 1.0
+    ) -> Dict[float, List[List[Point]]]:
+        """연소 확률 등치선 (확률 → 해당 확률 이상 영역의 외곽선 다각형 목록)"""
+        return {
+            float(level): mask_polygons(self.grid, self.burn_probability >= level, simplify_cells)
+            for level in levels
+        }
+
+    def arrival_contours(
+        self,
+        percentile: float = 50,
+        minutes: Optional[Sequence[float]] = None,
+        simplify_cells: float = 1.0
+    ) -> Dict[float, List[List[Point]]]:
+        """백분위 도달 시간 등치선 (시각 → 외곽선 다각형 목록, 미지정 시 1시간 간격)"""
+        arrival = self.arrival_percentiles[float(percentile)]
+        if minutes is None:
+            minutes = [60.0 * hour for hour in range(1, int(self.duration_minutes // 60) + 1)] or [self.duration_minutes]
+        return {
+            float(minute): mask_polygons(self.grid, arrival <= minute, simplify_cells)
+            for minute in minutes
+        }
+
+    def summary(
+        self,
+        levels: Sequence[float] = (0.1, 0.5, 0.9),
+        contour_minutes: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        return {
+            "members": self.member_count,
+            "duration_minutes": self.duration_minutes,
+            "cell_m": self.grid.cell_m,
+            "expected_area_km2": self.expected_area_km2,
+            "probability_contours": [
+                {"probability": level, "polygons": polygons}
+                for level, polygons in self.probability_contours(levels).items()
+            ],
+            "arrival_contours": [
+                {
+                    "percentile": percentile,
+                    "contours": [
+                        {"minutes": minute, "polygons": polygons}
+                        for minute, polygons in self.arrival_contours(percentile, contour_minutes).items()
+                    ]
+                }
+                for percentile in self.arrival_percentiles
+            ]
+        }
+
+class IncidentForecast:
+    """산불 건별 앙상블 상태 (구성원은 오래된 순, 새 측정값은 다음 갱신 때 반영)"""
+
+    def __init__(
+        self,
+        incident_id: str,
+        grid: SpreadGrid,
+        ignitions: List[Point],
+        conditions: EnsembleConditions,
+        duration_minutes: float,
+        member_count: int,
+        seed: Optional[int] = None
+    ):
+        self.incident_id = incident_id
+        self.grid = grid
+        # 요청한 발화 지점과 탐지로 추가된 발화 지점을 포함한 현재 발화 지점
+        self.origin = list(ignitions)
+        self.ignitions = list(ignitions)
+        self.conditions = conditions
+        self.duration_minutes = duration_minutes
+        self.member_count = member_count
+        self.rng = np.random.default_rng(seed)
+        self.members: List[EnsembleMember] = []
+        self.result: Optional[EnsembleResult] = None
+        self.version = 0
+        # 마지막 갱신에서 다시 실행한 구성원 수
+        self.last_refreshed = 0
+        self.updated_at = 0.0
+        # 다음 갱신 때 반영할 측정값 (센서별 최신 풍속/풍향, 새 발화 지점)
+        self.pending_wind: Dict[str, Tuple[float, float]] = {}
+        self.pending_ignitions: List[Point] = []
+
+    def contains(self, lat: float, lng: float) -> bool:
+        row, col = self.grid.cell_of(lat, lng)
+        return 0 <= row < self.grid.size and 0 <= col < self.grid.size
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.pending_wind or self.pending_ignitions)
+
+    def observe(self, reading: Any):
+        """격자 안의 측정값 하나 반영 대기 (예측 연소 영역 밖의 화재 탐지는 새 발화 지점)"""
+        lat, lng = reading.location_lat, reading.location_lng
+        if reading.wind_speed is not None and reading.wind_direction is not None:
+            self.pending_wind[reading.sensor_id] = (reading.wind_speed, reading.wind_direction)
+        if reading.fire_detected and self.result is not None:
+            row, col = self.grid.cell_of(lat, lng)
+            if self.result.burn_probability[row, col] < 0.5:
+                self.pending_ignitions.append((lat, lng))
+
+class SpreadEnsemble:
+    """
+    확산 앙상블 실행기와 산불 건별 캐시
+
+    구성원은 프로세스 풀에서 병렬 실행하며, 같은 산불을 다시 조회하면 캐시된 결과를 반환합니다.
+    캐시된 산불은 새 측정값을 반영할 때
+    - 새 발화 지점이 생기면 모든 구성원을,
+    - 중심 바람이 섭동 폭 이상 바뀌면 모든 구성원을,
+    - 그보다 작게 바뀌면 가장 오래된 구성원 일부(refresh_fraction)만 새 조건으로 다시 실행합니다.
+    """
+
+    def __init__(
+        self,
+        members: Optional[int] = None,
+        workers: Optional[int] = None,
+        refresh_fraction: Optional[float] = None,
+        max_incidents: Optional[int] = None,
+        simulator: Optional[SpreadSimulator] = None,
+        executor: Optional[Executor] = None
+    ):
+        self.members = members or settings.SPREAD_ENSEMBLE_MEMBERS
+        self.workers = workers or settings.SPREAD_ENSEMBLE_WORKERS or None
+        self.refresh_fraction = refresh_fraction or settings.SPREAD_ENSEMBLE_REFRESH_FRACTION
+        self.max_incidents = max_incidents or settings.SPREAD_ENSEMBLE_MAX_INCIDENTS
+        self.simulator = simulator or SpreadSimulator()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.incidents: "OrderedDict[str, IncidentForecast]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            # 작업 프로세스는 처음 실행할 때 생성 (workers 미지정 시 CPU 수)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def _run_members(self, incident: IncidentForecast, count: int) -> List[EnsembleMember]:
+        """현재 조건에서 새 구성원 count 개를 병렬 실행"""
+        loop = asyncio.get_running_loop()
+        draws = [incident.conditions.draw(incident.rng, incident.ignitions) for _ in range(count)]
+        outcomes = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._pool(), _simulate_member,
+                self.simulator, incident.grid, ignitions, speed, direction, incident.duration_minutes
+            )
+            for speed, direction, ignitions in draws
+        ))
+        return [
+            EnsembleMember(speed, direction, ignitions, outcome)
+            for (speed, direction, ignitions), outcome in zip(draws, outcomes)
+        ]
+
+    async def _update(self, incident: IncidentForecast, replace: int, mode: str):
+        """가장 오래된 구성원 replace 개를 새로 실행하고 다시 집계"""
+        started = time.perf_counter()
+        fresh = await self._run_members(incident, replace)
+        incident.members = incident.members[replace:] + fresh
+        incident.result = EnsembleResult(incident.grid, incident.members, incident.duration_minutes)
+        incident.version += 1
+        incident.last_refreshed = replace
+        incident.updated_at = time.time()
+
+        elapsed = time.perf_counter() - started
+        SPREAD_ENSEMBLE_SECONDS.labels(mode=mode).observe(elapsed)
+        SPREAD_ENSEMBLE_MEMBERS_TOTAL.labels(mode=mode).inc(replace)
+        logger.info(
+            f"🎲 확산 앙상블 {mode} - 산불: {incident.incident_id}, 구성원: {replace}/{incident.member_count}개, "
+            f"기대 면적: {incident.result.expected_area_km2:.2f}km², 소요: {elapsed:.2f}초"
+        )
+
+    def _lock(self, incident_id: str) -> asyncio.Lock:
+        return self._locks.setdefault(incident_id, asyncio.Lock())
+
+    async def forecast(
+        self,
+        incident_id: str,
+        grid: SpreadGrid,
+        ignitions: List[Point],
+        conditions: EnsembleConditions,
+        duration_minutes: float,
+        members: Optional[int] = None,
+        seed: Optional[int] = None,
+        requested_wind: Optional[EnsembleConditions] = None
+    ) -> IncidentForecast:
+        """
+        산불 건의 앙상블 예측 (캐시된 같은 조건이면 대기 중인 측정값만 반영)
+
+        발화 지점, 시뮬레이션 시간, 구성원 수가 캐시와 다르면 새로 실행합니다.
+        requested_wind 는 요청에 지정된 중심 바람으로, 캐시를 사용할 때 대기 중인 바람 측정값 대신 반영합니다.
+        """
+        members = members or self.members
+        async with self._lock(incident_id):
+            incident = self.incidents.get(incident_id)
+            if (
+                incident is None
+                or incident.origin != list(ignitions)
+                or incident.duration_minutes != duration_minutes
+                or incident.member_count != members
+            ):
+                incident = IncidentForecast(incident_id, grid, ignitions, conditions, duration_minutes, members, seed)
+                await self._update(incident, members, "full")
+                self.incidents[incident_id] = incident
+                while len(self.incidents) > self.max_incidents:
+                    evicted, _ = self.incidents.popitem(last=False)
+                    self._locks.pop(evicted, None)
+            else:
+                await self._apply_pending(incident, requested_wind)
+            self.incidents.move_to_end(incident_id)
+            return incident
+
+    async def refresh(self, incident_id: str) -> Optional[IncidentForecast]:
+        """캐시된 산불 건에 대기 중인 측정값 반영 (없는 산불은 None)"""
+        incident = self.incidents.get(incident_id)
+        if incident is None:
+            return None
+        async with self._lock(incident_id):
+            await self._apply_pending(incident)
+        return incident
+
+    async def _apply_pending(self, incident: IncidentForecast, requested_wind: Optional[EnsembleConditions] = None):
+        if requested_wind is not None:
+            # 요청에 지정된 바람이 대기 중인 바람 측정값보다 우선 (캐시 조건과 같으면 다시 실행하지 않음)
+            incident.pending_wind.clear()
+            if incident.conditions.shift(requested_wind) == 0:
+                requested_wind = None
+        if requested_wind is None and not incident.pending:
+            incident.last_refreshed = 0
+            return
+
+        # 바람은 새 발화점과 함께 대기 중이어도 먼저 조건에 반영
+        shift = 0.0
+        if requested_wind is not None:
+            shift = incident.conditions.shift(requested_wind)
+            incident.conditions = requested_wind
+        elif incident.pending_wind:
+            speeds, directions = np.array(list(incident.pending_wind.values()), dtype=float).T
+            radians = np.radians(directions)
+            observed = incident.conditions.with_wind(
+                float(speeds.mean()),
+                float(np.degrees(np.arctan2(np.sin(radians).mean(), np.cos(radians).mean())) % 360.0)
+            )
+            shift = incident.conditions.shift(observed)
+            incident.conditions = observed
+
+        if incident.pending_ignitions:
+            incident.ignitions = incident.ignitions + incident.pending_ignitions
+            replace, mode = incident.member_count, "ignition"
+        elif shift >= 1.0:
+            replace, mode = incident.member_count, "wind_shift"
+        else:
+            replace, mode = max(1, math.ceil(incident.member_count * self.refresh_fraction)), "rolling"
+        incident.pending_wind.clear()
+        incident.pending_ignitions.clear()
+        await self._update(incident, replace, mode)
+
+    def observe(self, readings: Sequence[Any]):
+        """새 측정값을 격자가 포함하는 산불 건에 반영 대기 (다음 조회 때 증분 갱신)"""
+        for incident in self.incidents.values():
+            for reading in readings:
+                if incident.contains(reading.location_lat, reading.location_lng):
+                    incident.observe(reading)
+
+    async def ingest(self, readings: Sequence[Any]):
+        """MQTT 수신 묶음 콜백"""
+        self.observe(readings)
+
+    async def observe_region(self, region: Any, readings: Sequence[Any]):
+        """수집 스케줄러 지역별 결과 콜백"""
+        self.observe(readings)
+
+    def shutdown(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# 산불 건별 확산 앙상블 (API/수집 콜백 공유)
+spread_ensemble = SpreadEnsemble()
@@ -0,0 +1,360 @@
+"""
+화재 확산 시뮬레이션 모듈
+격자 셀룰러 오토마타로 풍향/풍속, 경사, 연료 조건에 따른 연소 확률 래스터를 시간 단계별로 진행하고
+도달 시간 등치선과 피해 예상 영역 다각형을 산출
+"""
+
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.services.spatial_index import KM_PER_DEG_LAT
+
+logger = logging.getLogger(__name__)
+
+# 8방향 이웃 (행, 열 변화량) - 행은 남쪽으로 증가
+DIRECTIONS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+# 풍속 계수 (Alexandridis et al. 2008): exp(c1 V) * exp(c2 V (cos θ - 1))
+WIND_C1 = 0.045
+WIND_C2 = 0.131
+# 경사 계수 (도당): exp(a θ)
+SLOPE_COEFFICIENT = 0.035
+
+class SpreadGrid:
+    """
+    시뮬레이션 격자
+
+    중심 위경도 기준의 정사각형 영역을 cell_m 간격으로 나눕니다 (평면 근사, 0행이 북쪽 끝).
+    elevation(m), fuel(0: 비연소 ~ 1: 기준 연료, 1 초과 가능)은 격자 크기의 배열이며 생략 시 평지/기준 연료입니다.
+    """
+
+    def __init__(
+        self,
+        center_lat: float,
+        center_lng: float,
+        size_km: Optional[float] = None,
+        cell_m: Optional[float] = None,
+        elevation: Optional[np.ndarray] = None,
+        fuel: Optional[np.ndarray] = None
+    ):
+        self.center_lat = center_lat
+        self.center_lng = center_lng
+        self.cell_m = cell_m or settings.SPREAD_CELL_METERS
+        size_km = size_km or settings.SPREAD_AREA_KM
+        self.size = max(3, int(math.ceil(size_km * 1000 / self.cell_m)))
+        shape = (self.size, self.size)
+        self.elevation = np.zeros(shape, dtype=np.float32) if elevation is None else np.asarray(elevation, dtype=np.float32)
+        self.fuel = np.ones(shape, dtype=np.float32) if fuel is None else np.asarray(fuel, dtype=np.float32)
+        if self.elevation.shape != shape or self.fuel.shape != shape:
+            raise ValueError(f"고도/연료 배열 크기는 {shape} 이어야 합니다")
+        self._deg_lat = self.cell_m / 1000 / KM_PER_DEG_LAT
+        self._deg_lng = self._deg_lat / math.cos(math.radians(center_lat))
+
+    @classmethod
+    def from_terrain(
+        cls,
+        center_lat: float,
+        center_lng: float,
+        terrain: Any,
+        size_km: Optional[float] = None,
+        cell_m: Optional[float] = None
+    ) -> "SpreadGrid":
+        """지형 저장소(grid_rasters 제공)에서 셀 중심의 고도/연료를 채운 격자 (레이어가 없으면 평지/기준 연료)"""
+        grid = cls(center_lat, center_lng, size_km, cell_m)
+        elevation, fuel = terrain.grid_rasters(*grid.cell_centers())
+        if elevation is not None:
+            grid.elevation = elevation
+        if fuel is not None:
+            grid.fuel = fuel
+        return grid
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # 앙상블 구성원을 다른 프로세스로 보낼 때 평지/기준 연료 래스터는 생략
+        state = self.__dict__.copy()
+        if not state["elevation"].any():
+            state["elevation"] = None
+        if (state["fuel"] == 1.0).all():
+            state["fuel"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        shape = (state["size"], state["size"])
+        if state["elevation"] is None:
+            state["elevation"] = np.zeros(shape, dtype=np.float32)
+        if state["fuel"] is None:
+            state["fuel"] = np.ones(shape, dtype=np.float32)
+        self.__dict__.update(state)
+
+    @property
+    def cell_area_km2(self) -> float:
+        return (self.cell_m / 1000) ** 2
+
+    def cell_of(self, lat: float, lng: float) -> Tuple[int, int]:
+        """위경도가 속한 셀 (행, 열)"""
+        row = int(math.floor(self.size / 2 - (lat - self.center_lat) / self._deg_lat))
+        col = int(math.floor(self.size / 2 + (lng - self.center_lng) / self._deg_lng))
+        return row, col
+
+    def to_latlng(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """셀 좌표(실수 가능, 셀 모서리 기준)를 위경도로 변환"""
+        lats = self.center_lat + (self.size / 2 - np.asarray(rows, dtype=float)) * self._deg_lat
+        lngs = self.center_lng + (np.asarray(cols, dtype=float) - self.size / 2) * self._deg_lng
+        return lats, lngs
+
+    def cell_centers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """모든 셀 중심의 위경도 (행 기준 위도 배열, 열 기준 경도 배열)"""
+        centers = np.arange(self.size) + 0.5
+        return self.to_latlng(centers, centers)
+
+def mask_polygons(grid: SpreadGrid, mask: np.ndarray, simplify_cells: float = 1.0) -> List[List[Tuple[float, float]]]:
+    """격자 마스크의 외곽선 다각형 목록 (위경도, 면적 큰 순, simplify_cells: 단순화 허용 오차)"""
+    contours, _ = cv2.findContours(mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    polygons = []
+    for contour in sorted(contours, key=cv2.contourArea, reverse=True):
+        if simplify_cells > 0:
+            contour = cv2.approxPolyDP(contour, simplify_cells, True)
+        points = contour.reshape(-1, 2).astype(float)
+        # 외곽선 좌표는 셀 중심이므로 모서리 기준 좌표로 보정
+        lats, lngs = grid.to_latlng(points[:, 1] + 0.5, points[:, 0] + 0.5)
+        polygons.append(list(zip(lats.tolist(), lngs.tolist())))
+    return polygons
+
+class SpreadResult:
+    """확산 시뮬레이션 결과"""
+
+    def __init__(
+        self,
+        grid: SpreadGrid,
+        probability: np.ndarray,
+        arrival_minutes: np.ndarray,
+        duration_minutes: float,
+        steps: int,
+        elapsed_seconds: float
+    ):
+        self.grid = grid
+        # 시뮬레이션 종료 시점까지의 연소 확률
+        self.probability = probability
+        # 연소 확률이 0.5 에 도달한 시각 (분, 도달하지 않은 셀은 inf)
+        self.arrival_minutes = arrival_minutes
+        self.duration_minutes = duration_minutes
+        self.steps = steps
+        self.elapsed_seconds = elapsed_seconds
+
+    def contours(
+        self,
+        minutes: Optional[Sequence[float]] = None,
+        simplify_cells: float = 1.0
+    ) -> Dict[float, List[List[Tuple[float, float]]]]:
+        """
+        도달 시간 등치선
+
+        Args:
+            minutes: 등치선 시각 목록 (분, 미지정 시 1시간 간격)
+            simplify_cells: 다각형 단순화 허용 오차 (셀)
+
+        Returns:
+            시각 → 해당 시각까지 도달한 영역의 외곽선 다각형 목록
+        """
+        if minutes is None:
+            minutes = [60.0 * hour for hour in range(1, int(self.duration_minutes // 60) + 1)] or [self.duration_minutes]
+        return {
+            float(minute): mask_polygons(self.grid, self.arrival_minutes <= minute, simplify_cells)
+            for minute in minutes
+        }
+
+    def affected_polygon(self, simplify_cells: float = 1.0) -> List[Tuple[float, float]]:
+        """피해 예상 영역 (종료 시점까지 도달한 영역 중 가장 큰 외곽선)"""
+        polygons = mask_polygons(self.grid, np.isfinite(self.arrival_minutes), simplify_cells)
+        return polygons[0] if polygons else []
+
+    @property
+    def affected_area_km2(self) -> float:
+        return float(np.isfinite(self.arrival_minutes).sum() * self.grid.cell_area_km2)
+
+    @property
+    def expected_area_km2(self) -> float:
+        """연소 확률 합 기준 기대 피해 면적"""
+        return float(self.probability.sum(dtype=np.float64) * self.grid.cell_area_km2)
+
+    def summary(self, contour_minutes: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        return {
+            "duration_minutes": self.duration_minutes,
+            "cell_m": self.grid.cell_m,
+            "steps": self.steps,
+            "affected_area_km2": self.affected_area_km2,
+            "expected_area_km2": self.expected_area_km2,
+            "affected_polygon": self.affected_polygon(),
+            "contours": [
+                {"minutes": minute, "polygons": polygons}
+                for minute, polygons in self.contours(contour_minutes).items()
+            ],
+            "elapsed_seconds": self.elapsed_seconds
+        }
+
+class SpreadSimulator:
+    """
+    셀룰러 오토마타 화재 확산 시뮬레이터
+
+    각 셀은 연소 중인 8방향 이웃으로부터 노출량을 누적하며, 단계마다 가장 빠른 이웃의 R·dt / 거리 만큼 늘어납니다.
+    확산 속도 R 은 기준 속도 × 연료 × 풍속 계수 × 경사 계수입니다.
+    연소 확률은 1 - 0.5^노출량 으로, 이웃에서 예상 확산 시간만큼 노출되면 0.5 에 도달하며 이 시각을 도달 시각으로 기록합니다.
+    도달한 셀은 연소 지속 시간 동안 이웃으로 불을 옮기고, 단계 길이는 가장 빠른 방향이 한 단계에 한 셀을 넘지 않도록 정합니다.
+    연소 중인 셀 주변만 계산하므로 초기에는 작은 창에서, 확산에 따라 창을 넓혀 가며 진행합니다.
+    """
+
+    def __init__(
+        self,
+        base_ros_m_per_min: Optional[float] = None,
+        residence_minutes: Optional[float] = None,
+        max_step_minutes: float = 5.0
+    ):
+        self.base_ros = base_ros_m_per_min or settings.SPREAD_BASE_ROS_M_PER_MIN
+        self.residence_minutes = residence_minutes or settings.SPREAD_RESIDENCE_MINUTES
+        self.max_step_minutes = max_step_minutes
+
+    def spread_rates(
+        self,
+        grid: SpreadGrid,
+        wind_speed: float,
+        wind_direction: Optional[float]
+    ) -> List[np.ndarray]:
+        """
+        방향별 이웃 셀로의 확산 속도 배열 (분당 셀 비율 = R / 거리)
+
+        wind_direction 은 바람이 불어오는 방향(기상 관측 기준, 도)이며 불은 그 반대쪽으로 번집니다.
+        반환 배열은 대상 셀 기준이며 (i 번째 방향의 원본 셀은 대상 셀 - DIRECTIONS[i]) 격자 가장자리는 0 입니다.
+        """
+        size = grid.size
+        padded_elevation = np.pad(grid.elevation, 1, mode="edge")
+        wind_to = None if wind_direction is None else (wind_direction + 180.0) % 360.0
+        rates = []
+        for dr, dc in DIRECTIONS:
+            distance = grid.cell_m * math.hypot(dr, dc)
+            # 풍속 계수 (방향 간 각도에 따라 감쇠)
+            wind_factor = math.exp(WIND_C1 * wind_speed)
+            if wind_to is not None:
+                bearing = math.degrees(math.atan2(dc, -dr))
+                wind_factor *= math.exp(WIND_C2 * wind_speed * (math.cos(math.radians(bearing - wind_to)) - 1))
+            # 경사 계수 (오르막일수록 빠름)
+            source = padded_elevation[1 - dr:1 - dr + size, 1 - dc:1 - dc + size]
+            slope = np.degrees(np.arctan((grid.elevation - source) / distance))
+            rate = grid.fuel * (self.base_ros * wind_factor / distance) * np.exp(SLOPE_COEFFICIENT * slope)
+            # 원본 셀이 격자 밖인 가장자리
+            if dr:
+                rate[0 if dr > 0 else -1, :] = 0.0
+            if dc:
+                rate[:, 0 if dc > 0 else -1] = 0.0
+            rates.append(rate.astype(np.float32))
+        return rates
+
+    def simulate(
+        self,
+        grid: SpreadGrid,
+        ignitions: Sequence[Tuple[float, float]],
+        wind_speed: float = 0.0,
+        wind_direction: Optional[float] = None,
+        duration_minutes: float = 360.0,
+        initial_probability: Optional[np.ndarray] = None
+    ) -> SpreadResult:
+        """
+        확산 시뮬레이션
+
+        Args:
+            grid: 시뮬레이션 격자
+            ignitions: 발화 지점 [(lat, lng), ...] (격자 밖 지점은 무시)
+            wind_speed: 풍속 (m/s)
+            wind_direction: 풍향 (불어오는 방향, 도, 없으면 무풍 취급)
+            duration_minutes: 시뮬레이션 시간 (분)
+            initial_probability: 시작 시점의 연소 확률 래스터 (0.5 이상인 셀은 연소 중으로 시작, 발화 지점과 함께 적용)
+        """
+        started = time.perf_counter()
+        size = grid.size
+        rates = self.spread_rates(grid, wind_speed, wind_direction)
+
+        # 가장 빠른 방향이 한 단계에 한 셀을 넘지 않는 단계 길이
+        max_rate = max(float(rate.max()) for rate in rates)
+        dt = self.max_step_minutes if max_rate <= 0 else min(self.max_step_minutes, 1.0 / max_rate)
+        steps = max(1, int(math.ceil(duration_minutes / dt)))
+        dt = duration_minutes / steps
+
+        # 가장자리 1셀 여백을 둔 상태 배열 (여백은 도달하지 않은 셀)
+        exposure = np.zeros((size + 2, size + 2), dtype=np.float32)
+        arrival = np.full((size + 2, size + 2), np.inf, dtype=np.float32)
+        if initial_probability is not None:
+            initial = np.clip(np.asarray(initial_probability, dtype=np.float32), 0.0, 1.0 - 1e-6)
+            exposure[1:-1, 1:-1] = -np.log2(1.0 - initial)
+        for lat, lng in ignitions:
+            row, col = grid.cell_of(lat, lng)
+            if 0 <= row < size and 0 <= col < size:
+                exposure[row + 1, col + 1] = max(exposure[row + 1, col + 1], 1.0)
+        arrival[exposure >= 1.0] = 0.0
+
+        window = self._active_window(arrival, -self.residence_minutes, size)
+        for step in range(1, steps + 1):
+            if window is None:
+                break
+            now = (step - 1) * dt
+            r0, r1, c0, c1 = window
+            target = (slice(r0, r1), slice(c0, c1))
+
+            # 연소 중인 이웃별 이번 단계의 노출량 중 최댓값
+            # (직전 단계 중간에 도달한 이웃은 그 시각부터, 연소가 끝나는 이웃은 끝나는 시각까지)
+            gain = np.zeros((r1 - r0, c1 - c0), dtype=np.float32)
+            hazard = np.zeros_like(gain)
+            for (dr, dc), rate in zip(DIRECTIONS, rates):
+                source = arrival[r0 - dr:r1 - dr, c0 - dc:c1 - dc]
+                start = np.where(source >= now - dt, source, now)
+                overlap = np.minimum(now + dt, source + self.residence_minutes) - start
+                active = overlap > 0
+                rate = np.where(active, rate[r0 - 1:r1 - 1, c0 - 1:c1 - 1], 0.0)
+                np.maximum(gain, rate * np.where(active, overlap, 0.0), out=gain)
+                np.maximum(hazard, rate, out=hazard)
+
+            # 노출량이 1 을 넘는 시점을 단계 안에서 보간하여 도달 시각으로 기록
+            before = exposure[target]
+            after = before + gain
+            reached = arrival[target]
+            crossed = (after >= 1.0) & np.isinf(reached)
+            reached[crossed] = np.maximum(now - dt, now + dt - (after[crossed] - 1.0) / hazard[crossed])
+            exposure[target] = after
+            window = self._active_window(arrival, now + dt - self.residence_minutes, size, window)
+
+        probability = 1.0 - np.exp2(-exposure[1:-1, 1:-1])
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"🔥 확산 시뮬레이션 완료 - 격자: {size}x{size} ({grid.cell_m:.0f}m), "
+            f"{duration_minutes:.0f}분 / {steps}단계, 소요: {elapsed:.2f}초"
+        )
+        return SpreadResult(grid, probability, arrival[1:-1, 1:-1].copy(), duration_minutes, steps, elapsed)
+
+    @staticmethod
+    def _active_window(
+        arrival: np.ndarray,
+        since: float,
+        size: int,
+        window: Optional[Tuple[int, int, int, int]] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """since 이후 도달한 (연소 중인) 셀을 포함하고 한 셀 넓힌 계산 창 (여백 포함 좌표, 해당 셀이 없으면 None)"""
+        if window is None:
+            r0, r1, c0, c1 = 1, size + 1, 1, size + 1
+        else:
+            # 직전 창에서 새로 도달한 셀까지 포함하도록 한 셀 넓혀 확인
+            r0, r1, c0, c1 = max(1, window[0] - 1), min(size + 1, window[1] + 1), max(1, window[2] - 1), min(size + 1, window[3] + 1)
+        region = arrival[r0:r1, c0:c1]
+        region = (region > since) & np.isfinite(region)
+        rows = np.flatnonzero(region.any(axis=1))
+        if not rows.size:
+            return None
+        cols = np.flatnonzero(region.any(axis=0))
+        return (
+            max(1, r0 + int(rows[0]) - 1),
+            min(size + 1, r0 + int(rows[-1]) + 2),
+            max(1, c0 + int(cols[0]) - 1),
+            min(size + 1, c0 + int(cols[-1]) + 2)
+        )
@@ -0,0 +1,314 @@
+"""
+합성 센서망 생성 모듈
+공간 상관된 온도/습도/풍향 필드와 산불 이벤트를 가진 대규모 IoT 센서·카메라망 시뮬레이션
+"""
+
+import asyncio
+import math
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.models.sensor_data import SensorDataCreate, SensorType
+from app.services.spatial_index import KM_PER_DEG_LAT
+
+# IoT 센서 타입 (카메라 제외)
+IOT_SENSOR_TYPES = [
+    SensorType.TEMPERATURE,
+    SensorType.HUMIDITY,
+    SensorType.SMOKE_DENSITY,
+    SensorType.WIND_SPEED,
+    SensorType.VISIBILITY
+]
+CAMERA_TYPES = [SensorType.CCTV, SensorType.DRONE, SensorType.SATELLITE]
+
+class FireEvent:
+    """주입할 산불 이벤트"""
+
+    def __init__(
+        self,
+        lat: float,
+        lng: float,
+        start_s: float = 0.0,
+        intensity: float = 1.0,
+        growth_km_per_h: float = 0.5
+    ):
+        self.lat = lat
+        self.lng = lng
+        self.start_s = start_s
+        self.intensity = intensity
+        self.growth_km_per_h = growth_km_per_h
+
+    def radius_km(self, t: float) -> float:
+        """t초 시점의 화선 반경 (발화 전이면 0)"""
+        if t < self.start_s:
+            return 0.0
+        return 0.2 + self.growth_km_per_h * (t - self.start_s) / 3600
+
+class SmoothField:
+    """무작위 푸리에 모드 합으로 만든 공간 상관 필드 (평균 0, 표준편차 약 1)"""
+
+    def __init__(self, rng: np.random.Generator, modes: int = 8, min_wavelength_km: float = 5.0,
+                 max_wavelength_km: float = 40.0, period_s: float = 6 * 3600):
+        wavelengths = rng.uniform(min_wavelength_km, max_wavelength_km, modes)
+        angles = rng.uniform(0, 2 * math.pi, modes)
+        self.k = np.stack([np.cos(angles), np.sin(angles)]) * (2 * math.pi / wavelengths)
+        self.phase = rng.uniform(0, 2 * math.pi, modes)
+        self.omega = rng.uniform(0.5, 1.5, modes) * (2 * math.pi / period_s)
+        self.scale = math.sqrt(2.0 / modes)
+
+    def __call__(self, xy_km: np.ndarray, t: float) -> np.ndarray:
+        return np.cos(xy_km @ self.k - self.omega * t + self.phase).sum(axis=1) * self.scale
+
+class SyntheticSensorNetwork:
+    """합성 센서망 (시드가 같으면 위치·측정값이 항상 동일)"""
+
+    def __init__(
+        self,
+        n_sensors: int = 10000,
+        n_cameras: int = 200,
+        center: Tuple[float, float] = (37.5665, 127.9780),
+        extent_km: float = 50.0,
+        seed: int = 0,
+        fire_events: Optional[List[FireEvent]] = None,
+        emit_interval_s: float = 30.0
+    ):
+        self.n_sensors = n_sensors
+        self.n_cameras = n_cameras
+        self.center = center
+        self.extent_km = extent_km
+        self.seed = seed
+        self.fire_events = fire_events or []
+        self.emit_interval_s = emit_interval_s
+
+        rng = np.random.default_rng(seed)
+        total = n_sensors + n_cameras
+        self.km_per_deg_lng = KM_PER_DEG_LAT * math.cos(math.radians(center[0]))
+
+        # 중심 기준 km 좌표 및 위경도
+        self.xy_km = rng.uniform(-extent_km / 2, extent_km / 2, (total, 2))
+        self.lats = center[0] + self.xy_km[:, 1] / KM_PER_DEG_LAT
+        self.lngs = center[1] + self.xy_km[:, 0] / self.km_per_deg_lng
+
+        type_codes = np.empty(total, dtype=np.int8)
+        type_codes[:n_sensors] = rng.integers(0, len(IOT_SENSOR_TYPES), n_sensors)
+        type_codes[n_sensors:] = len(IOT_SENSOR_TYPES) + rng.integers(0, len(CAMERA_TYPES), n_cameras)
+        self.type_codes = type_codes
+        self.sensor_ids = [
+            f"syn_{(IOT_SENSOR_TYPES + CAMERA_TYPES)[code].value}_{i:06d}"
+            for i, code in enumerate(type_codes)
+        ]
+
+        # 센서별 측정 잡음 및 고정 편차
+        self.bias = rng.normal(0, 0.5, total)
+        self.temperature_field = SmoothField(rng)
+        self.humidity_field = SmoothField(rng)
+        self.wind_u_field = SmoothField(rng, max_wavelength_km=80.0)
+        self.wind_v_field = SmoothField(rng, max_wavelength_km=80.0)
+        self.base_wind = rng.uniform(-3, 3, 2)
+
+        self._noise_seed = seed
+        self._started_at = time.monotonic()
+
+    @property
+    def all_types(self) -> List[SensorType]:
+        return IOT_SENSOR_TYPES + CAMERA_TYPES
+
+    def _fire_influence(self, index: np.ndarray, t: float) -> np.ndarray:
+        """산불 이벤트에 의한 영향도 (0~1, 화선 근처일수록 큼)"""
+        influence = np.zeros(len(index))
+        if not self.fire_events:
+            return influence
+        for event in self.fire_events:
+            radius = event.radius_km(t)
+            if radius <= 0:
+                continue
+            dx = self.xy_km[index, 0] - (event.lng - self.center[1]) * self.km_per_deg_lng
+            dy = self.xy_km[index, 1] - (event.lat - self.center[0]) * KM_PER_DEG_LAT
+            distance = np.hypot(dx, dy)
+            influence = np.maximum(
+                influence,
+                event.intensity * np.exp(-np.maximum(0, distance - radius) ** 2 / (2 * 1.5 ** 2))
+            )
+        return np.clip(influence, 0, 1)
+
+    def sample(self, t: float, index: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        t초 시점의 측정값 (벡터 연산)
+
+        Args:
+            t: 시뮬레이션 시작 후 경과 시간 (초)
+            index: 대상 센서 인덱스 (미지정 시 전체)
+
+        Returns:
+            필드별 numpy 배열
+        """
+        if index is None:
+            index = np.arange(len(self.type_codes))
+        xy = self.xy_km[index]
+        noise = np.random.default_rng((self._noise_seed, int(t * 1000))).normal(0, 1, (4, len(index)))
+        fire = self._fire_influence(index, t)
+
+        diurnal = 4.0 * math.sin(2 * math.pi * ((t / 3600 + 6) % 24 - 9) / 24)
+        temperature = 20 + diurnal + 4 * self.temperature_field(xy, t) + self.bias[index] + 0.3 * noise[0] + 40 * fire
+        humidity = np.clip(
+            45 - 1.5 * diurnal + 15 * self.humidity_field(xy, t) - 1.2 * (temperature - 20)
+            + noise[1] - 30 * fire,
+            5, 100
+        )
+        wind_u = self.base_wind[0] + 2 * self.wind_u_field(xy, t) + 0.3 * noise[2]
+        wind_v = self.base_wind[1] + 2 * self.wind_v_field(xy, t) + 0.3 * noise[3]
+        smoke = np.clip(2 + 0.5 * np.abs(noise[0]) + 95 * fire, 0, None)
+
+        return {
+            "temperature": temperature,
+            "humidity": humidity,
+            "wind_speed": np.hypot(wind_u, wind_v),
+            # 풍향: 바람이 불어오는 방향 (기상 관례)
+            "wind_direction": (np.degrees(np.arctan2(-wind_u, -wind_v)) + 360) % 360,
+            "smoke_density": smoke,
+            "visibility": np.clip(20 - 0.18 * smoke, 0.1, 20),
+            "fire_confidence": fire
+        }
+
+    def readings(self, t: float, index: Optional[np.ndarray] = None) -> List[SensorDataCreate]:
+        """t초 시점의 SensorDataCreate 목록"""
+        if index is None:
+            index = np.arange(len(self.type_codes))
+        values = self.sample(t, index)
+        types = self.all_types
+        n_iot = len(IOT_SENSOR_TYPES)
+
+        # 행 단위 변환 비용을 줄이기 위해 파이썬 리스트로 한 번에 변환
+        columns = {
+            "temperature": values["temperature"].round(2).tolist(),
+            "humidity": values["humidity"].round(2).tolist(),
+            "smoke_density": values["smoke_density"].round(2).tolist(),
+            "wind_speed": values["wind_speed"].round(2).tolist(),
+            "wind_direction": values["wind_direction"].round(1).tolist(),
+            "visibility": values["visibility"].round(2).tolist()
+        }
+        confidences = values["fire_confidence"].round(3).tolist()
+        codes = self.type_codes[index].tolist()
+        lats = self.lats[index].tolist()
+        lngs = self.lngs[index].tolist()
+
+        readings = []
+        for row, i in enumerate(index.tolist()):
+            code = codes[row]
+            if code >= n_iot:
+                fields: Dict[str, Any] = {
+                    "fire_detected": confidences[row] >= 0.5,
+                    "fire_confidence": confidences[row],
+                    "image_analysis": {"source": "synthetic"}
+                }
+            else:
+                fields = {name: column[row] for name, column in columns.items()}
+
+            # 생성값은 스키마 범위 내로 만들어지므로 검증 생략 (미지정 필드는 기본값)
+            readings.append(SensorDataCreate.model_construct(
+                sensor_id=self.sensor_ids[i],
+                sensor_type=types[code],
+                location_lat=lats[row],
+                location_lng=lngs[row],
+                data_quality=0.9,
+                **fields
+            ))
+        return readings
+
+    async def stream(
+        self,
+        rate_per_s: float,
+        duration_s: Optional[float] = None,
+        batch_interval_s: float = 0.1,
+        realtime: bool = True
+    ) -> AsyncIterator[List[SensorDataCreate]]:
+        """
+        설정된 속도로 측정값 배치를 생성
+
+        센서들은 순서대로 돌아가며 측정값을 내보내고, 시뮬레이션 시각은
+        emit_interval_s 동안 전체 센서가 한 번씩 측정하도록 진행됩니다.
+
+        Args:
+            rate_per_s: 초당 측정값 수
+            duration_s: 실행 시간 (초, None이면 무한)
+            batch_interval_s: 배치 간격 (초)
+            realtime: False면 대기 없이 최대 속도로 생성
+        """
+        total = len(self.type_codes)
+        batch_size = max(1, int(rate_per_s * batch_interval_s))
+        cursor = 0
+        emitted = 0
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        while duration_s is None or emitted < rate_per_s * duration_s:
+            index = (np.arange(cursor, cursor + batch_size) % total)
+            t = (cursor / total) * self.emit_interval_s
+            yield self.readings(t, index)
+
+            cursor += batch_size
+            emitted += batch_size
+            if realtime:
+                delay = started + emitted / rate_per_s - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+    def nearby(self, kind: str, lat: float, lng: float, radius_km: float,
+               t: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        업스트림 API 형식의 반경 내 측정값 (대역 서버 공급용)
+
+        Args:
+            kind: cctv, drone, satellite 또는 sensors
+        """
+        if t is None:
+            t = time.monotonic() - self._started_at
+
+        dx = (self.lngs - lng) * self.km_per_deg_lng
+        dy = (self.lats - lat) * KM_PER_DEG_LAT
+        in_radius = np.hypot(dx, dy) <= radius_km
+        if kind == "sensors":
+            in_kind = self.type_codes < len(IOT_SENSOR_TYPES)
+        else:
+            code = len(IOT_SENSOR_TYPES) + [camera.value for camera in CAMERA_TYPES].index(kind)
+            in_kind = self.type_codes == code
+
+        index = np.nonzero(in_radius & in_kind)[0]
+        items = []
+        for reading in self.readings(t, index):
+            item = {
+                "id": reading.sensor_id,
+                "lat": reading.location_lat,
+                "lng": reading.location_lng,
+                "name": None,
+                "data_quality": reading.data_quality
+            }
+            if kind == "sensors":
+                item["type"] = reading.sensor_type.value
+                for field in ("temperature", "humidity", "smoke_density", "wind_speed",
+                              "wind_direction", "visibility"):
+                    item[field] = getattr(reading, field)
+            else:
+                item["image_url"] = None
+                item["fire_detected"] = reading.fire_detected
+                item["fire_confidence"] = reading.fire_confidence
+            items.append(item)
+        return items
+
+    def attach_to_standin(self, responder):
+        """업스트림 대역 서버의 합성 응답을 이 센서망으로 대체"""
+        def provider_for(kind: str):
+            def provider(path: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+                return self.nearby(
+                    kind,
+                    float(params.get("lat", self.center[0])),
+                    float(params.get("lng", self.center[1])),
+                    float(params.get("radius", 5.0))
+                )
+            return provider
+
+        for kind in ("cctv", "drone", "satellite"):
+            responder.providers[f"gigai/{kind}/nearby"] = provider_for(kind)
+        responder.providers["iot/sensors/nearby"] = provider_for("sensors")
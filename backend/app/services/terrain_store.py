@@ -0,0 +1,306 @@
+"""
+지형/연료 래스터 저장소 모듈
+고도(DEM), 연료 계수, 토지피복 래스터를 위경도 타일 단위 .npy 파일로 두고 필요한 타일만 메모리 매핑하여,
+여러 지점의 값을 한 번의 벡터 연산(쌍선형 보간/최근접)으로 조회
+"""
+
+import json
+import logging
+import math
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.spatial_index import KM_PER_DEG_LAT
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+
+# 환경부 토지피복 대분류 코드별 연료 계수 (시가화/수역 등은 거의 연소하지 않음)
+LANDCOVER_FUEL = {
+    100: 0.1,   # 시가화건조지역
+    200: 0.6,   # 농업지역
+    300: 1.0,   # 산림지역
+    400: 0.8,   # 초지
+    500: 0.2,   # 습지
+    600: 0.05,  # 나지
+    700: 0.0    # 수역
+}
+
+class RasterLayer:
+    """
+    타일 분할 래스터 레이어
+
+    디렉터리에 meta.json 과 "{타일 행}_{타일 열}.npy" 타일을 둡니다. 픽셀은 north/west 모서리에서 시작하는 면적 단위이며
+    값이 없는 타일 파일은 만들지 않습니다 (조회 시 NaN). 열린 타일은 최근 사용 순으로 max_open_tiles 개만 유지합니다.
+    """
+
+    def __init__(self, path: Path, max_open_tiles: Optional[int] = None):
+        self.path = Path(path)
+        with open(self.path / META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        self.name = meta.get("name", self.path.name)
+        self.north = float(meta["north"])
+        self.west = float(meta["west"])
+        self.res_lat = float(meta["res_lat"])
+        self.res_lng = float(meta["res_lng"])
+        self.rows = int(meta["rows"])
+        self.cols = int(meta["cols"])
+        self.tile_size = int(meta["tile_size"])
+        self.nodata = meta.get("nodata")
+        self.interpolation = meta.get("interpolation", "bilinear")
+        self.tile_cols = math.ceil(self.cols / self.tile_size)
+        self.max_open_tiles = max_open_tiles or settings.TERRAIN_MAX_OPEN_TILES
+        self._tiles: "OrderedDict[int, Optional[np.ndarray]]" = OrderedDict()
+
+    def _tile(self, tile_id: int) -> Optional[np.ndarray]:
+        """타일 메모리 매핑 (처음 조회할 때 열고, 없는 타일은 None)"""
+        if tile_id in self._tiles:
+            self._tiles.move_to_end(tile_id)
+            return self._tiles[tile_id]
+        tile_row, tile_col = divmod(tile_id, self.tile_cols)
+        path = self.path / f"{tile_row}_{tile_col}.npy"
+        tile = np.load(path, mmap_mode="r") if path.exists() else None
+        self._tiles[tile_id] = tile
+        while len(self._tiles) > self.max_open_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def gather(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """픽셀 (행, 열) 값 (범위 밖/값 없음/타일 없음은 NaN), 타일별로 묶어 한 번씩 읽음"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.full(rows.shape, np.nan)
+        inside = np.flatnonzero((rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols))
+        if not inside.size:
+            return values
+
+        rows, cols = rows[inside], cols[inside]
+        tile_ids = (rows // self.tile_size) * self.tile_cols + cols // self.tile_size
+        order = np.argsort(tile_ids, kind="stable")
+        bounds = np.flatnonzero(np.diff(tile_ids[order])) + 1
+        for group in np.split(order, bounds):
+            tile = self._tile(int(tile_ids[group[0]]))
+            if tile is None:
+                continue
+            tile_values = tile[rows[group] % self.tile_size, cols[group] % self.tile_size].astype(float)
+            if self.nodata is not None:
+                tile_values[tile_values == self.nodata] = np.nan
+            values[inside[group]] = tile_values
+        return values
+
+    def sample(self, lats: np.ndarray, lngs: np.ndarray, interpolation: Optional[str] = None) -> np.ndarray:
+        """
+        위경도 지점 값
+
+        bilinear 는 둘러싼 네 픽셀 중심의 가중 평균이며 값이 없는 픽셀은 빼고 가중치를 다시 나눕니다.
+        nearest 는 지점이 속한 픽셀 값입니다 (토지피복 등 범주형).
+        """
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        y = (self.north - lats) / self.res_lat
+        x = (lngs - self.west) / self.res_lng
+        if (interpolation or self.interpolation) == "nearest":
+            return self.gather(np.floor(y), np.floor(x))
+
+        # 픽셀 중심 기준 좌표
+        y -= 0.5
+        x -= 0.5
+        row0 = np.floor(y)
+        col0 = np.floor(x)
+        fy = y - row0
+        fx = x - col0
+        size = lats.size
+        corners = self.gather(
+            np.concatenate((row0, row0, row0 + 1, row0 + 1)).ravel(),
+            np.concatenate((col0, col0 + 1, col0, col0 + 1)).ravel()
+        ).reshape(4, size)
+        weights = np.stack((
+            (1 - fy) * (1 - fx),
+            (1 - fy) * fx,
+            fy * (1 - fx),
+            fy * fx
+        )).reshape(4, size)
+        missing = np.isnan(corners)
+        weights = np.where(missing, 0.0, weights)
+        total = weights.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = np.where(total > 0, (np.where(missing, 0.0, corners) * weights).sum(axis=0) / total, np.nan)
+        return values.reshape(lats.shape)
+
+    @property
+    def resolution_m(self) -> float:
+        return self.res_lat * KM_PER_DEG_LAT * 1000
+
+def write_layer(
+    root: Path,
+    name: str,
+    array: np.ndarray,
+    north: float,
+    west: float,
+    res_lat: float,
+    res_lng: float,
+    tile_size: int = 512,
+    nodata: Optional[float] = None,
+    interpolation: str = "bilinear"
+) -> Path:
+    """
+    래스터 배열을 타일 레이어로 저장 (값이 모두 nodata/NaN 인 타일은 생략)
+
+    Args:
+        root: 저장소 디렉터리
+        name: 레이어 이름 (elevation, fuel, landcover 등)
+        array: (행, 열) 배열, 0행이 북쪽
+        north, west: 북쪽/서쪽 모서리 위경도
+        res_lat, res_lng: 픽셀 크기 (도)
+        tile_size: 타일 한 변 픽셀 수
+        nodata: 값 없음 표시
+        interpolation: 조회 기본 방식 (bilinear/nearest)
+    """
+    path = Path(root) / name
+    path.mkdir(parents=True, exist_ok=True)
+    rows, cols = array.shape
+    written = 0
+    for tile_row in range(math.ceil(rows / tile_size)):
+        for tile_col in range(math.ceil(cols / tile_size)):
+            tile = array[
+                tile_row * tile_size:(tile_row + 1) * tile_size,
+                tile_col * tile_size:(tile_col + 1) * tile_size
+            ]
+            empty = np.isnan(tile) if np.issubdtype(tile.dtype, np.floating) else np.zeros(tile.shape, dtype=bool)
+            if nodata is not None:
+                empty |= tile == nodata
+            if empty.all():
+                continue
+            # 가장자리 타일도 같은 크기로 채워 색인 계산을 단순하게 유지
+            padded = np.full((tile_size, tile_size), np.nan if nodata is None else nodata, dtype=array.dtype)
+            padded[:tile.shape[0], :tile.shape[1]] = tile
+            np.save(path / f"{tile_row}_{tile_col}.npy", padded)
+            written += 1
+
+    meta = {
+        "name": name,
+        "north": north,
+        "west": west,
+        "res_lat": res_lat,
+        "res_lng": res_lng,
+        "rows": rows,
+        "cols": cols,
+        "tile_size": tile_size,
+        "dtype": str(array.dtype),
+        "nodata": nodata,
+        "interpolation": interpolation
+    }
+    with open(path / META_FILE, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    logger.info(f"🗺️ 래스터 레이어 저장 - {name}: {rows}x{cols}, 타일 {written}개")
+    return path
+
+class TerrainStore:
+    """
+    지형/연료 래스터 저장소
+
+    레이어는 처음 조회할 때 meta.json 만 읽어 열고, 타일은 해당 지점을 조회할 때 메모리 매핑합니다.
+    레이어가 없으면 조회 값은 모두 NaN 이므로 호출 측은 지형 정보 없이 동작합니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_open_tiles: Optional[int] = None):
+        self.root = Path(root or settings.TERRAIN_DATA_DIR)
+        self.max_open_tiles = max_open_tiles
+        self._layers: Dict[str, Optional[RasterLayer]] = {}
+
+    def layer(self, name: str) -> Optional[RasterLayer]:
+        if name not in self._layers:
+            path = self.root / name
+            self._layers[name] = RasterLayer(path, self.max_open_tiles) if (path / META_FILE).exists() else None
+        return self._layers[name]
+
+    def available(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(path.parent.name for path in self.root.glob(f"*/{META_FILE}"))
+
+    def sample(self, lats: np.ndarray, lngs: np.ndarray, name: str, interpolation: Optional[str] = None) -> np.ndarray:
+        """레이어 값 (레이어가 없으면 NaN)"""
+        layer = self.layer(name)
+        if layer is None:
+            return np.full(np.shape(lats), np.nan)
+        return layer.sample(lats, lngs, interpolation)
+
+    def fuel(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """연료 계수 (fuel 레이어, 없으면 토지피복 코드 환산, 둘 다 없으면 NaN)"""
+        if self.layer("fuel") is not None:
+            return self.sample(lats, lngs, "fuel")
+        codes = self.sample(lats, lngs, "landcover", "nearest")
+        fuel = np.full(codes.shape, np.nan)
+        # 세분류 코드(110, 310 등)는 대분류로 환산
+        major = np.where(np.isnan(codes), -1, codes // 100 * 100)
+        for code, factor in LANDCOVER_FUEL.items():
+            fuel[major == code] = factor
+        return fuel
+
+    def features(self, lats: np.ndarray, lngs: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        지점별 지형 특성
+
+        Returns:
+            {"elevation": m, "slope": 경사(도), "aspect": 사면 방향(내리막 방향, 도, 평지는 NaN), "fuel": 연료 계수}
+        """
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        features = {
+            "elevation": np.full(lats.shape, np.nan),
+            "slope": np.full(lats.shape, np.nan),
+            "aspect": np.full(lats.shape, np.nan),
+            "fuel": self.fuel(lats, lngs)
+        }
+        layer = self.layer("elevation")
+        if layer is None:
+            return features
+
+        # 픽셀 크기 간격의 중앙 차분 (다섯 지점을 한 번에 조회)
+        d_lat = layer.res_lat
+        d_lng = layer.res_lng
+        size = lats.size
+        values = layer.sample(
+            np.concatenate((lats.ravel(), lats.ravel() + d_lat, lats.ravel() - d_lat, lats.ravel(), lats.ravel())),
+            np.concatenate((lngs.ravel(), lngs.ravel(), lngs.ravel(), lngs.ravel() + d_lng, lngs.ravel() - d_lng))
+        ).reshape(5, size)
+        center, north, south, east, west = values
+        dy = 2 * d_lat * KM_PER_DEG_LAT * 1000
+        dx = 2 * d_lng * KM_PER_DEG_LAT * 1000 * np.cos(np.radians(lats.ravel()))
+        dz_north = (north - south) / dy
+        dz_east = (east - west) / dx
+        slope = np.degrees(np.arctan(np.hypot(dz_north, dz_east)))
+        aspect = np.where(slope > 0, np.degrees(np.arctan2(-dz_east, -dz_north)) % 360.0, np.nan)
+
+        features["elevation"] = center.reshape(lats.shape)
+        features["slope"] = slope.reshape(lats.shape)
+        features["aspect"] = aspect.reshape(lats.shape)
+        return features
+
+    def grid_rasters(self, lats: np.ndarray, lngs: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        격자 (행 위도 × 열 경도) 고도/연료 래스터
+
+        값이 없는 셀의 고도는 주변 평균으로, 연료는 기준 연료(1.0)로 채우며 레이어가 없으면 None 입니다.
+        """
+        lat_grid, lng_grid = np.meshgrid(np.asarray(lats, dtype=float), np.asarray(lngs, dtype=float), indexing="ij")
+        elevation = fuel = None
+        if self.layer("elevation") is not None:
+            elevation = self.sample(lat_grid, lng_grid, "elevation")
+            if np.isnan(elevation).all():
+                elevation = None
+            else:
+                elevation = np.where(np.isnan(elevation), np.nanmean(elevation), elevation).astype(np.float32)
+        if self.layer("fuel") is not None or self.layer("landcover") is not None:
+            fuel = self.fuel(lat_grid, lng_grid)
+            fuel = None if np.isnan(fuel).all() else np.where(np.isnan(fuel), 1.0, fuel).astype(np.float32)
+        return elevation, fuel
+
+# 전국 지형/연료 래스터 (설정 경로, 타일은 조회 시 메모리 매핑)
+terrain_store = TerrainStore()
@@ -0,0 +1,325 @@
+"""
+업스트림 대역 서버 모듈
+KT 기가아이즈, IoT 플랫폼, 기상청, 알림 채널 API를 로컬에서 기록/재생하고
+지연·오류·페이로드 크기를 주입하여 오프라인 부하/장애 테스트를 지원
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import ipaddress
+import random
+import socket
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from fastapi import FastAPI, Request, Response
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def default_upstreams() -> Dict[str, str]:
+    """
+    대역 서버 경로 접두사 → 실제 업스트림 주소 (기록 모드에서 전달 대상)
+    
+    서비스 쪽에서는 VISION_AI_ENDPOINT=http://localhost:8900/gigai 처럼 접두사를 붙여 지정합니다.
+    같은 .env 를 읽으면 이 값이 대역 서버 자신을 가리키므로, 기록 모드에서는 --upstream 으로 실제 주소를 지정합니다.
+    """
+    return {
+        "gigai": settings.VISION_AI_ENDPOINT,
+        "iot": settings.IOT_SENSOR_ENDPOINT,
+        "kma": settings.WEATHER_API_ENDPOINT,
+        "sms": settings.SMS_API_ENDPOINT,
+        "push": settings.PUSH_API_ENDPOINT,
+        "radio": settings.RADIO_API_ENDPOINT,
+        "cap": settings.CAP_SERVER_URL
+    }
+
+def parse_upstream(value: str) -> Tuple[str, str]:
+    """--upstream 인자 (접두사=주소) 해석"""
+    prefix, sep, url = value.partition("=")
+    prefix, url = prefix.strip().strip("/"), url.strip()
+    if not sep or not prefix or not url:
+        raise ValueError(f"업스트림은 접두사=주소 형식이어야 합니다: {value}")
+    if prefix not in default_upstreams():
+        raise ValueError(f"알 수 없는 업스트림 접두사: {prefix} (사용 가능: {', '.join(default_upstreams())})")
+    if urlparse(url).scheme not in ("http", "https"):
+        raise ValueError(f"업스트림 주소는 http(s) URL 이어야 합니다: {url}")
+    return prefix, url
+
+def _addresses(host: str) -> Set[str]:
+    """호스트가 가리키는 IP 주소 (해석 실패 시 빈 집합)"""
+    try:
+        return {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except (socket.gaierror, UnicodeError):
+        return set()
+
+def self_upstreams(upstreams: Dict[str, str], host: str, port: int) -> List[str]:
+    """
+    대역 서버 자신(host:port)을 가리키는 업스트림 접두사 목록
+
+    대역 서버가 모든 주소(0.0.0.0, ::)에서 수신하면 루프백과 이 장비의 주소를 모두 자신으로 봅니다.
+    """
+    local = _addresses(host)
+    wildcard = not host or any(ipaddress.ip_address(address.split("%")[0]).is_unspecified for address in local)
+    if wildcard:
+        local |= _addresses(socket.gethostname()) | _addresses("localhost")
+
+    looped = []
+    for prefix, url in upstreams.items():
+        parsed = urlparse(url)
+        if not parsed.hostname or (parsed.port or (443 if parsed.scheme == "https" else 80)) != port:
+            continue
+        targets = _addresses(parsed.hostname)
+        if targets & local or (wildcard and any(ipaddress.ip_address(a.split("%")[0]).is_loopback for a in targets)):
+            looped.append(prefix)
+    return looped
+
+# 응답 재현성을 해치는 인증/시각 파라미터는 픽스처 키에서 제외
+IGNORED_PARAMS = {"api_key", "serviceKey", "base_date", "base_time"}
+
+class StandinConfig:
+    """대역 서버 설정"""
+
+    def __init__(
+        self,
+        mode: str = "replay",
+        fixtures_dir: str = "fixtures/upstream",
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        payload_bytes: int = 0,
+        items_per_response: int = 5,
+        seed: int = 0,
+        upstreams: Optional[Dict[str, str]] = None,
+        listen: Optional[Tuple[str, int]] = None
+    ):
+        """
+        Args:
+            upstreams: 기록 모드 전달 대상 (지정한 접두사만 default_upstreams 를 덮어씀)
+            listen: 대역 서버 수신 (호스트, 포트) - 기록 모드에서 자신을 가리키는 업스트림을 거부하는 데 사용
+        """
+        if mode not in ("record", "replay", "synthetic"):
+            raise ValueError(f"지원하지 않는 모드: {mode}")
+        self.mode = mode
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.payload_bytes = payload_bytes
+        self.items_per_response = items_per_response
+        self.seed = seed
+        self.upstreams = {**default_upstreams(), **(upstreams or {})}
+        if mode == "record" and listen is not None:
+            looped = self_upstreams(self.upstreams, *listen)
+            if looped:
+                raise ValueError(
+                    f"기록 대상이 대역 서버 자신({listen[0]}:{listen[1]})을 가리킵니다: {', '.join(looped)} "
+                    f"- --upstream 접두사=실제주소 로 지정하세요"
+                )
+
+class FixtureStore:
+    """요청 단위 응답 픽스처 저장소"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def key(self, method: str, path: str, params: Dict[str, str], body: bytes) -> str:
+        normalized = sorted((k, v) for k, v in params.items() if k not in IGNORED_PARAMS)
+        digest = hashlib.sha1()
+        digest.update(f"{method} {path}".encode())
+        digest.update(json.dumps(normalized, ensure_ascii=False).encode())
+        digest.update(body)
+        return digest.hexdigest()[:16]
+
+    def _path(self, upstream: str, key: str) -> Path:
+        return self.root / upstream / f"{key}.json"
+
+    def load(self, upstream: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(upstream, key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def save(self, upstream: str, key: str, fixture: Dict[str, Any]):
+        path = self._path(upstream, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(fixture, ensure_ascii=False), encoding="utf-8")
+
+class SyntheticResponder:
+    """픽스처가 없을 때 사용할 합성 응답 생성기"""
+
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        # 요청 파라미터 → 관측값 목록을 돌려주는 외부 공급자 (합성 센서망 등)
+        self.providers: Dict[str, Callable[[str, Dict[str, str]], List[Dict[str, Any]]]] = {}
+
+    def _rng(self, path: str, params: Dict[str, str]) -> random.Random:
+        seed_key = f"{self.config.seed}:{path}:{params.get('lat')}:{params.get('lng')}"
+        return random.Random(hashlib.sha1(seed_key.encode()).hexdigest())
+
+    def _image_data(self, rng: random.Random) -> Optional[str]:
+        if self.config.payload_bytes <= 0:
+            return None
+        return base64.b64encode(rng.randbytes(self.config.payload_bytes)).decode()
+
+    def respond(self, upstream: str, path: str, params: Dict[str, str]) -> Response:
+        provider = self.providers.get(f"{upstream}/{path}")
+        if provider is not None:
+            return Response(
+                json.dumps({"data": provider(path, params)}, ensure_ascii=False),
+                media_type="application/json"
+            )
+
+        rng = self._rng(path, params)
+        lat = float(params.get("lat", 37.5665))
+        lng = float(params.get("lng", 127.978))
+
+        if path.endswith("/nearby") and upstream == "gigai":
+            kind = path.split("/")[0]
+            data = [
+                {
+                    "id": f"{kind}{i:03d}",
+                    "lat": lat + rng.uniform(-0.02, 0.02),
+                    "lng": lng + rng.uniform(-0.02, 0.02),
+                    "name": f"{kind}-{i:03d}",
+                    "image_url": None,
+                    "image_data": self._image_data(rng)
+                }
+                for i in range(self.config.items_per_response)
+            ]
+            return Response(json.dumps({"data": data}), media_type="application/json")
+
+        if path.endswith("/nearby") and upstream == "iot":
+            kinds = ["temperature", "humidity", "smoke_density", "wind_speed"]
+            data = [
+                {
+                    "id": f"s{i:04d}",
+                    "type": kinds[i % len(kinds)],
+                    "lat": lat + rng.uniform(-0.02, 0.02),
+                    "lng": lng + rng.uniform(-0.02, 0.02),
+                    "temperature": round(rng.uniform(15, 30), 1),
+                    "humidity": round(rng.uniform(20, 70), 1),
+                    "smoke_density": round(rng.uniform(0, 10), 2),
+                    "wind_speed": round(rng.uniform(0, 8), 1),
+                    "wind_direction": round(rng.uniform(0, 360), 0),
+                    "data_quality": 0.9
+                }
+                for i in range(self.config.items_per_response)
+            ]
+            return Response(json.dumps({"data": data}), media_type="application/json")
+
+        if upstream == "kma":
+            return Response(self._kma_xml(rng), media_type="application/xml")
+
+        if upstream == "cap":
+            return Response(json.dumps({"cap_id": str(uuid.UUID(int=rng.getrandbits(128)))}), media_type="application/json")
+
+        return Response(json.dumps({"message_id": str(uuid.UUID(int=rng.getrandbits(128)))}), media_type="application/json")
+
+    def _kma_xml(self, rng: random.Random) -> str:
+        fcst_time = f"{datetime.now().hour:02d}00"
+        values = {
+            "T1H": round(rng.uniform(10, 30), 1),
+            "REH": round(rng.uniform(20, 80)),
+            "WSD": round(rng.uniform(0, 12), 1),
+            "VEC": round(rng.uniform(0, 360)),
+            "PTY": 0
+        }
+        items = "".join(
+            f"<item><category>{category}</category><fcstTime>{fcst_time}</fcstTime>"
+            f"<fcstValue>{value}</fcstValue></item>"
+            for category, value in values.items()
+        )
+        return (
+            "<response><header><resultCode>00</resultCode><resultMsg>NORMAL_SERVICE</resultMsg></header>"
+            f"<body><items>{items}</items></body></response>"
+        )
+
+def create_standin_app(config: StandinConfig) -> FastAPI:
+    """업스트림 대역 서버 앱 생성"""
+    app = FastAPI(title="업스트림 대역 서버", docs_url=None, redoc_url=None)
+    fixtures = FixtureStore(config.fixtures_dir)
+    synthetic = SyntheticResponder(config)
+    rng = random.Random(config.seed)
+    app.state.config = config
+    app.state.synthetic = synthetic
+
+    async def inject_faults() -> Optional[Response]:
+        delay_ms = config.latency_ms
+        if config.latency_jitter_ms > 0:
+            # 지수분포 꼬리로 tail latency 재현
+            delay_ms += rng.expovariate(1.0 / config.latency_jitter_ms)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if config.error_rate > 0 and rng.random() < config.error_rate:
+            headers = {"Retry-After": "1"} if config.error_status == 429 else {}
+            return Response(status_code=config.error_status, headers=headers)
+        return None
+
+    async def record(upstream: str, path: str, request: Request, body: bytes, key: str) -> Response:
+        base_url = config.upstreams[upstream].rstrip("/")
+        url = f"{base_url}/{path}" if path else base_url
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in ("host", "content-length")}
+
+        async with httpx.AsyncClient() as client:
+            upstream_response = await client.request(
+                request.method, url,
+                params=dict(request.query_params),
+                content=body,
+                headers=headers,
+                timeout=30.0
+            )
+
+        fixture = {
+            "status": upstream_response.status_code,
+            "media_type": upstream_response.headers.get("content-type", "application/json"),
+            "body": upstream_response.text
+        }
+        if upstream_response.status_code < 500:
+            fixtures.save(upstream, key, fixture)
+        return Response(fixture["body"], status_code=fixture["status"], media_type=fixture["media_type"])
+
+    @app.get("/_standin/health")
+    async def health():
+        return {"status": "healthy", "mode": config.mode}
+
+    @app.api_route("/{upstream}", methods=["GET", "POST"])
+    @app.api_route("/{upstream}/{path:path}", methods=["GET", "POST"])
+    async def handle(upstream: str, request: Request, path: str = ""):
+        if upstream not in config.upstreams:
+            return Response(status_code=404)
+
+        fault = await inject_faults()
+        if fault is not None:
+            return fault
+
+        params = dict(request.query_params)
+        body = await request.body()
+        key = fixtures.key(request.method, f"{upstream}/{path}", params, body)
+
+        if config.mode == "record":
+            try:
+                return await record(upstream, path, request, body, key)
+            except Exception as e:
+                logger.error(f"업스트림 기록 실패 ({upstream}/{path}): {str(e)}")
+                return Response(status_code=502)
+
+        if config.mode == "replay":
+            fixture = fixtures.load(upstream, key)
+            if fixture is not None:
+                return Response(fixture["body"], status_code=fixture["status"], media_type=fixture["media_type"])
+
+        return synthetic.respond(upstream, path, params)
+
+    return app
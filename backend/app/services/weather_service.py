@@ -6,11 +6,14 @@
 import asyncio
 import logging
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import xml.etree.ElementTree as ET
 
 from app.core.config import settings
+from app.services.rate_limiter import CallPriority, rate_limiter
+from app.services.circuit_breaker import CircuitOpenError, upstream_guard
+from app.services.last_known_good import last_known_good_store
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +27,8 @@ class WeatherService:
     async def get_current_weather(
         self, 
         lat: float, 
-        lng: float
+        lng: float,
+        priority: CallPriority = CallPriority.NORMAL
     ) -> Optional[Dict[str, Any]]:
         """
         현재 날씨 정보 조회
@@ -32,6 +36,7 @@ class WeatherService:
         Args:
             lat: 위도
             lng: 경도
+            priority: 기상청 API 호출 우선순위
             
         Returns:
             날씨 정보 딕셔너리
@@ -40,31 +45,50 @@ class WeatherService:
             # 기상청 격자 좌표로 변환
             grid_coords = self._convert_to_grid_coordinates(lat, lng)
             
-            # 현재 시간 기준으로 조회
-            now = datetime.now()
-            base_date = now.strftime("%Y%m%d")
-            base_time = self._get_base_time(now)
-            
-            # 기상청 API 호출
-            weather_data = await self._call_weather_api(
-                grid_coords["nx"], 
-                grid_coords["ny"], 
-                base_date, 
-                base_time
+            # 격자별 최근 정상값 캐시 경유 (기상청 장애 시 마지막 정상값 사용)
+            current_weather, staleness = await last_known_good_store.get(
+                "weather",
+                (grid_coords["nx"], grid_coords["ny"]),
+                lambda: self._fetch_current_weather(grid_coords, priority),
+                fresh_seconds=settings.WEATHER_CACHE_FRESH_SECONDS
             )
             
-            if weather_data:
-                # 현재 날씨 정보 추출
-                current_weather = self._extract_current_weather(weather_data)
-                logger.info(f"🌤️ 날씨 데이터 수집 완료 - 위치: ({lat}, {lng})")
-                return current_weather
+            if current_weather is None:
+                return None
             
-            return None
+            logger.info(f"🌤️ 날씨 데이터 수집 완료 - 위치: ({lat}, {lng}), 경과: {staleness:.0f}초")
+            return {**current_weather, "staleness_seconds": staleness}
             
         except Exception as e:
             logger.error(f"❌ 날씨 데이터 수집 실패: {str(e)}")
             return None
     
+    async def _fetch_current_weather(
+        self, 
+        grid_coords: Dict[str, int],
+        priority: CallPriority = CallPriority.NORMAL
+    ) -> Optional[Dict[str, Any]]:
+        """기상청 API에서 현재 날씨 조회 (실패 시 None)"""
+        # 현재 시간 기준으로 조회
+        now = datetime.now()
+        base_date = now.strftime("%Y%m%d")
+        base_time = self._get_base_time(now)
+        
+        # 기상청 API 호출
+        weather_data = await self._call_weather_api(
+            grid_coords["nx"], 
+            grid_coords["ny"], 
+            base_date, 
+            base_time,
+            priority
+        )
+        
+        if not weather_data:
+            return None
+        
+        # 현재 날씨 정보 추출
+        return self._extract_current_weather(weather_data) or None
+    
     async def get_weather_forecast(
         self, 
         lat: float, 
@@ -111,6 +135,11 @@ class WeatherService:
             logger.error(f"❌ 날씨 예보 수집 실패: {str(e)}")
             return None
     
+    def grid_cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        """위경도가 속한 기상청 격자 (같은 격자의 지점은 날씨 조회 결과를 공유)"""
+        grid_coords = self._convert_to_grid_coordinates(lat, lng)
+        return grid_coords["nx"], grid_coords["ny"]
+    
     def _convert_to_grid_coordinates(self, lat: float, lng: float) -> Dict[str, int]:
         """위경도를 기상청 격자 좌표로 변환"""
         try:
@@ -186,26 +215,36 @@ class WeatherService:
         nx: int, 
         ny: int, 
         base_date: str, 
-        base_time: str
+        base_time: str,
+        priority: CallPriority = CallPriority.NORMAL
     ) -> Optional[Dict[str, Any]]:
         """기상청 API 호출"""
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_endpoint}/getVilageFcst",
-                    params={
-                        "serviceKey": self.api_key,
-                        "numOfRows": 1000,
-                        "pageNo": 1,
-                        "dataType": "XML",
-                        "base_date": base_date,
-                        "base_time": base_time,
-                        "nx": nx,
-                        "ny": ny
-                    },
-                    timeout=30.0
+                await rate_limiter.acquire("weather", priority)
+                response = await upstream_guard.call(
+                    "weather",
+                    lambda: client.get(
+                        f"{self.api_endpoint}/getVilageFcst",
+                        params={
+                            "serviceKey": self.api_key,
+                            "numOfRows": 1000,
+                            "pageNo": 1,
+                            "dataType": "XML",
+                            "base_date": base_date,
+                            "base_time": base_time,
+                            "nx": nx,
+                            "ny": ny
+                        },
+                        timeout=settings.UPSTREAM_TIMEOUT_SECONDS
+                    )
                 )
                 
+                if response.status_code == 429:
+                    await rate_limiter.report_quota_exceeded(
+                        "weather", response.headers.get("Retry-After")
+                    )
+                
                 if response.status_code == 200:
                     # XML 파싱
                     root = ET.fromstring(response.text)
@@ -234,6 +273,12 @@ class WeatherService:
                     logger.error(f"기상청 API 호출 실패: {response.status_code}")
                     return None
                     
+        except CircuitOpenError as e:
+            logger.warning(f"기상청 API 호출 생략: {str(e)}")
+            return None
+        except asyncio.TimeoutError:
+            logger.error(f"기상청 API 응답 시간 초과 ({settings.UPSTREAM_TIMEOUT_SECONDS}초)")
+            return None
         except Exception as e:
             logger.error(f"기상청 API 호출 중 오류: {str(e)}")
             return None
@@ -266,10 +311,10 @@ class WeatherService:
                     wind_speed = float(value)
                     break
             
-            # 풍향 (WAV)
+            # 풍향 (VEC)
             wind_direction = None
             for key, value in weather_data.items():
-                if key.startswith("WAV_") and key.endswith(target_time):
+                if key.startswith("VEC_") and key.endswith(target_time):
                     wind_direction = float(value)
                     break
             
@@ -336,7 +381,7 @@ class WeatherService:
                     "temperature": float(data.get("T1H", 0)),
                     "humidity": float(data.get("REH", 0)),
                     "wind_speed": float(data.get("WSD", 0)),
-                    "wind_direction": float(data.get("WAV", 0)),
+                    "wind_direction": float(data.get("VEC", 0)),
                     "air_pressure": float(data.get("PTY", 0)),
                     "precipitation_type": int(data.get("PTY", 0))
                 }
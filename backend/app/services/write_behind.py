@@ -0,0 +1,300 @@
+"""
+센서 데이터 지연 쓰기 버퍼 모듈
+수집된 센서 데이터를 제한된 크기의 대기열에 모아 다중 행 INSERT로 일괄 저장
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, StatementError
+
+from app.core.config import settings
+from app.core.metrics import (
+    WRITE_BEHIND_DROPPED_ROWS_TOTAL,
+    WRITE_BEHIND_FLUSH_ERRORS_TOTAL,
+    WRITE_BEHIND_FLUSH_SECONDS,
+    WRITE_BEHIND_QUEUE_DEPTH,
+    WRITE_BEHIND_ROWS_TOTAL,
+    WRITE_BEHIND_UNCHANGED_SKIPPED_TOTAL
+)
+from app.models.sensor_data import SensorData, SensorDataCreate
+from app.models.sensor_reading import SensorReading
+from app.services.collection_cursors import ChangeFilter
+
+logger = logging.getLogger(__name__)
+
+# 저장 작업 종료 신호
+_STOP = object()
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    다시 시도해도 성공하지 않을 저장 오류인지 여부
+
+    제약 조건 위반(IntegrityError)과 값 오류(DataError), 데이터베이스에 닿기 전의 파라미터 변환 오류는 영구 오류로,
+    연결 끊김(OperationalError, connection_invalidated 등) 그 밖의 오류는 일시 오류로 봅니다.
+    """
+    if isinstance(error, DBAPIError):
+        return isinstance(error, (IntegrityError, DataError)) and not error.connection_invalidated
+    return isinstance(error, StatementError)
+
+class WriteBehindBuffer:
+    """
+    sensor_data 지연 쓰기 버퍼
+
+    batch_size 개가 모이거나 flush_interval_seconds 가 지나면 전용 연결로 한 번에 저장합니다.
+    데이터베이스가 느려져 대기열이 가득 차면 put() 이 대기하므로 수집 속도가 저장 속도에 맞춰집니다.
+    연결 오류 같은 일시 오류는 배치를 보관한 채 재시도하고, 제약 조건 위반 같은 영구 오류가 나면
+    행 단위로 다시 저장해 실패한 행만 버립니다.
+    skip_unchanged 이면 직전에 저장한 값과 같은 센서 데이터는 저장하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        skip_unchanged: Optional[bool] = None,
+        stop_timeout_seconds: Optional[float] = None
+    ):
+        if engine is None:
+            from app.core.database import engine
+        self.engine = engine
+        self.max_queue_size = max_queue_size or settings.WRITE_BEHIND_MAX_QUEUE
+        self.batch_size = batch_size or settings.WRITE_BEHIND_BATCH_SIZE
+        self.flush_interval_seconds = (
+            flush_interval_seconds if flush_interval_seconds is not None
+            else settings.WRITE_BEHIND_FLUSH_INTERVAL_SECONDS
+        )
+        if skip_unchanged is None:
+            skip_unchanged = settings.WRITE_BEHIND_SKIP_UNCHANGED
+        self.change_filter = ChangeFilter() if skip_unchanged else None
+        self.stop_timeout_seconds = (
+            stop_timeout_seconds if stop_timeout_seconds is not None
+            else settings.WRITE_BEHIND_STOP_TIMEOUT_SECONDS
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[Connection] = None
+        # 저장 중인 배치의 남은 행 수 (중지 시간 초과 때 유실 집계용)
+        self._inflight = 0
+        # 연결을 사용 중인 스레드 작업 (함수, 결과) - 취소되어도 스레드는 계속 실행되므로 연결을 닫기 전에 대기
+        self._thread_call: Optional[Tuple[Callable, asyncio.Future]] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        return self._queue
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    async def put(self, reading: Union[SensorDataCreate, SensorReading]):
+        """센서 데이터 적재 (대기열이 가득 차면 빈 자리가 생길 때까지 대기)"""
+        if self.change_filter is not None and not self.change_filter.is_changed(reading):
+            WRITE_BEHIND_UNCHANGED_SKIPPED_TOTAL.inc()
+            return
+        await self.queue.put(reading)
+        WRITE_BEHIND_QUEUE_DEPTH.set(self.queue.qsize())
+
+    def start(self):
+        """저장 작업 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"💾 지연 쓰기 시작 - 배치: {self.batch_size}개, 간격: {self.flush_interval_seconds}초"
+            )
+
+    async def stop(self):
+        """
+        저장 작업 중지 (대기 중인 데이터는 stop_timeout_seconds 안에서 모두 저장)
+
+        데이터베이스 장애로 시간 안에 저장하지 못하면 저장 작업을 취소하고 유실된 행 수를 기록합니다.
+        이미 실행 중인 저장 스레드는 취소되지 않으므로 같은 시간 제한으로 끝나기를 기다린 뒤 연결을 닫고,
+        끝까지 저장된 행은 유실로 세지 않습니다.
+        """
+        connection_busy = False
+        try:
+            await asyncio.wait_for(self._shutdown(), timeout=self.stop_timeout_seconds)
+        except asyncio.TimeoutError:
+            if self._task is not None and not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            saved, connection_busy = await self._wait_thread_call()
+            lost = self._inflight - saved + sum(1 for item in self._drain(self.queue.qsize()) if item is not _STOP)
+            self._inflight = 0
+            WRITE_BEHIND_DROPPED_ROWS_TOTAL.labels("shutdown").inc(lost)
+            WRITE_BEHIND_QUEUE_DEPTH.set(0)
+            logger.error(
+                f"지연 쓰기 중지 시간 초과 ({self.stop_timeout_seconds}초) - 센서 데이터 {lost}개를 저장하지 못함"
+            )
+        self._task = None
+        self._thread_call = None
+
+        if connection_busy:
+            # 다른 스레드가 아직 사용 중인 연결은 닫지 않음 (연결은 스레드 간에 안전하지 않음)
+            logger.error("지연 쓰기 저장 스레드가 끝나지 않아 전용 연결을 닫지 않음")
+            self._connection = None
+        elif self._connection is not None:
+            await asyncio.to_thread(self._connection.close)
+            self._connection = None
+
+    async def _wait_thread_call(self) -> Tuple[int, bool]:
+        """
+        취소된 저장 작업이 남긴 스레드를 stop_timeout_seconds 까지 대기
+
+        Returns:
+            (그 스레드가 끝까지 저장한 행 수, 시간 안에 끝나지 않아 연결이 아직 사용 중인지 여부)
+        """
+        if self._thread_call is None:
+            return 0, False
+        func, call = self._thread_call
+        try:
+            result = await asyncio.wait_for(asyncio.shield(call), timeout=self.stop_timeout_seconds)
+        except asyncio.TimeoutError:
+            return 0, True
+        except Exception:
+            return 0, False
+
+        if func == self._insert:
+            saved = self._inflight
+            # 작업이 취소된 뒤 끝난 일괄 저장이므로 여기서 집계 (행 단위 저장은 스레드 안에서 집계)
+            WRITE_BEHIND_ROWS_TOTAL.inc(saved)
+        elif func == self._insert_each:
+            saved = self._inflight - len(result[0])
+        else:
+            saved = 0
+        return saved, False
+
+    async def _in_thread(self, func: Callable, *args):
+        """연결을 사용하는 작업을 스레드에서 실행 (작업이 취소되어도 stop 이 끝날 때까지 추적)"""
+        call = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        self._thread_call = (func, call)
+        return await asyncio.shield(call)
+
+    async def _shutdown(self):
+        # 대기열이 가득 차 있으면 저장 작업이 자리를 비울 때까지 종료 신호를 기다림 (stop 의 시간 제한 안에서)
+        if self._task is not None and not self._task.done():
+            try:
+                self.queue.put_nowait(_STOP)
+            except asyncio.QueueFull:
+                await self.queue.put(_STOP)
+            await self._task
+
+        while self.queue.qsize():
+            await self._flush([item for item in self._drain(self.batch_size) if item is not _STOP])
+
+    def _drain(self, limit: int) -> List[SensorDataCreate]:
+        batch = []
+        while len(batch) < limit and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            # 첫 항목이 들어온 시점부터 flush_interval_seconds 동안 batch_size 까지 모음
+            batch = []
+            item = await self.queue.get()
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[SensorDataCreate]):
+        if not batch:
+            return
+
+        rows = [self._to_row(reading) for reading in batch]
+        backoff = 0.5
+        while rows:
+            self._inflight = len(rows)
+            started = time.monotonic()
+            try:
+                await self._in_thread(self._insert, rows)
+                WRITE_BEHIND_FLUSH_SECONDS.observe(time.monotonic() - started)
+                WRITE_BEHIND_ROWS_TOTAL.inc(len(rows))
+                break
+            except Exception as e:
+                WRITE_BEHIND_FLUSH_ERRORS_TOTAL.inc()
+                if not is_permanent_error(e):
+                    error = e
+                else:
+                    # 저장할 수 없는 행이 섞여 있으면 행 단위로 저장해 그 행만 버림
+                    logger.warning(f"센서 데이터 일괄 저장 거부 ({len(rows)}개), 행 단위로 다시 저장: {str(e)}")
+                    rows, error = await self._in_thread(self._insert_each, rows)
+                    if not rows:
+                        break
+
+            # 일시 오류는 저장될 때까지 남은 행을 보관 (그동안 대기열이 차면 수집 쪽이 대기)
+            logger.error(f"센서 데이터 일괄 저장 실패 ({len(rows)}개), {backoff}초 후 재시도: {str(error)}")
+            await self._in_thread(self._reset_connection)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+        # 중지 시간 초과로 취소되면 남은 행 수를 유지해 유실로 집계
+        self._inflight = 0
+
+        WRITE_BEHIND_QUEUE_DEPTH.set(self.queue.qsize())
+
+    @staticmethod
+    def _to_row(reading: Union[SensorDataCreate, SensorReading]) -> Dict[str, Any]:
+        if not isinstance(reading, BaseModel):
+            return reading.to_row()
+        row = reading.model_dump()
+        row["sensor_type"] = reading.sensor_type.value
+        return row
+
+    def _insert(self, rows: List[Dict[str, Any]]):
+        # 요청 처리용 세션 풀과 경쟁하지 않도록 전용 연결을 유지
+        if self._connection is None:
+            self._connection = self.engine.connect()
+        with self._connection.begin():
+            self._connection.execute(insert(SensorData.__table__), rows)
+
+    def _insert_each(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+        """
+        행 단위 저장 (영구 오류가 난 행은 버림)
+
+        일시 오류가 나면 멈추고 그 행부터 남은 행과 오류를 반환합니다.
+        """
+        for i, row in enumerate(rows):
+            try:
+                self._insert([row])
+                WRITE_BEHIND_ROWS_TOTAL.inc()
+            except Exception as e:
+                if not is_permanent_error(e):
+                    return rows[i:], e
+                WRITE_BEHIND_DROPPED_ROWS_TOTAL.labels("rejected").inc()
+                logger.error(f"저장할 수 없는 센서 데이터 버림 ({row.get('sensor_id')}): {str(e)}")
+        return [], None
+
+    def _reset_connection(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+# 전역 지연 쓰기 버퍼 인스턴스
+write_behind_buffer = WriteBehindBuffer()
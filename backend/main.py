@@ -13,6 +13,12 @@ from app.core.config import settings
 from app.core.database import init_db
 from app.api.v1.api import api_router
 from app.core.logging import setup_logging
+from app.services.write_behind import write_behind_buffer
+from app.services.collection_scheduler import CollectionScheduler
+from app.services.mqtt_ingest import MqttIngestService
+from app.services.spread_ensemble import spread_ensemble
+from app.services.historical_index import historical_index
+from app.services.risk_tiles import risk_tile_cache
 
 # 로깅 설정
 setup_logging()
@@ -25,10 +31,45 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 산불 대응 AI Agent 시스템 시작")
     await init_db()
     logger.info("✅ 데이터베이스 초기화 완료")
+    if historical_index.path is not None and not historical_index.path.exists():
+        logger.warning(
+            f"⚠️ 과거 화재 지수 파일 없음 ({historical_index.path}) - 화재 기록이 쌓이기 전까지 계절/시간대 기본 위험도 사용 "
+            f"(scripts/build_historical_index.py 로 생성)"
+        )
+    
+    scheduler = None
+    if settings.COLLECTION_SCHEDULER_ENABLED:
+        scheduler = CollectionScheduler()
+        # 수집 결과를 진행 중인 산불 건의 확산 앙상블에 반영
+        scheduler.subscribe(spread_ensemble.observe_region)
+        # 새 화재 탐지를 과거 화재 지수에 누적
+        scheduler.subscribe(historical_index.observe_region)
+        # 지역 위험도가 바뀐 타일만 다시 그림
+        risk_tile_cache.add_regions(scheduler.registry)
+        scheduler.subscribe(risk_tile_cache.observe_region)
+        scheduler.start()
+    
+    mqtt_ingest = None
+    if settings.MQTT_ENABLED:
+        mqtt_ingest = MqttIngestService()
+        if scheduler is not None:
+            mqtt_ingest.subscribe(scheduler.ingest)
+        mqtt_ingest.subscribe(spread_ensemble.ingest)
+        mqtt_ingest.subscribe(historical_index.ingest)
+        await mqtt_ingest.start()
     
     yield
     
     # 종료 시
+    if mqtt_ingest is not None:
+        await mqtt_ingest.stop()
+    if scheduler is not None:
+        await scheduler.stop()
+    await risk_tile_cache.stop()
+    await write_behind_buffer.stop()
+    spread_ensemble.shutdown()
+    if historical_index.dirty:
+        historical_index.save()
     logger.info("🛑 산불 대응 AI Agent 시스템 종료")
 
 # FastAPI 앱 생성
@@ -59,6 +100,11 @@ app.add_middleware(
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
+# Prometheus 메트릭 엔드포인트
+if settings.PROMETHEUS_ENABLED:
+    from prometheus_client import make_asgi_app
+    app.mount("/metrics", make_asgi_app())
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+위험도 집계 벤치마크
+
+센서 데이터 N건에 대해 위험도 분석 + 권고안 분석이 쓰는 집계값을
+(1) 객체 목록을 항목별로 여러 번 훑는 기존 방식과 (2) 열 단위 변환 후 한 번에 집계하는 방식으로 비교합니다.
+
+사용 예)
+    python scripts/bench_risk_engine.py --sizes 1000 100000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.models.sensor_data import SensorType
+from app.models.sensor_reading import SensorReading
+from app.services.sensor_columns import SensorColumns
+
+IOT_TYPES = [SensorType.TEMPERATURE, SensorType.HUMIDITY, SensorType.SMOKE_DENSITY, SensorType.WIND_SPEED]
+
+def make_readings(count: int, seed: int = 0):
+    """측정값 생성 (값 일부 누락, 1% 화재 탐지)"""
+    rng = np.random.default_rng(seed)
+    temperature = rng.normal(22, 6, count).tolist()
+    humidity = rng.uniform(10, 90, count).tolist()
+    smoke = rng.exponential(5, count).tolist()
+    wind_speed = rng.uniform(0, 15, count).tolist()
+    wind_direction = rng.uniform(0, 360, count).tolist()
+    fire = (rng.random(count) < 0.01).tolist()
+    missing = rng.random((count, 4)) < 0.3
+
+    readings = []
+    for i in range(count):
+        m = missing[i]
+        readings.append(SensorReading(
+            f"iot_{i}",
+            IOT_TYPES[i % 4],
+            37.5,
+            127.9,
+            temperature=None if m[0] else temperature[i],
+            humidity=None if m[1] else humidity[i],
+            smoke_density=None if m[2] else smoke[i],
+            wind_speed=wind_speed[i],
+            wind_direction=None if m[3] else wind_direction[i],
+            fire_detected=fire[i],
+            fire_confidence=0.8 if fire[i] else None,
+            data_quality=0.9
+        ))
+    return readings
+
+def legacy_aggregates(sensor_data):
+    """기존 방식 (RiskAnalysisService + AIService 의 항목별 반복)"""
+    result = {}
+    # 화재 탐지
+    fire = [s for s in sensor_data if s.fire_detected]
+    if fire:
+        confidences = [s.fire_confidence or 0 for s in fire]
+        result["fire"] = (max(confidences), sum(confidences) / len(confidences))
+    # 환경 조건 (요약에서 한 번 더 계산)
+    for name in ("temperature", "humidity", "smoke_density", "visibility"):
+        data = [s for s in sensor_data if getattr(s, name) is not None]
+        if data:
+            result[name] = (
+                sum(getattr(s, name) for s in data) / len(data),
+                max(getattr(s, name) for s in data),
+                min(getattr(s, name) for s in data),
+                sum(getattr(s, name) for s in data) / len(data)
+            )
+    # 확산 예측
+    wind = [s for s in sensor_data if s.wind_speed is not None and s.wind_direction is not None]
+    if wind:
+        result["wind"] = (
+            sum(s.wind_speed for s in wind) / len(wind),
+            sum(s.wind_direction for s in wind) / len(wind)
+        )
+    # 분석 신뢰도
+    quality = [s.data_quality or 0.5 for s in sensor_data]
+    result["quality"] = (sum(quality) / len(quality), len(set(s.sensor_type for s in sensor_data)))
+    # 권고안 분석 (같은 항목 다시 반복)
+    for name in ("temperature", "humidity", "smoke_density", "wind_speed"):
+        data = [d for d in sensor_data if getattr(d, name) is not None]
+        if data:
+            result["ai_" + name] = (
+                sum(getattr(d, name) for d in data) / len(data),
+                max(getattr(d, name) for d in data),
+                min(getattr(d, name) for d in data)
+            )
+    return result
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="위험도 집계 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'측정값 수':>10}{'기존(초)':>12}{'열 변환(초)':>14}{'집계(초)':>12}{'합계 대비':>10}")
+    for size in args.sizes:
+        readings = make_readings(size)
+        _, legacy = timed(legacy_aggregates, readings)
+        columns, convert = timed(SensorColumns.from_readings, readings)
+        _, aggregate = timed(lambda: columns.stats)
+        print(
+            f"{size:>10,}{legacy:>12.4f}{convert:>14.4f}{aggregate:>12.4f}"
+            f"{legacy / (convert + aggregate):>9.1f}x"
+        )
+
+if __name__ == "__main__":
+    main()
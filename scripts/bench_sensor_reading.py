@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+센서 측정값 표현 비교 벤치마크
+
+같은 측정값 N건을 SensorDataCreate(검증), SensorDataCreate.model_construct, SensorData(ORM),
+SensorReading 으로 만들 때의 생성 시간, 보관 메모리, 위험도 분석 시간을 비교합니다.
+
+사용 예)
+    python scripts/bench_sensor_reading.py --count 100000
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from unittest.mock import AsyncMock
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.models.sensor_data import SensorData, SensorDataCreate, SensorType
+from app.models.sensor_reading import SensorReading
+from app.services.risk_analysis_service import RiskAnalysisService
+
+def make_fields(count: int):
+    """측정값 필드 (IoT 센서 형태)"""
+    return [
+        {
+            "sensor_id": f"iot_{i:06d}",
+            "sensor_type": SensorType.TEMPERATURE,
+            "location_lat": 37.5 + (i % 1000) * 1e-4,
+            "location_lng": 127.9 + (i // 1000) * 1e-4,
+            "temperature": 15.0 + (i % 30),
+            "humidity": 20.0 + (i % 60),
+            "smoke_density": float(i % 50),
+            "wind_speed": float(i % 12),
+            "wind_direction": float(i % 360),
+            "data_quality": 0.9
+        }
+        for i in range(count)
+    ]
+
+def measure(label: str, build, fields):
+    """생성 시간과 보관 메모리 측정 (메모리 추적은 시간 측정과 분리)"""
+    gc.collect()
+    started = time.perf_counter()
+    objects = build(fields)
+    elapsed = time.perf_counter() - started
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(fields)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return label, objects, elapsed, current
+
+def analyze_seconds(service: RiskAnalysisService, objects) -> float:
+    started = time.perf_counter()
+    asyncio.run(service.analyze_fire_risk(objects, {"lat": 37.5, "lng": 127.9}))
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 측정값 표현 비교 벤치마크")
+    parser.add_argument("--count", type=int, default=100000, help="측정값 수")
+    args = parser.parse_args()
+
+    fields = make_fields(args.count)
+    service = RiskAnalysisService()
+    # 날씨 API 호출은 제외하고 센서 데이터 처리 시간만 측정
+    service.weather_service.get_current_weather = AsyncMock(return_value=None)
+
+    cases = [
+        ("SensorDataCreate (검증)", lambda rows: [SensorDataCreate(**row) for row in rows]),
+        ("SensorDataCreate.model_construct", lambda rows: [SensorDataCreate.model_construct(**row) for row in rows]),
+        ("SensorData (ORM)", lambda rows: [SensorData(**row) for row in rows]),
+        ("SensorReading", lambda rows: [SensorReading(**row) for row in rows])
+    ]
+
+    print(f"측정값 {args.count:,}건")
+    print(f"{'표현':<34}{'생성(초)':>10}{'메모리(MB)':>12}{'건당(B)':>10}{'분석(초)':>10}")
+    for label, build in cases:
+        label, objects, elapsed, memory = measure(label, build, fields)
+        analysis = analyze_seconds(service, objects)
+        print(
+            f"{label:<34}{elapsed:>10.3f}{memory / 1e6:>12.1f}"
+            f"{memory / args.count:>10.0f}{analysis:>10.3f}"
+        )
+        del objects
+
+    # 검증된 스키마 → SensorReading 변환 비용
+    created = [SensorDataCreate(**row) for row in fields]
+    started = time.perf_counter()
+    [SensorReading.from_create(data) for data in created]
+    print(f"\nSensorDataCreate → SensorReading 변환: {time.perf_counter() - started:.3f}초")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+센서 위치 공간 색인 벤치마크
+
+센서 N개를 (1) 전국 범위와 (2) 산림 밀집 지역(40km × 40km)에 배치하고
+반경/영역 조회 시간을 전수 거리 계산과 비교합니다.
+
+사용 예)
+    python scripts/bench_spatial_index.py --sensors 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.services.spatial_index import KM_PER_DEG_LAT, SpatialIndex
+
+LAYOUTS = {
+    "전국": ((33.2, 38.6), (125.0, 129.6)),
+    "밀집": ((37.4, 37.76), (127.3, 127.75))
+}
+
+def per_query_ms(fn, queries):
+    started = time.perf_counter()
+    for query in queries:
+        fn(*query)
+    return (time.perf_counter() - started) / len(queries) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="공간 색인 벤치마크")
+    parser.add_argument("--sensors", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--radius-km", type=float, default=5.0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print(f"{'배치':>6}{'생성(ms)':>10}{'증분 갱신(µs)':>14}{'반경(ms)':>10}{'영역(ms)':>10}{'전수(ms)':>10}{'평균 결과':>10}")
+    for name, ((lat0, lat1), (lng0, lng1)) in LAYOUTS.items():
+        lats = rng.uniform(lat0, lat1, args.sensors)
+        lngs = rng.uniform(lng0, lng1, args.sensors)
+        centers = list(zip(rng.uniform(lat0, lat1, args.queries).tolist(), rng.uniform(lng0, lng1, args.queries).tolist()))
+
+        started = time.perf_counter()
+        index = SpatialIndex.from_points(lats, lngs)
+        build = (time.perf_counter() - started) * 1000
+
+        # 센서 1만 개 이동 (증분 갱신)
+        moves = rng.integers(0, args.sensors, 10000).tolist()
+        started = time.perf_counter()
+        for slot in moves:
+            index.upsert(slot, lats[slot] + 0.01, lngs[slot] + 0.01)
+            lats[slot] += 0.01
+            lngs[slot] += 0.01
+        update = (time.perf_counter() - started) / len(moves) * 1e6
+
+        radius = per_query_ms(lambda lat, lng: index.radius_slots(lat, lng, args.radius_km), centers)
+        half = args.radius_km / KM_PER_DEG_LAT
+        bbox = per_query_ms(lambda lat, lng: index.bbox_slots(lat - half, lat + half, lng - half, lng + half), centers)
+
+        def brute(lat, lng):
+            dy = (lats - lat) * KM_PER_DEG_LAT
+            dx = (lngs - lng) * KM_PER_DEG_LAT * np.cos(np.radians(lat))
+            return np.flatnonzero(dx * dx + dy * dy <= args.radius_km ** 2)
+        full = per_query_ms(brute, centers[:200])
+        hits = np.mean([len(index.radius_slots(lat, lng, args.radius_km)) for lat, lng in centers[:200]])
+
+        print(f"{name:>6}{build:>10.1f}{update:>14.2f}{radius:>10.3f}{bbox:>10.3f}{full:>10.3f}{hits:>10.0f}")
+
+if __name__ == "__main__":
+    main()
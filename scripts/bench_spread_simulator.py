@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+격자 화재 확산 시뮬레이션 벤치마크
+
+20km × 20km 영역을 30m 격자로 나누고 풍속/지형 조건별로 6시간 확산 시뮬레이션 시간을 측정합니다.
+
+사용 예)
+    python scripts/bench_spread_simulator.py --hours 6 --cell-m 30
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.services.spread_simulator import SpreadGrid, SpreadSimulator
+
+CENTER = (36.9, 129.2)
+
+def main():
+    parser = argparse.ArgumentParser(description="확산 시뮬레이션 벤치마크")
+    parser.add_argument("--size-km", type=float, default=20.0)
+    parser.add_argument("--cell-m", type=float, default=30.0)
+    parser.add_argument("--hours", type=float, default=6.0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    simulator = SpreadSimulator()
+
+    print(f"{'조건':>12}{'격자':>10}{'단계':>8}{'시뮬레이션(s)':>14}{'등치선(s)':>10}{'도달 면적(km²)':>15}")
+    for name, wind_speed, terrain in (("무풍/평지", 0.0, False), ("풍속 8m/s", 8.0, False), ("풍속 15m/s+지형", 15.0, True)):
+        grid = SpreadGrid(*CENTER, size_km=args.size_km, cell_m=args.cell_m)
+        if terrain:
+            # 누적 난수로 만든 산지 지형과 일부 비연소 구역
+            grid.elevation[:] = np.cumsum(np.cumsum(rng.normal(0, 0.5, grid.elevation.shape), axis=0), axis=1) / 10
+            grid.fuel[:] = np.where(rng.random(grid.fuel.shape) < 0.05, 0.0, rng.uniform(0.6, 1.4, grid.fuel.shape))
+
+        result = simulator.simulate(grid, [CENTER], wind_speed, 250.0, args.hours * 60)
+        started = time.perf_counter()
+        result.summary()
+        contours = time.perf_counter() - started
+
+        print(
+            f"{name:>12}{grid.size:>7}²{result.steps:>10}{result.elapsed_seconds:>14.2f}"
+            f"{contours:>10.3f}{result.affected_area_km2:>15.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+과거 화재 발생 지수 생성
+
+sensor_data 테이블의 화재 탐지 기록(또는 위도/경도/시각 열이 있는 산불 발생 이력 CSV)을
+격자 셀 × 월 × 시 화재 건수로 집계하여 서버가 시작할 때 불러오는 지수 파일로 저장합니다.
+
+사용 예)
+    python scripts/build_historical_index.py
+    python scripts/build_historical_index.py --csv forest_fires.csv --since 2014-01-01
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.config import settings
+from app.services.historical_index import HistoricalFireIndex
+
+def load_database():
+    """sensor_data 테이블의 화재 탐지 기록 (위도, 경도, 시각)"""
+    from app.core.database import SessionLocal
+    from app.models.sensor_data import SensorData
+
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(SensorData.location_lat, SensorData.location_lng, SensorData.timestamp)
+            .filter(SensorData.fire_detected == True)
+            .yield_per(10000)
+        )
+        return [tuple(row) for row in rows]
+    finally:
+        db.close()
+
+def load_csv(path: str, lat_column: str, lng_column: str, time_column: str):
+    """CSV 산불 발생 이력 (시각은 ISO 형식, 시간대가 없으면 한국 표준시)"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [
+            (float(row[lat_column]), float(row[lng_column]), datetime.fromisoformat(row[time_column]))
+            for row in csv.DictReader(f)
+        ]
+
+def main():
+    parser = argparse.ArgumentParser(description="과거 화재 발생 지수 생성")
+    parser.add_argument("--csv", help="산불 발생 이력 CSV (없으면 sensor_data 테이블)")
+    parser.add_argument("--lat-column", default="lat")
+    parser.add_argument("--lng-column", default="lng")
+    parser.add_argument("--time-column", default="timestamp")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None, help="기록 기간 시작 (기본: 가장 이른 기록)")
+    parser.add_argument("--output", default=settings.HISTORICAL_INDEX_PATH)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    records = (
+        load_csv(args.csv, args.lat_column, args.lng_column, args.time_column) if args.csv
+        else load_database()
+    )
+    lats, lngs, timestamps = zip(*records) if records else ((), (), ())
+    index = HistoricalFireIndex.build(lats, lngs, timestamps, since=args.since)
+    index.save(args.output)
+    print(
+        f"📚 탐지 기록 {len(records)}건 → 화재 {index.total}건, 셀 {index.active_cells}개 "
+        f"({time.perf_counter() - started:.1f}s, {args.output})"
+    )
+
+if __name__ == "__main__":
+    main()
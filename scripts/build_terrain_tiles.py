@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+지형/연료 래스터 타일 생성
+
+.npy 로 내보낸 DEM, 연료, 토지피복 래스터(0행이 북쪽)를 지형 저장소의 타일 레이어로 나눠 저장합니다.
+입력 파일은 메모리 매핑으로 읽으므로 전국 단위 래스터도 타일 크기만큼의 메모리로 변환됩니다.
+
+사용 예)
+    python scripts/build_terrain_tiles.py elevation dem.npy --north 38.7 --west 124.5 --res 0.0003
+    python scripts/build_terrain_tiles.py landcover landcover.npy --north 38.7 --west 124.5 --res 0.0003 --nodata 0 --interpolation nearest
+    python scripts/build_terrain_tiles.py elevation dem.npy --north 38.7 --west 124.5 --res 0.0003 --bench-points 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from app.core.config import settings
+from app.services.terrain_store import TerrainStore, write_layer
+
+def main():
+    parser = argparse.ArgumentParser(description="지형/연료 래스터 타일 생성")
+    parser.add_argument("layer", help="레이어 이름 (elevation, fuel, landcover)")
+    parser.add_argument("source", help="입력 .npy 파일")
+    parser.add_argument("--north", type=float, required=True, help="북쪽 모서리 위도")
+    parser.add_argument("--west", type=float, required=True, help="서쪽 모서리 경도")
+    parser.add_argument("--res", type=float, required=True, help="픽셀 크기 (도)")
+    parser.add_argument("--res-lng", type=float, default=None, help="경도 방향 픽셀 크기 (기본: --res)")
+    parser.add_argument("--tile-size", type=int, default=512)
+    parser.add_argument("--nodata", type=float, default=None)
+    parser.add_argument("--interpolation", choices=("bilinear", "nearest"), default="bilinear")
+    parser.add_argument("--root", default=settings.TERRAIN_DATA_DIR)
+    parser.add_argument("--bench-points", type=int, default=0, help="생성 후 무작위 지점 일괄 조회 시간 측정")
+    args = parser.parse_args()
+
+    array = np.load(args.source, mmap_mode="r")
+    res_lng = args.res_lng or args.res
+    started = time.perf_counter()
+    path = write_layer(
+        args.root, args.layer, array, args.north, args.west, args.res, res_lng,
+        tile_size=args.tile_size, nodata=args.nodata, interpolation=args.interpolation
+    )
+    tiles = len(list(path.glob("*.npy")))
+    print(f"🗺️ {args.layer}: {array.shape[0]}×{array.shape[1]} → 타일 {tiles}개 ({time.perf_counter() - started:.1f}s, {path})")
+
+    if args.bench_points:
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(args.north - array.shape[0] * args.res, args.north, args.bench_points)
+        lngs = rng.uniform(args.west, args.west + array.shape[1] * res_lng, args.bench_points)
+        store = TerrainStore(args.root)
+        for label in ("첫 조회", "재조회"):
+            started = time.perf_counter()
+            values = store.sample(lats, lngs, args.layer)
+            print(f"  {label}: {args.bench_points}개 지점 {time.perf_counter() - started:.3f}s (유효 {np.isfinite(values).mean():.0%})")
+
+if __name__ == "__main__":
+    main()
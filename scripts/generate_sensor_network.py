@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+합성 센서망 생성 스크립트
+
+사용 예)
+    # 10만 센서, 초당 5천 건을 60초 동안 JSON Lines로 출력
+    python scripts/generate_sensor_network.py --sensors 100000 --rate 5000 --duration 60 --output readings.jsonl
+    # 센서 데이터 API로 직접 전송
+    python scripts/generate_sensor_network.py --rate 200 --post http://localhost:8000/api/v1/sensor-data/
+    # 업스트림 대역 서버의 /nearby 응답으로 제공
+    python scripts/generate_sensor_network.py --sensors 50000 --standin-port 8900 --fire 37.57,127.98,600
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import httpx
+
+from app.services.synthetic_network import FireEvent, SyntheticSensorNetwork
+
+def parse_fire(value: str) -> FireEvent:
+    """'위도,경도[,발화시각초[,강도]]' 형식 파싱"""
+    parts = [float(p) for p in value.split(",")]
+    if len(parts) < 2:
+        raise argparse.ArgumentTypeError("--fire 형식: 위도,경도[,발화시각초[,강도]]")
+    return FireEvent(parts[0], parts[1], *parts[2:4])
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="합성 센서망 생성기")
+    parser.add_argument("--sensors", type=int, default=10000, help="IoT 센서 수")
+    parser.add_argument("--cameras", type=int, default=200, help="카메라(CCTV/드론/위성) 수")
+    parser.add_argument("--center", default="37.5665,127.9780", help="중심 위경도")
+    parser.add_argument("--extent-km", type=float, default=50.0, help="영역 한 변 길이 (km)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=1000.0, help="초당 측정값 수")
+    parser.add_argument("--duration", type=float, default=None, help="실행 시간 (초)")
+    parser.add_argument("--emit-interval", type=float, default=30.0, help="센서별 측정 주기 (초)")
+    parser.add_argument("--fire", type=parse_fire, action="append", default=[], help="산불 이벤트 주입")
+    parser.add_argument("--fast", action="store_true", help="대기 없이 최대 속도로 생성")
+    parser.add_argument("--output", help="JSON Lines 출력 파일 ('-'는 표준출력)")
+    parser.add_argument("--post", help="센서 데이터 API 주소")
+    parser.add_argument("--standin-port", type=int, help="업스트림 대역 서버로 제공할 포트")
+    return parser.parse_args()
+
+async def emit(network: SyntheticSensorNetwork, args):
+    """측정값 스트림을 파일/API로 전송"""
+    output = None
+    if args.output:
+        output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    client = httpx.AsyncClient(timeout=30.0) if args.post else None
+    total = 0
+    
+    try:
+        async for batch in network.stream(args.rate, args.duration, realtime=not args.fast):
+            if output:
+                output.write("".join(reading.model_dump_json() + "\n" for reading in batch))
+            if client:
+                await asyncio.gather(*[
+                    client.post(args.post, content=reading.model_dump_json(),
+                                headers={"Content-Type": "application/json"})
+                    for reading in batch
+                ])
+            total += len(batch)
+    finally:
+        if output and output is not sys.stdout:
+            output.close()
+        if client:
+            await client.aclose()
+    
+    print(f"✅ 합성 측정값 {total}건 생성 완료", file=sys.stderr)
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    lat, lng = (float(v) for v in args.center.split(","))
+    network = SyntheticSensorNetwork(
+        n_sensors=args.sensors,
+        n_cameras=args.cameras,
+        center=(lat, lng),
+        extent_km=args.extent_km,
+        seed=args.seed,
+        fire_events=args.fire,
+        emit_interval_s=args.emit_interval
+    )
+    print(f"🌲 합성 센서망 생성 - 센서 {args.sensors}개, 카메라 {args.cameras}개, 시드 {args.seed}", file=sys.stderr)
+    
+    if args.standin_port:
+        import uvicorn
+        from app.services.upstream_standin import StandinConfig, create_standin_app
+        
+        app = create_standin_app(StandinConfig(mode="synthetic", seed=args.seed))
+        network.attach_to_standin(app.state.synthetic)
+        uvicorn.run(app, host="0.0.0.0", port=args.standin_port, log_level="warning")
+        return
+    
+    asyncio.run(emit(network, args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+업스트림 대역 서버 실행 스크립트
+
+사용 예)
+    # 실제 API 응답 기록 (.env 의 업스트림 주소가 대역 서버를 가리키므로 실제 주소를 직접 지정)
+    python scripts/upstream_standin.py --mode record --fixtures fixtures/upstream \
+        --upstream gigai=https://api.kt.com/gigai --upstream kma=https://apis.data.go.kr/1360000/VilageFcstInfoService_2.0
+    # 기록된 응답 재생 + 지연/오류 주입
+    python scripts/upstream_standin.py --mode replay --latency-ms 50 --jitter-ms 200 --error-rate 0.05
+"""
+
+import argparse
+import os
+import sys
+
+# 백엔드 패키지를 Python 경로에 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import uvicorn
+
+from app.services.upstream_standin import StandinConfig, create_standin_app, parse_upstream
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="업스트림 대역 서버 (기록/재생/장애 주입)")
+    parser.add_argument("--mode", choices=["record", "replay", "synthetic"], default="replay")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--fixtures", default="fixtures/upstream", help="픽스처 저장 경로")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="기본 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지수분포 추가 지연 평균 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0-1)")
+    parser.add_argument("--error-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="합성 이미지 데이터 크기 (bytes)")
+    parser.add_argument("--items", type=int, default=5, help="합성 응답당 항목 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--upstream", action="append", default=[], metavar="PREFIX=URL",
+        help="기록 모드 전달 대상 (예: gigai=https://api.kt.com/gigai, 여러 번 지정 가능, 미지정 접두사는 .env 주소)"
+    )
+    return parser.parse_args()
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    try:
+        config = StandinConfig(
+            mode=args.mode,
+            fixtures_dir=args.fixtures,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            payload_bytes=args.payload_bytes,
+            items_per_response=args.items,
+            seed=args.seed,
+            upstreams=dict(parse_upstream(value) for value in args.upstream),
+            listen=(args.host, args.port)
+        )
+    except ValueError as e:
+        sys.exit(f"❌ {e}")
+    
+    print(f"🧪 업스트림 대역 서버 시작 - 모드: {args.mode}, 포트: {args.port}")
+    uvicorn.run(create_standin_app(config), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+원본 데이터 blob 저장소 테스트
+"""
+
+import pytest
+import base64
+import os
+from backend.app.services.blob_store import BLOB_REF_KEY, BlobStore, PayloadPolicy
+
+class TestBlobStore:
+    """내용 주소 기반 저장소 테스트"""
+    
+    def test_put_is_content_addressed(self, tmp_path):
+        """같은 내용은 같은 해시로 한 번만 저장"""
+        store = BlobStore(str(tmp_path))
+        
+        first = store.put(b"forest" * 100)
+        second = store.put(b"forest" * 100)
+        
+        assert first == second
+        assert store.get(first) == b"forest" * 100
+        assert len([f for _, _, files in os.walk(tmp_path) for f in files]) == 1
+    
+    def test_incompressible_data_stored_raw(self, tmp_path):
+        """압축해도 줄지 않는 내용은 그대로 저장"""
+        store = BlobStore(str(tmp_path))
+        data = os.urandom(4096)
+        
+        digest = store.put(data)
+        
+        assert store._path(digest, False).exists()
+        assert store.get(digest) == data
+
+class TestPayloadPolicy:
+    """raw_data 저장 정책 테스트"""
+    
+    @pytest.fixture
+    def policy(self, tmp_path):
+        return PayloadPolicy(BlobStore(str(tmp_path)), max_inline_bytes=256)
+    
+    @pytest.mark.asyncio
+    async def test_image_data_moved_to_blob(self, policy):
+        """base64 이미지는 참조로 대체되고 복원 가능"""
+        image = base64.b64encode(os.urandom(3000)).decode()
+        item = {"id": "cam1", "lat": 37.5, "lng": 127.9, "image_url": "http://cam/1.jpg", "image_data": image}
+        
+        stored = await policy.apply(item)
+        
+        assert stored["image_data"][BLOB_REF_KEY]
+        assert stored["image_data"]["bytes"] == 3000
+        assert stored["lat"] == 37.5 and stored["image_url"] == "http://cam/1.jpg"
+        assert len(str(stored)) < 400
+        assert policy.hydrate(stored) == item
+    
+    @pytest.mark.asyncio
+    async def test_small_payload_kept_inline(self, policy):
+        """작은 항목은 그대로 유지 (파일 기록 없음)"""
+        item = {"id": "s1", "temperature": 21.5, "tags": ["a", "b"]}
+        
+        stored = await policy.apply(item)
+        
+        assert stored == item
+        assert not any(policy.store.root.iterdir())
+    
+    @pytest.mark.asyncio
+    async def test_large_nested_field_moved(self, policy):
+        """직렬화 크기가 기준을 넘는 필드는 이동"""
+        item = {"id": "s1", "history": [{"t": i, "v": i * 0.5} for i in range(100)]}
+        
+        stored = await policy.apply(item)
+        
+        assert stored["history"]["encoding"] == "json"
+        assert policy.hydrate(stored) == item
+    
+    @pytest.mark.asyncio
+    async def test_shared_payload_stored_once(self, policy):
+        """여러 행이 공유하는 원본은 하나의 blob 참조"""
+        weather = {"temperature": 18.0, "humidity": 40.0, "wind_speed": 3.2}
+        
+        first = await policy.apply(weather, shared=True)
+        second = await policy.apply(dict(weather), shared=True)
+        
+        assert first == second
+        assert set(first) == {BLOB_REF_KEY, "bytes", "encoding"}
+        assert policy.hydrate(first) == weather
@@ -0,0 +1,164 @@
+"""
+업스트림 회로 차단기 테스트
+"""
+
+import pytest
+import asyncio
+import time
+import httpx
+from backend.app.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    UpstreamGuard
+)
+
+class TestCircuitBreaker:
+    """회로 차단기 상태 전환 테스트"""
+
+    def test_opens_after_consecutive_failures(self):
+        """연속 실패가 기준에 도달하면 차단"""
+        breaker = CircuitBreaker("test_breaker_open", failure_threshold=3, reset_timeout_seconds=30)
+
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """성공하면 연속 실패 횟수 초기화"""
+        breaker = CircuitBreaker("test_breaker_reset", failure_threshold=2, reset_timeout_seconds=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        """차단 해제 대기 후 시험 호출은 하나만 허용"""
+        breaker = CircuitBreaker("test_breaker_probe", failure_threshold=1, reset_timeout_seconds=30)
+        breaker.record_failure()
+        breaker.opened_at = time.monotonic() - 31
+
+        breaker.before_call()
+        assert breaker.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.before_call()
+
+    def test_half_open_failure_reopens(self):
+        """시험 호출이 실패하면 다시 차단"""
+        breaker = CircuitBreaker("test_breaker_reopen", failure_threshold=5, reset_timeout_seconds=30)
+        breaker.state = CircuitState.OPEN
+        breaker.opened_at = time.monotonic() - 31
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+class TestUpstreamGuard:
+    """업스트림 호출 보호 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_circuit(self):
+        """5xx 응답이 이어지면 이후 호출은 요청 없이 즉시 실패"""
+        guard = UpstreamGuard(failure_threshold=2, reset_timeout_seconds=30, timeout_seconds=1)
+        calls = []
+
+        async def request():
+            calls.append(1)
+            return httpx.Response(503)
+
+        for _ in range(2):
+            response = await guard.call("test_guard_5xx", request)
+            assert response.status_code == 503
+
+        with pytest.raises(CircuitOpenError):
+            await guard.call("test_guard_5xx", request)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_is_not_failure(self):
+        """429 응답은 장애로 집계하지 않음"""
+        guard = UpstreamGuard(failure_threshold=1, reset_timeout_seconds=30, timeout_seconds=1)
+
+        async def request():
+            return httpx.Response(429)
+
+        await guard.call("test_guard_429", request)
+
+        assert guard.breaker("test_guard_429").state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounds_latency(self):
+        """응답이 늦으면 시간 제한에서 끊고 실패로 집계"""
+        guard = UpstreamGuard(failure_threshold=1, reset_timeout_seconds=30, timeout_seconds=0.05)
+
+        async def request():
+            await asyncio.sleep(5)
+            return httpx.Response(200)
+
+        started = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            await guard.call("test_guard_timeout", request)
+
+        assert time.monotonic() - started < 1
+        assert guard.breaker("test_guard_timeout").state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_wins_over_slow_primary(self):
+        """p95 보다 늦은 요청은 보조 요청의 응답을 사용"""
+        guard = UpstreamGuard(
+            failure_threshold=5,
+            reset_timeout_seconds=30,
+            timeout_seconds=2,
+            hedging_enabled=True,
+            hedge_min_samples=3
+        )
+        for _ in range(3):
+            guard.latency("test_guard_hedge").record(0.01)
+
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(1)
+                return httpx.Response(200, text="slow")
+            return httpx.Response(200, text="fast")
+
+        started = time.monotonic()
+        response = await guard.call("test_guard_hedge", request)
+
+        assert response.text == "fast"
+        assert len(attempts) == 2
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_samples(self):
+        """응답 시간 표본이 부족하면 보조 요청을 보내지 않음"""
+        guard = UpstreamGuard(timeout_seconds=1, hedging_enabled=True, hedge_min_samples=3)
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200)
+
+        await guard.call("test_guard_cold", request)
+
+        assert len(attempts) == 1
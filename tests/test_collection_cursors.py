@@ -0,0 +1,85 @@
+"""
+증분 수집 커서 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+from backend.app.models.sensor_data import SensorDataCreate, SensorType
+from backend.app.services.collection_cursors import ChangeFilter, SourceCursor
+from backend.app.services.collection_sources import CollectionSource, parse_iot_item
+from backend.app.services.data_collection_service import DataCollectionService
+from backend.app.services.last_known_good import LastKnownGoodStore
+
+def make_item(item_id: str, temperature: float):
+    return {"id": item_id, "type": "temperature", "lat": 37.5, "lng": 127.9, "temperature": temperature}
+
+class TestSourceCursor:
+    """소스 커서 테스트 클래스"""
+    
+    def test_full_response_replaces_items(self):
+        """커서 미지원 업스트림은 응답 전체로 교체"""
+        cursor = SourceCursor()
+        cursor.apply(None, {"data": [make_item("a", 20), make_item("b", 21)]})
+        items = cursor.apply(None, {"data": [make_item("b", 22)]})
+        
+        assert items == [make_item("b", 22)]
+        assert cursor.request_params() == {}
+        assert cursor.request_headers() == {}
+    
+    def test_delta_response_merges_items(self):
+        """커서 지원 업스트림은 변경분 병합 및 삭제 반영"""
+        cursor = SourceCursor()
+        cursor.apply('"v1"', {"data": [make_item("a", 20), make_item("b", 21)], "next_cursor": "10"})
+        assert cursor.request_params() == {"cursor": "10"}
+        assert cursor.request_headers() == {"If-None-Match": '"v1"'}
+        
+        items = cursor.apply('"v2"', {"data": [make_item("c", 23)], "deleted": ["a"], "next_cursor": "11"})
+        assert sorted(item["id"] for item in items) == ["b", "c"]
+        assert cursor.request_params() == {"cursor": "11"}
+    
+    def test_change_filter(self):
+        """같은 값은 한 번만 통과, heartbeat 이후 다시 통과"""
+        reading = SensorDataCreate(
+            sensor_id="iot_a", sensor_type=SensorType.TEMPERATURE,
+            location_lat=37.5, location_lng=127.9, temperature=20.0
+        )
+        change_filter = ChangeFilter(heartbeat_seconds=600)
+        assert change_filter.is_changed(reading)
+        assert not change_filter.is_changed(reading)
+        assert change_filter.is_changed(reading.model_copy(update={"temperature": 21.0}))
+        
+        assert ChangeFilter(heartbeat_seconds=0).is_changed(reading)
+
+class TestIncrementalCollection:
+    """증분 수집 테스트 클래스"""
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_items_are_not_reparsed(self):
+        """내용이 같은 항목은 변환(이미지 분석 등)을 다시 하지 않음"""
+        calls = []
+        
+        async def counting_parser(service, source, item):
+            calls.append(item["id"])
+            return await parse_iot_item(service, source, item)
+        
+        source = CollectionSource("delta", "변경분 소스", "iot_sensors", "/delta", counting_parser, "IOT_SENSOR_API_KEY", 0.9)
+        responses = [
+            [make_item("a", 20), make_item("b", 21)],
+            [make_item("a", 20), make_item("b", 25)]
+        ]
+        
+        async def fake_fetch(source, location, radius_km, priority, cursor=None):
+            return cursor.apply(None, {"data": responses.pop(0)})
+        
+        service = DataCollectionService()
+        location = {"lat": 37.5, "lng": 127.9}
+        with patch(
+            "backend.app.services.data_collection_service.last_known_good_store",
+            LastKnownGoodStore(max_staleness_seconds=60, refresh_timeout_seconds=1.0)
+        ), patch.object(service, "_fetch_source_items", side_effect=fake_fetch):
+            first = [data async for data in service.stream_source(source, location, 5.0)]
+            second = [data async for data in service.stream_source(source, location, 5.0)]
+        
+        assert calls == ["a", "b", "b"]
+        assert [data.temperature for data in first] == [20, 21]
+        assert [data.temperature for data in second] == [20, 25]
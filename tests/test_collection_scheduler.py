@@ -0,0 +1,175 @@
+"""
+다지역 수집 스케줄러 테스트
+"""
+
+import pytest
+from backend.app.models.sensor_data import SensorDataCreate, SensorType
+from backend.app.services.collection_scheduler import (
+    CollectionScheduler,
+    MonitoredRegion,
+    RegionRegistry,
+    default_regions,
+    plan_queries
+)
+from backend.app.services.polling_cadence import PollingCadence
+
+def make_reading(sensor_id: str, lat: float, lng: float) -> SensorDataCreate:
+    return SensorDataCreate(
+        sensor_id=sensor_id,
+        sensor_type=SensorType.CCTV,
+        location_lat=lat,
+        location_lng=lng
+    )
+
+class FakeCollectionService:
+    """업스트림 호출 대신 고정 데이터를 반환하는 수집 서비스"""
+    
+    def __init__(self, readings):
+        self.readings = readings
+        self.queries = []
+        self.fire_flagged_locations = set()
+    
+    def _location_key(self, location):
+        return (round(location["lat"], 4), round(location["lng"], 4))
+    
+    async def stream_all_data(self, location, radius_km, priority, include_weather=True):
+        self.queries.append((location, radius_km))
+        for data in self.readings:
+            yield data
+    
+    async def _collect_weather_data(self, location, priority):
+        return []
+
+class FakeRiskTracker:
+    """고정 위험도를 반환하는 지역별 위험도 상태"""
+    
+    def __init__(self, overall_risk: float):
+        self.overall_risk = overall_risk
+        self.observed = {}
+    
+    def observe(self, region, readings, now=None):
+        self.observed.setdefault(region, []).extend(readings)
+    
+    async def refresh_weather(self, region, location):
+        pass
+    
+    def risk(self, region, now=None):
+        return {"overall_risk": self.overall_risk}
+
+class FakeBuffer:
+    """저장 대상 기록용 버퍼"""
+    
+    def __init__(self):
+        self.items = []
+    
+    async def put(self, reading):
+        self.items.append(reading)
+    
+    def start(self):
+        pass
+
+class TestCollectionScheduler:
+    """다지역 수집 스케줄러 테스트 클래스"""
+    
+    def test_plan_merges_overlapping_regions(self):
+        """겹치는 지역만 하나의 조회로 합침"""
+        queries = plan_queries(default_regions(), max_radius_km=15.0)
+        
+        assert len(queries) == 3
+        merged = next(query for query in queries if len(query.regions) == 2)
+        assert {region.name for region in merged.regions} == {"청계산", "관악산"}
+        for region in merged.regions:
+            # 합친 조회 반경이 두 지역을 모두 포함
+            assert region.distance_km(merged.lat, merged.lng) + region.radius_km <= merged.radius_km + 1e-6
+    
+    def test_plan_respects_max_radius(self):
+        """합친 반경이 최대값을 넘으면 따로 조회"""
+        queries = plan_queries(default_regions(), max_radius_km=6.0)
+        assert len(queries) == 4
+    
+    @pytest.mark.asyncio
+    async def test_run_once_fans_out_and_stores_once(self):
+        """겹치는 지역의 데이터는 한 번만 저장하고 각 지역에 나눠 전달"""
+        a = MonitoredRegion("A", 37.50, 127.00, radius_km=5.0)
+        b = MonitoredRegion("B", 37.50, 127.08, radius_km=5.0)
+        readings = [
+            make_reading("west", 37.50, 126.98),    # A만
+            make_reading("middle", 37.50, 127.04),  # A, B 모두
+            make_reading("east", 37.50, 127.10)     # B만
+        ]
+        service = FakeCollectionService(readings)
+        buffer = FakeBuffer()
+        scheduler = CollectionScheduler(
+            RegionRegistry([a, b]), service, buffer,
+            cadence=PollingCadence(10, 300), risk_tracker=FakeRiskTracker(0.0)
+        )
+        
+        received = {}
+        async def on_region_data(region, data):
+            received[region.name] = [d.sensor_id for d in data]
+        scheduler.subscribe(on_region_data)
+        
+        await scheduler.run_once()
+        
+        assert len(service.queries) == 1
+        assert [d.sensor_id for d in buffer.items] == ["west", "middle", "east"]
+        assert received == {"A": ["west", "middle"], "B": ["middle", "east"]}
+        assert [d.sensor_id for d in scheduler.risk_tracker.observed["B"]] == ["middle", "east"]
+    
+    def test_cadence_tightens_with_risk(self):
+        """위험도가 높을수록 수집 간격이 최소값에 가까워짐"""
+        cadence = PollingCadence(min_seconds=10, max_seconds=300)
+        cadence.observe_risk("quiet", 0.0)
+        cadence.observe_risk("medium", 0.5)
+        cadence.observe_risk("critical", 0.95)
+        
+        quiet = cadence.region_interval("quiet")
+        medium = cadence.region_interval("medium")
+        critical = cadence.region_interval("critical")
+        assert quiet == 300
+        assert quiet > medium > critical >= 10
+        # 관측 이력이 없는 지역은 기본 간격 사용
+        assert cadence.region_interval("unknown", 30) == 30
+    
+    def test_cadence_rising_risk_and_camera_detection(self):
+        """위험도 상승 중이거나 카메라가 화재를 탐지하면 간격 단축"""
+        cadence = PollingCadence(min_seconds=10, max_seconds=300, camera_min_seconds=5)
+        cadence.observe_risk("steady", 0.4)
+        cadence.observe_risk("steady", 0.4)
+        cadence.observe_risk("rising", 0.2)
+        cadence.observe_risk("rising", 0.4)
+        assert cadence.region_interval("rising") < cadence.region_interval("steady")
+        
+        camera = make_reading("cctv_001", 37.5, 127.0).model_copy(
+            update={"fire_detected": True, "fire_confidence": 0.95}
+        )
+        cadence.observe_readings("watched", [camera])
+        assert cadence.camera_interval("cctv_001") < 10
+        assert cadence.region_interval("watched") == cadence.camera_interval("cctv_001")
+    
+    def test_cadence_backs_off_when_unchanged(self):
+        """한산한 지역에서 데이터 변화가 없으면 간격 증가"""
+        cadence = PollingCadence(min_seconds=10, max_seconds=1000)
+        readings = [make_reading("iot_s0001", 37.5, 127.0)]
+        cadence.observe_risk("quiet", 0.1)
+        cadence.observe_readings("quiet", readings)
+        first = cadence.region_interval("quiet")
+        cadence.observe_readings("quiet", readings)
+        assert cadence.region_interval("quiet") > first
+    
+    @pytest.mark.asyncio
+    async def test_ingest_pushed_fire_reading_pulls_collection_forward(self):
+        """푸시 수신된 화재 징후는 해당 지역 수집을 즉시 앞당김"""
+        a = MonitoredRegion("A", 37.50, 127.00, radius_km=5.0)
+        service = FakeCollectionService([])
+        scheduler = CollectionScheduler(RegionRegistry([a]), service, FakeBuffer(), cadence=PollingCadence())
+        scheduler._next_due["A"] = float("inf")
+        
+        smoke = make_reading("iot_s0001", 37.50, 127.01).model_copy(
+            update={"sensor_type": SensorType.SMOKE_DENSITY, "smoke_density": 80.0}
+        )
+        await scheduler.ingest([smoke, make_reading("far", 38.0, 128.0)])
+        
+        assert [d.sensor_id for d in scheduler.latest["A"]] == ["iot_s0001"]
+        assert scheduler._next_due["A"] != float("inf")
+        assert (37.5, 127.0) in service.fire_flagged_locations
@@ -0,0 +1,75 @@
+"""
+데이터 수집 서비스 테스트
+"""
+
+import pytest
+import asyncio
+from unittest.mock import patch
+from backend.app.services.data_collection_service import DataCollectionService
+from backend.app.services.collection_sources import (
+    COLLECTION_SOURCES,
+    CollectionSource,
+    get_sources,
+    parse_iot_item
+)
+from backend.app.services.last_known_good import LastKnownGoodStore
+
+class TestDataCollectionService:
+    """데이터 수집 서비스 테스트 클래스"""
+    
+    @pytest.fixture
+    def collection_service(self):
+        """데이터 수집 서비스 인스턴스 (격리된 최근 정상값 저장소 사용)"""
+        with patch(
+            "backend.app.services.data_collection_service.last_known_good_store",
+            LastKnownGoodStore(max_staleness_seconds=60, refresh_timeout_seconds=1.0)
+        ):
+            yield DataCollectionService()
+    
+    @pytest.fixture
+    def sample_location(self):
+        """샘플 위치 정보"""
+        return {"lat": 37.5665, "lng": 127.9780}
+    
+    def test_registered_sources(self):
+        """기본 수집 소스 등록 확인"""
+        assert set(COLLECTION_SOURCES) == {"cctv", "drone", "satellite", "iot_sensors"}
+        assert [s.path for s in get_sources(["cctv", "iot_sensors"])] == ["/cctv/nearby", "/sensors/nearby"]
+    
+    @pytest.mark.asyncio
+    async def test_stream_yields_fast_source_first(self, collection_service, sample_location):
+        """느린 소스를 기다리지 않고 빠른 소스 데이터부터 반환"""
+        fast = CollectionSource("fast", "빠른 소스", "iot_sensors", "/fast", parse_iot_item, "IOT_SENSOR_API_KEY", 0.9)
+        slow = CollectionSource("slow", "느린 소스", "iot_sensors", "/slow", parse_iot_item, "IOT_SENSOR_API_KEY", 0.9)
+        
+        async def fake_fetch(source, location, radius_km, priority, cursor=None):
+            if source.name == "slow":
+                await asyncio.sleep(0.2)
+            return [{"id": source.name, "type": "temperature", "lat": 37.5, "lng": 127.9, "temperature": 20.0}]
+        
+        with patch.object(collection_service, "_fetch_source_items", side_effect=fake_fetch):
+            stream = collection_service.stream_all_data(
+                sample_location, sources=[slow, fast], include_weather=False
+            )
+            first = await stream.__anext__()
+            rest = [data async for data in stream]
+        
+        assert first.sensor_id == "fast_fast"
+        assert [data.sensor_id for data in rest] == ["slow_slow"]
+    
+    @pytest.mark.asyncio
+    async def test_collect_all_data_flags_fire_location(self, collection_service, sample_location):
+        """화재 탐지 시 위치가 우선 수집 대상으로 표시되는지 테스트"""
+        async def fake_fetch(source, location, radius_km, priority, cursor=None):
+            return [{"id": source.name, "lat": 37.5, "lng": 127.9, "image_url": None}]
+        
+        async def fake_analyze(image_url, image_data):
+            return {"fire_detected": True, "fire_confidence": 0.9}
+        
+        with patch.object(collection_service, "_fetch_source_items", side_effect=fake_fetch), \
+             patch.object(collection_service.vision_ai_service, "analyze_image", side_effect=fake_analyze), \
+             patch.object(collection_service, "_collect_weather_data", return_value=[]):
+            data = await collection_service.collect_all_data(sample_location)
+        
+        assert {d.sensor_type.value for d in data if d.fire_detected} == {"cctv", "drone", "satellite"}
+        assert collection_service._location_key(sample_location) in collection_service.fire_flagged_locations
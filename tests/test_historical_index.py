@@ -0,0 +1,167 @@
+"""
+과거 화재 발생 지수 테스트
+"""
+
+import math
+import pytest
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.historical_index import HistoricalFireIndex, KST
+from backend.app.services.region_risk import RegionRiskTracker
+from backend.app.services.risk_analysis_service import RiskAnalysisService, SensorColumns
+
+HOTSPOT = (36.55, 128.75)
+QUIET = (37.55, 127.05)
+# 봄철 오후
+SPRING = datetime(2024, 4, 5, 14, 20, tzinfo=KST)
+
+def make_index(**kwargs) -> HistoricalFireIndex:
+    kwargs.setdefault("cell_deg", 0.1)
+    kwargs.setdefault("gap_hours", 24.0)
+    kwargs.setdefault("prior_strength", 20.0)
+    kwargs.setdefault("reference_rate", 0.05)
+    return HistoricalFireIndex(**kwargs)
+
+def history():
+    """10년간 매년 봄 오후 핫스팟 화재 3건(각각 두 번씩 탐지) + 조용한 지역 가을 밤 1건"""
+    records = []
+    for year in range(2014, 2024):
+        for day in (3, 10, 17):
+            start = datetime(year, 4, day, 14, 10, tzinfo=KST)
+            records.append((*HOTSPOT, start))
+            records.append((HOTSPOT[0] + 0.01, HOTSPOT[1], start + timedelta(hours=3)))
+    records.append((*QUIET, datetime(2020, 10, 1, 2, 0, tzinfo=KST)))
+    return records
+
+class TestHistoricalFireIndex:
+    """과거 화재 발생 지수 테스트 클래스"""
+
+    def test_build_counts_incidents_by_cell_month_hour(self):
+        """같은 셀에서 gap 안에 이어진 탐지는 한 건, 월/시는 한국 표준시 기준"""
+        lats, lngs, timestamps = zip(*history())
+        index = HistoricalFireIndex.build(lats, lngs, timestamps, **{
+            "cell_deg": 0.1, "gap_hours": 24.0, "prior_strength": 20.0, "reference_rate": 0.05
+        })
+        rows, cols, valid = index.cell_of(np.array([HOTSPOT[0]]), np.array([HOTSPOT[1]]))
+        assert valid[0]
+        assert index.total == 31 and index.active_cells == 2
+        assert index.counts[rows[0], cols[0], 3, 14] == 30
+        assert index.cell_total[rows[0], cols[0]] == 30
+        assert index.slot_total[9, 2] == 1
+        assert index.since == pytest.approx(datetime(2014, 4, 3, 14, 10, tzinfo=KST).timestamp())
+
+        # UTC 시각은 한국 표준시로 바꿔 집계, 시간대가 없으면 한국 표준시로 간주
+        utc = HistoricalFireIndex.build([QUIET[0]] * 2, [QUIET[1]] * 2, [
+            datetime(2020, 9, 30, 17, 0, tzinfo=timezone.utc),
+            datetime(2021, 9, 30, 17, 0)
+        ])
+        assert utc.slot_total[9, 2] == 1 and utc.slot_total[8, 17] == 1
+
+    def test_incremental_record_matches_build(self):
+        """새 탐지를 하나씩 반영한 결과가 일괄 생성과 같음"""
+        records = history()
+        lats, lngs, timestamps = zip(*records)
+        built = HistoricalFireIndex.build(lats, lngs, timestamps, cell_deg=0.1, gap_hours=24.0)
+        index = make_index()
+        added = sum(index.record(lat, lng, when) for lat, lng, when in records)
+
+        assert added == built.total
+        np.testing.assert_array_equal(index.counts, built.counts)
+        np.testing.assert_array_equal(index.cell_month, built.cell_month)
+        np.testing.assert_array_equal(index.cell_hour, built.cell_hour)
+        np.testing.assert_array_equal(index.last_incident, built.last_incident)
+        assert index.active_cells == built.active_cells and index.since == built.since
+
+        # 범위 밖 기록은 무시
+        assert not index.record(45.0, 127.0, SPRING)
+
+    def test_observe_readings(self):
+        """센서 데이터 묶음의 화재 탐지만 반영"""
+        index = make_index()
+        readings = [
+            SensorReading("cam_1", SensorType.CCTV, *HOTSPOT, fire_detected=True, fire_confidence=0.9),
+            SensorReading("cam_2", SensorType.CCTV, HOTSPOT[0] + 0.01, HOTSPOT[1], fire_detected=True),
+            SensorReading("temp_1", SensorType.TEMPERATURE, *QUIET, temperature=30.0)
+        ]
+        assert index.observe(readings, SPRING) == 1
+        assert index.dirty and index.total == 1
+
+    def test_risk_follows_history(self):
+        """화재가 잦은 셀의 해당 월/시 구간 위험도가 높고, 기록이 없으면 계절/시간대 기본 위험도"""
+        index = make_index(prior_years=1.0)
+        empty = index.risk(np.array([HOTSPOT[0]]), np.array([HOTSPOT[1]]), SPRING)
+        assert empty["risk_score"][0] == pytest.approx(0.3)
+        assert empty["seasonal_risk"][0] == pytest.approx(0.3) and empty["time_risk"][0] == pytest.approx(0.3)
+        autumn_night = index.lookup(*QUIET, datetime(2024, 10, 5, 2, 0, tzinfo=KST))
+        assert autumn_night["risk_score"] == pytest.approx(0.25) and autumn_night["incident_count"] == 0
+
+        for lat, lng, when in history():
+            index.record(lat, lng, when)
+        now = datetime(2024, 4, 5, 14, 30, tzinfo=KST)
+        risk = index.risk(np.array([HOTSPOT[0], QUIET[0], 37.0, math.nan]), np.array([HOTSPOT[1], QUIET[1], 127.0, math.nan]), now)
+        hotspot, quiet, never, unknown = risk["risk_score"]
+        assert hotspot > quiet > never > 0.0
+        assert 0.0 < unknown < hotspot
+        assert risk["incident_count"][0] == 30
+
+        # 연간 건수 기준: 10년간 30건, 거의 모두 4월 14시 (월/시 비율과 연간 건수 모두 기본 위험도 쪽으로 당김)
+        years = (now.timestamp() - index.since) / (365.25 * 86400)
+        prior_slot = index.prior_rates()[0]
+        share = prior_slot[3, 14] / prior_slot.sum()
+        rate = (30 * (30 + 20 * share) / 50 + prior_slot[3, 14]) / (years + 1.0)
+        assert hotspot == pytest.approx(1 - math.exp(-rate / 0.05))
+        # 기록 없는 셀은 기본 위험도를 (연수 + 1) 로 나눈 건수
+        assert never == pytest.approx(1 - math.exp(-prior_slot[3, 14] / (years + 1.0) / 0.05))
+        assert never < empty["risk_score"][0] < hotspot
+
+        night = index.risk(np.array([HOTSPOT[0]]), np.array([HOTSPOT[1]]), datetime(2024, 4, 5, 2, 0, tzinfo=KST))
+        winter = index.risk(np.array([HOTSPOT[0]]), np.array([HOTSPOT[1]]), datetime(2024, 1, 5, 14, 0, tzinfo=KST))
+        assert night["risk_score"][0] < hotspot and winter["risk_score"][0] < hotspot
+        assert winter["time_risk"][0] > night["time_risk"][0]
+        assert night["seasonal_risk"][0] > winter["seasonal_risk"][0]
+
+    def test_save_and_load(self, tmp_path):
+        """저장한 지수를 그대로 불러오고, 파일이 없으면 빈 지수"""
+        path = tmp_path / "index.npz"
+        index = make_index(path=str(path))
+        for lat, lng, when in history():
+            index.record(lat, lng, when)
+        index.save()
+        assert not index.dirty
+
+        loaded = HistoricalFireIndex.load(str(path))
+        np.testing.assert_array_equal(loaded.counts, index.counts)
+        np.testing.assert_array_equal(loaded.last_incident, index.last_incident)
+        assert loaded.since == index.since and loaded.total == index.total
+        # 재시작 직후 이어진 탐지를 다시 세지 않음
+        assert not loaded.record(*HOTSPOT, datetime(2023, 4, 17, 20, 0, tzinfo=KST))
+
+        empty = HistoricalFireIndex.load(str(tmp_path / "missing.npz"))
+        assert empty.total == 0 and empty.since is None
+
+    @pytest.mark.asyncio
+    async def test_service_uses_index_per_location(self):
+        """일괄 분석은 지점별 과거 위험도를 사용하고 단일 분석과 같음, 지역 위험도는 지역 위치로 조회"""
+        service = RiskAnalysisService()
+        service.historical_index = make_index()
+        for lat, lng, when in history():
+            service.historical_index.record(lat, lng, when)
+        service.weather_service.get_current_weather = AsyncMock(return_value=None)
+        locations = [{"lat": HOTSPOT[0], "lng": HOTSPOT[1]}, {"lat": QUIET[0], "lng": QUIET[1]}]
+        columns = SensorColumns.from_readings([])
+
+        batch = await service.analyze_fire_risk_batch(columns, locations, 5.0)
+        single = [await service.analyze_fire_risk(columns, location) for location in locations]
+        for summary, result in zip(batch, single):
+            assert summary["historical_risk"] == pytest.approx(result["historical_risk"]["risk_score"])
+            assert summary["overall_risk"] == pytest.approx(summary["historical_risk"] * 0.1)
+        assert batch[0]["historical_risk"] >= batch[1]["historical_risk"]
+        assert single[0]["historical_risk"]["incident_count"] == 30
+
+        tracker = RegionRiskTracker(window_seconds=600, halflife_seconds=60, risk_service=service)
+        tracker.observe("hotspot", [SensorReading("temp_1", SensorType.TEMPERATURE, *HOTSPOT, temperature=20.0)], now=0.0)
+        await tracker.refresh_weather("hotspot", locations[0])
+        assert tracker.risk("hotspot", now=1.0)["historical_risk"] == pytest.approx(batch[0]["historical_risk"])
@@ -0,0 +1,90 @@
+"""
+최근 정상값 캐시 테스트
+"""
+
+import pytest
+import asyncio
+from backend.app.services.last_known_good import LastKnownGoodStore
+
+class TestLastKnownGoodStore:
+    """최근 정상값 저장소 테스트 클래스"""
+    
+    @pytest.fixture
+    def store(self):
+        """응답 대기 한도 0.05초 저장소"""
+        return LastKnownGoodStore(max_staleness_seconds=60, refresh_timeout_seconds=0.05)
+    
+    @pytest.mark.asyncio
+    async def test_fresh_fetch(self, store):
+        """캐시가 없으면 업스트림 결과를 그대로 반환"""
+        async def fetcher():
+            return {"temperature": 25.0}
+        
+        value, staleness = await store.get("weather", (60, 127), fetcher)
+        
+        assert value == {"temperature": 25.0}
+        assert staleness == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_serves_last_known_good_on_failure(self, store):
+        """업스트림 실패 시 마지막 정상값과 경과 시간 반환"""
+        async def ok():
+            return [1, 2, 3]
+        
+        async def failing():
+            return None
+        
+        await store.get("iot_sensors", "yongmun", ok)
+        value, staleness = await store.get("iot_sensors", "yongmun", failing)
+        
+        assert value == [1, 2, 3]
+        assert staleness is not None and staleness >= 0
+    
+    @pytest.mark.asyncio
+    async def test_slow_upstream_refreshes_in_background(self, store):
+        """느린 업스트림은 캐시를 먼저 반환하고 백그라운드에서 갱신"""
+        async def ok():
+            return "old"
+        
+        async def slow():
+            await asyncio.sleep(0.2)
+            return "new"
+        
+        await store.get("cctv", "yongmun", ok)
+        value, staleness = await store.get("cctv", "yongmun", slow)
+        assert value == "old"
+        
+        await asyncio.sleep(0.25)
+        assert store.peek("cctv", "yongmun").value == "new"
+    
+    @pytest.mark.asyncio
+    async def test_fresh_window_skips_upstream(self, store):
+        """fresh_seconds 이내에는 업스트림을 호출하지 않음"""
+        calls = []
+        
+        async def fetcher():
+            calls.append(1)
+            return "value"
+        
+        await store.get("weather", (60, 127), fetcher, fresh_seconds=600)
+        await store.get("weather", (60, 127), fetcher, fresh_seconds=600)
+        
+        assert len(calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_too_stale_is_dropped(self):
+        """최대 허용 경과 시간을 넘은 데이터는 사용하지 않음"""
+        store = LastKnownGoodStore(max_staleness_seconds=0.0, refresh_timeout_seconds=0.05)
+        
+        async def ok():
+            return "value"
+        
+        async def failing():
+            return None
+        
+        await store.get("weather", (60, 127), ok)
+        await asyncio.sleep(0.01)
+        value, staleness = await store.get("weather", (60, 127), failing)
+        
+        assert value is None
+        assert staleness is None
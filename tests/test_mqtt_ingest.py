@@ -0,0 +1,139 @@
+"""
+MQTT 센서 데이터 수신 테스트
+"""
+
+import pytest
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from backend.app.services.mqtt_ingest import MqttIngestService
+
+class LocalBrokerClient:
+    """paho 클라이언트를 대신하는 로컬 브로커 (별도 스레드에서 콜백 호출)"""
+    
+    def __init__(self, client_id):
+        self.client_id = client_id
+        self.subscriptions = []
+        self.on_connect = None
+        self.on_message = None
+        self.running = False
+    
+    def username_pw_set(self, username, password):
+        pass
+    
+    def connect_async(self, host, port):
+        self.address = (host, port)
+    
+    def loop_start(self):
+        self.running = True
+        threading.Thread(target=self.on_connect, args=(self, None, {}, 0)).start()
+    
+    def loop_stop(self):
+        self.running = False
+    
+    def disconnect(self):
+        pass
+    
+    def subscribe(self, topic, qos=0):
+        self.subscriptions.append(topic)
+    
+    def publish(self, topic, payload):
+        message = SimpleNamespace(topic=topic, payload=json.dumps(payload).encode())
+        threading.Thread(target=self.on_message, args=(self, None, message)).start()
+
+class FakeBuffer:
+    def __init__(self):
+        self.items = []
+    
+    async def put(self, reading):
+        self.items.append(reading)
+    
+    def start(self):
+        pass
+
+class TestMqttIngestService:
+    """MQTT 수신 서비스 테스트 클래스"""
+    
+    @pytest.mark.asyncio
+    async def test_published_readings_reach_buffer_and_subscribers(self):
+        """발행된 측정값이 1초 이내에 저장 경로와 구독자에 전달"""
+        clients = []
+        def factory(client_id):
+            clients.append(LocalBrokerClient(client_id))
+            return clients[-1]
+        
+        buffer = FakeBuffer()
+        service = MqttIngestService(
+            broker_url="mqtt://broker:1883", topic="forest_fire/sensors/#",
+            buffer=buffer, batch_interval_seconds=0.05, client_factory=factory
+        )
+        batches = []
+        async def on_batch(readings):
+            batches.append(readings)
+        service.subscribe(on_batch)
+        
+        await service.start()
+        await asyncio.sleep(0.05)
+        client = clients[0]
+        assert client.address == ("broker", 1883)
+        assert client.subscriptions == ["forest_fire/sensors/#"]
+        
+        published_at = time.monotonic()
+        client.publish("forest_fire/sensors/s0001", {
+            "type": "temperature", "lat": 37.5, "lng": 127.9, "temperature": 31.5
+        })
+        client.publish("forest_fire/sensors/bulk", [
+            {"id": "s0002", "type": "smoke_density", "lat": 37.5, "lng": 127.9, "smoke_density": 12.0},
+            {"id": "s0003", "type": "unknown", "lat": 37.5, "lng": 127.9}
+        ])
+        
+        while len(buffer.items) < 2 and time.monotonic() - published_at < 1.0:
+            await asyncio.sleep(0.01)
+        await service.stop()
+        
+        assert time.monotonic() - published_at < 1.0
+        assert sorted(r.sensor_id for r in buffer.items) == ["iot_s0001", "iot_s0002"]
+        assert sum(len(batch) for batch in batches) == 2
+    
+    @pytest.mark.asyncio
+    async def test_stop_finishes_batch_in_progress(self):
+        """묶음을 모으거나 처리하는 중에 중지해도 이미 꺼낸 메시지는 모두 처리"""
+        clients = []
+        def factory(client_id):
+            clients.append(LocalBrokerClient(client_id))
+            return clients[-1]
+        
+        buffer = FakeBuffer()
+        service = MqttIngestService(buffer=buffer, batch_size=2, batch_interval_seconds=10.0, client_factory=factory)
+        handled = []
+        async def slow_subscriber(readings):
+            await asyncio.sleep(0.1)
+            handled.extend(readings)
+        service.subscribe(slow_subscriber)
+        
+        await service.start()
+        for i in range(3):
+            clients[0].publish(f"forest_fire/sensors/s{i:04d}", {
+                "type": "temperature", "lat": 37.5, "lng": 127.9, "temperature": 20.0 + i
+            })
+        # 첫 묶음(2개)은 구독자 처리 중, 세 번째는 다음 묶음을 모으는 중
+        while len(buffer.items) < 2 or not service._queue.empty():
+            await asyncio.sleep(0.01)
+        await service.stop()
+        
+        assert sorted(r.sensor_id for r in buffer.items) == ["iot_s0000", "iot_s0001", "iot_s0002"]
+        assert sorted(r.sensor_id for r in handled) == ["iot_s0000", "iot_s0001", "iot_s0002"]
+    
+    @pytest.mark.asyncio
+    async def test_validate_skips_invalid_payloads(self):
+        """해석할 수 없거나 범위를 벗어난 항목은 제외"""
+        service = MqttIngestService(buffer=FakeBuffer(), client_factory=LocalBrokerClient)
+        readings = await service.validate([
+            ("forest_fire/sensors/a", b"not-json"),
+            ("forest_fire/sensors/b", json.dumps({"type": "humidity", "lat": 37.5, "lng": 127.9, "humidity": 150}).encode()),
+            ("forest_fire/sensors/c", json.dumps({"type": "humidity", "lat": 37.5, "lng": 127.9, "humidity": 40}).encode())
+        ])
+        
+        assert [r.sensor_id for r in readings] == ["iot_c"]
@@ -0,0 +1,62 @@
+"""
+업스트림 호출 한도 관리 테스트
+"""
+
+import pytest
+import asyncio
+from backend.app.services.rate_limiter import CallPriority, TokenBucket, UpstreamRateLimiter
+
+class TestUpstreamRateLimiter:
+    """업스트림 호출 제어기 테스트 클래스"""
+    
+    @pytest.fixture
+    def limiter(self):
+        """초당 20회, 버스트 1회 한도의 호출 제어기"""
+        return UpstreamRateLimiter(
+            limits={"kt_gigai": {"rate": 20.0, "burst": 1}},
+            backend="local"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_token_bucket_wait_time(self):
+        """토큰 부족 시 대기 시간 반환 테스트"""
+        bucket = TokenBucket(rate=10.0, capacity=1)
+        
+        assert await bucket.try_acquire() == 0.0
+        wait = await bucket.try_acquire()
+        assert 0 < wait <= 0.1
+    
+    @pytest.mark.asyncio
+    async def test_unknown_upstream_not_limited(self, limiter):
+        """한도가 없는 업스트림은 대기하지 않음"""
+        assert await limiter.acquire("unknown") == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_fire_priority_goes_first(self, limiter):
+        """화재 탐지 지역 호출이 먼저 처리되는지 테스트"""
+        order = []
+        
+        async def call(name, priority):
+            await limiter.acquire("kt_gigai", priority)
+            order.append(name)
+        
+        # 버스트 소진
+        await limiter.acquire("kt_gigai")
+        
+        tasks = [
+            asyncio.create_task(call("low", CallPriority.LOW)),
+            asyncio.create_task(call("normal", CallPriority.NORMAL)),
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("fire", CallPriority.FIRE)))
+        await asyncio.gather(*tasks)
+        
+        assert order == ["fire", "normal", "low"]
+    
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_pauses_upstream(self, limiter):
+        """429 응답 후 Retry-After 동안 호출 보류 테스트"""
+        await limiter.report_quota_exceeded("kt_gigai", "0.2")
+        
+        waited = await limiter.acquire("kt_gigai")
+        assert waited >= 0.15
@@ -0,0 +1,98 @@
+"""
+권고안 생성 파이프라인 테스트
+"""
+
+import pytest
+import asyncio
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.recommendation_pipeline import RecommendationPipeline
+
+class FakeCollectionService:
+    async def collect_all_data(self, location, radius_km):
+        return [SensorReading("iot_1", SensorType.TEMPERATURE, location["lat"], location["lng"], temperature=20.0)]
+
+class FakeRiskService:
+    async def analyze_fire_risk(self, sensor_data, location):
+        return {"overall_risk": 0.5}
+
+class SlowAIService:
+    """처리 중인 작업 수를 기록하는 느린 권고안 생성 서비스"""
+    
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+    
+    async def generate_recommendations(self, sensor_data, fire_risk_level, location):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if location["lat"] < 0:
+            raise ValueError("잘못된 위치")
+        return [f"rec-{location['lat']}"]
+
+class TestRecommendationPipeline:
+    """권고안 생성 파이프라인 테스트 클래스"""
+    
+    def make_pipeline(self, ai_service, recommend_workers=1, queue_size=2):
+        persisted = []
+        
+        def persist(recommendations):
+            persisted.extend(recommendations)
+            return recommendations
+        
+        pipeline = RecommendationPipeline(
+            FakeCollectionService(), FakeRiskService(), ai_service,
+            persist=persist,
+            workers={"collect": 2, "risk": 2, "recommend": recommend_workers, "persist": 1},
+            queue_size=queue_size
+        )
+        return pipeline, persisted
+    
+    @pytest.mark.asyncio
+    async def test_submit_runs_all_stages(self):
+        """수집 → 위험도 → 권고안 → 저장 순서로 처리"""
+        pipeline, persisted = self.make_pipeline(SlowAIService(0))
+        result = await pipeline.submit({"lat": 1.0, "lng": 2.0})
+        await pipeline.stop()
+        
+        assert result == ["rec-1.0"]
+        assert persisted == ["rec-1.0"]
+    
+    @pytest.mark.asyncio
+    async def test_stage_error_fails_only_that_job(self):
+        """단계 실패는 해당 요청에만 전달"""
+        pipeline, persisted = self.make_pipeline(SlowAIService(0))
+        bad, good = await asyncio.gather(
+            pipeline.submit({"lat": -1.0, "lng": 2.0}),
+            pipeline.submit({"lat": 3.0, "lng": 2.0}),
+            return_exceptions=True
+        )
+        await pipeline.stop()
+        
+        assert isinstance(bad, ValueError)
+        assert good == ["rec-3.0"]
+    
+    @pytest.mark.asyncio
+    async def test_slow_stage_applies_backpressure(self):
+        """느린 단계의 작업자 수와 대기열 크기만큼만 작업이 쌓임"""
+        ai_service = SlowAIService(0.05)
+        pipeline, persisted = self.make_pipeline(ai_service, recommend_workers=1, queue_size=2)
+        
+        jobs = [
+            asyncio.create_task(pipeline.submit({"lat": float(i), "lng": 0.0}))
+            for i in range(10)
+        ]
+        await asyncio.sleep(0.02)
+        stages = {stage.name: stage for stage in pipeline._stages}
+        assert stages["recommend"].queue.qsize() <= 2
+        assert stages["collect"].queue.qsize() <= 2
+        
+        results = await asyncio.gather(*jobs)
+        await pipeline.stop()
+        
+        assert ai_service.max_active == 1
+        assert sorted(r[0] for r in results) == sorted(f"rec-{float(i)}" for i in range(10))
+        assert len(persisted) == 10
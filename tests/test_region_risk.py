@@ -0,0 +1,129 @@
+"""
+지역별 실시간 위험도 상태 테스트
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, patch
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.region_risk import RegionRiskTracker, RollingStat
+from backend.app.services.risk_analysis_service import RiskAnalysisService
+
+WEATHER = {"temperature": 30.0, "humidity": 20.0, "wind_speed": 10.0}
+
+def make_snapshot():
+    return [
+        SensorReading("cctv_1", SensorType.CCTV, 37.50, 127.90, fire_detected=True, fire_confidence=0.9, data_quality=0.8),
+        SensorReading("cctv_2", SensorType.CCTV, 37.51, 127.91, fire_detected=True, fire_confidence=None),
+        SensorReading("iot_1", SensorType.TEMPERATURE, 37.52, 127.92, temperature=31.0, humidity=22.0, visibility=3.0),
+        SensorReading("iot_2", SensorType.SMOKE_DENSITY, 37.53, 127.93, temperature=27.0, smoke_density=40.0, data_quality=0.0),
+        SensorReading("iot_3", SensorType.WIND_SPEED, 37.54, 127.94, wind_speed=4.0, wind_direction=350.0),
+        SensorReading("iot_4", SensorType.WIND_SPEED, 37.55, 127.95, wind_speed=6.0, wind_direction=10.0)
+    ]
+
+class TestRollingStat:
+    """이동 구간 집계 테스트 클래스"""
+    
+    def test_matches_brute_force_window(self):
+        """추가/만료 후 개수/평균/최솟값/최댓값은 구간 내 값 전수 계산과 같음"""
+        rng = np.random.default_rng(0)
+        stat = RollingStat(window_seconds=10.0, halflife_seconds=5.0)
+        times = np.cumsum(rng.uniform(0, 1, 500))
+        values = rng.normal(0, 10, 500)
+        
+        for i, (at, value) in enumerate(zip(times, values)):
+            stat.push(at, value)
+            stat.expire(at)
+            window = values[:i + 1][times[:i + 1] >= at - 10.0]
+            assert stat.count == len(window)
+            assert stat.mean == pytest.approx(window.mean())
+            assert stat.min == window.min()
+            assert stat.max == window.max()
+    
+    def test_ewma_halflife(self):
+        """반감기가 지난 값은 가중치 절반, 같은 시각의 값은 단순 평균"""
+        stat = RollingStat(window_seconds=100.0, halflife_seconds=5.0)
+        stat.push(0.0, 10.0)
+        stat.push(5.0, 20.0)
+        assert stat.ewma == pytest.approx((10.0 * 0.5 + 20.0) / 1.5)
+        
+        stat.push(5.0, 30.0)
+        assert stat.ewma == pytest.approx((10.0 * 0.5 + 20.0 + 30.0) / 2.5)
+    
+    def test_empty_after_expiry(self):
+        """모든 값이 만료되면 NaN"""
+        stat = RollingStat(window_seconds=10.0, halflife_seconds=5.0)
+        stat.push(0.0, 1.0)
+        
+        assert stat.expire(11.0)
+        assert stat.count == 0
+        assert np.isnan(stat.mean) and np.isnan(stat.max)
+
+class TestRegionRiskTracker:
+    """지역별 실시간 위험도 테스트 클래스"""
+    
+    @pytest.mark.asyncio
+    async def test_matches_full_analysis_for_snapshot(self):
+        """구간 안에 센서별 측정값이 하나씩 있으면 전체 목록 분석과 같은 위험도"""
+        risk_service = RiskAnalysisService()
+        tracker = RegionRiskTracker(window_seconds=600, halflife_seconds=60, risk_service=risk_service)
+        snapshot = make_snapshot()
+        
+        with patch.object(risk_service.weather_service, 'get_current_weather', AsyncMock(return_value=WEATHER)):
+            single = await risk_service.analyze_fire_risk(snapshot, {"lat": 37.5, "lng": 127.9})
+            tracker.observe("A", snapshot, now=0.0)
+            await tracker.refresh_weather("A", {"lat": 37.5, "lng": 127.9})
+        
+        risk = tracker.risk("A", now=1.0)
+        assert risk["overall_risk"] == pytest.approx(single["overall_risk"])
+        assert risk["risk_level"] == single["risk_level"]
+        assert risk["fire_detection_risk"] == pytest.approx(single["fire_detection_risk"]["risk_score"])
+        assert risk["environmental_risk"] == pytest.approx(single["environmental_risk"]["risk_score"])
+        assert risk["weather_risk"] == pytest.approx(single["weather_risk"]["risk_score"])
+        assert risk["confidence"] == pytest.approx(single["confidence"])
+        difference = abs(risk["spread_direction"] - single["spread_prediction"]["spread_direction"]) % 360
+        assert min(difference, 360 - difference) == pytest.approx(0.0, abs=1e-6)
+        assert risk["trends"]["temperature"] == pytest.approx(29.0)
+    
+    def test_readings_expire_from_window(self):
+        """구간이 지난 측정값은 위험도에서 제외"""
+        tracker = RegionRiskTracker(window_seconds=60, halflife_seconds=30, risk_service=RiskAnalysisService())
+        tracker.observe("A", make_snapshot(), now=0.0)
+        assert tracker.risk("A", now=30.0)["sensor_count"] == 6
+        
+        tracker.observe("A", [SensorReading("iot_9", SensorType.TEMPERATURE, 37.5, 127.9, temperature=20.0)], now=50.0)
+        risk = tracker.risk("A", now=61.0)
+        
+        assert risk["sensor_count"] == 1
+        assert risk["detection_count"] == 0
+        assert risk["environmental_risk"] == 0.0
+    
+    def test_detection_cleared_by_latest_reading(self):
+        """센서의 최근 측정값이 탐지 해제이면 탐지 수에서 제외"""
+        tracker = RegionRiskTracker(window_seconds=600, halflife_seconds=60, risk_service=RiskAnalysisService())
+        tracker.observe("A", make_snapshot(), now=0.0)
+        assert tracker.risk("A", now=1.0)["detection_count"] == 2
+        
+        tracker.observe("A", [SensorReading("cctv_1", SensorType.CCTV, 37.50, 127.90, fire_detected=False)], now=2.0)
+        risk = tracker.risk("A", now=3.0)
+        
+        assert risk["detection_count"] == 1
+        assert risk["sensor_count"] == 6
+    
+    def test_risk_cached_until_state_changes(self):
+        """상태가 그대로면 재산출 없이 같은 결과"""
+        tracker = RegionRiskTracker(window_seconds=600, halflife_seconds=60, risk_service=RiskAnalysisService())
+        tracker.observe("A", make_snapshot(), now=0.0)
+        tracker.observe("B", make_snapshot()[:1], now=0.0)
+        
+        first = tracker.risk("A", now=1.0)
+        assert tracker.risk("A", now=2.0) is first
+        
+        tracker.observe("A", [SensorReading("iot_9", SensorType.SMOKE_DENSITY, 37.5, 127.9, smoke_density=90.0)], now=3.0)
+        risks = tracker.risk_all(now=4.0)
+        
+        assert risks["A"] is not first
+        assert risks["A"]["environmental_risk"] > first["environmental_risk"]
+        assert set(risks) == {"A", "B"}
+        assert tracker.risk("unknown") is None
@@ -0,0 +1,158 @@
+"""
+다지점 위험도 일괄 분석 테스트
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, patch
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.risk_analysis_service import RiskAnalysisService, SensorColumns
+from backend.app.services.risk_batch import assign_sensors, collect_snapshot
+from backend.app.services.spatial_index import KM_PER_DEG_LAT
+
+TYPES = [SensorType.CCTV, SensorType.TEMPERATURE, SensorType.HUMIDITY, SensorType.SMOKE_DENSITY, SensorType.WIND_SPEED]
+
+def make_readings(count: int, seed: int = 0):
+    """여러 지점에 흩어진 센서 데이터 (값 일부 누락)"""
+    rng = np.random.default_rng(seed)
+    readings = []
+    for i in range(count):
+        missing = rng.random(6) < 0.3
+        fire = bool(rng.random() < 0.1)
+        readings.append(SensorReading(
+            f"sensor_{i}",
+            TYPES[i % len(TYPES)],
+            float(rng.uniform(37.3, 37.7)),
+            float(rng.uniform(127.3, 127.7)),
+            temperature=None if missing[0] else float(rng.normal(28, 6)),
+            humidity=None if missing[1] else float(rng.uniform(10, 80)),
+            smoke_density=None if missing[2] else float(rng.exponential(20)),
+            visibility=None if missing[3] else float(rng.uniform(0, 10)),
+            wind_speed=None if missing[4] else float(rng.uniform(0, 15)),
+            wind_direction=None if missing[5] else float(rng.uniform(0, 360)),
+            fire_detected=fire,
+            fire_confidence=float(rng.uniform(0.5, 1.0)) if fire and rng.random() < 0.8 else None,
+            data_quality=None if rng.random() < 0.2 else float(rng.uniform(0.5, 1.0))
+        ))
+    return readings
+
+def brute_force(columns, location, radius_km):
+    dy = (columns.location_lat - location["lat"]) * KM_PER_DEG_LAT
+    dx = (columns.location_lng - location["lng"]) * KM_PER_DEG_LAT * np.cos(np.radians(location["lat"]))
+    return np.flatnonzero(dx * dx + dy * dy <= radius_km * radius_km)
+
+LOCATIONS = [
+    {"lat": 37.40, "lng": 127.40},
+    {"lat": 37.50, "lng": 127.50},
+    {"lat": 37.501, "lng": 127.501},
+    {"lat": 37.65, "lng": 127.62},
+    {"lat": 36.00, "lng": 126.00}
+]
+
+WEATHER = {"temperature": 30.0, "humidity": 20.0, "wind_speed": 10.0}
+
+class TestRiskBatch:
+    """다지점 위험도 일괄 분석 테스트 클래스"""
+    
+    def test_assign_sensors_matches_brute_force(self):
+        """정렬 + 이진 탐색 배정은 전수 거리 계산과 같음"""
+        columns = SensorColumns.from_readings(make_readings(500))
+        lats = np.array([loc["lat"] for loc in LOCATIONS])
+        lngs = np.array([loc["lng"] for loc in LOCATIONS])
+        
+        group, sensors = assign_sensors(columns, lats, lngs, 5.0)
+        
+        for i, location in enumerate(LOCATIONS):
+            assert sorted(sensors[group == i].tolist()) == brute_force(columns, location, 5.0).tolist()
+        assert not (group == 4).any()
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_location_analysis(self):
+        """지점별 결과는 반경 내 센서로 analyze_fire_risk 를 호출한 결과와 같음"""
+        risk_service = RiskAnalysisService()
+        columns = SensorColumns.from_readings(make_readings(500))
+        
+        with patch.object(risk_service.weather_service, 'get_current_weather', AsyncMock(return_value=WEATHER)):
+            results = await risk_service.analyze_fire_risk_batch(columns, LOCATIONS, 5.0)
+            
+            assert len(results) == len(LOCATIONS)
+            for location, result in zip(LOCATIONS, results):
+                subset = columns.subset(brute_force(columns, location, 5.0))
+                single = await risk_service.analyze_fire_risk(subset, location)
+                
+                assert result["sensor_count"] == len(subset)
+                assert result["overall_risk"] == pytest.approx(single["overall_risk"])
+                assert result["risk_level"] == single["risk_level"]
+                assert result["fire_detection_risk"] == pytest.approx(single["fire_detection_risk"]["risk_score"])
+                assert result["environmental_risk"] == pytest.approx(single["environmental_risk"]["risk_score"])
+                assert result["weather_risk"] == pytest.approx(single["weather_risk"]["risk_score"])
+                assert result["detection_count"] == single["fire_detection_risk"]["detection_count"]
+                assert result["confidence"] == pytest.approx(single["confidence"])
+                assert result["affected_radius"] == pytest.approx(single["spread_prediction"]["affected_radius"])
+                if single["spread_prediction"]["spread_direction"] is None:
+                    assert result["spread_direction"] is None
+                else:
+                    assert result["spread_direction"] == pytest.approx(single["spread_prediction"]["spread_direction"])
+    
+    @pytest.mark.asyncio
+    async def test_weather_fetched_once_per_grid_cell(self):
+        """같은 기상청 격자의 지점은 날씨 조회를 공유"""
+        risk_service = RiskAnalysisService()
+        columns = SensorColumns.from_readings(make_readings(50))
+        cells = {risk_service.weather_service.grid_cell(loc["lat"], loc["lng"]) for loc in LOCATIONS}
+        
+        with patch.object(risk_service.weather_service, 'get_current_weather', AsyncMock(return_value=WEATHER)) as mock_weather:
+            await risk_service.analyze_fire_risk_batch(columns, LOCATIONS, 5.0)
+        
+        assert len(cells) < len(LOCATIONS)
+        assert mock_weather.await_count == len(cells)
+    
+    @pytest.mark.asyncio
+    async def test_location_without_sensors(self):
+        """반경 내 센서가 없는 지점은 날씨/과거 위험도만 반영"""
+        risk_service = RiskAnalysisService()
+        columns = SensorColumns.from_readings(make_readings(50))
+        
+        with patch.object(risk_service.weather_service, 'get_current_weather', AsyncMock(return_value=None)):
+            [result] = await risk_service.analyze_fire_risk_batch(columns, [LOCATIONS[-1]], 5.0)
+        
+        assert result["sensor_count"] == 0
+        assert result["fire_detection_risk"] == 0.0
+        assert result["environmental_risk"] == 0.0
+        assert result["confidence"] == 0.0
+        assert result["spread_direction"] is None
+        assert result["overall_risk"] == pytest.approx(result["historical_risk"] * 0.1)
+    
+    @pytest.mark.asyncio
+    async def test_collect_snapshot_merges_queries(self):
+        """겹치는 지점은 한 번에 조회하고 중복 센서는 하나만 남김"""
+        readings = make_readings(20)
+        collector = AsyncMock()
+        collector.collect_all_data.return_value = readings
+        
+        snapshot = await collect_snapshot(collector, LOCATIONS[1:3], 5.0)
+        
+        assert collector.collect_all_data.await_count == 1
+        assert len(snapshot) == len(readings)
+        
+        # 떨어진 지점은 따로 조회하고, 조회 위치마다 같은 ID 로 만들어지는 기상 측정값은 모두 유지
+        async def collect_all_data(location, radius_km):
+            weather = [
+                SensorReading("weather_temp", SensorType.TEMPERATURE, location["lat"], location["lng"], temperature=30.0),
+                SensorReading("weather_wind", SensorType.WIND_SPEED, location["lat"], location["lng"], wind_speed=5.0)
+            ]
+            return readings + weather
+        collector = AsyncMock()
+        collector.collect_all_data.side_effect = collect_all_data
+        
+        snapshot = await collect_snapshot(collector, [LOCATIONS[0], LOCATIONS[3]], 5.0)
+        
+        assert collector.collect_all_data.await_count == 2
+        assert len(snapshot) == len(readings) + 4
+        columns = SensorColumns.from_readings(snapshot)
+        for location in (LOCATIONS[0], LOCATIONS[3]):
+            nearby = brute_force(columns, location, 0.5)
+            assert sorted(columns.sensor_ids[i] for i in nearby if columns.sensor_ids[i].startswith("weather_")) == [
+                "weather_temp", "weather_wind"
+            ]
@@ -0,0 +1,114 @@
+"""
+위험도 분석 결과 메모이제이션 테스트
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.risk_analysis_service import RiskAnalysisService, SensorColumns
+from backend.app.services.risk_memo import RiskMemo, snapshot_fingerprint
+
+LOCATION = {"lat": 37.5662, "lng": 126.9781}
+WEATHER = {"temperature": 30.2, "humidity": 20.0, "wind_speed": 8.1}
+
+def make_snapshot(temperature: float = 35.0):
+    return [
+        SensorReading("cctv_1", SensorType.CCTV, 37.5665, 126.9780, fire_detected=True, fire_confidence=0.85),
+        SensorReading("temp_1", SensorType.TEMPERATURE, 37.5670, 126.9785, temperature=temperature, humidity=25.0),
+        SensorReading("wind_1", SensorType.WIND_SPEED, 37.5660, 126.9775, wind_speed=6.0, wind_direction=45.0)
+    ]
+
+def fingerprint(readings, weather=WEATHER, location=LOCATION, extra=()):
+    return snapshot_fingerprint(
+        SensorColumns.from_readings(readings), weather, location, extra,
+        value_decimals=2, location_deg=0.001
+    )
+
+class TestRiskMemo:
+    """위험도 분석 결과 메모이제이션 테스트 클래스"""
+
+    def test_fingerprint_quantization(self):
+        """센서 순서와 양자화 단위 안의 차이는 무시하고, 그 밖의 입력 변화는 구분"""
+        base = fingerprint(make_snapshot())
+        assert fingerprint(make_snapshot()[::-1]) == base
+        assert fingerprint(make_snapshot(35.001)) == base
+        assert fingerprint(make_snapshot(35.1)) != base
+        assert fingerprint(make_snapshot()[:2]) != base
+
+        assert fingerprint(make_snapshot(), {**WEATHER, "temperature": 30.1}) == base
+        assert fingerprint(make_snapshot(), {**WEATHER, "temperature": 31.0}) != base
+        assert fingerprint(make_snapshot(), None) != base
+
+        assert fingerprint(make_snapshot(), location={"lat": 37.5664, "lng": 126.9779}) == base
+        assert fingerprint(make_snapshot(), location={"lat": 37.5685, "lng": 126.9780}) != base
+        assert fingerprint(make_snapshot(), extra=(("fire_detection", 0.5),)) != base
+
+        assert fingerprint([]) == fingerprint([])
+
+    def test_lru_eviction_and_hit_rate(self):
+        """최근 사용 순으로 max_entries 개만 유지, 조회 결과는 복사본"""
+        memo = RiskMemo(max_entries=2)
+        stored = {"overall_risk": 0.1, "weather_risk": {"risk_score": 0.5}}
+        memo.put("a", stored)
+        stored["weather_risk"]["risk_score"] = 0.0
+        memo.put("b", {"overall_risk": 0.2})
+        assert memo.get("a") == {"overall_risk": 0.1, "weather_risk": {"risk_score": 0.5}}
+        memo.put("c", {"overall_risk": 0.3})
+        assert memo.get("b") is None
+        assert len(memo) == 2
+
+        cached = memo.get("a")
+        cached["overall_risk"] = 0.9
+        cached["weather_risk"]["risk_score"] = 0.9
+        assert memo.get("a") == {"overall_risk": 0.1, "weather_risk": {"risk_score": 0.5}}
+        assert memo.hits == 3 and memo.misses == 1
+        assert memo.hit_rate == pytest.approx(0.75)
+
+        disabled = RiskMemo(max_entries=0)
+        disabled.put("a", {})
+        assert disabled.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_uses_cache(self):
+        """같은 입력의 반복 분석은 캐시 결과를 반환하고, 입력이나 가중치가 바뀌면 다시 분석"""
+        service = RiskAnalysisService()
+        service.risk_memo = RiskMemo(max_entries=8)
+        service.weather_service.get_current_weather = AsyncMock(return_value=WEATHER)
+
+        with patch.object(service, "_analyze_fire_detection", wraps=service._analyze_fire_detection) as detection:
+            first = await service.analyze_fire_risk(make_snapshot(), LOCATION)
+            for _ in range(4):
+                again = await service.analyze_fire_risk(make_snapshot()[::-1], dict(LOCATION))
+                assert again["overall_risk"] == first["overall_risk"]
+                assert again["spread_prediction"] == first["spread_prediction"]
+            assert detection.call_count == 1
+            assert service.risk_memo.hits == 4
+
+            # 캐시 결과도 분석 시각과 날씨(수신 시각 포함)는 이번 조회 값
+            fresh_weather = {**WEATHER, "staleness_seconds": 0.0}
+            service.weather_service.get_current_weather = AsyncMock(return_value=fresh_weather)
+            again = await service.analyze_fire_risk(make_snapshot(), LOCATION)
+            assert again["analysis_timestamp"] > first["analysis_timestamp"]
+            assert again["weather_risk"]["weather_data"] is fresh_weather
+
+            # 반환값(중첩 값 포함)을 고쳐도 캐시는 그대로
+            again["overall_risk"] = 0.0
+            again["spread_prediction"]["spread_speed"] = -1.0
+            first["spread_prediction"]["affected_radius"] = -1.0
+            cached = await service.analyze_fire_risk(make_snapshot(), LOCATION)
+            assert cached["overall_risk"] != 0.0
+            assert cached["spread_prediction"]["spread_speed"] >= 0.0 and cached["spread_prediction"]["affected_radius"] >= 0.0
+
+            changed = await service.analyze_fire_risk(make_snapshot(44.0), LOCATION)
+            assert changed["environmental_risk"] != first["environmental_risk"]
+            assert detection.call_count == 2
+
+            service.weather_service.get_current_weather = AsyncMock(return_value={**WEATHER, "wind_speed": 15.0})
+            windy = await service.analyze_fire_risk(make_snapshot(), LOCATION)
+            assert windy["weather_risk"]["risk_score"] > first["weather_risk"]["risk_score"]
+
+            service.weights = {**service.weights, "fire_detection": 0.5}
+            reweighted = await service.analyze_fire_risk(make_snapshot(), LOCATION)
+            assert reweighted["overall_risk"] > windy["overall_risk"]
+            assert detection.call_count == 4
@@ -0,0 +1,127 @@
+"""
+위험도 지도 타일 테스트
+"""
+
+import math
+import pytest
+import cv2
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from backend.app.api.v1.endpoints import risk as risk_endpoints
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.collection_scheduler import MonitoredRegion
+from backend.app.services.region_risk import RegionRiskTracker
+from backend.app.services.risk_analysis_service import RiskAnalysisService
+from backend.app.services.risk_tiles import NODATA, RiskTileCache, pixel_centers, tile_range
+
+EAST = MonitoredRegion("east", 37.50, 127.50, radius_km=3.0)
+WEST = MonitoredRegion("west", 37.50, 127.00, radius_km=3.0)
+
+def hot(sensor_id: str, region: MonitoredRegion, temperature: float) -> SensorReading:
+    return SensorReading(sensor_id, SensorType.TEMPERATURE, region.lat, region.lng, temperature=temperature, humidity=10.0)
+
+def make_cache(**kwargs) -> RiskTileCache:
+    tracker = RegionRiskTracker(window_seconds=600, halflife_seconds=60, risk_service=RiskAnalysisService())
+    tracker.observe("east", [hot("t_east", EAST, 40.0)])
+    tracker.observe("west", [hot("t_west", WEST, 30.0)])
+    cache = RiskTileCache(tracker=tracker, min_zoom=kwargs.pop("min_zoom", 9), max_zoom=kwargs.pop("max_zoom", 11), **kwargs)
+    cache.add_regions([EAST, WEST])
+    return cache
+
+def center_tile(region: MonitoredRegion, zoom: int):
+    x_min, x_max, y_min, y_max = tile_range(region.lat, region.lng, 0.0, zoom)
+    return zoom, x_min, y_min
+
+def tiles_of(region: MonitoredRegion, zooms) -> set:
+    tiles = set()
+    for zoom in zooms:
+        x_min, x_max, y_min, y_max = tile_range(region.lat, region.lng, region.radius_km, zoom)
+        tiles.update((zoom, x, y) for x in range(x_min, x_max + 1) for y in range(y_min, y_max + 1))
+    return tiles
+
+class TestRiskTiles:
+    """위험도 지도 타일 테스트 클래스"""
+
+    def test_tile_geometry(self):
+        """타일 범위는 원을 덮고 픽셀 중심은 해당 타일 안"""
+        zoom, x, y = center_tile(EAST, 11)
+        lats, lngs = pixel_centers(zoom, x, y)
+        assert lats[0] > EAST.lat > lats[-1] and lats[0] > lats[-1]
+        assert lngs[0] < EAST.lng < lngs[-1]
+
+        x_min, x_max, y_min, y_max = tile_range(EAST.lat, EAST.lng, EAST.radius_km, 11)
+        assert x_min <= x <= x_max and y_min <= y <= y_max
+        # 11레벨 타일 폭 ≈ 15.6km cos(37.5°) → 반경 3km 원은 최대 2×2 타일
+        assert (x_max - x_min + 1) * (y_max - y_min + 1) <= 4
+
+    @pytest.mark.asyncio
+    async def test_only_changed_tiles_are_rerendered(self):
+        """지역 위험도가 바뀌면 그 지역과 겹치는 타일만 다시 그림"""
+        cache = make_cache()
+        rendered = await cache.refresh()
+        assert rendered == len(cache.tiles) > 0
+        assert await cache.refresh() == 0
+
+        east_tiles = tiles_of(EAST, range(9, 12))
+        before = {key: tile.etag for key, tile in cache.tiles.items()}
+        cache.tracker.observe("east", [hot("t_east_2", EAST, 45.0)])
+        assert await cache.refresh() == len(east_tiles)
+        for key, tile in cache.tiles.items():
+            assert (tile.etag != before[key]) == (key in east_tiles)
+
+        # 지역을 빼면 그 지역 타일도 제거
+        del cache.regions["west"]
+        await cache.refresh()
+        assert set(cache.tiles) == east_tiles
+
+    @pytest.mark.asyncio
+    async def test_rendered_values(self):
+        """지역 안 픽셀은 지역 위험도, 밖은 값 없음 (색상 타일은 투명)"""
+        cache = make_cache(min_zoom=11, max_zoom=11)
+        await cache.refresh()
+        expected = cache.tracker.risk("east")["overall_risk"]
+
+        tile = cache.get(*center_tile(EAST, 11))
+        values = cv2.imdecode(np.frombuffer(tile.values, np.uint8), cv2.IMREAD_UNCHANGED)
+        color = cv2.imdecode(np.frombuffer(tile.color, np.uint8), cv2.IMREAD_UNCHANGED)
+        assert values.shape == (256, 256) and color.shape == (256, 256, 4)
+
+        lats, lngs = pixel_centers(*center_tile(EAST, 11))
+        row, col = np.abs(lats - EAST.lat).argmin(), np.abs(lngs - EAST.lng).argmin()
+        assert values[row, col] == round(expected * 254)
+        assert color[row, col, 3] > 0
+
+        covered = values != NODATA
+        assert 0 < covered.mean() < 1
+        assert (color[..., 3][~covered] == 0).all()
+        # 덮인 면적 ≈ 원 면적
+        km_per_pixel = 40075.016 * math.cos(math.radians(EAST.lat)) / 2 ** 11 / 256
+        assert covered.sum() * km_per_pixel ** 2 <= math.pi * 3.0 ** 2 * 1.05
+
+    @pytest.mark.asyncio
+    async def test_endpoint_serves_tiles_with_etag(self, monkeypatch):
+        """타일은 ETag 와 함께 반환하고, 같은 ETag 재검증은 304, 지역 밖은 투명 타일"""
+        cache = make_cache(min_zoom=11, max_zoom=11)
+        await cache.refresh()
+        monkeypatch.setattr(risk_endpoints, "risk_tile_cache", cache)
+        app = FastAPI()
+        app.include_router(risk_endpoints.router, prefix="/risk")
+        client = TestClient(app)
+
+        zoom, x, y = center_tile(EAST, 11)
+        response = client.get(f"/risk/tiles/{zoom}/{x}/{y}.png")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        etag = response.headers["etag"]
+        assert response.content == cache.get(zoom, x, y).color
+
+        assert client.get(f"/risk/tiles/{zoom}/{x}/{y}.png", headers={"If-None-Match": etag}).status_code == 304
+        values = client.get(f"/risk/tiles/{zoom}/{x}/{y}.png?layer=values", headers={"If-None-Match": etag})
+        assert values.status_code == 200 and values.headers["etag"] != etag
+
+        empty = client.get(f"/risk/tiles/{zoom}/{x + 20}/{y}.png")
+        assert empty.status_code == 200 and empty.headers["etag"] != etag
+        assert client.get(f"/risk/tiles/5/{x}/{y}.png").status_code == 404
+        assert client.get(f"/risk/tiles/{zoom}/{x}/{y}.png?layer=raw").status_code == 422
@@ -0,0 +1,95 @@
+"""
+열 단위 센서 데이터 테스트
+"""
+
+import pytest
+import numpy as np
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.sensor_columns import SensorColumns
+from backend.app.services.risk_analysis_service import RiskAnalysisService
+from backend.app.services.ai_service import AIService
+
+@pytest.fixture
+def readings():
+    """센서 데이터 (일부 값 누락)"""
+    return [
+        SensorReading("cctv_1", SensorType.CCTV, 37.50, 127.90, fire_detected=True, fire_confidence=0.9, data_quality=0.8),
+        SensorReading("cctv_2", SensorType.CCTV, 37.51, 127.91, fire_detected=True, fire_confidence=None),
+        SensorReading("iot_1", SensorType.TEMPERATURE, 37.52, 127.92, temperature=31.0, humidity=22.0),
+        SensorReading("iot_2", SensorType.TEMPERATURE, 37.53, 127.93, temperature=27.0, data_quality=0.0),
+        SensorReading("iot_3", SensorType.WIND_SPEED, 37.54, 127.94, wind_speed=4.0, wind_direction=350.0),
+        SensorReading("iot_4", SensorType.WIND_SPEED, 37.55, 127.95, wind_speed=6.0, wind_direction=10.0),
+        SensorReading("iot_5", SensorType.WIND_SPEED, 37.56, 127.96, wind_speed=8.0)
+    ]
+
+class TestSensorColumns:
+    """열 단위 집계 테스트 클래스"""
+    
+    def test_missing_values_become_nan(self, readings):
+        """None 은 NaN 으로 변환"""
+        columns = SensorColumns.from_readings(readings)
+        
+        assert np.isnan(columns["temperature"][0])
+        assert columns["temperature"][2] == 31.0
+        assert columns.fire_detected.tolist() == [True, True, False, False, False, False, False]
+    
+    def test_column_stats(self, readings):
+        """열별 개수/평균/최솟값/최댓값"""
+        stats = SensorColumns.from_readings(readings).stats
+        
+        assert stats["temperature"].count == 2
+        assert stats["temperature"].mean == 29.0
+        assert stats["temperature"].max == 31.0
+        assert stats["humidity"].min == 22.0
+        assert stats["smoke_density"].count == 0
+        assert stats["smoke_density"].mean is None
+    
+    def test_fire_and_quality_stats(self, readings):
+        """탐지 신뢰도 미기록은 0, 품질 미기록/0 은 0.5"""
+        stats = SensorColumns.from_readings(readings).stats
+        
+        assert stats.fire.count == 2
+        assert stats.fire.max == 0.9
+        assert stats.fire.mean == pytest.approx(0.45)
+        assert stats.quality_mean == pytest.approx((0.8 + 0.5 * 6) / 7)
+        assert stats.sensor_type_count == 3
+    
+    def test_wind_direction_circular_mean(self, readings):
+        """풍향 평균은 원형 평균 (350°, 10° → 0°)"""
+        stats = SensorColumns.from_readings(readings).stats
+        
+        assert stats.wind_pairs == 2
+        assert stats.wind_pair_speed == 5.0
+        assert min(stats.wind_direction_mean, 360 - stats.wind_direction_mean) == pytest.approx(0.0, abs=1e-9)
+    
+    def test_empty_batch(self):
+        """빈 묶음도 집계 가능"""
+        stats = SensorColumns.from_readings([]).stats
+        
+        assert stats.count == 0
+        assert stats.fire.count == 0
+        assert stats.wind_pairs == 0
+    
+    def test_stats_computed_once(self, readings):
+        """같은 묶음의 집계값은 한 번만 계산"""
+        columns = SensorColumns.from_readings(readings)
+        
+        assert columns.stats is columns.stats
+        assert SensorColumns.of(columns) is columns
+    
+    @pytest.mark.asyncio
+    async def test_shared_by_risk_and_ai(self, readings):
+        """위험도 분석과 권고안 분석이 같은 집계값 사용"""
+        # 서비스가 사용하는 모듈의 SensorColumns 로 변환
+        from backend.app.services.risk_analysis_service import SensorColumns as ServiceColumns
+        columns = ServiceColumns.from_readings(readings)
+        
+        fire = RiskAnalysisService()._analyze_fire_detection(columns)
+        analysis = await AIService()._analyze_sensor_data(columns)
+        
+        assert fire["detection_count"] == 2
+        assert [s["sensor_id"] for s in fire["detection_sources"]] == ["cctv_1", "cctv_2"]
+        assert analysis["fire_confidence"] == 0.9
+        assert analysis["environmental_conditions"]["wind"]["directions"] == [350.0, 10.0]
+        assert analysis["environmental_conditions"]["wind"]["max_speed"] == 8.0
@@ -0,0 +1,79 @@
+"""
+경량 센서 측정값 테스트
+"""
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import StaticPool
+from backend.app.models.sensor_data import SensorData, SensorDataCreate, SensorType
+from backend.app.models.sensor_reading import READING_FIELDS, SensorReading
+from backend.app.services.risk_analysis_service import RiskAnalysisService
+from backend.app.services.write_behind import WriteBehindBuffer
+
+def make_create() -> SensorDataCreate:
+    return SensorDataCreate(
+        sensor_id="cctv_001",
+        sensor_type=SensorType.CCTV,
+        location_lat=37.5665,
+        location_lng=127.9780,
+        fire_detected=True,
+        fire_confidence=0.9,
+        image_analysis={"fire_detected": True},
+        data_quality=0.8
+    )
+
+class TestSensorReading:
+    """경량 센서 측정값 테스트 클래스"""
+    
+    def test_slots_only(self):
+        """인스턴스 딕셔너리 없이 필드만 보관"""
+        reading = SensorReading("iot_1", SensorType.TEMPERATURE, 37.5, 127.9, temperature=20.0)
+        
+        assert not hasattr(reading, "__dict__")
+        with pytest.raises(AttributeError):
+            reading.unknown = 1
+    
+    def test_round_trip_with_create(self):
+        """스키마 객체와 상호 변환"""
+        created = make_create()
+        
+        reading = SensorReading.from_create(created)
+        
+        assert reading.to_create().model_dump() == created.model_dump()
+        assert reading.to_dict() == created.model_dump()
+    
+    def test_round_trip_with_orm(self):
+        """저장 후 조회한 ORM 객체와 상호 변환"""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SensorData.__table__.create(engine)
+        reading = SensorReading.from_create(make_create())
+        
+        with engine.begin() as conn:
+            conn.execute(SensorData.__table__.insert(), [reading.to_row()])
+            row = conn.execute(select(SensorData.__table__)).first()
+        
+        restored = SensorReading.from_orm(row)
+        assert restored == reading
+        assert restored.sensor_type == SensorType.CCTV
+        assert reading.to_orm().__tablename__ == "sensor_data"
+    
+    def test_fields_match_schema(self):
+        """필드 구성이 SensorDataCreate 와 같음"""
+        assert READING_FIELDS == tuple(SensorDataCreate.model_fields)
+    
+    @pytest.mark.asyncio
+    async def test_accepted_by_risk_analysis(self):
+        """위험도 분석에 그대로 전달 가능"""
+        service = RiskAnalysisService()
+        readings = [SensorReading.from_create(make_create())]
+        
+        fire = service._analyze_fire_detection(readings)
+        
+        assert fire["detection_count"] == 1
+        assert fire["max_confidence"] == 0.9
+    
+    def test_write_behind_row(self):
+        """지연 쓰기 버퍼 INSERT 행 변환"""
+        created = make_create()
+        
+        assert WriteBehindBuffer._to_row(SensorReading.from_create(created)) == WriteBehindBuffer._to_row(created)
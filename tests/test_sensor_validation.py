@@ -0,0 +1,113 @@
+"""
+센서 데이터 일괄 검증 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from backend.app.models.sensor_data import SensorData, SensorDataCreate, SensorType
+from backend.app.services.sensor_validation import validate_batch
+
+def make_item(i: int, **overrides):
+    item = {
+        "sensor_id": f"iot_s{i:04d}",
+        "sensor_type": "temperature",
+        "location_lat": 37.5665,
+        "location_lng": 127.9780,
+        "temperature": 20.0 + i,
+        "raw_data": {"id": i}
+    }
+    item.update(overrides)
+    return item
+
+class TestValidateBatch:
+    """일괄 검증 테스트 클래스"""
+    
+    def test_valid_batch(self):
+        """정상 목록은 모든 필드가 채워진 행으로 반환"""
+        result = validate_batch([make_item(i) for i in range(3)])
+        
+        assert result.errors == {}
+        assert result.indices == [0, 1, 2]
+        rows = result.rows()
+        assert set(rows[0]) == set(SensorDataCreate.model_fields)
+        assert rows[0]["sensor_type"] == "temperature"
+        assert rows[0]["fire_detected"] is False
+    
+    def test_invalid_items_reported_without_aborting(self):
+        """잘못된 항목은 위치와 함께 오류로 모으고 나머지는 유지"""
+        items = [
+            make_item(0),
+            make_item(1, humidity=150),
+            make_item(2, sensor_type="unknown"),
+            make_item(3)
+        ]
+        
+        result = validate_batch(items)
+        
+        assert result.indices == [0, 3]
+        assert set(result.errors) == {1, 2}
+        assert result.errors[1][0]["loc"] == ["humidity"]
+        assert [r.sensor_id for r in result.readings()] == ["iot_s0000", "iot_s0003"]
+    
+    def test_same_rules_as_schema(self):
+        """SensorDataCreate 와 같은 결과"""
+        item = make_item(5, humidity=40, wind_direction=180)
+        
+        row = validate_batch([item]).validated[0]
+        
+        assert row == SensorDataCreate(**item).model_dump()
+        assert row["sensor_type"] == SensorType.TEMPERATURE
+
+class TestBatchEndpoint:
+    """일괄 등록 API 테스트"""
+    
+    @pytest.fixture
+    def client(self):
+        from backend.app.api.v1.endpoints import sensor_data
+        from backend.app.api.v1.endpoints.sensor_data import get_db
+        
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SensorData.__table__.create(engine)
+        session_factory = sessionmaker(bind=engine)
+        
+        def override_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+        
+        app = FastAPI()
+        app.include_router(sensor_data.router, prefix="/sensor-data")
+        app.dependency_overrides[get_db] = override_db
+        client = TestClient(app)
+        client.engine = engine
+        return client
+    
+    def test_batch_insert_with_partial_errors(self, client):
+        """정상 항목만 저장하고 항목별 오류 반환"""
+        items = [make_item(0), make_item(1, location_lat=120), make_item(2)]
+        
+        response = client.post("/sensor-data/batch", json=items)
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["accepted"] == 2
+        assert body["rejected"] == 1
+        assert body["errors"][0]["index"] == 1
+        with client.engine.connect() as conn:
+            assert conn.execute(select(func.count()).select_from(SensorData.__table__)).scalar() == 2
+    
+    def test_list_filters_by_bounds(self, client):
+        """목록 조회에 위경도 영역 적용"""
+        items = [make_item(i, location_lat=37.0 + i * 0.1) for i in range(5)]
+        client.post("/sensor-data/batch", json=items)
+        
+        response = client.get("/sensor-data/", params={"location_lat_min": 37.15, "location_lat_max": 37.35})
+        
+        assert response.status_code == 200
+        assert [item["sensor_id"] for item in response.json()] == ["iot_s0002", "iot_s0003"]
@@ -0,0 +1,88 @@
+"""
+센서 위치 공간 색인 테스트
+"""
+
+import pytest
+import numpy as np
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.spatial_index import KM_PER_DEG_LAT, SpatialIndex
+from backend.app.services.risk_analysis_service import SensorColumns
+
+def brute_force_radius(lats, lngs, lat, lng, radius_km):
+    dy = (lats - lat) * KM_PER_DEG_LAT
+    dx = (lngs - lng) * KM_PER_DEG_LAT * np.cos(np.radians(lat))
+    return np.flatnonzero(dx * dx + dy * dy <= radius_km * radius_km).tolist()
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return rng.uniform(37.0, 38.0, 5000), rng.uniform(127.0, 128.0, 5000)
+
+QUERIES = [(37.5, 127.5, 5.0), (37.01, 127.99, 12.0), (37.3, 127.2, 0.5), (39.0, 127.0, 5.0), (37.5, 127.5, 150.0)]
+
+class TestSpatialIndex:
+    """공간 색인 테스트 클래스"""
+    
+    def test_radius_matches_brute_force(self, points):
+        """반경 조회는 전수 거리 계산과 같음 (버킷 수보다 넓은 조회 포함)"""
+        lats, lngs = points
+        index = SpatialIndex.from_points(lats, lngs, cell_km=2.0)
+        
+        for lat, lng, radius_km in QUERIES:
+            assert sorted(index.radius_slots(lat, lng, radius_km).tolist()) == brute_force_radius(lats, lngs, lat, lng, radius_km)
+    
+    def test_bbox_matches_brute_force(self, points):
+        """영역 조회는 경계 포함, 범위 밖 경계는 위경도 한계로 제한"""
+        lats, lngs = points
+        index = SpatialIndex.from_points(lats, lngs, cell_km=2.0)
+        
+        expected = np.flatnonzero((lats >= 37.2) & (lats <= 37.4) & (lngs >= 127.6) & (lngs <= 127.9)).tolist()
+        assert sorted(index.bbox_slots(37.2, 37.4, 127.6, 127.9).tolist()) == expected
+        assert len(index.bbox_slots(-1e9, 1e9, -1e9, 1e9)) == len(lats)
+    
+    def test_incremental_updates_match_bulk_build(self, points):
+        """항목별 추가/이동/삭제 후에도 같은 결과"""
+        lats, lngs = points
+        index = SpatialIndex(cell_km=2.0, capacity=4)
+        for i, (lat, lng) in enumerate(zip(lats, lngs)):
+            index.upsert(f"s{i}", lat, lng, i)
+        
+        # 절반은 이동, 일부는 삭제 후 다시 추가
+        lats, lngs = lats.copy(), lngs.copy()
+        for i in range(0, len(lats), 2):
+            lats[i], lngs[i] = lats[i] + 0.05, lngs[i] - 0.05
+            index.upsert(f"s{i}", lats[i], lngs[i], i)
+        for i in range(1, 200, 3):
+            assert index.remove(f"s{i}")
+        assert not index.remove("s1")
+        for i in range(1, 100, 3):
+            index.upsert(f"s{i}", lats[i], lngs[i], i)
+        
+        alive = set(range(len(lats))) - {i for i in range(1, 200, 3) if i >= 100}
+        assert len(index) == len(alive)
+        for lat, lng, radius_km in QUERIES:
+            expected = [i for i in brute_force_radius(lats, lngs, lat, lng, radius_km) if i in alive]
+            assert sorted(index.within(lat, lng, radius_km)) == expected
+    
+    def test_update_keeps_latest_reading(self):
+        """센서별 최신 측정값 유지"""
+        index = SpatialIndex(cell_km=2.0)
+        index.update([SensorReading("iot_1", SensorType.TEMPERATURE, 37.5, 127.5, temperature=20.0)])
+        index.update([SensorReading("iot_1", SensorType.TEMPERATURE, 37.6, 127.5, temperature=25.0)])
+        
+        assert len(index) == 1
+        assert index.within(37.5, 127.5, 1.0) == []
+        [reading] = index.within(37.6, 127.5, 1.0)
+        assert reading.temperature == 25.0
+    
+    def test_sensor_columns_within(self, points):
+        """열 단위 데이터의 반경 선택 (색인은 한 번만 생성)"""
+        lats, lngs = points
+        columns = SensorColumns([f"s{i}" for i in range(len(lats))], ["temperature"] * len(lats), lats, lngs, np.zeros(len(lats)))
+        
+        nearby = columns.within({"lat": 37.5, "lng": 127.5}, 5.0)
+        
+        assert nearby.sensor_ids == [f"s{i}" for i in brute_force_radius(lats, lngs, 37.5, 127.5, 5.0)]
+        assert columns.spatial_index is columns.spatial_index
+        assert len(columns.within({"lat": 39.0, "lng": 127.5}, 5.0)) == 0
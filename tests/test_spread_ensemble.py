@@ -0,0 +1,228 @@
+"""
+화재 확산 앙상블 예측 테스트
+"""
+
+import math
+import pickle
+import pytest
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import AsyncMock
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.risk_analysis_service import RiskAnalysisService
+from backend.app.services.spread_ensemble import (
+    EnsembleConditions,
+    EnsembleMember,
+    EnsembleResult,
+    SpreadEnsemble,
+    _simulate_member
+)
+from backend.app.services.spread_simulator import SpreadGrid, SpreadSimulator
+
+CENTER = (37.5, 127.0)
+
+def make_ensemble(**kwargs) -> SpreadEnsemble:
+    """작은 격자용 앙상블 (스레드 풀 실행)"""
+    return SpreadEnsemble(
+        members=kwargs.pop("members", 12),
+        refresh_fraction=kwargs.pop("refresh_fraction", 0.25),
+        simulator=SpreadSimulator(base_ros_m_per_min=5.0),
+        executor=kwargs.pop("executor", ThreadPoolExecutor(4)),
+        **kwargs
+    )
+
+def small_grid() -> SpreadGrid:
+    return SpreadGrid(*CENTER, size_km=4.0, cell_m=30.0)
+
+def wind_reading(sensor_id: str, speed: float, direction: float, fire: bool = False, lat: float = 37.5, lng: float = 127.0):
+    return SensorReading(
+        sensor_id, SensorType.WIND_SPEED, lat, lng,
+        wind_speed=speed, wind_direction=direction, fire_detected=fire
+    )
+
+class TestSpreadEnsemble:
+    """화재 확산 앙상블 예측 테스트 클래스"""
+
+    def test_conditions_from_forecast(self):
+        """예보 변동이 기본 섭동 폭보다 크면 섭동 폭을 넓히고, 현재 값이 없으면 예보 평균 사용"""
+        forecast = {"hourly": [
+            {"wind_speed": 4.0, "wind_direction": 350.0},
+            {"wind_speed": 8.0, "wind_direction": 10.0},
+            {"wind_speed": 12.0, "wind_direction": 30.0},
+            {"wind_speed": 40.0, "wind_direction": 180.0}
+        ]}
+        conditions = EnsembleConditions.from_forecast(None, None, forecast, hours=3)
+        assert conditions.wind_speed == pytest.approx(8.0)
+        assert conditions.wind_direction == pytest.approx(10.0)
+        assert conditions.wind_speed_sigma == pytest.approx(math.sqrt(32 / 3))
+        assert conditions.wind_direction_sigma == pytest.approx(20.0)
+
+        calm = EnsembleConditions.from_forecast(3.0, 90.0, None, hours=6)
+        assert (calm.wind_speed, calm.wind_direction) == (3.0, 90.0)
+        assert calm.wind_speed_sigma == pytest.approx(1.5)
+
+    def test_aggregate_probability_and_percentiles(self):
+        """연소 확률은 도달한 구성원 비율, 백분위 도달 시간은 순위 기준"""
+        grid = SpreadGrid(*CENTER, size_km=0.3, cell_m=30.0)
+        arrivals = [
+            np.array([[10.0, np.inf]], dtype=np.float32),
+            np.array([[20.0, 50.0]], dtype=np.float32),
+            np.array([[30.0, 70.0]], dtype=np.float32),
+            np.array([[40.0, np.inf]], dtype=np.float32)
+        ]
+        members = [EnsembleMember(0.0, None, [CENTER], (2, 3, arrival)) for arrival in arrivals]
+        members.append(EnsembleMember(0.0, None, [CENTER], (0, 0, np.empty((0, 0), dtype=np.float32))))
+        result = EnsembleResult(grid, members, duration_minutes=60, percentiles=(20, 50, 100))
+
+        assert result.burn_probability[2, 3] == pytest.approx(0.8)
+        assert result.burn_probability[2, 4] == pytest.approx(0.2)
+        assert result.burn_probability.sum() == pytest.approx(1.0)
+        assert result.arrival_percentiles[20.0][2, 3] == 10.0
+        assert result.arrival_percentiles[50.0][2, 3] == 30.0
+        assert result.arrival_percentiles[50.0][2, 4] == np.inf
+        assert result.arrival_percentiles[100.0][2, 3] == np.inf
+
+    def test_member_runs_in_worker_process(self):
+        """구성원 실행 함수와 격자는 프로세스 풀로 보낼 수 있음 (평지 래스터는 생략하여 전송)"""
+        grid = small_grid()
+        restored = pickle.loads(pickle.dumps(grid))
+        assert len(pickle.dumps(grid)) < 10000
+        assert restored.elevation.shape == restored.fuel.shape == (grid.size, grid.size)
+
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        with ProcessPoolExecutor(2) as executor:
+            row, col, arrival = executor.submit(_simulate_member, simulator, grid, [CENTER], 5.0, 270.0, 60.0).result()
+        local = simulator.simulate(grid, [CENTER], 5.0, 270.0, 60.0).arrival_minutes
+        np.testing.assert_array_equal(local[row:row + arrival.shape[0], col:col + arrival.shape[1]], arrival)
+        assert np.isfinite(local).sum() == np.isfinite(arrival).sum()
+
+    @pytest.mark.asyncio
+    async def test_forecast_is_cached_per_incident(self):
+        """같은 산불 건을 같은 조건으로 다시 요청하면 구성원을 다시 실행하지 않음"""
+        ensemble = make_ensemble()
+        conditions = EnsembleConditions(6.0, 270.0)
+        first = await ensemble.forecast("fire-1", small_grid(), [CENTER], conditions, 90, seed=1)
+        assert first.version == 1 and len(first.members) == 12
+        # 서풍이므로 동쪽으로 번짐
+        probability = first.result.burn_probability
+        center = first.grid.size // 2
+        assert probability[center, center + 10] > probability[center, center - 10]
+        assert probability[center, center] > 0.5
+
+        again = await ensemble.forecast("fire-1", small_grid(), [CENTER], conditions, 90)
+        assert again is first and again.version == 1 and again.last_refreshed == 0
+
+        other = await ensemble.forecast("fire-1", small_grid(), [CENTER], conditions, 120)
+        assert other is not first and other.version == 1
+
+    @pytest.mark.asyncio
+    async def test_small_wind_change_refreshes_oldest_members(self):
+        """섭동 폭보다 작은 바람 변화는 오래된 구성원 일부만 다시 실행"""
+        ensemble = make_ensemble()
+        incident = await ensemble.forecast("fire-1", small_grid(), [CENTER], EnsembleConditions(6.0, 270.0), 90, seed=1)
+        survivors = incident.members[3:]
+
+        ensemble.observe([wind_reading("wind_1", 6.5, 275.0), wind_reading("far", 20.0, 90.0, lat=38.5)])
+        assert list(incident.pending_wind) == ["wind_1"]
+        refreshed = await ensemble.refresh("fire-1")
+
+        assert refreshed.version == 2 and refreshed.last_refreshed == 3
+        assert refreshed.members[:9] == survivors
+        assert refreshed.conditions.wind_speed == pytest.approx(6.5)
+        assert refreshed.conditions.wind_direction == pytest.approx(275.0)
+        assert not refreshed.pending
+
+    @pytest.mark.asyncio
+    async def test_wind_shift_and_new_ignition_rerun_all(self):
+        """섭동 폭 이상의 바람 변화나 예측 영역 밖 화재 탐지는 모든 구성원을 다시 실행"""
+        ensemble = make_ensemble()
+        incident = await ensemble.forecast("fire-1", small_grid(), [CENTER], EnsembleConditions(6.0, 270.0), 60, seed=1)
+
+        ensemble.observe([wind_reading("wind_1", 6.0, 90.0)])
+        await ensemble.refresh("fire-1")
+        assert incident.last_refreshed == 12
+        center = incident.grid.size // 2
+        assert incident.result.burn_probability[center, center - 10] > incident.result.burn_probability[center, center + 10]
+
+        # 예측 영역 안의 탐지는 무시, 밖의 탐지는 새 발화 지점
+        ensemble.observe([SensorReading("cam_1", SensorType.CCTV, CENTER[0], CENTER[1], fire_detected=True)])
+        assert not incident.pending
+        spot = (CENTER[0] + 0.012, CENTER[1])
+        ensemble.observe([SensorReading("cam_2", SensorType.CCTV, spot[0], spot[1], fire_detected=True)])
+        await ensemble.refresh("fire-1")
+        assert incident.ignitions == [CENTER, spot]
+        assert incident.last_refreshed == 12
+        row, col = incident.grid.cell_of(*spot)
+        assert incident.result.burn_probability[row, col] > 0.5
+
+        # 요청 발화 지점이 같으면 탐지로 추가된 발화 지점을 유지한 채 캐시 사용
+        again = await ensemble.forecast("fire-1", small_grid(), [CENTER], EnsembleConditions(6.0, 270.0), 60)
+        assert again is incident and again.ignitions == [CENTER, spot]
+
+    @pytest.mark.asyncio
+    async def test_wind_and_ignition_pending_together(self):
+        """새 발화 지점과 함께 대기 중인 바람 측정값도 다시 실행하는 구성원 조건에 반영"""
+        ensemble = make_ensemble()
+        incident = await ensemble.forecast("fire-1", small_grid(), [CENTER], EnsembleConditions(2.0, 90.0), 60, seed=1)
+
+        spot = (CENTER[0] + 0.012, CENTER[1])
+        ensemble.observe([
+            wind_reading("wind_1", 12.0, 270.0),
+            SensorReading("cam_2", SensorType.CCTV, spot[0], spot[1], fire_detected=True)
+        ])
+        assert incident.pending_wind and incident.pending_ignitions
+        await ensemble.refresh("fire-1")
+
+        assert incident.ignitions == [CENTER, spot]
+        assert incident.last_refreshed == 12 and not incident.pending
+        assert incident.conditions.wind_speed == pytest.approx(12.0)
+        assert incident.conditions.wind_direction == pytest.approx(270.0)
+        # 서풍이므로 동쪽으로 번짐
+        center = incident.grid.size // 2
+        assert incident.result.burn_probability[center, center + 10] > incident.result.burn_probability[center, center - 10]
+
+    @pytest.mark.asyncio
+    async def test_incident_cache_is_bounded(self):
+        """캐시는 최근 사용 순으로 max_incidents 건만 유지"""
+        ensemble = make_ensemble(members=2, max_incidents=2)
+        conditions = EnsembleConditions(3.0, 0.0)
+        for incident_id in ("a", "b", "c"):
+            await ensemble.forecast(incident_id, small_grid(), [CENTER], conditions, 30)
+        assert list(ensemble.incidents) == ["b", "c"]
+        assert await ensemble.refresh("a") is None
+
+    @pytest.mark.asyncio
+    async def test_service_uses_forecast_spread(self):
+        """서비스는 센서 바람을 중심으로, 예보 변동을 섭동 폭으로 사용하고 재요청은 캐시 사용"""
+        service = RiskAnalysisService()
+        service.spread_ensemble = make_ensemble(members=4)
+        service.weather_service.get_weather_forecast = AsyncMock(return_value={"hourly": [
+            {"wind_speed": 2.0, "wind_direction": 270.0},
+            {"wind_speed": 10.0, "wind_direction": 270.0}
+        ]})
+        readings = [wind_reading("wind_1", 6.0, 270.0)]
+        ignitions = [{"lat": CENTER[0], "lng": CENTER[1]}]
+
+        incident, wind = await service.forecast_fire_spread_ensemble("fire-1", readings, ignitions, 120)
+        assert wind["source"] == "sensors"
+        assert incident.conditions.wind_speed == pytest.approx(6.0)
+        assert incident.conditions.wind_speed_sigma == pytest.approx(4.0)
+        assert incident.grid.size == 667
+
+        again, wind = await service.forecast_fire_spread_ensemble("fire-1", [], ignitions, 120)
+        assert again is incident and wind["source"] == "cache"
+        service.weather_service.get_weather_forecast.assert_awaited_once()
+        assert service.cached_ensemble("fire-1", ignitions, 120) is incident
+        assert service.cached_ensemble("fire-1", ignitions, 60) is None
+
+        # 지정한 바람이 캐시 조건과 다르면 섭동 폭은 유지한 채 그 바람으로 다시 실행
+        shifted, wind = await service.forecast_fire_spread_ensemble("fire-1", [], ignitions, 120, wind_speed=15.0, wind_direction=90.0)
+        assert shifted is incident and wind["source"] == "request"
+        assert wind["wind_speed"] == pytest.approx(15.0) and wind["wind_direction"] == pytest.approx(90.0)
+        assert incident.version == 2 and incident.last_refreshed == 4
+        assert incident.conditions.wind_speed_sigma == pytest.approx(4.0)
+
+        same, wind = await service.forecast_fire_spread_ensemble("fire-1", [], ignitions, 120, wind_speed=15.0)
+        assert wind["source"] == "request" and same.version == 2 and same.last_refreshed == 0
+        service.weather_service.get_weather_forecast.assert_awaited_once()
@@ -0,0 +1,138 @@
+"""
+격자 화재 확산 시뮬레이션 테스트
+"""
+
+import math
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from backend.app.models.sensor_data import SensorType
+from backend.app.models.sensor_reading import SensorReading
+from backend.app.services.risk_analysis_service import RiskAnalysisService, SensorColumns
+from backend.app.services.spread_simulator import SpreadGrid, SpreadSimulator, WIND_C1, WIND_C2
+
+CENTER = (37.5, 127.0)
+
+def extents(result):
+    """발화 셀 기준 북/남/서/동 방향 도달 셀 수"""
+    center = result.grid.size // 2
+    rows, cols = np.nonzero(np.isfinite(result.arrival_minutes))
+    return center - rows.min(), rows.max() - center, center - cols.min(), cols.max() - center
+
+class TestSpreadSimulator:
+    """격자 화재 확산 시뮬레이션 테스트 클래스"""
+
+    def test_calm_spread_is_isotropic(self):
+        """무풍/평지에서는 사방으로 기준 속도에 가깝게 번짐"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        grid = SpreadGrid(*CENTER, size_km=6.0, cell_m=30.0)
+        result = simulator.simulate(grid, [CENTER], duration_minutes=180)
+
+        north, south, west, east = extents(result)
+        assert north == south == west == east
+        # 3시간 × 5m/분 = 900m = 30셀
+        assert 27 <= east <= 31
+        center = grid.size // 2
+        assert result.arrival_minutes[center, center + 10] == pytest.approx(60, rel=0.15)
+
+    def test_wind_elongates_downwind(self):
+        """서풍이면 동쪽으로 길게, 서쪽으로는 거의 번지지 않음"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        grid = SpreadGrid(*CENTER, size_km=8.0, cell_m=30.0)
+        result = simulator.simulate(grid, [CENTER], wind_speed=10.0, wind_direction=270.0, duration_minutes=180)
+
+        north, south, west, east = extents(result)
+        assert east > 5 * west
+        assert north == south
+        # 머리 화재 속도 = 기준 속도 × exp(c1 V)
+        head_cells = 5.0 * math.exp(WIND_C1 * 10.0) * 180 / 30.0
+        assert east == pytest.approx(head_cells, rel=0.1)
+        backing_cells = 5.0 * math.exp(WIND_C1 * 10.0 - 2 * WIND_C2 * 10.0) * 180 / 30.0
+        assert west <= backing_cells + 2
+
+    def test_upslope_faster_than_downslope(self):
+        """북쪽으로 높아지는 경사에서는 북쪽으로 더 빨리 번짐"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        size_km, cell_m = 4.0, 30.0
+        size = math.ceil(size_km * 1000 / cell_m)
+        elevation = np.repeat((np.arange(size)[::-1] * cell_m * 0.3)[:, None], size, axis=1)
+        grid = SpreadGrid(*CENTER, size_km=size_km, cell_m=cell_m, elevation=elevation)
+        result = simulator.simulate(grid, [CENTER], duration_minutes=120)
+
+        north, south, west, east = extents(result)
+        assert north > south
+        assert west == east
+
+    def test_fuel_break_stops_spread(self):
+        """비연소 띠(연료 0)를 넘어 번지지 않음"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        size_km, cell_m = 3.0, 30.0
+        size = math.ceil(size_km * 1000 / cell_m)
+        fuel = np.ones((size, size), dtype=np.float32)
+        fuel[:, size // 2 + 5:size // 2 + 7] = 0.0
+        grid = SpreadGrid(*CENTER, size_km=size_km, cell_m=cell_m, fuel=fuel)
+        result = simulator.simulate(grid, [CENTER], wind_speed=8.0, wind_direction=270.0, duration_minutes=240)
+
+        assert np.isfinite(result.arrival_minutes[:, :size // 2 + 5]).any()
+        assert not np.isfinite(result.arrival_minutes[:, size // 2 + 5:]).any()
+
+    def test_contours_and_polygon(self):
+        """시각별 등치선은 시간이 지날수록 넓어지고 피해 영역은 격자 안의 위경도 다각형"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        grid = SpreadGrid(*CENTER, size_km=6.0, cell_m=30.0)
+        result = simulator.simulate(grid, [CENTER], wind_speed=6.0, wind_direction=0.0, duration_minutes=180)
+
+        contours = result.contours()
+        assert list(contours) == [60.0, 120.0, 180.0]
+        areas = [np.sum(result.arrival_minutes <= minute) for minute in contours]
+        assert areas == sorted(areas) and areas[0] > 0
+
+        polygon = result.affected_polygon()
+        assert len(polygon) >= 4
+        lats = [point[0] for point in polygon]
+        # 북풍이므로 남쪽으로 번짐
+        assert min(lats) < CENTER[0] - 0.01
+        assert max(lats) < CENTER[0] + 0.01
+        assert (result.probability[np.isfinite(result.arrival_minutes)] >= 0.5 - 1e-6).all()
+        assert result.affected_area_km2 == pytest.approx(
+            np.isfinite(result.arrival_minutes).sum() * 0.0009
+        )
+
+        summary = result.summary()
+        assert summary["affected_polygon"] == polygon
+        assert [contour["minutes"] for contour in summary["contours"]] == [60.0, 120.0, 180.0]
+
+    def test_full_area_runs_quickly(self):
+        """20km × 20km / 30m 격자 6시간 시뮬레이션이 수 초 안에 끝남"""
+        simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        rng = np.random.default_rng(0)
+        grid = SpreadGrid(*CENTER, size_km=20.0, cell_m=30.0)
+        grid.elevation[:] = np.cumsum(rng.normal(0, 2, grid.elevation.shape), axis=0)
+        result = simulator.simulate(grid, [CENTER], wind_speed=12.0, wind_direction=225.0, duration_minutes=360)
+
+        assert grid.size == 667
+        assert result.elapsed_seconds < 5.0
+        assert result.affected_area_km2 > 1.0
+
+    @pytest.mark.asyncio
+    async def test_service_uses_sensor_wind(self):
+        """바람 미지정 시 센서 평균 풍속/풍향을 사용하고, 센서가 없으면 날씨를 조회"""
+        service = RiskAnalysisService()
+        service.spread_simulator = SpreadSimulator(base_ros_m_per_min=5.0)
+        service.weather_service.get_current_weather = AsyncMock(return_value={"wind_speed": 4.0, "wind_direction": 90.0})
+        readings = [
+            SensorReading("wind_1", SensorType.WIND_SPEED, 37.5, 127.0, wind_speed=8.0, wind_direction=350.0),
+            SensorReading("wind_2", SensorType.WIND_SPEED, 37.51, 127.01, wind_speed=6.0, wind_direction=10.0)
+        ]
+
+        result, wind = await service.simulate_fire_spread(
+            SensorColumns.from_readings(readings), [{"lat": 37.5, "lng": 127.0}], 60
+        )
+        assert wind["source"] == "sensors"
+        assert wind["wind_speed"] == pytest.approx(7.0)
+        assert min(abs(wind["wind_direction"]), abs(wind["wind_direction"] - 360)) < 1e-6
+        assert result.affected_area_km2 > 0
+        service.weather_service.get_current_weather.assert_not_called()
+
+        _, wind = await service.simulate_fire_spread([], [{"lat": 37.5, "lng": 127.0}], 60)
+        assert wind == {"wind_speed": 4.0, "wind_direction": 90.0, "source": "weather"}
@@ -0,0 +1,65 @@
+"""
+합성 센서망 테스트
+"""
+
+import pytest
+import numpy as np
+from backend.app.services.synthetic_network import FireEvent, SyntheticSensorNetwork
+
+class TestSyntheticSensorNetwork:
+    """합성 센서망 테스트 클래스"""
+    
+    @pytest.fixture
+    def network(self):
+        """발화 지점이 있는 소규모 센서망"""
+        return SyntheticSensorNetwork(
+            n_sensors=2000,
+            n_cameras=50,
+            seed=7,
+            fire_events=[FireEvent(37.5665, 127.9780, start_s=0.0, intensity=1.0)]
+        )
+    
+    def test_deterministic_from_seed(self, network):
+        """같은 시드는 같은 측정값을 생성"""
+        other = SyntheticSensorNetwork(
+            n_sensors=2000, n_cameras=50, seed=7,
+            fire_events=[FireEvent(37.5665, 127.9780, start_s=0.0, intensity=1.0)]
+        )
+        
+        assert network.readings(120.0) == other.readings(120.0)
+    
+    def test_fields_spatially_correlated(self, network):
+        """가까운 센서끼리 온도가 더 비슷한지 테스트"""
+        quiet = SyntheticSensorNetwork(n_sensors=2000, n_cameras=0, seed=7)
+        temperature = quiet.sample(0.0)["temperature"]
+        xy = quiet.xy_km
+        
+        distance = np.hypot(*(xy[:1000] - xy[1000:2000]).T)
+        diff = np.abs(temperature[:1000] - temperature[1000:2000])
+        assert diff[distance < 2].mean() < diff[distance > 20].mean()
+    
+    def test_fire_event_raises_smoke(self, network):
+        """발화 지점 근처 센서의 연기 농도 상승 및 카메라 탐지"""
+        readings = network.readings(600.0)
+        
+        near = [r for r in readings if r.smoke_density is not None
+                and abs(r.location_lat - 37.5665) < 0.01 and abs(r.location_lng - 127.978) < 0.01]
+        far = [r for r in readings if r.smoke_density is not None and abs(r.location_lat - 37.5665) > 0.15]
+        assert near and far
+        assert min(r.smoke_density for r in near) > max(r.smoke_density for r in far)
+    
+    @pytest.mark.asyncio
+    async def test_stream_rate(self, network):
+        """설정된 속도만큼 측정값을 생성"""
+        total = 0
+        async for batch in network.stream(rate_per_s=5000, duration_s=1.0, realtime=False):
+            total += len(batch)
+        
+        assert total == 5000
+    
+    def test_nearby_upstream_format(self, network):
+        """대역 서버용 업스트림 형식 변환"""
+        sensors = network.nearby("sensors", 37.5665, 127.9780, 3.0, t=0.0)
+        
+        assert sensors
+        assert {"id", "type", "lat", "lng", "temperature"} <= set(sensors[0])
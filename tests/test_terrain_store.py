@@ -0,0 +1,159 @@
+"""
+지형/연료 래스터 저장소 테스트
+"""
+
+import math
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock
+from backend.app.services.risk_analysis_service import RiskAnalysisService, SensorColumns
+from backend.app.services.spatial_index import KM_PER_DEG_LAT
+from backend.app.services.spread_simulator import SpreadGrid
+from backend.app.services.terrain_store import TerrainStore, write_layer
+from tests.test_risk_batch import make_readings
+
+NORTH, WEST = 38.0, 127.0
+RES = 0.001
+
+def plane(rows: int, cols: int, per_row: float = -2.0, per_col: float = 1.0) -> np.ndarray:
+    """행/열 방향으로 일정하게 변하는 고도 (기본: 북쪽과 동쪽으로 높아짐)"""
+    r, c = np.mgrid[0:rows, 0:cols]
+    return (500.0 + per_row * r + per_col * c).astype(np.float32)
+
+def pixel_center(row: float, col: float):
+    return NORTH - (row + 0.5) * RES, WEST + (col + 0.5) * RES
+
+@pytest.fixture
+def store(tmp_path):
+    write_layer(tmp_path, "elevation", plane(40, 50), NORTH, WEST, RES, RES, tile_size=16)
+    return TerrainStore(str(tmp_path), max_open_tiles=4)
+
+class TestTerrainStore:
+    """지형/연료 래스터 저장소 테스트 클래스"""
+
+    def test_bilinear_matches_plane_across_tiles(self, store):
+        """쌍선형 보간은 평면을 정확히 재현 (타일 경계를 걸친 지점 포함)"""
+        rng = np.random.default_rng(0)
+        rows = rng.uniform(0, 39, 500)
+        cols = rng.uniform(0, 49, 500)
+        lats, lngs = pixel_center(rows, cols)
+        values = store.sample(lats, lngs, "elevation")
+        np.testing.assert_allclose(values, 500.0 - 2.0 * rows + cols, rtol=1e-6)
+
+        # 모양 유지 (2차원 입력)
+        grid = store.sample(lats.reshape(20, 25), lngs.reshape(20, 25), "elevation")
+        assert grid.shape == (20, 25)
+
+    def test_outside_missing_and_nodata(self, tmp_path):
+        """범위 밖/빈 타일은 NaN, 값 없는 픽셀은 가중치에서 제외"""
+        array = plane(32, 32)
+        array[16:, 16:] = -9999
+        array[4, 5] = -9999
+        write_layer(tmp_path, "elevation", array, NORTH, WEST, RES, RES, tile_size=16, nodata=-9999)
+        store = TerrainStore(str(tmp_path))
+        assert sorted(p.name for p in (tmp_path / "elevation").glob("*.npy")) == ["0_0.npy", "0_1.npy", "1_0.npy"]
+
+        lat, lng = pixel_center(25, 25)
+        outside_lat, outside_lng = pixel_center(-10, 5)
+        values = store.sample(np.array([lat, outside_lat]), np.array([lng, outside_lng]), "elevation")
+        assert np.isnan(values).all()
+
+        # (4, 5) 픽셀이 빠지면 나머지 세 픽셀로 가중 평균
+        lat, lng = pixel_center(4.5, 4.5)
+        value = store.sample(np.array([lat]), np.array([lng]), "elevation")[0]
+        expected = np.average([array[4, 4], array[5, 4], array[5, 5]], weights=[0.25, 0.25, 0.25])
+        assert value == pytest.approx(expected)
+
+    def test_tiles_are_opened_lazily(self, store):
+        """조회한 지점의 타일만 열고 열린 타일 수는 제한"""
+        layer = store.layer("elevation")
+        assert layer._tiles == {}
+        lat, lng = pixel_center(2, 2)
+        store.sample(np.array([lat]), np.array([lng]), "elevation")
+        assert list(layer._tiles) == [0]
+        assert isinstance(layer._tiles[0], np.memmap)
+
+        lats, lngs = pixel_center(np.array([2, 2, 2, 20, 20, 35]), np.array([2, 20, 40, 2, 20, 40]))
+        store.sample(lats, lngs, "elevation")
+        assert len(layer._tiles) == 4
+
+    def test_landcover_fuel_and_missing_layers(self, tmp_path):
+        """연료 레이어가 없으면 토지피복 코드로 환산, 레이어가 없으면 NaN"""
+        store = TerrainStore(str(tmp_path))
+        assert np.isnan(store.fuel(np.array([37.99]), np.array([127.01]))).all()
+        assert store.available() == []
+
+        codes = np.full((20, 20), 310, dtype=np.int16)
+        codes[:, 10:] = 700
+        codes[0, 0] = 0
+        write_layer(tmp_path, "landcover", codes, NORTH, WEST, RES, RES, tile_size=8, nodata=0, interpolation="nearest")
+        store = TerrainStore(str(tmp_path))
+        lats, lngs = pixel_center(np.array([5.4, 5.0, 0.0]), np.array([9.4, 9.6, 0.0]))
+        fuel = store.fuel(lats, lngs)
+        assert fuel[0] == 1.0 and fuel[1] == 0.0 and np.isnan(fuel[2])
+        assert store.available() == ["landcover"]
+
+    def test_features_slope_and_aspect(self, tmp_path):
+        """북쪽으로 높아지는 사면은 남향(내리막 180도), 경사는 고도 변화율의 역탄젠트"""
+        meters_per_pixel = RES * KM_PER_DEG_LAT * 1000
+        write_layer(tmp_path, "elevation", plane(30, 30, per_row=-20.0, per_col=0.0), NORTH, WEST, RES, RES, tile_size=16)
+        store = TerrainStore(str(tmp_path))
+        lat, lng = pixel_center(15, 15)
+        features = store.features(np.array([lat]), np.array([lng]))
+        assert features["aspect"][0] == pytest.approx(180.0)
+        assert features["slope"][0] == pytest.approx(math.degrees(math.atan(20.0 / meters_per_pixel)))
+        assert np.isnan(features["fuel"][0])
+
+        flat = TerrainStore(str(tmp_path / "missing")).features(np.array([lat]), np.array([lng]))
+        assert all(np.isnan(values).all() for values in flat.values())
+
+    def test_spread_grid_from_terrain(self, tmp_path):
+        """확산 격자는 셀 중심의 고도/연료로 채우고, 레이어가 없으면 평지/기준 연료"""
+        write_layer(tmp_path, "elevation", plane(200, 200), NORTH, WEST, RES, RES, tile_size=64)
+        fuel = np.full((200, 200), 0.5, dtype=np.float32)
+        write_layer(tmp_path, "fuel", fuel, NORTH, WEST, RES, RES, tile_size=64)
+        store = TerrainStore(str(tmp_path))
+
+        grid = SpreadGrid.from_terrain(NORTH - 0.1, WEST + 0.1, store, size_km=3.0, cell_m=100.0)
+        assert grid.elevation.shape == (30, 30)
+        # 북쪽(0행)이 더 높음
+        assert grid.elevation[0].mean() > grid.elevation[-1].mean()
+        assert np.allclose(grid.fuel, 0.5)
+
+        flat = SpreadGrid.from_terrain(NORTH - 0.1, WEST + 0.1, TerrainStore(str(tmp_path / "missing")), size_km=3.0, cell_m=100.0)
+        assert not flat.elevation.any() and (flat.fuel == 1.0).all()
+
+    @pytest.mark.asyncio
+    async def test_risk_spread_uses_terrain(self, tmp_path):
+        """지형 보정은 일괄 분석과 단일 분석이 같고, 오르막으로 부는 바람은 확산을 빠르게, 내리막은 느리게 함"""
+        # 위도 37.3~37.7, 경도 127.3~127.7 을 덮는 동쪽으로 높아지는 사면
+        north, west, res = 37.8, 127.2, 0.002
+        write_layer(tmp_path, "elevation", plane(300, 300, per_row=0.0, per_col=15.0), north, west, res, res, tile_size=128)
+        service = RiskAnalysisService()
+        service.weather_service.get_current_weather = AsyncMock(return_value={"temperature": 30.0, "humidity": 20.0, "wind_speed": 10.0})
+        columns = SensorColumns.from_readings(make_readings(400, seed=3))
+        location = {"lat": 37.5, "lng": 127.5}
+
+        flat = await service.analyze_fire_risk_batch(columns, [location], 5.0)
+        service.terrain_store = TerrainStore(str(tmp_path))
+        sloped = await service.analyze_fire_risk_batch(columns, [location], 5.0)
+        single = await service.analyze_fire_risk(columns.within(location, 5.0), location)
+
+        direction = sloped[0]["spread_direction"]
+        terrain = sloped[0]["terrain"]
+        # 서쪽을 향한 사면 (동쪽이 오르막)
+        assert terrain["aspect"] == pytest.approx(270.0) and terrain["slope"] > 0
+        factor = sloped[0]["spread_speed"] / flat[0]["spread_speed"]
+        # 서풍(불어오는 방향 270°)에 가까울수록 불은 동쪽 오르막으로 번짐
+        assert (factor > 1.0) == (math.cos(math.radians(direction - 270.0)) > 0)
+        assert single["spread_prediction"]["spread_speed"] == pytest.approx(sloped[0]["spread_speed"])
+        assert single["spread_prediction"]["terrain"] == terrain
+
+        # 남향 사면(북쪽이 오르막)에서 남풍은 불을 오르막으로, 북풍은 내리막으로 몰아감
+        south_facing = {"slope": np.array([20.0]), "aspect": np.array([180.0]), "fuel": np.array([1.0])}
+        upslope = RiskAnalysisService._terrain_spread_factor(np.array([180.0]), south_facing)[0]
+        downslope = RiskAnalysisService._terrain_spread_factor(np.array([0.0]), south_facing)[0]
+        across = RiskAnalysisService._terrain_spread_factor(np.array([90.0]), south_facing)[0]
+        assert upslope > 1.0 > downslope
+        assert across == pytest.approx(1.0)
+        assert upslope * downslope == pytest.approx(1.0)
@@ -0,0 +1,90 @@
+"""
+업스트림 대역 서버 테스트
+"""
+
+import pytest
+import httpx
+import xml.etree.ElementTree as ET
+from backend.app.services.upstream_standin import (
+    StandinConfig,
+    FixtureStore,
+    create_standin_app,
+    parse_upstream,
+    self_upstreams
+)
+
+class TestUpstreamStandin:
+    """업스트림 대역 서버 테스트 클래스"""
+    
+    def _client(self, config):
+        return httpx.AsyncClient(app=create_standin_app(config), base_url="http://standin")
+    
+    @pytest.mark.asyncio
+    async def test_synthetic_cctv_payload_size(self, tmp_path):
+        """합성 CCTV 응답 항목 수 및 이미지 크기 테스트"""
+        config = StandinConfig(mode="synthetic", fixtures_dir=str(tmp_path), payload_bytes=300, items_per_response=3)
+        
+        async with self._client(config) as client:
+            response = await client.get("/gigai/cctv/nearby", params={"lat": 37.5, "lng": 127.5, "radius": 5})
+        
+        data = response.json()["data"]
+        assert response.status_code == 200
+        assert len(data) == 3
+        assert len(data[0]["image_data"]) == 400  # base64(300 bytes)
+    
+    @pytest.mark.asyncio
+    async def test_synthetic_kma_response(self, tmp_path):
+        """합성 기상청 응답이 XML 형식인지 테스트"""
+        config = StandinConfig(mode="synthetic", fixtures_dir=str(tmp_path))
+        
+        async with self._client(config) as client:
+            response = await client.get("/kma/getVilageFcst", params={"nx": 60, "ny": 127})
+        
+        root = ET.fromstring(response.text)
+        assert root.find(".//resultCode").text == "00"
+        assert len(root.findall(".//item")) > 0
+    
+    @pytest.mark.asyncio
+    async def test_replay_recorded_fixture(self, tmp_path):
+        """기록된 픽스처 재생 테스트 (인증 파라미터는 키에서 제외)"""
+        store = FixtureStore(tmp_path)
+        key = store.key("GET", "iot/sensors/nearby", {"lat": "37.5", "lng": "127.5"}, b"")
+        store.save("iot", key, {"status": 200, "media_type": "application/json", "body": '{"data": [{"id": "x"}]}'})
+        config = StandinConfig(mode="replay", fixtures_dir=str(tmp_path))
+        
+        async with self._client(config) as client:
+            response = await client.get(
+                "/iot/sensors/nearby", params={"lat": "37.5", "lng": "127.5", "api_key": "secret"}
+            )
+        
+        assert response.json() == {"data": [{"id": "x"}]}
+    
+    @pytest.mark.asyncio
+    async def test_error_injection(self, tmp_path):
+        """오류 주입 테스트"""
+        config = StandinConfig(mode="synthetic", fixtures_dir=str(tmp_path), error_rate=1.0, error_status=429)
+        
+        async with self._client(config) as client:
+            response = await client.post("/cap", json={})
+        
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+    
+    def test_record_upstreams_must_not_loop_back(self):
+        """기록 대상은 --upstream 으로 덮어쓰고, 대역 서버 자신을 가리키는 대상은 거부"""
+        assert parse_upstream("gigai=https://api.kt.com/gigai") == ("gigai", "https://api.kt.com/gigai")
+        for value in ("gigai", "unknown=https://example.com", "kma=ftp://example.com"):
+            with pytest.raises(ValueError):
+                parse_upstream(value)
+        
+        local = {"gigai": "http://localhost:8900/gigai", "kma": "http://127.0.0.1:8900/kma", "iot": "http://localhost:8901/iot"}
+        assert self_upstreams(local, "0.0.0.0", 8900) == ["gigai", "kma"]
+        assert self_upstreams(local, "127.0.0.1", 8900) == ["gigai", "kma"]
+        assert self_upstreams({"cap": "https://api.kt.com/cap"}, "0.0.0.0", 443) == []
+        
+        with pytest.raises(ValueError, match="gigai"):
+            StandinConfig(mode="record", upstreams={"gigai": "http://localhost:8900/gigai"}, listen=("0.0.0.0", 8900))
+        config = StandinConfig(mode="record", upstreams={"gigai": "https://api.kt.com/gigai"}, listen=("0.0.0.0", 8900))
+        assert config.upstreams["gigai"] == "https://api.kt.com/gigai" and "kma" in config.upstreams
+        # 재생/합성 모드는 전달하지 않으므로 검사하지 않음
+        StandinConfig(mode="replay", upstreams={"gigai": "http://localhost:8900/gigai"}, listen=("0.0.0.0", 8900))
@@ -0,0 +1,136 @@
+"""
+센서 데이터 지연 쓰기 버퍼 테스트
+"""
+
+import pytest
+import asyncio
+import time
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.pool import StaticPool
+from backend.app.models.sensor_data import SensorData, SensorDataCreate, SensorType
+from backend.app.services.write_behind import WriteBehindBuffer
+
+def make_reading(i: int) -> SensorDataCreate:
+    return SensorDataCreate(
+        sensor_id=f"iot_s{i:04d}",
+        sensor_type=SensorType.TEMPERATURE,
+        location_lat=37.5665,
+        location_lng=127.9780,
+        temperature=20.0 + i,
+        raw_data={"id": i}
+    )
+
+class TestWriteBehindBuffer:
+    """지연 쓰기 버퍼 테스트 클래스"""
+    
+    @pytest.fixture
+    def engine(self):
+        """메모리 SQLite 엔진"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        SensorData.__table__.create(engine)
+        return engine
+    
+    def count_rows(self, engine) -> int:
+        with engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(SensorData.__table__)).scalar()
+    
+    @pytest.mark.asyncio
+    async def test_flush_on_batch_size(self, engine):
+        """배치 크기에 도달하면 간격을 기다리지 않고 저장"""
+        buffer = WriteBehindBuffer(engine, max_queue_size=100, batch_size=10, flush_interval_seconds=60)
+        buffer.start()
+        for i in range(10):
+            await buffer.put(make_reading(i))
+        await asyncio.sleep(0.2)
+        
+        assert self.count_rows(engine) == 10
+        await buffer.stop()
+    
+    @pytest.mark.asyncio
+    async def test_flush_on_interval_and_stop(self, engine):
+        """배치가 차지 않아도 간격이 지나면 저장하고, 중지 시 남은 데이터 저장"""
+        buffer = WriteBehindBuffer(engine, max_queue_size=100, batch_size=50, flush_interval_seconds=0.05)
+        buffer.start()
+        for i in range(3):
+            await buffer.put(make_reading(i))
+        await asyncio.sleep(0.2)
+        assert self.count_rows(engine) == 3
+        
+        await buffer.stop()
+        for i in range(3, 8):
+            await buffer.put(make_reading(i))
+        await buffer.stop()
+        assert self.count_rows(engine) == 8
+    
+    @pytest.mark.asyncio
+    async def test_backpressure_when_full(self, engine):
+        """대기열이 가득 차면 저장될 때까지 적재가 대기"""
+        buffer = WriteBehindBuffer(engine, max_queue_size=2, batch_size=2, flush_interval_seconds=0.01)
+        await buffer.put(make_reading(0))
+        await buffer.put(make_reading(1))
+        
+        blocked = asyncio.create_task(buffer.put(make_reading(2)))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        
+        buffer.start()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await buffer.stop()
+        assert self.count_rows(engine) == 3
+    
+    @pytest.mark.asyncio
+    async def test_rejected_rows_are_dropped(self, engine):
+        """제약 조건을 위반한 행만 버리고 나머지는 저장, 이후 수집도 계속 저장"""
+        with engine.begin() as conn:
+            conn.execute(text("CREATE UNIQUE INDEX ux_sensor_id ON sensor_data (sensor_id)"))
+        buffer = WriteBehindBuffer(engine, max_queue_size=100, batch_size=5, flush_interval_seconds=60, skip_unchanged=False)
+        buffer.start()
+        for i in [0, 1, 2, 1, 3]:
+            await buffer.put(make_reading(i))
+        await asyncio.sleep(0.2)
+        assert self.count_rows(engine) == 4
+        
+        for i in range(4, 9):
+            await buffer.put(make_reading(i))
+        await asyncio.sleep(0.2)
+        assert self.count_rows(engine) == 9
+        await buffer.stop()
+    
+    @pytest.mark.asyncio
+    async def test_stop_gives_up_after_timeout(self, tmp_path, caplog):
+        """데이터베이스에 연결할 수 없어도 가득 찬 대기열에서 중지가 시간 제한 안에 끝남"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'sensor.db'}")
+        buffer = WriteBehindBuffer(engine, max_queue_size=3, batch_size=2, flush_interval_seconds=0.01, stop_timeout_seconds=0.3)
+        buffer.start()
+        for i in range(5):
+            await buffer.put(make_reading(i))
+        assert buffer.queue.full()
+        
+        started = time.monotonic()
+        await buffer.stop()
+        assert time.monotonic() - started < 1.0
+        assert buffer.depth == 0 and buffer._task is None
+        assert "센서 데이터 5개를 저장하지 못함" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_running_insert(self, engine, caplog):
+        """시간 초과 때 이미 실행 중인 저장 스레드는 끝나기를 기다린 뒤 연결을 닫고, 저장된 행은 유실로 세지 않음"""
+        buffer = WriteBehindBuffer(engine, max_queue_size=10, batch_size=3, flush_interval_seconds=60, stop_timeout_seconds=0.3)
+        insert = buffer._insert
+        def slow_insert(rows):
+            time.sleep(0.45)
+            insert(rows)
+        buffer._insert = slow_insert
+        buffer.start()
+        for i in range(3):
+            await buffer.put(make_reading(i))
+        await asyncio.sleep(0.05)
+        
+        await buffer.stop()
+        assert self.count_rows(engine) == 3
+        assert "센서 데이터 0개를 저장하지 못함" in caplog.text
+        assert buffer._connection is None